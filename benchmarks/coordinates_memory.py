@@ -0,0 +1,76 @@
+"""Report the memory cost per vertex of list[Coordinates] versus PackedCoordinates.
+
+Usage:
+    python benchmarks/coordinates_memory.py [--vertices N]
+
+Positions are validated from a JSON document, as a model field would be, and
+memory is measured with tracemalloc: "retained" is the net allocation held by
+the validated structure, "peak" the highest allocation during validation.
+PackedCoordinates validates through list[Coordinates] before packing, so only
+the retained size is reduced, not the peak.
+"""
+
+import argparse
+import gc
+import json
+import random
+import sys
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from pydantic import TypeAdapter  # noqa: E402
+
+from pydantic_geojson._base import Coordinates  # noqa: E402
+from pydantic_geojson.packed import PackedCoordinates  # noqa: E402
+
+
+def bytes_per_vertex(build: Callable[[], Any], vertices: int) -> tuple[float, float]:
+    """Return the retained and peak traced allocation of ``build()`` per vertex."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        start = tracemalloc.get_traced_memory()[0]
+        result = build()
+        peak = tracemalloc.get_traced_memory()[1] - start
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del result
+    return size / vertices, peak / vertices
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--vertices", type=int, default=200_000)
+    args = parser.parse_args()
+    n = args.vertices
+
+    rng = random.Random(0)
+    positions_2d = [[rng.uniform(-180, 180), rng.uniform(-90, 90)] for _ in range(n)]
+    positions_3d = [[lon, lat, rng.uniform(0, 1000)] for lon, lat in positions_2d]
+    json_2d = json.dumps(positions_2d).encode()
+    json_3d = json.dumps(positions_3d).encode()
+
+    plain = TypeAdapter(list[Coordinates])
+    packed = TypeAdapter(PackedCoordinates)
+    rows = [
+        ("list[Coordinates] 2D", lambda: plain.validate_json(json_2d)),
+        ("PackedCoordinates 2D", lambda: packed.validate_json(json_2d)),
+        ("list[Coordinates] 3D", lambda: plain.validate_json(json_3d)),
+        ("PackedCoordinates 3D", lambda: packed.validate_json(json_3d)),
+    ]
+    print(f"{'representation':<24}{'retained/vertex':>17}{'peak/vertex':>13}")
+    for name, build in rows:
+        retained, peak = bytes_per_vertex(build, n)
+        print(f"{name:<24}{retained:>17.1f}{peak:>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
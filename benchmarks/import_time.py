@@ -0,0 +1,48 @@
+"""Measure the cold import time of pydantic_geojson.
+
+Usage:
+    python benchmarks/import_time.py [--runs N]
+
+Each sample runs the statement in a fresh interpreter and times it with
+``time.perf_counter``; the median over all runs is reported. ``import pydantic``
+is included as a reference point. The budgets checked by the test suite live
+in tests/test_import_time.py.
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+STATEMENTS = [
+    "import pydantic",
+    "import pydantic_geojson",
+    "from pydantic_geojson import FeatureCollectionModel",
+]
+
+TIMER = "import time; _t = time.perf_counter(); {statement}; print(time.perf_counter() - _t)"
+
+
+def cold_import_seconds(statement: str) -> float:
+    """Run ``statement`` in a fresh interpreter and return how long it took."""
+    result = subprocess.run(
+        [sys.executable, "-c", TIMER.format(statement=statement)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return float(result.stdout)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    for statement in STATEMENTS:
+        samples = [cold_import_seconds(statement) for _ in range(args.runs)]
+        print(f"{statement:<55}{statistics.median(samples) * 1000:>8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
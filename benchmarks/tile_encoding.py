@@ -0,0 +1,94 @@
+"""Time vector tile encoding with and without the numpy fast paths.
+
+Usage:
+    python benchmarks/tile_encoding.py [--vertices N] [--runs N]
+
+A synthetic collection of dense lines and polygons is projected once, then
+every tile of a few zoom levels is encoded from the projected features, as
+``TileIndex`` does on a cache miss. The projection step and the median time
+per tile are reported for the vectorized paths and for the pure Python
+fallback used when numpy is not installed.
+"""
+
+import argparse
+import math
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from pydantic_geojson import FeatureCollectionModel, _tiling, mvt  # noqa: E402
+from pydantic_geojson._tiling import project_features  # noqa: E402
+from pydantic_geojson.mvt import encode_layer  # noqa: E402
+
+ZOOMS = (2, 4, 6)
+
+
+def build_collection(vertices: int) -> FeatureCollectionModel:
+    """Return 20 wavy lines and 20 circular polygons with ``vertices`` positions each."""
+    features = []
+    for i in range(20):
+        lat = -40 + 4 * i
+        line = [[-90 + 180 * k / vertices, lat + math.sin(k / 15)] for k in range(vertices)]
+        ring = [
+            [
+                -45 + 4 * i + 1.5 * math.cos(2 * math.pi * k / vertices),
+                lat + 1.5 * math.sin(2 * math.pi * k / vertices),
+            ]
+            for k in range(vertices)
+        ]
+        features.append(
+            {"type": "Feature", "geometry": {"type": "LineString", "coordinates": line}}
+        )
+        features.append(
+            {
+                "type": "Feature",
+                "geometry": {"type": "Polygon", "coordinates": [ring + ring[:1]]},
+            }
+        )
+    return FeatureCollectionModel.model_validate(
+        {"type": "FeatureCollection", "features": features}
+    )
+
+
+def run(collection: FeatureCollectionModel, runs: int) -> tuple[float, float, int]:
+    """Return the projection time, the median time per tile and the number of tiles."""
+    started = time.perf_counter()
+    projected = project_features(collection.features)
+    projection = time.perf_counter() - started
+
+    samples = []
+    for _ in range(runs):
+        for z in ZOOMS:
+            for x in range(1 << z):
+                for y in range(1 << z):
+                    started = time.perf_counter()
+                    tile = encode_layer(projected, z, x, y, layer_name="bench")
+                    if tile:
+                        samples.append(time.perf_counter() - started)
+    return projection, statistics.median(samples), len(samples) // runs
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--vertices", type=int, default=5_000)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+    collection = build_collection(args.vertices)
+
+    numpy = _tiling.np
+    rows: list[tuple[str, Any]] = [("numpy", numpy)] if numpy is not None else []
+    rows.append(("pure Python", None))
+    print(f"{'path':<14}{'projection':>14}{'per tile':>12}{'tiles':>8}")
+    for name, module in rows:
+        _tiling.np = mvt.np = module
+        projection, per_tile, tiles = run(collection, args.runs)
+        print(f"{name:<14}{projection * 1000:>11.1f} ms{per_tile * 1000:>9.2f} ms{tiles:>8}")
+    _tiling.np = mvt.np = numpy
+
+
+if __name__ == "__main__":
+    main()
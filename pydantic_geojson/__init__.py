@@ -17,18 +17,22 @@ Example:
     ```
 """
 
-from .feature import FeatureModel
-from .feature_collection import FeatureCollectionModel
-from .geometry_collection import GeometryCollectionModel
-from .line_string import LineStringModel
-from .multi_line_string import MultiLineStringModel
-from .multi_point import MultiPointModel
-from .multi_polygon import MultiPolygonModel
-from .object_type import GeometryType
-from .point import PointModel
-from .polygon import PolygonModel
-
-__version__ = "0.3.1"
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .feature import FeatureModel
+    from .feature_collection import FeatureCollectionModel
+    from .geometry_collection import GeometryCollectionModel
+    from .line_string import LineStringModel
+    from .multi_line_string import MultiLineStringModel
+    from .multi_point import MultiPointModel
+    from .multi_polygon import MultiPolygonModel
+    from .object_type import GeometryType
+    from .point import PointModel
+    from .polygon import PolygonModel
+
+__version__ = "0.3.2"
 __author__ = "Aliaksandr Vaskevich"
 __maintainer__ = __author__
 
@@ -54,3 +58,42 @@ __all__ = [
     "FeatureModel",
     "FeatureCollectionModel",
 ]
+
+# Public names are resolved lazily (PEP 562) so that ``import pydantic_geojson``
+# does not import every model module up front.
+_LAZY_IMPORTS = {
+    "GeometryType": ".object_type",
+    "PointModel": ".point",
+    "MultiPointModel": ".multi_point",
+    "LineStringModel": ".line_string",
+    "MultiLineStringModel": ".multi_line_string",
+    "PolygonModel": ".polygon",
+    "MultiPolygonModel": ".multi_polygon",
+    "GeometryCollectionModel": ".geometry_collection",
+    "FeatureModel": ".feature",
+    "FeatureCollectionModel": ".feature_collection",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import public models on first attribute access.
+
+    Args:
+        name: The attribute being looked up on the package.
+
+    Returns:
+        The requested public object, cached in the package namespace.
+
+    Raises:
+        AttributeError: If ``name`` is not a public name of the package.
+    """
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
@@ -1,7 +1,13 @@
 import math
-from typing import Annotated, Literal, NamedTuple, Optional, Union
+from collections.abc import Mapping
+from typing import Annotated, Any, Callable, Literal, NamedTuple, Optional, Union
 
-from pydantic import AfterValidator, BaseModel, ConfigDict, Field
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field, ValidationError
+from pydantic_core import InitErrorDetails, PydanticCustomError, from_json
+from typing_extensions import Self
+
+from .fail_fast import context_max_errors, validate_fail_fast
+from .limits import ValidationLimits, check_json_limits, check_limits, context_limits
 
 LonField = Annotated[
     Union[float, int],
@@ -377,6 +383,10 @@ def validate_no_forbidden_members(cls, data):
     return data
 
 
+# Name under which geometry models cache their content hash, in ``__dict__``.
+CONTENT_HASH_ATTRIBUTE = "_content_hash"
+
+
 class GeoJSONModel(BaseModel):
     """Base class for all GeoJSON models.
 
@@ -390,7 +400,9 @@ class GeoJSONModel(BaseModel):
             1D, 2D, or 3D bounding boxes respectively.
     """
 
-    model_config = ConfigDict(arbitrary_types_allowed=True, extra="allow")
+    # Schemas are built on first use (validation, serialization or JSON schema)
+    # rather than at import time, which keeps ``import pydantic_geojson`` cheap.
+    model_config = ConfigDict(arbitrary_types_allowed=True, extra="allow", defer_build=True)
 
     type: Union[
         PointFieldType,
@@ -404,3 +416,136 @@ class GeoJSONModel(BaseModel):
         FeatureCollectionFieldType,
     ]
     bbox: BoundingBox
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # A new member value invalidates the cached content hash.
+        self.__dict__.pop(CONTENT_HASH_ATTRIBUTE, None)
+        super().__setattr__(name, value)
+
+    def model_copy(self, *, update: Optional[Mapping[str, Any]] = None, deep: bool = False) -> Self:
+        """Copy the model, dropping the cached content hash if members are updated.
+
+        Args:
+            update: Members to change in the copy.
+            deep: Make a deep copy.
+
+        Returns:
+            The copy.
+        """
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            copied.__dict__.pop(CONTENT_HASH_ATTRIBUTE, None)
+        return copied
+
+    def content_hash(self, refresh: bool = False) -> str:
+        """Return a stable digest of the content of the object.
+
+        The digest covers the coordinate values of geometries, and the
+        geometry and properties of features, in order; ids, bounding boxes
+        and foreign members are left out. It does not depend on how numbers
+        are formatted, and is cached on geometries until a member is
+        assigned; the hashes of features and collections are composed from
+        those of their parts on every call (see ``pydantic_geojson.hashing``).
+
+        Args:
+            refresh: Recompute the hashes of geometries, e.g. after
+                coordinates were changed in place.
+
+        Returns:
+            The hash, 32 hex digits.
+        """
+        from .hashing import content_digest
+
+        return content_digest(self, refresh).hex()
+
+    @classmethod
+    def model_json_schema(cls, *args: Any, **kwargs: Any) -> dict[str, Any]:
+        """Return the JSON Schema of the model, precomputed for the public models.
+
+        The public model classes called with default options, apart from
+        ``mode``, are served from ``pydantic_geojson.schema``. Subclasses,
+        parameterized models and other options are generated by pydantic.
+
+        Args:
+            *args: Passed on to ``BaseModel.model_json_schema``.
+            **kwargs: Passed on to ``BaseModel.model_json_schema``, e.g.
+                ``mode="serialization"``.
+
+        Returns:
+            A fresh copy of the JSON Schema.
+        """
+        from .schema import SCHEMA_MODES, _public_name, model_json_schema
+
+        mode = kwargs.get("mode", "validation")
+        if not args and set(kwargs) <= {"mode"} and mode in SCHEMA_MODES:
+            if _public_name(cls) is not None:
+                return model_json_schema(cls, mode)
+        return super().model_json_schema(*args, **kwargs)
+
+    @classmethod
+    def model_validate(cls, obj: Any, **kwargs: Any) -> Self:
+        """Validate ``obj``, first enforcing the ValidationLimits in the context, if any.
+
+        With ``context={"max_errors": n}``, validation stops after ``n`` errors
+        (see ``pydantic_geojson.fail_fast``).
+
+        Args:
+            obj: The object to validate.
+            **kwargs: Passed on to ``BaseModel.model_validate``, e.g.
+                ``context={"limits": ValidationLimits(...), "max_errors": 1}``.
+
+        Returns:
+            The validated model.
+
+        Raises:
+            ValidationError: If a limit is exceeded or the object is invalid.
+        """
+        limits = context_limits(kwargs.get("context"))
+        if limits is not None:
+            _raise_for_limits(cls, check_limits, obj, limits)
+        max_errors = context_max_errors(kwargs.get("context"))
+        if max_errors is not None:
+            return validate_fail_fast(cls, obj, max_errors, **kwargs)
+        return super().model_validate(obj, **kwargs)
+
+    @classmethod
+    def model_validate_json(cls, json_data: Union[str, bytes, bytearray], **kwargs: Any) -> Self:
+        """Validate a JSON document, first enforcing the ValidationLimits in the context.
+
+        Limits are checked on the raw document, before it is parsed. With
+        ``context={"max_errors": n}``, validation stops after ``n`` errors.
+
+        Args:
+            json_data: The JSON document to validate.
+            **kwargs: Passed on to ``BaseModel.model_validate_json``, e.g.
+                ``context={"limits": ValidationLimits(...), "max_errors": 1}``.
+
+        Returns:
+            The validated model.
+
+        Raises:
+            ValidationError: If a limit is exceeded or the document is invalid.
+        """
+        limits = context_limits(kwargs.get("context"))
+        if limits is not None:
+            _raise_for_limits(cls, check_json_limits, json_data, limits)
+        max_errors = context_max_errors(kwargs.get("context"))
+        if max_errors is not None:
+            try:
+                obj = from_json(json_data)
+            except ValueError:
+                return super().model_validate_json(json_data, **kwargs)  # reports the JSON error
+            return validate_fail_fast(cls, obj, max_errors, **kwargs)
+        return super().model_validate_json(json_data, **kwargs)
+
+
+def _raise_for_limits(
+    cls: type, check: Callable[[Any, ValidationLimits], None], data: Any, limits: ValidationLimits
+) -> None:
+    """Run a limits check, reporting an exceeded limit as a ValidationError."""
+    try:
+        check(data, limits)
+    except PydanticCustomError as exc:
+        raise ValidationError.from_exception_data(
+            cls.__name__, [InitErrorDetails(type=exc, loc=(), input=data)]
+        ) from None
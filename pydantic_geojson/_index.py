@@ -0,0 +1,123 @@
+"""Static R-tree over bounding boxes.
+
+The tree is bulk-loaded with Sort-Tile-Recursive (STR) packing: boxes are
+sorted by the x of their centres, cut into vertical slices, and each slice is
+sorted by the y of the centres, so that runs of consecutive boxes are close
+together. Every level of the tree then groups consecutive runs of the level
+below into full nodes, so the children of a node are contiguous and each
+level is stored as flat arrays. Building takes O(n log n); a query visits only
+the nodes whose boxes intersect it.
+"""
+
+import math
+from array import array
+from collections.abc import Iterator, Sequence
+
+NODE_CAPACITY = 16
+
+
+class STRTree:
+    """Static R-tree answering which boxes intersect a box.
+
+    Boxes are ``(min_x, min_y, max_x, max_y)`` and closed: boxes that only
+    touch intersect. Boxes with NaN coordinates, such as the bounds of empty
+    geometries, are never returned.
+    """
+
+    def __init__(
+        self, boxes: Sequence[Sequence[float]], node_capacity: int = NODE_CAPACITY
+    ) -> None:
+        """Build the tree.
+
+        Args:
+            boxes: The box of each item; items are identified by their index.
+            node_capacity: Maximum number of children of a node.
+        """
+        self.node_capacity = node_capacity
+        entries = [index for index, box in enumerate(boxes) if not any(map(math.isnan, box[:4]))]
+        node_count = -(-len(entries) // node_capacity)
+        slice_size = max(1, math.ceil(math.sqrt(node_count))) * node_capacity
+        entries.sort(key=lambda index: boxes[index][0] + boxes[index][2])
+        ordered = []
+        for start in range(0, len(entries), slice_size):
+            ordered.extend(
+                sorted(
+                    entries[start : start + slice_size],
+                    key=lambda index: boxes[index][1] + boxes[index][3],
+                )
+            )
+        self.items = array("q", ordered)
+        # levels[0] holds the items' boxes in STR order, levels[-1] the root.
+        leaves = tuple(array("d", (boxes[index][axis] for index in ordered)) for axis in range(4))
+        self.levels = [leaves]
+        while len(self.levels[-1][0]) > 1:
+            self.levels.append(self._parents(self.levels[-1]))
+
+    def _parents(self, level: tuple[array, ...]) -> tuple[array, ...]:
+        capacity = self.node_capacity
+        min_x, min_y, max_x, max_y = level
+        parents: tuple[array, ...] = tuple(array("d") for _ in range(4))
+        for start in range(0, len(min_x), capacity):
+            end = start + capacity
+            parents[0].append(min(min_x[start:end]))
+            parents[1].append(min(min_y[start:end]))
+            parents[2].append(max(max_x[start:end]))
+            parents[3].append(max(max_y[start:end]))
+        return parents
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def query(self, box: Sequence[float]) -> list[int]:
+        """Return the items whose boxes intersect ``box``, in tree order.
+
+        Args:
+            box: ``(min_x, min_y, max_x, max_y)``.
+
+        Returns:
+            The indexes of the intersecting boxes.
+        """
+        if not self.items:
+            return []
+        query_min_x, query_min_y, query_max_x, query_max_y = box[:4]
+        capacity = self.node_capacity
+        top = len(self.levels) - 1
+        min_x, min_y, max_x, max_y = self.levels[top]
+        if not (
+            min_x[0] <= query_max_x
+            and max_x[0] >= query_min_x
+            and min_y[0] <= query_max_y
+            and max_y[0] >= query_min_y
+        ):
+            return []
+        found = []
+        # Nodes whose boxes intersect the query, as (level, index).
+        stack = [(top, 0)]
+        while stack:
+            depth, node = stack.pop()
+            if depth == 0:
+                found.append(self.items[node])
+                continue
+            min_x, min_y, max_x, max_y = self.levels[depth - 1]
+            for child in range(node * capacity, min((node + 1) * capacity, len(min_x))):
+                if (
+                    min_x[child] <= query_max_x
+                    and max_x[child] >= query_min_x
+                    and min_y[child] <= query_max_y
+                    and max_y[child] >= query_min_y
+                ):
+                    stack.append((depth - 1, child))
+        return found
+
+    def pairs(self) -> Iterator[tuple[int, int]]:
+        """Yield the pairs of items whose boxes intersect each other.
+
+        Yields:
+            ``(i, j)`` with ``i < j``, each pair once.
+        """
+        min_x, min_y, max_x, max_y = self.levels[0]
+        for position, item in enumerate(self.items):
+            box = (min_x[position], min_y[position], max_x[position], max_y[position])
+            for other in sorted(self.query(box)):
+                if other > item:
+                    yield item, other
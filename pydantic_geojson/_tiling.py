@@ -0,0 +1,504 @@
+"""Projection, simplification and clipping primitives shared by the tile encoders.
+
+Geometries are converted once into flat Web Mercator "world" coordinates in the
+unit square ``[0, 1] x [0, 1]`` (``y`` pointing down, as in tile space). Every
+vertex is stored as an ``(x, y, importance)`` triple in a flat ``array("d")``
+so that simplification for any zoom level is a single threshold filter over
+the buffer, in the spirit of geojson-vt.
+
+When numpy is installed, projection, importance, simplification and clipping
+run as array operations over the flat buffers of long parts; without it the
+same steps fall back to plain Python loops.
+"""
+
+import math
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any, NamedTuple, Optional
+
+from pydantic import BaseModel
+
+from ._base import Coordinates
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore[assignment]
+
+POINT = 1
+LINESTRING = 2
+POLYGON = 3
+
+# Importance assigned to vertices that must survive every simplification level
+# (endpoints and clipping intersections).
+KEEP = 1.0
+
+Part = array  # flat array("d") of (x, y, importance) triples
+
+# Below this many vertices the per-call overhead of numpy outweighs the loop it saves.
+# Douglas-Peucker spans break even at about twice as many.
+VECTORIZE_MIN_VERTICES = 16
+
+
+class ProjectedFeature(NamedTuple):
+    """A feature projected to world coordinates and ready to be sliced into tiles.
+
+    Attributes:
+        kind: MVT geometry kind (``POINT``, ``LINESTRING`` or ``POLYGON``).
+        geometry: For points, a single flat part holding every point. For lines,
+            one flat part per line. For polygons, one list of rings per polygon.
+        bbox: World-space extent as ``(min_x, min_y, max_x, max_y)``.
+        id: The feature identifier, if any.
+        properties: The feature properties, if any.
+    """
+
+    kind: int
+    geometry: list[Any]
+    bbox: tuple[float, float, float, float]
+    id: Optional[Any]
+    properties: Optional[dict[str, Any]]
+
+
+def project_x(lon: float) -> float:
+    """Project a longitude to the Web Mercator unit square."""
+    return lon / 360.0 + 0.5
+
+
+def project_y(lat: float) -> float:
+    """Project a latitude to the Web Mercator unit square, clamped to [0, 1]."""
+    sin = math.sin(lat * math.pi / 180.0)
+    if sin >= 1.0:
+        return 0.0
+    if sin <= -1.0:
+        return 1.0
+    y = 0.5 - 0.25 * math.log((1.0 + sin) / (1.0 - sin)) / math.pi
+    return 0.0 if y < 0.0 else 1.0 if y > 1.0 else y
+
+
+def project_positions(positions: Sequence[Coordinates]) -> Part:
+    """Project positions into a flat ``(x, y, importance)`` buffer with zero importance."""
+    count = len(positions)
+    if np is not None and count >= VECTORIZE_MIN_VERTICES:
+        lon = np.fromiter((position[0] for position in positions), np.float64, count)
+        lat = np.fromiter((position[1] for position in positions), np.float64, count)
+        sin = np.sin(lat * math.pi / 180.0)
+        with np.errstate(divide="ignore"):
+            # The poles divide by zero; the infinite result clips to 0 or 1.
+            y = 0.5 - 0.25 * np.log((1.0 + sin) / (1.0 - sin)) / math.pi
+        triples = np.zeros((count, 3))
+        triples[:, 0] = lon / 360.0 + 0.5
+        triples[:, 1] = np.clip(y, 0.0, 1.0)
+        return array("d", triples.tobytes())
+    out = array("d", bytes(24 * count))
+    i = 0
+    for position in positions:
+        out[i] = project_x(position[0])
+        out[i + 1] = project_y(position[1])
+        i += 3
+    return out
+
+
+def compute_importance(part: Part) -> None:
+    """Fill in Douglas-Peucker importance for the vertices of ``part``.
+
+    The importance of a vertex is the squared distance at which it would be
+    removed by Douglas-Peucker simplification, so any tolerance can later be
+    applied with a single comparison per vertex. Endpoints are always kept.
+
+    Args:
+        part: Flat ``(x, y, importance)`` buffer, updated in place.
+    """
+    count = len(part) // 3
+    if count == 0:
+        return
+    first, last = 0, count - 1
+    part[first * 3 + 2] = KEEP
+    part[last * 3 + 2] = KEEP
+    flat = np.frombuffer(part) if np is not None and count >= VECTORIZE_MIN_VERTICES else None
+    stack = [(first, last)]
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+        ax, ay = part[start * 3], part[start * 3 + 1]
+        bx, by = part[end * 3], part[end * 3 + 1]
+        if flat is not None and end - start > 2 * VECTORIZE_MIN_VERTICES:
+            index, max_dist = _farthest(flat, start, end, ax, ay, bx, by)
+            part[index * 3 + 2] = max_dist
+            stack.append((start, index))
+            stack.append((index, end))
+            continue
+        dx, dy = bx - ax, by - ay
+        seg_len = dx * dx + dy * dy
+        max_dist = -1.0
+        index = start
+        for i in range(start + 1, end):
+            px, py = part[i * 3], part[i * 3 + 1]
+            if seg_len == 0.0:
+                ex, ey = px - ax, py - ay
+            else:
+                t = ((px - ax) * dx + (py - ay) * dy) / seg_len
+                if t <= 0.0:
+                    ex, ey = px - ax, py - ay
+                elif t >= 1.0:
+                    ex, ey = px - bx, py - by
+                else:
+                    ex, ey = px - (ax + t * dx), py - (ay + t * dy)
+            dist = ex * ex + ey * ey
+            if dist > max_dist:
+                max_dist = dist
+                index = i
+        part[index * 3 + 2] = max_dist
+        stack.append((start, index))
+        stack.append((index, end))
+
+
+def _farthest(
+    flat: Any, start: int, end: int, ax: float, ay: float, bx: float, by: float
+) -> tuple[int, float]:
+    """Return the vertex strictly between ``start`` and ``end`` farthest from segment ``a-b``.
+
+    This is the vectorized inner loop of ``compute_importance``; it performs the
+    same floating point operations, so both paths pick the same vertex.
+    """
+    px = flat[(start + 1) * 3 : end * 3 : 3]
+    py = flat[(start + 1) * 3 + 1 : end * 3 : 3]
+    dx, dy = bx - ax, by - ay
+    seg_len = dx * dx + dy * dy
+    ex, ey = px - ax, py - ay
+    if seg_len != 0.0:
+        t = (ex * dx + ey * dy) / seg_len
+        ex = np.where(t <= 0.0, ex, np.where(t >= 1.0, px - bx, px - (ax + t * dx)))
+        ey = np.where(t <= 0.0, ey, np.where(t >= 1.0, py - by, py - (ay + t * dy)))
+    dist = ex * ex + ey * ey
+    offset = int(np.argmax(dist))
+    return start + 1 + offset, float(dist[offset])
+
+
+def _part_bbox(part: Part, bbox: list[float]) -> None:
+    xs = part[0::3]
+    ys = part[1::3]
+    if xs:
+        bbox[0] = min(bbox[0], min(xs))
+        bbox[1] = min(bbox[1], min(ys))
+        bbox[2] = max(bbox[2], max(xs))
+        bbox[3] = max(bbox[3], max(ys))
+
+
+def _line_part(positions: Sequence[Coordinates]) -> Part:
+    part = project_positions(positions)
+    compute_importance(part)
+    return part
+
+
+def _polygon_rings(rings: Sequence[Sequence[Coordinates]]) -> list[Part]:
+    return [_line_part(ring) for ring in rings]
+
+
+def _iter_simple_geometries(geometry: Any) -> Iterator[Any]:
+    if geometry is None:
+        return
+    if geometry.type == "GeometryCollection":
+        for child in geometry.geometries:
+            yield from _iter_simple_geometries(child)
+    else:
+        yield geometry
+
+
+def project_geometry(geometry: Any) -> Optional[tuple[int, list[Any]]]:
+    """Project a non-collection geometry model to a ``(kind, geometry)`` pair."""
+    geometry_type = geometry.type
+    coordinates = geometry.coordinates
+    if geometry_type == "Point":
+        return POINT, [project_positions([coordinates])]
+    if geometry_type == "MultiPoint":
+        return (POINT, [project_positions(coordinates)]) if coordinates else None
+    if geometry_type == "LineString":
+        return LINESTRING, [_line_part(coordinates)]
+    if geometry_type == "MultiLineString":
+        return (LINESTRING, [_line_part(line) for line in coordinates]) if coordinates else None
+    if geometry_type == "Polygon":
+        return (POLYGON, [_polygon_rings(coordinates)]) if coordinates else None
+    if geometry_type == "MultiPolygon":
+        polygons = [_polygon_rings(rings) for rings in coordinates if rings]
+        return (POLYGON, polygons) if polygons else None
+    raise ValueError(f"Unsupported geometry type for tiling: {geometry_type}")
+
+
+def project_features(features: Iterable[Any]) -> list[ProjectedFeature]:
+    """Project feature models into world coordinates.
+
+    GeometryCollections are flattened into one projected feature per member,
+    each carrying the parent's id and properties. Typed properties models are
+    dumped to dictionaries. Features without geometry are skipped.
+
+    Args:
+        features: Iterable of ``FeatureModel`` instances.
+
+    Returns:
+        The projected features, in input order.
+    """
+    projected = []
+    for feature in features:
+        properties = feature.properties
+        if isinstance(properties, BaseModel):
+            properties = properties.model_dump(mode="json", exclude_none=True)
+        for geometry in _iter_simple_geometries(feature.geometry):
+            result = project_geometry(geometry)
+            if result is None:
+                continue
+            kind, parts = result
+            bbox = [math.inf, math.inf, -math.inf, -math.inf]
+            if kind == POLYGON:
+                for rings in parts:
+                    # The exterior ring bounds the polygon.
+                    _part_bbox(rings[0], bbox)
+            else:
+                for part in parts:
+                    _part_bbox(part, bbox)
+            projected.append(
+                ProjectedFeature(
+                    kind,
+                    parts,
+                    (bbox[0], bbox[1], bbox[2], bbox[3]),
+                    feature.id,
+                    properties,
+                )
+            )
+    return projected
+
+
+def simplify(part: Part, sq_tolerance: float) -> Part:
+    """Keep only the vertices whose importance exceeds ``sq_tolerance``."""
+    if sq_tolerance <= 0.0:
+        return part
+    if np is not None and len(part) >= 3 * VECTORIZE_MIN_VERTICES:
+        triples = np.frombuffer(part).reshape(-1, 3)
+        return array("d", triples[triples[:, 2] > sq_tolerance].tobytes())
+    out = array("d")
+    for i in range(0, len(part), 3):
+        if part[i + 2] > sq_tolerance:
+            out.extend(part[i : i + 3])
+    return out
+
+
+def _intersect(
+    ax: float, ay: float, bx: float, by: float, value: float, axis: int
+) -> tuple[float, float]:
+    if axis == 0:
+        t = (value - ax) / (bx - ax)
+        return value, ay + (by - ay) * t
+    t = (value - ay) / (by - ay)
+    return ax + (bx - ax) * t, value
+
+
+def clip_line(part: Part, k1: float, k2: float, axis: int) -> list[Part]:
+    """Clip a flat line part to ``k1 <= coordinate <= k2`` along ``axis``.
+
+    Args:
+        part: Flat ``(x, y, importance)`` buffer.
+        k1: Lower bound along the axis.
+        k2: Upper bound along the axis.
+        axis: ``0`` to clip on x, ``1`` to clip on y.
+
+    Returns:
+        The pieces of the line that fall within the range.
+    """
+    # Parts entirely on one side of the range need no per-vertex pass.
+    values = part[axis::3]
+    if not values:
+        return []
+    low, high = min(values), max(values)
+    if high < k1 or low > k2:
+        return []
+    if k1 <= low and high <= k2:
+        return [part] if len(part) >= 6 else []
+    if np is not None and len(part) >= 3 * VECTORIZE_MIN_VERTICES:
+        return _clip_line_runs(part, k1, k2, axis)
+    parts: list[Part] = []
+    current = array("d")
+    for i in range(0, len(part) - 3, 3):
+        ax, ay = part[i], part[i + 1]
+        bx, by = part[i + 3], part[i + 4]
+        a = part[i + axis]
+        b = part[i + 3 + axis]
+        if k1 <= a <= k2:
+            if not current:
+                current.extend(part[i : i + 3])
+        elif a < k1 < b or b < k2 < a:
+            x, y = _intersect(ax, ay, bx, by, k1 if a < k1 else k2, axis)
+            current = array("d", (x, y, KEEP))
+        if b < k1 or b > k2:
+            if current:
+                x, y = _intersect(ax, ay, bx, by, k1 if b < k1 else k2, axis)
+                current.extend((x, y, KEEP))
+                parts.append(current)
+                current = array("d")
+        else:
+            current.extend(part[i + 3 : i + 6])
+    if current:
+        parts.append(current)
+    return [p for p in parts if len(p) >= 6]
+
+
+def _clip_line_runs(part: Part, k1: float, k2: float, axis: int) -> list[Part]:
+    """Vectorized ``clip_line``: find runs of inside vertices, then copy each run at once.
+
+    Each run gains the point where the line enters the range before it and the
+    point where it leaves after it; segments that cross the whole range become
+    two-point pieces. The pieces are the same as the per-vertex loop produces.
+    """
+    values = np.frombuffer(part)[axis::3]
+    inside = (values >= k1) & (values <= k2)
+    a, b = values[:-1], values[1:]
+    enters = ~inside[:-1] & (((a < k1) & (k1 < b)) | ((b < k2) & (k2 < a)))
+    edges = np.diff(inside.astype(np.int8), prepend=np.int8(0), append=np.int8(0))
+    runs = zip(np.flatnonzero(edges == 1).tolist(), np.flatnonzero(edges == -1).tolist())
+    # A crossing segment is keyed by its first vertex, which never starts a run.
+    crossings = [(i, -1) for i in np.flatnonzero(enters & ~inside[1:]).tolist()]
+
+    def cross(segment: int, outside: int) -> tuple[float, float, float]:
+        i = segment * 3
+        bound = k1 if part[outside * 3 + axis] < k1 else k2
+        x, y = _intersect(part[i], part[i + 1], part[i + 3], part[i + 4], bound, axis)
+        return x, y, KEEP
+
+    parts: list[Part] = []
+    for start, stop in sorted([*runs, *crossings]):
+        if stop < 0:
+            parts.append(array("d", (*cross(start, start), *cross(start, start + 1))))
+            continue
+        piece = array("d")
+        if start and enters[start - 1]:
+            piece.extend(cross(start - 1, start - 1))
+        piece.extend(part[start * 3 : stop * 3])
+        if stop < len(values):
+            piece.extend(cross(stop - 1, stop))
+        parts.append(piece)
+    return [p for p in parts if len(p) >= 6]
+
+
+def clip_ring(ring: Part, k1: float, k2: float, axis: int) -> Part:
+    """Clip a closed ring to ``k1 <= coordinate <= k2`` along ``axis``.
+
+    This is one Sutherland-Hodgman pass against a pair of parallel edges; the
+    result is closed again and is empty when fewer than four vertices remain.
+    """
+    # Rings entirely on one side of the range need no per-vertex pass.
+    values = ring[axis::3]
+    if not values:
+        return array("d")
+    low, high = min(values), max(values)
+    if high < k1 or low > k2:
+        return array("d")
+    if k1 <= low and high <= k2:
+        return ring if len(ring) >= 12 else array("d")
+    if np is not None and len(ring) >= 3 * VECTORIZE_MIN_VERTICES:
+        out = _clip_ring_slots(ring, k1, k2, axis)
+    else:
+        out = array("d")
+        for i in range(0, len(ring) - 3, 3):
+            ax, ay = ring[i], ring[i + 1]
+            bx, by = ring[i + 3], ring[i + 4]
+            a = ring[i + axis]
+            b = ring[i + 3 + axis]
+            if k1 <= a <= k2:
+                out.extend(ring[i : i + 3])
+            crossings = (k1, k2) if a < b else (k2, k1)
+            for k in crossings:
+                if a < k < b or b < k < a:
+                    x, y = _intersect(ax, ay, bx, by, k, axis)
+                    out.extend((x, y, KEEP))
+    if out and (out[0] != out[-3] or out[1] != out[-2]):
+        out.extend(out[0:3])
+    return out if len(out) >= 12 else array("d")
+
+
+def _clip_ring_slots(ring: Part, k1: float, k2: float, axis: int) -> Part:
+    """Vectorized Sutherland-Hodgman pass of ``clip_ring``, without the closing vertex.
+
+    Every edge has three output slots: its start vertex, kept when inside, and
+    the crossings of the two bounds in the direction of travel, kept when the
+    edge strictly crosses them. The kept slots, in order, are the clipped ring.
+    """
+    triples = np.frombuffer(ring).reshape(-1, 3)
+    start, end = triples[:-1], triples[1:]
+    a, b = start[:, axis], end[:, axis]
+    other = 1 - axis
+    slots = np.empty((len(a), 3, 3))
+    keep = np.empty((len(a), 3), dtype=bool)
+    slots[:, 0] = start
+    keep[:, 0] = (a >= k1) & (a <= k2)
+    forward = a < b
+    for slot, k in ((1, np.where(forward, k1, k2)), (2, np.where(forward, k2, k1))):
+        keep[:, slot] = ((a < k) & (k < b)) | ((b < k) & (k < a))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t = (k - a) / (b - a)
+        slots[:, slot, axis] = k
+        slots[:, slot, other] = start[:, other] + (end[:, other] - start[:, other]) * t
+        slots[:, slot, 2] = KEEP
+    return array("d", slots[keep].tobytes())
+
+
+def clip_feature(
+    feature: ProjectedFeature,
+    sq_tolerance: float,
+    min_x: float,
+    min_y: float,
+    max_x: float,
+    max_y: float,
+) -> list[Any]:
+    """Simplify and clip a projected feature to a world-space box.
+
+    Args:
+        feature: The projected feature.
+        sq_tolerance: Squared simplification tolerance in world units.
+        min_x: Left edge of the clip box.
+        min_y: Top edge of the clip box.
+        max_x: Right edge of the clip box.
+        max_y: Bottom edge of the clip box.
+
+    Returns:
+        The clipped geometry in the same nested layout as ``feature.geometry``;
+        empty when nothing is left.
+    """
+    f_min_x, f_min_y, f_max_x, f_max_y = feature.bbox
+    inside = f_min_x >= min_x and f_max_x <= max_x and f_min_y >= min_y and f_max_y <= max_y
+
+    if feature.kind == POINT:
+        points = feature.geometry[0]
+        if inside:
+            return [points]
+        kept = array("d")
+        for i in range(0, len(points), 3):
+            x, y = points[i], points[i + 1]
+            if min_x <= x <= max_x and min_y <= y <= max_y:
+                kept.extend(points[i : i + 3])
+        return [kept] if kept else []
+
+    if feature.kind == LINESTRING:
+        lines = []
+        for part in feature.geometry:
+            part = simplify(part, sq_tolerance)
+            if inside:
+                lines.append(part)
+                continue
+            for x_part in clip_line(part, min_x, max_x, 0):
+                lines.extend(clip_line(x_part, min_y, max_y, 1))
+        return [line for line in lines if len(line) >= 6]
+
+    polygons = []
+    for rings in feature.geometry:
+        clipped_rings = []
+        for ring_index, ring in enumerate(rings):
+            ring = simplify(ring, sq_tolerance)
+            if not inside:
+                ring = clip_ring(clip_ring(ring, min_x, max_x, 0), min_y, max_y, 1)
+            if len(ring) < 12:
+                if ring_index == 0:
+                    break  # Without its exterior ring the polygon is gone.
+                continue
+            clipped_rings.append(ring)
+        if clipped_rings:
+            polygons.append(clipped_rings)
+    return polygons
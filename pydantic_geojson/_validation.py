@@ -0,0 +1,194 @@
+"""Validation of models member by member, shared by fail-fast validation and bulk ingest.
+
+Features, geometries and the members of GeometryCollections are validated
+one by one, each against the model matching its ``"type"`` member, and the
+errors are collected with their full location until a budget is spent.
+"""
+
+import typing
+from functools import cache
+from typing import Any, Literal, Optional, Union
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from pydantic_core import ErrorDetails, InitErrorDetails, PydanticCustomError, PydanticKnownError
+from pydantic_core import core_schema as cs
+
+# Fields whose members are validated one by one.
+_SPLIT_FIELDS = ("features", "geometries", "geometry")
+
+_KNOWN_ERROR_TYPES = frozenset(typing.get_args(cs.ErrorType))
+
+
+class BudgetExhausted(Exception):
+    """Raised by ``Errors.add`` once the error budget is spent."""
+
+
+class Errors:
+    """Errors collected so far, with a budget."""
+
+    def __init__(self, max_errors: int) -> None:
+        self.max_errors = max_errors
+        self.details: list[ErrorDetails] = []
+
+    def add(self, errors: list[ErrorDetails], prefix: tuple[Union[str, int], ...]) -> None:
+        for error in errors:
+            self.details.append({**error, "loc": prefix + error["loc"]})
+            if len(self.details) >= self.max_errors:
+                raise BudgetExhausted
+
+    def validation_error(self, title: str) -> ValidationError:
+        line_errors = []
+        for error in self.details:
+            error_type: Union[str, PydanticCustomError] = error["type"]
+            if error["type"] not in _KNOWN_ERROR_TYPES:
+                # Custom error types cannot be rebuilt from their name.
+                error_type = PydanticCustomError(error["type"], error["msg"])
+            line_errors.append(
+                InitErrorDetails(
+                    type=error_type,
+                    loc=error["loc"],
+                    input=error["input"],
+                    ctx=error.get("ctx", {}),
+                )
+            )
+        return ValidationError.from_exception_data(title, line_errors)
+
+
+def _error_details(error: PydanticKnownError, data: Any) -> ErrorDetails:
+    return ErrorDetails(
+        type=error.type, loc=(), msg=error.message(), input=data, ctx=error.context or {}
+    )
+
+
+def _members(annotation: Any) -> tuple[Any, ...]:
+    """Flatten Optional and Union annotations into their members, without None.
+
+    Type variables of unparameterized generic models stand for their default.
+    """
+    if isinstance(annotation, typing.TypeVar):
+        annotation = getattr(annotation, "__default__", Any)
+    if typing.get_origin(annotation) is Union:
+        return tuple(
+            member
+            for arg in typing.get_args(annotation)
+            for member in _members(arg)
+            if member is not type(None)
+        )
+    return (annotation,)
+
+
+def _type_values(model: type[BaseModel]) -> tuple[Any, ...]:
+    field = model.model_fields.get("type")
+    if field is None or typing.get_origin(field.annotation) is not Literal:
+        return ()
+    return typing.get_args(field.annotation)
+
+
+@cache
+def split_field(model: type[BaseModel], name: str) -> Optional[tuple[bool, dict[Any, Any], Any]]:
+    """How to validate the members of field ``name`` of ``model`` one by one.
+
+    Returns:
+        None if the field is not split, else whether it is a list, the models
+        of its items keyed by their ``"type"`` value, and the item annotation.
+    """
+    if not model.__pydantic_complete__:
+        model.model_rebuild()  # resolves forward references of deferred models
+    field = model.model_fields.get(name)
+    if field is None:
+        return None
+    annotation = field.annotation
+    is_list = typing.get_origin(annotation) is list
+    if is_list:
+        (annotation,) = typing.get_args(annotation)
+    dispatch: dict[Any, Any] = {}
+    for member in _members(annotation):
+        if not (isinstance(member, type) and issubclass(member, BaseModel)):
+            return None
+        for value in _type_values(member):
+            dispatch[value] = member
+    return is_list, dispatch, annotation
+
+
+@cache
+def _adapter(annotation: Any) -> TypeAdapter:
+    return TypeAdapter(annotation)
+
+
+def validate_item(
+    annotation: Any,
+    dispatch: dict[Any, Any],
+    data: Any,
+    errors: Errors,
+    prefix: tuple[Union[str, int], ...],
+    kwargs: dict[str, Any],
+) -> Any:
+    """Validate one member of a split field, as returned by ``split_field``; None on error."""
+    if data is None and type(None) in typing.get_args(annotation):
+        return None
+    if isinstance(data, dict) and dispatch:
+        # Like a union discriminated by "type", report one error for an unknown type.
+        if "type" not in data:
+            error = PydanticKnownError("union_tag_not_found", {"discriminator": "'type'"})
+        elif data["type"] in dispatch:
+            return validate_model(dispatch[data["type"]], data, errors, prefix, kwargs)
+        else:
+            error = PydanticKnownError(
+                "union_tag_invalid",
+                {
+                    "discriminator": "'type'",
+                    "tag": str(data["type"]),
+                    "expected_tags": ", ".join(repr(tag) for tag in dispatch),
+                },
+            )
+        errors.add([_error_details(error, data)], prefix)
+        return None
+    # Not an object: let the full annotation report the error.
+    try:
+        return _adapter(annotation).validate_python(data, **kwargs)
+    except ValidationError as exc:
+        errors.add(exc.errors(include_url=False), prefix)
+    return None
+
+
+def validate_model(
+    model: type[BaseModel],
+    data: Any,
+    errors: Errors,
+    prefix: tuple[Union[str, int], ...],
+    kwargs: dict[str, Any],
+) -> Any:
+    """Validate ``data`` as ``model``, splitting features and geometries; None on error."""
+    failed = len(errors.details)
+    validated: dict[str, Any] = {}
+    if isinstance(data, dict):
+        for name in _SPLIT_FIELDS:
+            split = split_field(model, name) if name in data else None
+            if split is None:
+                continue
+            is_list, dispatch, annotation = split
+            value = data[name]
+            if not is_list:
+                validated[name] = validate_item(
+                    annotation, dispatch, value, errors, (*prefix, name), kwargs
+                )
+            elif isinstance(value, list):
+                validated[name] = [
+                    validate_item(annotation, dispatch, item, errors, (*prefix, name, i), kwargs)
+                    for i, item in enumerate(value)
+                ]
+    members_failed = len(errors.details) > failed
+    if members_failed:
+        # Validate the rest of the object; errors of the split fields are already reported.
+        data = {key: value for key, value in data.items() if key not in validated}
+    elif validated:
+        # Members are model instances now, which pydantic does not validate again.
+        data = {**data, **validated}
+    try:
+        return model.__pydantic_validator__.validate_python(data, **kwargs)
+    except ValidationError as exc:
+        model_errors = exc.errors(include_url=False)
+        if members_failed:
+            model_errors = [e for e in model_errors if not (e["loc"] and e["loc"][0] in validated)]
+        errors.add(model_errors, prefix)
+    return None
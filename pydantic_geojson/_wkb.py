@@ -0,0 +1,154 @@
+"""Well-known binary (WKB) encoding of GeoJSON geometry objects.
+
+Geometries are written as little-endian ISO WKB, with the Z variants of the
+geometry types when any position has an altitude; missing altitudes are then
+written as NaN. Both byte orders and both the ISO and the EWKB flavour of Z
+geometries are read. Geometries with M values are not supported.
+"""
+
+import math
+import struct
+from typing import Any
+
+from .columnar import GEOMETRY_TYPE_CODES
+
+_GEOMETRY_TYPES = {code: name for name, code in GEOMETRY_TYPE_CODES.items()}
+_EWKB_Z = 0x80000000
+_EWKB_FLAGS = 0xE0000000  # Z, M and SRID flags
+
+
+def _has_z(geometry: dict[str, Any]) -> bool:
+    if geometry["type"] == "GeometryCollection":
+        return any(_has_z(member) for member in geometry["geometries"])
+    stack = [geometry["coordinates"]]
+    while stack:
+        value = stack.pop()
+        if value and not isinstance(value[0], (list, tuple)):
+            if len(value) > 2 and value[2] is not None:
+                return True
+        else:
+            stack.extend(value)
+    return False
+
+
+def _write_positions(out: bytearray, positions: Any, has_z: bool) -> None:
+    flat: list[float] = []
+    if has_z:
+        for position in positions:
+            alt = position[2] if len(position) > 2 else None
+            flat.extend((position[0], position[1], math.nan if alt is None else alt))
+    else:
+        for position in positions:
+            flat.extend((position[0], position[1]))
+    out += struct.pack(f"<{len(flat)}d", *flat)
+
+
+def _write(out: bytearray, geometry: dict[str, Any], has_z: bool) -> None:
+    geometry_type = geometry["type"]
+    out += struct.pack("<BI", 1, GEOMETRY_TYPE_CODES[geometry_type] + (1000 if has_z else 0))
+    if geometry_type == "GeometryCollection":
+        out += struct.pack("<I", len(geometry["geometries"]))
+        for member in geometry["geometries"]:
+            _write(out, member, has_z)
+        return
+    coordinates = geometry["coordinates"]
+    if geometry_type == "Point":
+        _write_positions(out, (coordinates,), has_z)
+    elif geometry_type == "LineString":
+        out += struct.pack("<I", len(coordinates))
+        _write_positions(out, coordinates, has_z)
+    elif geometry_type == "Polygon":
+        out += struct.pack("<I", len(coordinates))
+        for ring in coordinates:
+            out += struct.pack("<I", len(ring))
+            _write_positions(out, ring, has_z)
+    else:
+        member_type = geometry_type[len("Multi") :]
+        out += struct.pack("<I", len(coordinates))
+        for member in coordinates:
+            _write(out, {"type": member_type, "coordinates": member}, has_z)
+
+
+def dumps(geometry: dict[str, Any]) -> bytes:
+    """Encode a GeoJSON geometry object as WKB.
+
+    Args:
+        geometry: A GeoJSON geometry object, e.g. from ``model_dump()``.
+
+    Returns:
+        The little-endian ISO WKB encoding.
+    """
+    out = bytearray()
+    _write(out, geometry, _has_z(geometry))
+    return bytes(out)
+
+
+class _Reader:
+    """Reads one WKB geometry, tracking the position in the buffer."""
+
+    def __init__(self, data: bytes) -> None:
+        self.data = memoryview(data)
+        self.pos = 0
+
+    def unpack(self, fmt: str) -> tuple[Any, ...]:
+        values = struct.unpack_from(fmt, self.data, self.pos)
+        self.pos += struct.calcsize(fmt)
+        return values
+
+    def positions(self, order: str, count: int, has_z: bool) -> list[list[float]]:
+        dims = 3 if has_z else 2
+        values = self.unpack(f"{order}{count * dims}d")
+        if not has_z:
+            return [[values[i], values[i + 1]] for i in range(0, len(values), 2)]
+        return [
+            [x, y] if z != z else [x, y, z]
+            for x, y, z in zip(values[0::3], values[1::3], values[2::3])
+        ]
+
+    def geometry(self) -> dict[str, Any]:
+        (byte_order,) = self.unpack("B")
+        order = "<" if byte_order == 1 else ">"
+        (code,) = self.unpack(f"{order}I")
+        has_z = bool(code & _EWKB_Z)
+        if code & _EWKB_FLAGS & ~_EWKB_Z:
+            raise ValueError(f"Unsupported WKB geometry type {code:#x}")
+        code &= ~_EWKB_FLAGS
+        if code >= 1000:
+            has_z, code = code // 1000 == 1, code % 1000
+            if not has_z:
+                raise ValueError("WKB geometries with M values are not supported")
+        geometry_type = _GEOMETRY_TYPES.get(code)
+        if geometry_type is None:
+            raise ValueError(f"Unsupported WKB geometry type {code}")
+
+        if geometry_type == "Point":
+            return {"type": "Point", "coordinates": self.positions(order, 1, has_z)[0]}
+        (count,) = self.unpack(f"{order}I")
+        if geometry_type == "LineString":
+            return {"type": "LineString", "coordinates": self.positions(order, count, has_z)}
+        if geometry_type == "Polygon":
+            rings = []
+            for _ in range(count):
+                (length,) = self.unpack(f"{order}I")
+                rings.append(self.positions(order, length, has_z))
+            return {"type": "Polygon", "coordinates": rings}
+        members = [self.geometry() for _ in range(count)]
+        if geometry_type == "GeometryCollection":
+            return {"type": "GeometryCollection", "geometries": members}
+        return {"type": geometry_type, "coordinates": [member["coordinates"] for member in members]}
+
+
+def loads(data: bytes) -> dict[str, Any]:
+    """Decode a WKB geometry into a GeoJSON geometry object.
+
+    Args:
+        data: The WKB encoding.
+
+    Returns:
+        The GeoJSON geometry object, with positions as lists.
+
+    Raises:
+        ValueError: If the geometry type is not supported.
+        struct.error: If ``data`` is truncated.
+    """
+    return _Reader(data).geometry()
@@ -0,0 +1,391 @@
+"""Cutting geometries at the antimeridian.
+
+RFC 7946 Section 3.1.9 asks producers to cut geometries that cross the
+antimeridian into parts on either side of it, so that no edge has to be
+interpreted as going "the short way round". An edge is taken to cross the
+antimeridian when its endpoints are more than 180 degrees of longitude apart.
+
+``cut_antimeridian`` splits LineStrings into MultiLineStrings and Polygons
+into MultiPolygons (Multi* geometries gain parts) in time linear in the
+number of positions, plus sorting the crossing points of each polygon along
+the antimeridian. Crossing points are interpolated linearly in longitude and
+latitude. A polygon ring that encircles a pole, crossing the antimeridian an
+odd number of times, is closed along that pole; as the ring's winding order
+cannot tell which pole it encircles, the right-hand rule is assumed (a
+counterclockwise exterior ring heading east encircles the north pole).
+
+Validation can also reject uncut crossings:
+
+Example:
+    ```python
+    from pydantic_geojson.antimeridian import cut_antimeridian
+
+    route = cut_antimeridian(route)  # MultiLineStringModel if it crossed
+    FeatureCollectionModel.model_validate(data, context={"antimeridian_cut": True})
+    ```
+"""
+
+import bisect
+import math
+from collections.abc import Sequence
+from functools import cache
+from typing import Any, Optional
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from .packed import PackedCoordinates
+
+# Key of the antimeridian check flag in the pydantic validation context.
+ANTIMERIDIAN_CONTEXT_KEY = "antimeridian_cut"
+
+# Position in the unwrapped plane: longitude (possibly beyond +-180), latitude, altitude.
+_Position = tuple[float, float, Optional[float]]
+
+
+def context_antimeridian_cut(context: Any) -> bool:
+    """Return whether a validation context asks for the antimeridian check."""
+    return isinstance(context, dict) and bool(context.get(ANTIMERIDIAN_CONTEXT_KEY))
+
+
+def _lons(positions: Sequence[Any]) -> Sequence[float]:
+    if isinstance(positions, PackedCoordinates):
+        return positions.lons
+    return [position[0] for position in positions]
+
+
+def crosses_antimeridian(positions: Sequence[Any]) -> bool:
+    """Return whether any edge of a position sequence crosses the antimeridian.
+
+    Args:
+        positions: The positions, e.g. a LineString or a linear ring.
+
+    Returns:
+        True if two consecutive positions are more than 180 degrees of
+        longitude apart.
+    """
+    lons = _lons(positions)
+    return any(abs(b - a) > 180 for a, b in zip(lons, lons[1:]))
+
+
+def check_antimeridian(sequences: Sequence[Sequence[Any]], what: str) -> None:
+    """Check that no position sequence crosses the antimeridian.
+
+    Args:
+        sequences: Lines or rings.
+        what: Description of a sequence for the error message, formatted with
+            its index, e.g. ``"Ring {} of Polygon"``.
+
+    Raises:
+        ValueError: If a sequence crosses the antimeridian.
+    """
+    for index, positions in enumerate(sequences):
+        if crosses_antimeridian(positions):
+            raise ValueError(
+                f"{what.format(index)} crosses the antimeridian; RFC 7946 Section "
+                "3.1.9 asks for such geometries to be cut. Use cut_antimeridian() to cut it."
+            )
+
+
+# ---------------------------------------------------------------------------
+# Splitting position sequences
+# ---------------------------------------------------------------------------
+
+
+def _unwrap(positions: Sequence[Any]) -> list[_Position]:
+    """Positions with longitudes made continuous: no step exceeds 180 degrees."""
+    unwrapped: list[_Position] = []
+    previous_lon = offset = 0.0
+    for index, position in enumerate(positions):
+        lon, lat = position[0], position[1]
+        alt = position[2] if len(position) > 2 else None
+        if index:
+            step = lon - previous_lon
+            if step > 180:
+                offset -= 360
+            elif step < -180:
+                offset += 360
+        previous_lon = lon
+        unwrapped.append((lon + offset, lat, alt))
+    return unwrapped
+
+
+def _window(lon: float) -> int:
+    """Index ``w`` of the window ``(-180 + 360 w, 180 + 360 w]`` holding ``lon``."""
+    return math.ceil((lon - 180) / 360)
+
+
+def _first_window(positions: list[_Position]) -> int:
+    for lon, _, _ in positions:
+        if (lon - 180) % 360:
+            return _window(lon)
+    return 0
+
+
+def _crossing(a: _Position, b: _Position, boundary: float) -> _Position:
+    t = (boundary - a[0]) / (b[0] - a[0])
+    alt = None if a[2] is None or b[2] is None else a[2] + t * (b[2] - a[2])
+    return boundary, a[1] + t * (b[1] - a[1]), alt
+
+
+def _split(positions: list[_Position]) -> list[tuple[int, list[_Position]]]:
+    """Split unwrapped positions into chains, each within one window."""
+    window = _first_window(positions)
+    chain = [positions[0]]
+    chains = [(window, chain)]
+    for a, b in zip(positions, positions[1:]):
+        right = 180 + 360 * window
+        if b[0] > right or b[0] < right - 360:
+            boundary = right if b[0] > right else right - 360
+            point = _crossing(a, b, boundary)
+            if chain[-1][:2] != point[:2]:
+                chain.append(point)
+            window += 1 if b[0] > right else -1
+            chain = [point]
+            chains.append((window, chain))
+        if b[:2] != chain[-1][:2]:
+            chain.append(b)
+    return chains
+
+
+def _wrap(positions: list[_Position], window: int) -> list[list[float]]:
+    shift = 360 * window
+    return [
+        [lon - shift, lat] if alt is None else [lon - shift, lat, alt]
+        for lon, lat, alt in positions
+    ]
+
+
+def cut_line(positions: Sequence[Any]) -> list[list[list[float]]]:
+    """Cut a line at the antimeridian.
+
+    Args:
+        positions: The positions of the line.
+
+    Returns:
+        The parts of the line as position lists, on either side of the
+        antimeridian; a single part if it does not cross it.
+    """
+    if not crosses_antimeridian(positions):
+        return [[list(position) for position in _wrap(_unwrap(positions), 0)]]
+    parts = [_wrap(chain, window) for window, chain in _split(_unwrap(positions))]
+    return [part for part in parts if len(part) > 1]
+
+
+# ---------------------------------------------------------------------------
+# Polygons
+# ---------------------------------------------------------------------------
+
+
+def _signed_area(positions: list[_Position]) -> float:
+    origin = positions[0][0]
+    return sum(
+        (a[0] - origin) * b[1] - (b[0] - origin) * a[1] for a, b in zip(positions, positions[1:])
+    )
+
+
+def _ring_chains(ring: Sequence[Any], hole: bool) -> list[tuple[int, list[_Position]]]:
+    """Chains of a crossing ring, oriented with the polygon interior on their left."""
+    positions = _unwrap(ring)
+    turns = round((positions[-1][0] - positions[0][0]) / 360)
+    if abs(turns) > 1:
+        raise ValueError("Cannot cut a ring that winds around the earth more than once")
+    if turns:
+        # The ring encircles a pole: close it along the pole, assuming the
+        # interior is on its left (north when heading east).
+        # Steps of 90 degrees along the pole keep every edge of the parts
+        # shorter than 180 degrees of longitude.
+        pole = 90.0 if turns > 0 else -90.0
+        end, start = positions[-1], positions[0]
+        step = -90 if turns > 0 else 90
+        positions[-1:] = [end] + [(end[0] + step * i, pole, None) for i in range(5)] + [start]
+    elif (_signed_area(positions) < 0) != hole:
+        positions.reverse()
+    chains = _split(positions)
+    if len(chains) > 1 and chains[0][0] == chains[-1][0]:
+        # The ring starts inside a chain: join its last and first chains.
+        window, last = chains.pop()
+        chains[0] = (window, last + chains[0][1][1:])
+    return chains
+
+
+def _join(chains: list[tuple[int, list[_Position]]]) -> list[tuple[int, list[_Position]]]:
+    """Close chains into rings along the window boundaries they start and end on.
+
+    A chain leaving its window through the right boundary (heading east, so
+    with the interior to the north) continues at the next chain entering that
+    boundary further north; one leaving through the left boundary continues
+    at the next chain entering it further south.
+    """
+    entries: dict[tuple[int, float], list[tuple[float, int]]] = {}
+    for index, (window, chain) in enumerate(chains):
+        entries.setdefault((window, chain[0][0]), []).append((chain[0][1], index))
+    for points in entries.values():
+        points.sort()
+    following: list[Optional[int]] = []
+    for window, chain in chains:
+        lon, lat, _ = chain[-1]
+        candidates = entries.get((window, lon), [])
+        lats = [entry_lat for entry_lat, _ in candidates]
+        if lon == 180 + 360 * window:
+            position = bisect.bisect_left(lats, lat)
+            following.append(candidates[position][1] if position < len(candidates) else None)
+        else:
+            position = bisect.bisect_right(lats, lat) - 1
+            following.append(candidates[position][1] if position >= 0 else None)
+
+    rings = []
+    used = [False] * len(chains)
+    for first in range(len(chains)):
+        if used[first]:
+            continue
+        window, ring = chains[first][0], list(chains[first][1])
+        used[first] = True
+        current = following[first]
+        while current is not None and current != first and not used[current]:
+            used[current] = True
+            ring.extend(chains[current][1])
+            current = following[current]
+        if ring[0][:2] != ring[-1][:2]:
+            ring.append(ring[0])
+        if len(ring) >= 4:
+            rings.append((window, ring))
+    return rings
+
+
+def _contains(ring: list[list[float]], lon: float, lat: float) -> bool:
+    inside = False
+    for a, b in zip(ring, ring[1:]):
+        if (a[1] > lat) != (b[1] > lat):
+            if lon < a[0] + (lat - a[1]) * (b[0] - a[0]) / (b[1] - a[1]):
+                inside = not inside
+    return inside
+
+
+def cut_polygon(rings: Sequence[Sequence[Any]]) -> list[list[list[list[float]]]]:
+    """Cut a polygon at the antimeridian.
+
+    Args:
+        rings: The exterior ring followed by the holes.
+
+    Returns:
+        The polygons (lists of rings of positions) on either side of the
+        antimeridian; a single polygon if it does not cross it. Rings that
+        are cut follow the right-hand rule.
+
+    Raises:
+        ValueError: If a ring winds around the earth more than once.
+    """
+    if not any(crosses_antimeridian(ring) for ring in rings):
+        return [[[list(position) for position in _wrap(_unwrap(ring), 0)] for ring in rings]]
+    chains = []
+    whole_holes = []
+    for index, ring in enumerate(rings):
+        if index and not crosses_antimeridian(ring):
+            whole_holes.append(_wrap(_unwrap(ring), 0))
+        else:
+            chains.extend(_ring_chains(ring, hole=index > 0))
+    polygons = [[_wrap(ring, window)] for window, ring in _join(chains)]
+    for hole in whole_holes:
+        lon, lat = hole[0][0], hole[0][1]
+        target = next(
+            (polygon for polygon in polygons if _contains(polygon[0], lon, lat)), polygons[0]
+        )
+        target.append(hole)
+    return polygons
+
+
+# ---------------------------------------------------------------------------
+# Geometry models
+# ---------------------------------------------------------------------------
+
+
+def _model(geometry: Any, geometry_type: str, coordinates: Any) -> Any:
+    from .geometry_collection import GeometryCollectionModel
+    from .multi_line_string import MultiLineStringModel
+    from .multi_polygon import MultiPolygonModel
+
+    models: dict[str, Any] = {
+        "MultiLineString": MultiLineStringModel,
+        "MultiPolygon": MultiPolygonModel,
+        "GeometryCollection": GeometryCollectionModel,
+    }
+    # Foreign members describe the geometry as a whole and stay with its parts.
+    data: dict[str, Any] = {**(geometry.model_extra or {}), "type": geometry_type}
+    data["geometries" if geometry_type == "GeometryCollection" else "coordinates"] = coordinates
+    if geometry.bbox is not None:
+        data["bbox"] = geometry.bbox
+    return models[geometry_type].model_validate(data)
+
+
+@cache
+def _geometry_adapter(feature_type: type[BaseModel]) -> TypeAdapter[Any]:
+    return TypeAdapter(feature_type.model_fields["geometry"].annotation)
+
+
+def _cut_feature(feature: Any) -> Any:
+    geometry = cut_antimeridian(feature.geometry)
+    if geometry is not feature.geometry:
+        # A parameterized Feature may not accept the Multi* geometry a cut
+        # produces; model_copy would not check it.
+        feature_type: type[BaseModel] = type(feature)
+        try:
+            _geometry_adapter(feature_type).validate_python(geometry)
+        except ValidationError:
+            raise ValueError(
+                f"Cutting at the antimeridian turns the {feature.geometry.type} of a "
+                f"{feature_type.__name__} into a {geometry.type}, which it does not accept; "
+                "cut features whose geometry type allows it, such as FeatureModel"
+            ) from None
+    return feature.model_copy(update={"geometry": geometry})
+
+
+def cut_antimeridian(geometry: Any) -> Any:
+    """Cut a geometry, a Feature or a FeatureCollection at the antimeridian.
+
+    LineStrings and Polygons that cross the antimeridian become
+    MultiLineStrings and MultiPolygons; the parts of Multi* geometries and
+    the members of GeometryCollections are cut likewise. Geometries that do
+    not cross it are returned as they are.
+
+    Args:
+        geometry: A geometry model, a FeatureModel, a FeatureCollectionModel
+            or None.
+
+    Returns:
+        The cut geometry, or a copy of the Feature or FeatureCollection with
+        cut geometries.
+
+    Raises:
+        ValueError: If a polygon ring winds around the earth more than once,
+            or a parameterized Feature does not accept the cut geometry type.
+    """
+    geometry_type = getattr(geometry, "type", None)
+    if geometry_type == "FeatureCollection":
+        features = [cut_antimeridian(feature) for feature in geometry.features]
+        return geometry.model_copy(update={"features": features})
+    if geometry_type == "Feature":
+        return _cut_feature(geometry)
+    if geometry_type == "LineString":
+        if not crosses_antimeridian(geometry.coordinates):
+            return geometry
+        return _model(geometry, "MultiLineString", cut_line(geometry.coordinates))
+    if geometry_type == "MultiLineString":
+        if not any(crosses_antimeridian(line) for line in geometry.coordinates):
+            return geometry
+        lines = [part for line in geometry.coordinates for part in cut_line(line)]
+        return _model(geometry, "MultiLineString", lines)
+    if geometry_type == "Polygon":
+        if not any(crosses_antimeridian(ring) for ring in geometry.coordinates):
+            return geometry
+        return _model(geometry, "MultiPolygon", cut_polygon(geometry.coordinates))
+    if geometry_type == "MultiPolygon":
+        if not any(crosses_antimeridian(ring) for rings in geometry.coordinates for ring in rings):
+            return geometry
+        polygons = [part for rings in geometry.coordinates for part in cut_polygon(rings)]
+        return _model(geometry, "MultiPolygon", polygons)
+    if geometry_type == "GeometryCollection":
+        members = [cut_antimeridian(member) for member in geometry.geometries]
+        if all(cut is member for cut, member in zip(members, geometry.geometries)):
+            return geometry
+        return _model(geometry, "GeometryCollection", members)
+    return geometry
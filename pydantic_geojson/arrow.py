@@ -0,0 +1,527 @@
+"""Arrow and GeoArrow export and import.
+
+Collections are exported as Arrow tables with one column per property, an
+``id`` column when features have ids, and a ``geometry`` column. When all
+geometries share one type (other than GeometryCollection) the geometry
+column uses the GeoArrow native encoding (``geoarrow.point``,
+``geoarrow.polygon``, ...) with separated ``x``/``y``/``z`` coordinates;
+otherwise it holds WKB (``geoarrow.wkb``). Property values that Arrow cannot
+type, such as mixed types or objects, are stored as JSON text
+(``arrow.json``).
+
+The native encoding of a ``ColumnarFeatureCollection`` shares its coordinate
+and offset buffers with the Arrow arrays instead of copying them.
+
+Requires pyarrow: ``pip install 'pydantic-geojson[arrow]'``.
+
+Example:
+    ```python
+    from pydantic_geojson.arrow import read_ipc, write_ipc
+
+    write_ipc(collection, "places.arrow")
+    collection = read_ipc("places.arrow")
+    ```
+"""
+
+import json
+import math
+import os
+from array import array
+from collections.abc import Iterable
+from typing import Any, Literal, Optional, Union
+
+try:
+    import pyarrow as pa
+except ImportError as exc:  # pragma: no cover
+    raise ImportError(
+        "pydantic_geojson.arrow requires pyarrow; install it with "
+        "pip install 'pydantic-geojson[arrow]'"
+    ) from exc
+
+from . import _wkb
+from .columnar import ColumnarFeatureCollection
+from .fail_fast import validate_fail_fast
+from .feature_collection import FeatureCollectionModel
+
+GEOMETRY_COLUMN = "geometry"
+ID_COLUMN = "id"
+
+_EXTENSION_NAME = b"ARROW:extension:name"
+# Marks an ``id`` column that holds a property rather than the feature ids.
+_PROPERTY_METADATA = b"pydantic_geojson:property"
+_EXTENSION_METADATA = b"ARROW:extension:metadata"
+# GeoJSON coordinates are always WGS 84 longitude/latitude (RFC 7946 Section 4).
+_GEOARROW_METADATA = json.dumps({"crs": "OGC:CRS84"}).encode()
+_JSON_EXTENSION = "arrow.json"
+_WKB_EXTENSION = "geoarrow.wkb"
+_NATIVE_EXTENSIONS = {
+    1: "geoarrow.point",
+    2: "geoarrow.linestring",
+    3: "geoarrow.polygon",
+    4: "geoarrow.multipoint",
+    5: "geoarrow.multilinestring",
+    6: "geoarrow.multipolygon",
+}
+_NATIVE_CODES = {name: code for code, name in _NATIVE_EXTENSIONS.items()}
+# Names of the list levels of each native encoding, outermost first.
+_LEVEL_NAMES = {
+    1: (),
+    2: ("vertices",),
+    3: ("rings", "vertices"),
+    4: ("points",),
+    5: ("linestrings", "vertices"),
+    6: ("polygons", "rings", "vertices"),
+}
+
+GeometryEncoding = Literal["auto", "native", "wkb"]
+
+
+# ---------------------------------------------------------------------------
+# Export
+# ---------------------------------------------------------------------------
+
+
+def _buffer_array(values: array, arrow_type: pa.DataType) -> pa.Array:
+    """Wrap a stdlib array as an Arrow array without copying."""
+    return pa.Array.from_buffers(arrow_type, len(values), [None, pa.py_buffer(values)])
+
+
+def _compose(outer: Optional[array], inner: array) -> array:
+    """Offsets ``inner[outer[i]]``; None stands for the identity."""
+    if outer is None:
+        return inner
+    return array("i", [inner[index] for index in outer])
+
+
+def _coordinates(
+    x: array, y: array, z: Optional[array], mask: Optional[pa.Array] = None
+) -> pa.Array:
+    names = ["x", "y"] if z is None else ["x", "y", "z"]
+    children = [_buffer_array(values, pa.float64()) for values in (x, y, z) if values is not None]
+    fields = [pa.field(name, pa.float64(), nullable=False) for name in names]
+    return pa.StructArray.from_arrays(children, fields=fields, mask=mask)
+
+
+def _with_null_points(values: array, starts: list[int], nulls: list[bool]) -> array:
+    return array("d", [math.nan if null else values[start] for start, null in zip(starts, nulls)])
+
+
+def _native_geometry(columnar: ColumnarFeatureCollection, code: int) -> pa.Array:
+    nulls = [geometry_type == 0 for geometry_type in columnar.geometry_types]
+    mask = pa.array(nulls, pa.bool_()) if any(nulls) else None
+    # Offsets from features to each level; None while the mapping is the identity.
+    features = columnar.member_offsets if mask is not None else None
+    if code in (5, 6):
+        features = _compose(features, columnar.geometry_offsets)
+    to_rings = features
+    if code in (3, 6):
+        to_rings = _compose(to_rings, columnar.part_offsets)
+
+    if code == 1:
+        x, y, z = columnar.x, columnar.y, columnar.z
+        if features is not None:
+            # Null points still take a (NaN) coordinate slot.
+            starts = [columnar.ring_offsets[index] for index in features[:-1]]
+            x, y = _with_null_points(x, starts, nulls), _with_null_points(y, starts, nulls)
+            if z is not None:
+                z = _with_null_points(z, starts, nulls)
+        return _coordinates(x, y, z, mask)
+
+    geometry = _coordinates(columnar.x, columnar.y, columnar.z)
+    levels: list[Optional[array]]
+    if code in (2, 4):
+        levels = [_compose(to_rings, columnar.ring_offsets)]
+    elif code in (3, 5):
+        levels = [to_rings, columnar.ring_offsets]
+    else:
+        levels = [features, columnar.part_offsets, columnar.ring_offsets]
+    names = _LEVEL_NAMES[code]
+    for depth in range(len(levels) - 1, -1, -1):
+        offsets = levels[depth]
+        assert offsets is not None
+        list_type = pa.list_(pa.field(names[depth], geometry.type, nullable=False))
+        geometry = pa.ListArray.from_arrays(
+            _buffer_array(offsets, pa.int32()),
+            geometry,
+            type=list_type,
+            mask=mask if depth == 0 else None,
+        )
+    return geometry
+
+
+def _geometry_column(
+    columnar: ColumnarFeatureCollection, encoding: GeometryEncoding
+) -> tuple[pa.Field, pa.Array]:
+    if encoding not in ("auto", "native", "wkb"):
+        raise ValueError(f"Unknown geometry encoding {encoding!r}")
+    codes = set(columnar.geometry_types) - {0}
+    code = codes.pop() if len(codes) == 1 else None
+    if encoding != "wkb" and code in _NATIVE_EXTENSIONS:
+        values = _native_geometry(columnar, code)
+        extension = _NATIVE_EXTENSIONS[code]
+    elif encoding == "native" and codes:
+        raise ValueError(
+            "The native GeoArrow encoding needs geometries of one type other than "
+            "GeometryCollection; use the WKB encoding"
+        )
+    else:
+        geometries = (columnar.geometry(index) for index in range(len(columnar)))
+        values = pa.array(
+            [None if geometry is None else _wkb.dumps(geometry) for geometry in geometries],
+            pa.binary(),
+        )
+        extension = _WKB_EXTENSION
+    metadata = {_EXTENSION_NAME: extension.encode(), _EXTENSION_METADATA: _GEOARROW_METADATA}
+    return pa.field(GEOMETRY_COLUMN, values.type, metadata=metadata), values
+
+
+def _value_column(name: str, values: list[Any]) -> tuple[pa.Field, pa.Array]:
+    """Arrow column for property values, as JSON text when Arrow cannot type them."""
+    try:
+        column = pa.array(values)
+        if not pa.types.is_struct(column.type):
+            return pa.field(name, column.type), column
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        pass
+    column = pa.array(
+        [None if value is None else json.dumps(value) for value in values], pa.string()
+    )
+    return pa.field(name, pa.string(), metadata={_EXTENSION_NAME: _JSON_EXTENSION}), column
+
+
+def to_arrow(
+    collection: Union[FeatureCollectionModel, ColumnarFeatureCollection],
+    *,
+    geometry_encoding: GeometryEncoding = "auto",
+) -> pa.Table:
+    """Export a collection as an Arrow table.
+
+    Args:
+        collection: The collection, as a model or in columnar form. Buffers
+            of a columnar collection are shared with the table.
+        geometry_encoding: ``"native"`` for the GeoArrow native encoding,
+            ``"wkb"`` for WKB, or ``"auto"`` for native when possible.
+
+    Returns:
+        A table with the property columns, an ``id`` column if any feature
+        has an id, and a ``geometry`` column. Bounding boxes and foreign
+        members are not exported. A property named ``id`` is written as the
+        ``id`` column when no feature has an id; the column is then marked as
+        a property, so that ``from_arrow`` reads it back as one.
+
+    Raises:
+        ValueError: If a property is named ``geometry``, a property is named
+            ``id`` while features have ids, or the native encoding is requested
+            for geometries of mixed types.
+    """
+    columnar = (
+        collection
+        if isinstance(collection, ColumnarFeatureCollection)
+        else ColumnarFeatureCollection.from_model(collection)
+    )
+    fields = []
+    columns = []
+    has_ids = any(feature_id is not None for feature_id in columnar.ids)
+    if has_ids:
+        field, column = _value_column(ID_COLUMN, columnar.ids)
+        fields.append(field)
+        columns.append(column)
+    for name in columnar.column_names:
+        if name == GEOMETRY_COLUMN or (name == ID_COLUMN and has_ids):
+            raise ValueError(f"Property {name!r} clashes with the {name!r} column")
+        field, column = _value_column(name, columnar.column(name))
+        if name == ID_COLUMN:
+            field = _as_property(field)
+        fields.append(field)
+        columns.append(column)
+    field, column = _geometry_column(columnar, geometry_encoding)
+    fields.append(field)
+    columns.append(column)
+    return pa.Table.from_arrays(columns, schema=pa.schema(fields))
+
+
+def geometries_to_arrow(
+    geometries: Iterable[Any], *, geometry_encoding: GeometryEncoding = "auto"
+) -> pa.Table:
+    """Export geometry models as a table with a single ``geometry`` column.
+
+    Args:
+        geometries: Geometry models, or None for null geometries.
+        geometry_encoding: ``"native"``, ``"wkb"`` or ``"auto"``, as for ``to_arrow``.
+
+    Returns:
+        The table.
+    """
+    columnar = ColumnarFeatureCollection.from_geometries(geometries)
+    field, column = _geometry_column(columnar, geometry_encoding)
+    return pa.Table.from_arrays([column], schema=pa.schema([field]))
+
+
+def write_ipc(
+    collection: Union[FeatureCollectionModel, ColumnarFeatureCollection],
+    sink: Any,
+    *,
+    geometry_encoding: GeometryEncoding = "auto",
+) -> None:
+    """Write a collection as an Arrow IPC file (also known as Feather v2).
+
+    Args:
+        collection: The collection, as a model or in columnar form.
+        sink: A path, a pyarrow NativeFile or a writable binary file object.
+        geometry_encoding: ``"native"``, ``"wkb"`` or ``"auto"``, as for ``to_arrow``.
+    """
+    table = to_arrow(collection, geometry_encoding=geometry_encoding)
+    if isinstance(sink, os.PathLike):
+        sink = os.fspath(sink)
+    with pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+
+
+# ---------------------------------------------------------------------------
+# Import
+# ---------------------------------------------------------------------------
+
+
+def _as_property(field: pa.Field) -> pa.Field:
+    return field.with_metadata({**(field.metadata or {}), _PROPERTY_METADATA: b"true"})
+
+
+def _is_property(field: pa.Field) -> bool:
+    return (field.metadata or {}).get(_PROPERTY_METADATA) == b"true"
+
+
+def _extension_name(field: pa.Field) -> Optional[str]:
+    if isinstance(field.type, pa.BaseExtensionType):
+        return str(field.type.extension_name)
+    name = (field.metadata or {}).get(_EXTENSION_NAME)
+    return name.decode() if name is not None else None
+
+
+def _storage(column: Union[pa.Array, pa.ChunkedArray]) -> pa.Array:
+    if isinstance(column, pa.ChunkedArray):
+        column = column.combine_chunks()
+    if isinstance(column, pa.ExtensionArray):
+        column = column.storage
+    return column
+
+
+def _values(arrow_array: pa.Array, typecode: str) -> array:
+    """Copy the values of a primitive Arrow array into a stdlib array, in bulk."""
+    values = array(typecode)
+    size = values.itemsize
+    start = arrow_array.offset * size
+    values.frombytes(memoryview(arrow_array.buffers()[1])[start : start + len(arrow_array) * size])
+    return values
+
+
+def _list_level(arrow_array: pa.Array) -> tuple[array, pa.Array]:
+    """Offsets of a list array, rebased to start at 0, and its referenced values."""
+    offsets = _values(arrow_array.offsets, "q" if pa.types.is_large_list(arrow_array.type) else "i")
+    start, end = offsets[0], offsets[-1]
+    if start or offsets.typecode != "i":
+        offsets = array("i", [offset - start for offset in offsets])
+    return offsets, arrow_array.values.slice(start, end - start)
+
+
+def _decode_coordinates(coordinates: pa.Array) -> tuple[array, array, Optional[array]]:
+    if pa.types.is_struct(coordinates.type):
+        children = coordinates.flatten()
+        x, y = _values(children[0], "d"), _values(children[1], "d")
+        z = _values(children[2], "d") if len(children) > 2 else None
+        return x, y, z
+    # Interleaved encoding: fixed_size_list<double>[2 or 3].
+    dims = coordinates.type.list_size
+    flat = _values(coordinates.flatten(), "d")
+    return flat[0::dims], flat[1::dims], flat[2::dims] if dims > 2 else None
+
+
+def _compact(offsets: array, nulls: list[bool]) -> array:
+    """Drop the entries of null geometries from feature-level offsets."""
+    if not any(nulls):
+        return offsets
+    compact = array("i", [offsets[0]])
+    for index, null in enumerate(nulls):
+        if not null:
+            compact.append(offsets[index + 1])
+        elif offsets[index] != offsets[index + 1]:
+            raise ValueError(f"Null geometry {index} has coordinates")
+    return compact
+
+
+def _decode_native(column: pa.Array, code: int) -> ColumnarFeatureCollection:
+    nulls = column.is_null().to_pylist()
+    valid_count = nulls.count(False)
+    identity = array("i", range(valid_count + 1))
+    levels = []
+    values = column
+    for _ in _LEVEL_NAMES[code]:
+        offsets, values = _list_level(values)
+        levels.append(offsets)
+    x, y, z = _decode_coordinates(values)
+    if code == 1:
+        if any(nulls):
+            keep = [index for index, null in enumerate(nulls) if not null]
+            x, y = (array("d", [values[index] for index in keep]) for values in (x, y))
+            if z is not None:
+                z = array("d", [z[index] for index in keep])
+        geometry_offsets, part_offsets, ring_offsets = identity, identity, identity
+    elif code in (2, 4):
+        geometry_offsets, part_offsets = identity, identity
+        ring_offsets = _compact(levels[0], nulls)
+    elif code == 3:
+        geometry_offsets = identity
+        part_offsets, ring_offsets = _compact(levels[0], nulls), levels[1]
+    elif code == 5:
+        geometry_offsets = _compact(levels[0], nulls)
+        part_offsets, ring_offsets = array("i", range(len(levels[1]))), levels[1]
+    else:
+        geometry_offsets = _compact(levels[0], nulls)
+        part_offsets, ring_offsets = levels[1], levels[2]
+    member_offsets = array("i", [0])
+    for null in nulls:
+        member_offsets.append(member_offsets[-1] + (not null))
+    if z is not None and not any(1 for alt in z if alt == alt):
+        z = None
+    return ColumnarFeatureCollection._from_buffers(
+        x=x,
+        y=y,
+        z=z,
+        geometry_types=array("B", [0 if null else code for null in nulls]),
+        member_types=array("B", [code]) * valid_count,
+        member_offsets=member_offsets,
+        geometry_offsets=geometry_offsets,
+        part_offsets=part_offsets,
+        ring_offsets=ring_offsets,
+    )
+
+
+def _geometry_field(schema: pa.Schema, geometry_column: Optional[str]) -> pa.Field:
+    if geometry_column is not None:
+        return schema.field(geometry_column)
+    for field in schema:
+        name = _extension_name(field)
+        if name is not None and name.startswith("geoarrow."):
+            return field
+    return schema.field(GEOMETRY_COLUMN)
+
+
+def _decode_geometries(field: pa.Field, column: pa.Array) -> list[Optional[dict[str, Any]]]:
+    extension = _extension_name(field)
+    if extension in _NATIVE_CODES:
+        columnar = _decode_native(column, _NATIVE_CODES[extension])
+        return [columnar.geometry(index) for index in range(len(columnar))]
+    if extension not in (None, _WKB_EXTENSION) or not (
+        pa.types.is_binary(column.type) or pa.types.is_large_binary(column.type)
+    ):
+        raise ValueError(f"Unsupported geometry column {field.name!r} of type {field.type}")
+    return [None if data is None else _wkb.loads(data) for data in column.to_pylist()]
+
+
+def _decode_values(field: pa.Field, column: pa.Array) -> list[Any]:
+    values: list[Any] = column.to_pylist()
+    if _extension_name(field) == _JSON_EXTENSION:
+        values = [None if value is None else json.loads(value) for value in values]
+    return values
+
+
+def _features(table: pa.Table, geometry_column: Optional[str]) -> list[dict[str, Any]]:
+    """Decode the rows of ``table`` into Feature objects."""
+    schema = table.schema
+    geometry_field = _geometry_field(schema, geometry_column)
+    geometries = _decode_geometries(geometry_field, _storage(table.column(geometry_field.name)))
+    columns = {
+        field.name: _decode_values(field, _storage(table.column(field.name)))
+        for field in schema
+        if field.name != geometry_field.name
+    }
+    id_property = ID_COLUMN in schema.names and _is_property(schema.field(ID_COLUMN))
+    ids = None if id_property else columns.pop(ID_COLUMN, None)
+    features = []
+    for index, geometry in enumerate(geometries):
+        feature = {
+            "type": "Feature",
+            "geometry": geometry,
+            "properties": {
+                name: values[index] for name, values in columns.items() if values[index] is not None
+            },
+        }
+        if ids is not None and ids[index] is not None:
+            feature["id"] = ids[index]
+        features.append(feature)
+    return features
+
+
+def from_arrow(
+    table: pa.Table,
+    *,
+    model: type[FeatureCollectionModel] = FeatureCollectionModel,
+    geometry_column: Optional[str] = None,
+) -> FeatureCollectionModel:
+    """Import a table exported by ``to_arrow`` or another GeoArrow producer.
+
+    Native GeoArrow geometry columns (separated or interleaved coordinates)
+    and WKB columns are supported. Null property values are left out of the
+    feature properties.
+
+    Args:
+        table: The table.
+        model: The collection model to validate against.
+        geometry_column: Name of the geometry column; by default the first
+            column with a GeoArrow extension name, else ``geometry``.
+
+    Returns:
+        The validated collection.
+
+    Raises:
+        ValidationError: If the decoded collection is invalid.
+        ValueError: If the geometry column cannot be decoded.
+        KeyError: If there is no geometry column.
+    """
+    features = _features(table, geometry_column)
+    return validate_fail_fast(model, {"type": "FeatureCollection", "features": features})
+
+
+def geometries_from_arrow(table: pa.Table, *, geometry_column: Optional[str] = None) -> list[Any]:
+    """Import the geometries of a table as geometry models.
+
+    Args:
+        table: The table.
+        geometry_column: Name of the geometry column, as for ``from_arrow``.
+
+    Returns:
+        One geometry model, or None for null geometries, per row.
+
+    Raises:
+        ValidationError: If a geometry is invalid.
+    """
+    field = _geometry_field(table.schema, geometry_column)
+    geometries = _decode_geometries(field, _storage(table.column(field.name)))
+    features = [{"type": "Feature", "geometry": geometry} for geometry in geometries]
+    collection = validate_fail_fast(
+        FeatureCollectionModel, {"type": "FeatureCollection", "features": features}
+    )
+    return [feature.geometry for feature in collection.features]
+
+
+def read_ipc(
+    source: Any,
+    *,
+    model: type[FeatureCollectionModel] = FeatureCollectionModel,
+    geometry_column: Optional[str] = None,
+) -> FeatureCollectionModel:
+    """Read a collection from an Arrow IPC file.
+
+    Args:
+        source: A path (memory-mapped), a pyarrow NativeFile, a buffer or a
+            readable binary file object.
+        model: The collection model to validate against.
+        geometry_column: Name of the geometry column, as for ``from_arrow``.
+
+    Returns:
+        The validated collection.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        source = pa.memory_map(os.fspath(source))
+    with pa.ipc.open_file(source) as reader:
+        table = reader.read_all()
+    return from_arrow(table, model=model, geometry_column=geometry_column)
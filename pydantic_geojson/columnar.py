@@ -0,0 +1,614 @@
+"""Columnar (struct-of-arrays) storage for FeatureCollections.
+
+A ``FeatureCollectionModel`` holds one ``FeatureModel`` per feature, each with
+its own geometry model, coordinate tuples and properties dictionary. Reading a
+single property or the extent of every feature means visiting all of them.
+``ColumnarFeatureCollection`` stores the same collection the way GeoArrow
+does: positions in flat coordinate buffers, the geometry structure as offset
+arrays, geometry types as a code array and each property as a column.
+
+Example:
+    ```python
+    from pydantic_geojson.columnar import ColumnarFeatureCollection
+
+    columns = ColumnarFeatureCollection.from_model(collection)
+    populations = columns.column("population")
+    big = columns.filter([p is not None and p > 1_000_000 for p in populations])
+    europe = big.filter(big.intersects([-25, 34, 45, 72]))
+    collection = europe.to_model()
+    ```
+"""
+
+import copy
+import math
+from array import array
+from collections.abc import Iterable, Sequence
+from typing import Any, Optional
+
+from pydantic import BaseModel
+
+from .fail_fast import validate_fail_fast
+from .feature_collection import FeatureCollectionModel
+from .packed import PackedCoordinates
+
+# Geometry type codes, as in WKB and GeoArrow. Code 0 stands for a null geometry.
+GEOMETRY_TYPE_CODES = {
+    "Point": 1,
+    "LineString": 2,
+    "Polygon": 3,
+    "MultiPoint": 4,
+    "MultiLineString": 5,
+    "MultiPolygon": 6,
+    "GeometryCollection": 7,
+}
+_GEOMETRY_TYPES = {code: name for name, code in GEOMETRY_TYPE_CODES.items()}
+_GEOMETRY_COLLECTION = GEOMETRY_TYPE_CODES["GeometryCollection"]
+
+# Members stored in the buffers; all other members are kept as they are.
+_GEOMETRY_MEMBERS = frozenset({"type", "coordinates", "geometries"})
+_FEATURE_MEMBERS = frozenset({"type", "geometry", "properties", "id"})
+_COLLECTION_MEMBERS = frozenset({"type", "features"})
+
+
+def _extras(model: BaseModel, stored: frozenset[str]) -> Optional[dict[str, Any]]:
+    """Members of ``model`` that were set and are not stored in the buffers."""
+    extras = {name: getattr(model, name) for name in model.model_fields_set if name not in stored}
+    return extras or None
+
+
+def _parts(code: int, coordinates: Any) -> Any:
+    """Coordinates of a geometry as a list of parts, each a list of position sequences."""
+    if code == 1:
+        return [[[coordinates]]]
+    if code in (2, 4):
+        return [[coordinates]]
+    if code == 3:
+        return [coordinates]
+    if code == 5:
+        return [[line] for line in coordinates]
+    return coordinates
+
+
+def box_intersects(bounds: Sequence[float], bbox: Sequence[float]) -> bool:
+    """Return whether the box ``bounds`` intersects ``bbox``.
+
+    Args:
+        bounds: ``[west, south, east, north]`` with ``west <= east``; NaN
+            bounds intersect nothing.
+        bbox: ``[west, south, east, north]``; ``west > east`` denotes a box
+            crossing the antimeridian.
+
+    Returns:
+        True if the boxes share at least one point.
+    """
+    min_x, min_y, max_x, max_y = bounds
+    west, south, east, north = bbox
+    if not (min_y <= north and max_y >= south):
+        return False
+    if west <= east:
+        return min_x <= east and max_x >= west
+    return max_x >= west or min_x <= east
+
+
+class ColumnarFeatureCollection:
+    """A FeatureCollection stored as flat buffers and property columns.
+
+    Geometries are stored with the GeoArrow layout, extended by one level so
+    that a feature can hold the members of a GeometryCollection:
+
+    - ``member_offsets``: feature ``i`` holds the member geometries
+      ``member_offsets[i]:member_offsets[i + 1]``; one for a plain geometry,
+      none for a null geometry.
+    - ``geometry_offsets``: parts of each member geometry (the polygons of a
+      MultiPolygon, the lines of a MultiLineString, one part otherwise).
+    - ``part_offsets``: rings of each part (the rings of a polygon, one
+      position sequence otherwise).
+    - ``ring_offsets``: positions of each ring, indexing ``x``, ``y`` and ``z``.
+
+    Geometry types are stored per feature in ``geometry_types`` and per member
+    geometry in ``member_types``, as ``GEOMETRY_TYPE_CODES``. Properties are
+    stored per name as columns holding None where a feature lacks the
+    property. Ids, bounding boxes and foreign members are kept, so
+    ``from_model`` followed by ``to_model`` gives an equal collection; numbers
+    read back as floats. Nested GeometryCollections are not supported.
+
+    Collections returned by ``filter`` and ``take`` hold copies of the
+    selected data. The buffers can be handed to other libraries as they are;
+    treat them as read-only.
+
+    Attributes:
+        x: Longitudes of all positions, ``array("d")``.
+        y: Latitudes of all positions, ``array("d")``.
+        z: Altitudes of all positions with NaN for positions without one, or
+            None if no position has an altitude.
+        geometry_types: Geometry type code of each feature, ``array("B")``.
+        member_types: Geometry type code of each member geometry, ``array("B")``.
+        member_offsets: Offsets into the member geometries, ``array("i")``.
+        geometry_offsets: Offsets into the parts, ``array("i")``.
+        part_offsets: Offsets into the rings, ``array("i")``.
+        ring_offsets: Offsets into the positions, ``array("i")``.
+        ids: Feature ids, None where a feature has no id.
+    """
+
+    __slots__ = (
+        "x",
+        "y",
+        "z",
+        "geometry_types",
+        "member_types",
+        "member_offsets",
+        "geometry_offsets",
+        "part_offsets",
+        "ring_offsets",
+        "ids",
+        "_columns",
+        "_present",
+        "_null_properties",
+        "_feature_extras",
+        "_geometry_extras",
+        "_member_extras",
+        "_collection_extras",
+        "_bounds",
+    )
+
+    def __init__(self) -> None:
+        self.x = array("d")
+        self.y = array("d")
+        self.z: Optional[array] = array("d")
+        self.geometry_types = array("B")
+        self.member_types = array("B")
+        self.member_offsets = array("i", [0])
+        self.geometry_offsets = array("i", [0])
+        self.part_offsets = array("i", [0])
+        self.ring_offsets = array("i", [0])
+        self.ids: list[Any] = []
+        self._columns: dict[str, list[Any]] = {}
+        # Per column flags of the features that have the property; only for
+        # columns where some feature lacks it.
+        self._present: dict[str, bytearray] = {}
+        self._null_properties = bytearray()
+        self._feature_extras: list[Optional[dict[str, Any]]] = []
+        self._geometry_extras: list[Optional[dict[str, Any]]] = []
+        self._member_extras: list[Optional[dict[str, Any]]] = []
+        self._collection_extras: Optional[dict[str, Any]] = None
+        self._bounds: Optional[array] = None
+
+    @classmethod
+    def from_model(cls, collection: FeatureCollectionModel) -> "ColumnarFeatureCollection":
+        """Build the columnar form of a validated collection.
+
+        Args:
+            collection: The collection; typed properties models are stored as
+                their ``model_dump()``.
+
+        Returns:
+            The columnar collection.
+
+        Raises:
+            ValueError: If a feature holds a nested GeometryCollection.
+        """
+        columnar = cls.from_features(collection.features)
+        columnar._collection_extras = _extras(collection, _COLLECTION_MEMBERS)
+        return columnar
+
+    @classmethod
+    def from_features(cls, features: Iterable[BaseModel]) -> "ColumnarFeatureCollection":
+        """Build the columnar form of validated features, e.g. a slice of a stream.
+
+        Args:
+            features: FeatureModel instances (or of a subclass).
+
+        Returns:
+            The columnar collection.
+
+        Raises:
+            ValueError: If a feature holds a nested GeometryCollection.
+        """
+        columnar = cls()
+        for feature in features:
+            columnar._append_feature(feature)
+        columnar._finish()
+        return columnar
+
+    @classmethod
+    def from_geometries(
+        cls, geometries: Iterable[Optional[BaseModel]]
+    ) -> "ColumnarFeatureCollection":
+        """Build the columnar form of geometry models, one feature per geometry.
+
+        Args:
+            geometries: Validated geometry models, or None for null geometries.
+
+        Returns:
+            The columnar collection, without properties.
+
+        Raises:
+            ValueError: If a geometry is a nested GeometryCollection.
+        """
+        columnar = cls()
+        for geometry in geometries:
+            columnar._append_geometry(geometry)
+            columnar.ids.append(None)
+            columnar._feature_extras.append(None)
+            columnar._null_properties.append(1)
+        columnar._finish()
+        return columnar
+
+    @classmethod
+    def _from_buffers(cls, **buffers: Any) -> "ColumnarFeatureCollection":
+        """Wrap geometry buffers decoded elsewhere, e.g. from Arrow, without properties."""
+        columnar = cls()
+        for name, buffer in buffers.items():
+            setattr(columnar, name, buffer)
+        count = len(columnar.geometry_types)
+        columnar.ids = [None] * count
+        columnar._feature_extras = [None] * count
+        columnar._geometry_extras = [None] * count
+        columnar._member_extras = [None] * len(columnar.member_types)
+        columnar._null_properties = bytearray(b"\x01") * count
+        return columnar
+
+    def _append_feature(self, feature: BaseModel) -> None:
+        row = len(self.geometry_types)
+        self._append_geometry(feature.geometry)  # type: ignore[attr-defined]
+        self.ids.append(feature.id)  # type: ignore[attr-defined]
+        self._feature_extras.append(_extras(feature, _FEATURE_MEMBERS))
+        properties = feature.properties  # type: ignore[attr-defined]
+        if isinstance(properties, BaseModel):
+            properties = properties.model_dump()
+        if properties is None:
+            self._null_properties.append(1)
+            return
+        self._null_properties.append(0)
+        for name, value in properties.items():
+            column = self._columns.get(name)
+            if column is None:
+                column = self._columns[name] = []
+            if len(column) < row:
+                self._pad(name, row)
+            column.append(value)
+            present = self._present.get(name)
+            if present is not None:
+                present.append(1)
+
+    def _append_geometry(self, geometry: Any) -> None:
+        row = len(self.geometry_types)
+        if geometry is None:
+            self.geometry_types.append(0)
+            self._geometry_extras.append(None)
+        else:
+            code = GEOMETRY_TYPE_CODES[geometry.type]
+            self.geometry_types.append(code)
+            self._geometry_extras.append(_extras(geometry, _GEOMETRY_MEMBERS))
+            if code == _GEOMETRY_COLLECTION:
+                for member in geometry.geometries:
+                    if member.type == "GeometryCollection":
+                        raise ValueError(
+                            f"Feature {row} holds a nested GeometryCollection, "
+                            "which cannot be stored in columnar form"
+                        )
+                    self._append_member(member.type, member.coordinates)
+                    self._member_extras.append(_extras(member, _GEOMETRY_MEMBERS))
+            else:
+                self._append_member(geometry.type, geometry.coordinates)
+                self._member_extras.append(None)
+        self.member_offsets.append(len(self.member_types))
+
+    def _append_member(self, geometry_type: str, coordinates: Any) -> None:
+        code = GEOMETRY_TYPE_CODES[geometry_type]
+        self.member_types.append(code)
+        for part in _parts(code, coordinates):
+            for ring in part:
+                self._append_positions(ring)
+                self.ring_offsets.append(len(self.x))
+            self.part_offsets.append(len(self.ring_offsets) - 1)
+        self.geometry_offsets.append(len(self.part_offsets) - 1)
+
+    def _append_positions(self, positions: Sequence[Any]) -> None:
+        assert self.z is not None
+        if isinstance(positions, PackedCoordinates):
+            self.x.extend(positions.lons)
+            self.y.extend(positions.lats)
+            alts = positions.alts
+            self.z.extend(alts if alts is not None else [math.nan] * len(positions))
+            return
+        self.x.extend([position[0] for position in positions])
+        self.y.extend([position[1] for position in positions])
+        self.z.extend(
+            [
+                math.nan if len(position) < 3 or position[2] is None else position[2]
+                for position in positions
+            ]
+        )
+
+    def _pad(self, name: str, length: int) -> None:
+        """Fill column ``name`` up to ``length`` rows with absent values."""
+        column = self._columns[name]
+        present = self._present.get(name)
+        if present is None:
+            present = self._present[name] = bytearray(b"\x01") * len(column)
+        missing = length - len(column)
+        column.extend([None] * missing)
+        present.extend(bytes(missing))
+
+    def _finish(self) -> None:
+        for name, column in self._columns.items():
+            if len(column) < len(self):
+                self._pad(name, len(self))
+        if not any(1 for alt in self.z or () if alt == alt):
+            self.z = None
+        if not any(self._null_properties):
+            self._null_properties = bytearray()
+
+    def __len__(self) -> int:
+        return len(self.geometry_types)
+
+    def __repr__(self) -> str:
+        return (
+            f"ColumnarFeatureCollection({len(self)} features, {len(self.x)} positions, "
+            f"columns={self.column_names!r})"
+        )
+
+    @property
+    def column_names(self) -> list[str]:
+        """Names of the property columns, in order of first appearance."""
+        return list(self._columns)
+
+    def column(self, name: str) -> list[Any]:
+        """Return the values of property ``name``, one per feature.
+
+        Features without the property, or with null properties, hold None.
+        The list is shared with the collection; copy it before modifying it.
+
+        Raises:
+            KeyError: If no feature has the property.
+        """
+        return self._columns[name]
+
+    def geometry_type(self, index: int) -> Optional[str]:
+        """Return the geometry type name of feature ``index``, or None for a null geometry."""
+        return _GEOMETRY_TYPES.get(self.geometry_types[index])
+
+    def _position_range(self, index: int) -> tuple[int, int]:
+        parts = self.geometry_offsets
+        rings = self.part_offsets
+        positions = self.ring_offsets
+        start = positions[rings[parts[self.member_offsets[index]]]]
+        end = positions[rings[parts[self.member_offsets[index + 1]]]]
+        return start, end
+
+    @property
+    def bounds(self) -> array:
+        """Bounding boxes of the features, flat ``[west, south, east, north, ...]``.
+
+        Features without positions have NaN bounds. Computed once on first access.
+        """
+        if self._bounds is None:
+            bounds = array("d")
+            x, y = self.x, self.y
+            for index in range(len(self)):
+                start, end = self._position_range(index)
+                if start == end:
+                    bounds.extend((math.nan,) * 4)
+                else:
+                    xs = x[start:end]
+                    ys = y[start:end]
+                    bounds.extend((min(xs), min(ys), max(xs), max(ys)))
+            self._bounds = bounds
+        return self._bounds
+
+    @property
+    def total_bounds(self) -> Optional[tuple[float, float, float, float]]:
+        """Bounding box ``(west, south, east, north)`` of all positions, or None if there are none."""
+        if not self.x:
+            return None
+        return min(self.x), min(self.y), max(self.x), max(self.y)
+
+    def intersects(self, bbox: Sequence[float]) -> list[bool]:
+        """Return a mask of the features whose bounds intersect ``bbox``.
+
+        Args:
+            bbox: ``[west, south, east, north]``; ``west > east`` denotes a box
+                crossing the antimeridian.
+
+        Returns:
+            One flag per feature, for use with ``filter``.
+        """
+        bounds = self.bounds
+        return [
+            box_intersects(bounds[offset : offset + 4], bbox) for offset in range(0, len(bounds), 4)
+        ]
+
+    def with_coordinates(self, x: array, y: array) -> "ColumnarFeatureCollection":
+        """Return the collection with other x and y buffers, e.g. reprojected ones.
+
+        Every other buffer and column is shared with this collection, not copied.
+
+        Args:
+            x: New ``array("d")`` of x coordinates, one per position.
+            y: New ``array("d")`` of y coordinates, one per position.
+
+        Returns:
+            The new collection.
+
+        Raises:
+            ValueError: If a buffer does not hold one value per position.
+        """
+        if len(x) != len(self.x) or len(y) != len(self.y):
+            raise ValueError(
+                f"Expected {len(self.x)} coordinates, got {len(x)} x and {len(y)} y values"
+            )
+        result = copy.copy(self)
+        result.x = x
+        result.y = y
+        result._bounds = None
+        return result
+
+    def filter(self, mask: Sequence[bool]) -> "ColumnarFeatureCollection":
+        """Return the features whose flag in ``mask`` is true.
+
+        Args:
+            mask: One flag per feature.
+
+        Returns:
+            A new columnar collection.
+
+        Raises:
+            ValueError: If ``mask`` does not have one flag per feature.
+        """
+        if len(mask) != len(self):
+            raise ValueError(f"Mask has {len(mask)} flags for {len(self)} features")
+        return self.take([index for index, keep in enumerate(mask) if keep])
+
+    def take(self, indices: Iterable[int]) -> "ColumnarFeatureCollection":
+        """Return the features at ``indices``, in that order.
+
+        Coordinates are copied slice by slice and offsets are rebased, without
+        building any model.
+
+        Args:
+            indices: Feature indices; may repeat.
+
+        Returns:
+            A new columnar collection.
+        """
+        indices = list(indices)
+        result = type(self)()
+        result._collection_extras = self._collection_extras
+        members, parts, rings, positions = (
+            self.member_offsets,
+            self.geometry_offsets,
+            self.part_offsets,
+            self.ring_offsets,
+        )
+        for index in indices:
+            member_start, member_end = members[index], members[index + 1]
+            part_start, part_end = parts[member_start], parts[member_end]
+            ring_start, ring_end = rings[part_start], rings[part_end]
+            start, end = positions[ring_start], positions[ring_end]
+
+            shift = len(result.x) - start
+            result.ring_offsets.extend(
+                [offset + shift for offset in positions[ring_start + 1 : ring_end + 1]]
+            )
+            shift = len(result.ring_offsets) - 1 - (ring_end - ring_start) - ring_start
+            result.part_offsets.extend(
+                [offset + shift for offset in rings[part_start + 1 : part_end + 1]]
+            )
+            shift = len(result.part_offsets) - 1 - (part_end - part_start) - part_start
+            result.geometry_offsets.extend(
+                [offset + shift for offset in parts[member_start + 1 : member_end + 1]]
+            )
+            result.member_types.extend(self.member_types[member_start:member_end])
+            result._member_extras.extend(self._member_extras[member_start:member_end])
+            result.member_offsets.append(len(result.member_types))
+
+            result.x.extend(self.x[start:end])
+            result.y.extend(self.y[start:end])
+            if self.z is not None:
+                assert result.z is not None
+                result.z.extend(self.z[start:end])
+            result.geometry_types.append(self.geometry_types[index])
+            result._geometry_extras.append(self._geometry_extras[index])
+            result._feature_extras.append(self._feature_extras[index])
+            result.ids.append(self.ids[index])
+        if self.z is None:
+            result.z = None
+        result._columns = {
+            name: [column[index] for index in indices] for name, column in self._columns.items()
+        }
+        result._present = {
+            name: bytearray([present[index] for index in indices])
+            for name, present in self._present.items()
+        }
+        if self._null_properties:
+            result._null_properties = bytearray([self._null_properties[index] for index in indices])
+        return result
+
+    def _positions(self, ring: int) -> list[list[float]]:
+        start, end = self.ring_offsets[ring], self.ring_offsets[ring + 1]
+        xs, ys = self.x[start:end], self.y[start:end]
+        if self.z is None:
+            return [[x, y] for x, y in zip(xs, ys)]
+        return [[x, y] if z != z else [x, y, z] for x, y, z in zip(xs, ys, self.z[start:end])]
+
+    def _member(self, member: int) -> dict[str, Any]:
+        code = self.member_types[member]
+        parts = [
+            [
+                self._positions(ring)
+                for ring in range(self.part_offsets[part], self.part_offsets[part + 1])
+            ]
+            for part in range(self.geometry_offsets[member], self.geometry_offsets[member + 1])
+        ]
+        if code == 1:
+            coordinates: Any = parts[0][0][0]
+        elif code in (2, 4):
+            coordinates = parts[0][0]
+        elif code == 3:
+            coordinates = parts[0]
+        elif code == 5:
+            coordinates = [part[0] for part in parts]
+        else:
+            coordinates = parts
+        return {"type": _GEOMETRY_TYPES[code], "coordinates": coordinates}
+
+    def geometry(self, index: int) -> Optional[dict[str, Any]]:
+        """Return the geometry of feature ``index`` as a GeoJSON object, or None."""
+        code = self.geometry_types[index]
+        members = range(self.member_offsets[index], self.member_offsets[index + 1])
+        geometry: Optional[dict[str, Any]]
+        if code == 0:
+            geometry = None
+        elif code == _GEOMETRY_COLLECTION:
+            geometry = {
+                "type": "GeometryCollection",
+                "geometries": [
+                    {**self._member(member), **(self._member_extras[member] or {})}
+                    for member in members
+                ],
+            }
+        else:
+            geometry = self._member(members[0])
+        if geometry is not None and self._geometry_extras[index]:
+            geometry.update(self._geometry_extras[index])  # type: ignore[arg-type]
+        return geometry
+
+    def _feature(self, index: int) -> dict[str, Any]:
+        properties: Optional[dict[str, Any]] = None
+        if not (self._null_properties and self._null_properties[index]):
+            present = self._present
+            properties = {
+                name: column[index]
+                for name, column in self._columns.items()
+                if name not in present or present[name][index]
+            }
+        feature = {"type": "Feature", "geometry": self.geometry(index), "properties": properties}
+        if self.ids[index] is not None:
+            feature["id"] = self.ids[index]
+        if self._feature_extras[index]:
+            feature.update(self._feature_extras[index])  # type: ignore[arg-type]
+        return feature
+
+    def to_model(
+        self, model: type[FeatureCollectionModel] = FeatureCollectionModel
+    ) -> FeatureCollectionModel:
+        """Build the collection model.
+
+        Args:
+            model: The collection model, FeatureCollectionModel, a parameterized
+                FeatureCollectionModel or a subclass.
+
+        Returns:
+            The validated collection.
+        """
+        # Fail-fast validation dispatches each geometry on its type instead of
+        # trying every member of the geometry union.
+        return validate_fail_fast(
+            model,
+            {
+                "type": "FeatureCollection",
+                **(self._collection_extras or {}),
+                "features": [self._feature(index) for index in range(len(self))],
+            },
+        )
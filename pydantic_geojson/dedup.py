@@ -0,0 +1,190 @@
+"""Deduplication of features and geometries.
+
+``unique_features`` drops the repeats from a stream of features, in one pass,
+keeping the first of each. Features are compared by one of three keys:
+
+- ``"id"``: the ``id`` member; features without an id are all kept.
+- ``"geometry"``: the content hash of the geometry, so identical geometries
+  with different ids or properties are repeats; features without a geometry
+  are all kept.
+- ``"content"``: the content hash of the geometry and the properties, so
+  exact repeats are dropped whatever their ids.
+
+Example:
+    ```python
+    from pydantic_geojson.dedup import deduplicate, unique_features
+
+    merged = deduplicate(collection, "geometry", tolerance=1e-9)
+    with open("feed.geojsonl") as lines:
+        features = (FeatureModel.model_validate_json(line) for line in lines)
+        for feature in unique_features(features, window=1_000_000):
+            ...
+    ```
+
+Only the keys of the features seen so far are kept, not the features: 16
+bytes of digest, or the id, per distinct feature. With a ``window``, only the
+keys of the most recently seen distinct features are kept, which bounds the
+memory and finds the repeats that are at most about ``window`` distinct
+features apart, as in feeds where duplicates arrive close together.
+
+Content hashes compare coordinate values exactly (see
+``pydantic_geojson.hashing``). With a relative ``tolerance``, such as
+``1e-9`` for the ``math.isclose`` default used by ``Coordinates.__eq__``,
+values are snapped to a grid first: values that differ by a little more
+than the tolerance may then be repeats, and values that differ by less
+than the tolerance but straddle a grid line are not.
+"""
+
+from collections import OrderedDict
+from collections.abc import Hashable, Iterable, Iterator
+from typing import Any, Literal, Optional, TypeVar
+
+from pydantic import BaseModel
+
+from .feature import FeatureModel
+from .feature_collection import FeatureCollectionModel
+from .hashing import check_tolerance, content_digest
+
+DedupKey = Literal["id", "geometry", "content"]
+
+FeatureT = TypeVar("FeatureT", bound=FeatureModel[Any, Any])
+GeometryT = TypeVar("GeometryT", bound=BaseModel)
+CollectionT = TypeVar("CollectionT", bound=FeatureCollectionModel[Any, Any])
+
+
+class _Seen:
+    """Set of keys, or of the ``window`` most recently seen keys."""
+
+    __slots__ = ("_keys", "_recent", "_window")
+
+    def __init__(self, window: Optional[int]) -> None:
+        if window is not None and window < 1:
+            raise ValueError(f"Window must be at least 1, got {window}")
+        self._keys: set[Hashable] = set()
+        self._recent: OrderedDict[Hashable, None] = OrderedDict()
+        self._window = window
+
+    def add(self, key: Hashable) -> bool:
+        """Add a key; return whether it is new."""
+        if self._window is None:
+            keys = self._keys
+            if key in keys:
+                return False
+            keys.add(key)
+            return True
+        recent = self._recent
+        if key in recent:
+            recent.move_to_end(key)
+            return False
+        recent[key] = None
+        if len(recent) > self._window:
+            recent.popitem(last=False)
+        return True
+
+
+def unique_features(
+    features: Iterable[FeatureT],
+    by: DedupKey = "content",
+    *,
+    tolerance: Optional[float] = None,
+    window: Optional[int] = None,
+) -> Iterator[FeatureT]:
+    """Yield the first of each group of repeated features, in order.
+
+    Args:
+        features: The features, e.g. a list or a generator.
+        by: What makes features repeats: ``"id"``, ``"geometry"``, or
+            ``"content"`` for the geometry and the properties.
+        tolerance: Relative tolerance to snap coordinate values with before
+            hashing, or None to compare them exactly.
+        window: Keep only the keys of this many recently seen distinct
+            features, or None to keep them all.
+
+    Yields:
+        The features that are not repeats of an earlier one.
+
+    Raises:
+        ValueError: If ``by``, ``tolerance`` or ``window`` is invalid.
+    """
+    if by not in ("id", "geometry", "content"):
+        raise ValueError(f"Deduplicate by 'id', 'geometry' or 'content', not {by!r}")
+    check_tolerance(tolerance)
+    seen = _Seen(window)
+    return _unique_features(features, by, tolerance, seen)
+
+
+def _unique_features(
+    features: Iterable[FeatureT], by: DedupKey, tolerance: Optional[float], seen: _Seen
+) -> Iterator[FeatureT]:
+    # Separate from unique_features so that bad arguments raise on the call.
+    for feature in features:
+        key: Hashable
+        if by == "id":
+            key = feature.id
+        elif by == "geometry":
+            geometry = feature.geometry
+            key = None if geometry is None else content_digest(geometry, tolerance=tolerance)
+        else:
+            key = content_digest(feature, tolerance=tolerance)
+        if key is None or seen.add(key):
+            yield feature
+
+
+def unique_geometries(
+    geometries: Iterable[GeometryT],
+    *,
+    tolerance: Optional[float] = None,
+    window: Optional[int] = None,
+) -> Iterator[GeometryT]:
+    """Yield the first of each group of identical geometries, in order.
+
+    Args:
+        geometries: The geometry models.
+        tolerance: Relative tolerance to snap coordinate values with before
+            hashing, or None to compare them exactly.
+        window: Keep only the hashes of this many recently seen distinct
+            geometries, or None to keep them all.
+
+    Yields:
+        The geometries that are not repeats of an earlier one.
+
+    Raises:
+        ValueError: If ``tolerance`` or ``window`` is invalid.
+    """
+    check_tolerance(tolerance)
+    seen = _Seen(window)
+    return (
+        geometry
+        for geometry in geometries
+        if seen.add(content_digest(geometry, tolerance=tolerance))
+    )
+
+
+def deduplicate(
+    collection: CollectionT,
+    by: DedupKey = "content",
+    *,
+    tolerance: Optional[float] = None,
+    window: Optional[int] = None,
+) -> CollectionT:
+    """Return a copy of a collection without repeated features.
+
+    The copy shares the kept feature models with the collection, without
+    validating them again; its other members, including ``bbox``, are
+    copied as they are.
+
+    Args:
+        collection: The collection.
+        by: What makes features repeats, as in ``unique_features``.
+        tolerance: Relative tolerance to snap coordinate values with, as in
+            ``unique_features``.
+        window: Number of recent keys to keep, as in ``unique_features``.
+
+    Returns:
+        The new collection, with the first of each group of repeated features.
+
+    Raises:
+        ValueError: If ``by``, ``tolerance`` or ``window`` is invalid.
+    """
+    features = list(unique_features(collection.features, by, tolerance=tolerance, window=window))
+    return collection.model_copy(update={"features": features})
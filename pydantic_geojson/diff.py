@@ -0,0 +1,163 @@
+"""Structural diff and patch of feature collections.
+
+``diff_collections`` compares two snapshots of a collection and reports the
+features that were added, removed or modified; ``apply_diff`` applies such a
+diff to a collection in place. Features are matched by ``id``, and features
+without an id by a digest of their content (geometry and properties), so a
+changed feature without an id shows up as removed and added. Matching goes
+through dictionaries, in time linear in the size of the collections.
+
+Example:
+    ```python
+    from pydantic_geojson.diff import apply_diff, diff_collections
+
+    diff = diff_collections(yesterday, today)
+    print(len(diff.added), len(diff.removed), len(diff.modified))
+    apply_diff(replica, diff)  # replica now has the features of today
+    ```
+
+Geometries and properties are compared by their content hashes (see
+``pydantic_geojson.hashing``), the same ones that match features without an
+id. They treat ``-0.0`` and ``0.0``, and ``1`` and ``1.0``, as equal but
+otherwise require exact equality, unlike the tolerant ``Coordinates.__eq__``.
+The geometry hashes are cached on the geometries, so diffing against the
+next snapshot only hashes the new one.
+"""
+
+from collections import deque
+from collections.abc import Hashable, Sequence
+from typing import Any, NamedTuple
+
+from .feature import FeatureModel
+from .feature_collection import FeatureCollectionModel
+from .hashing import content_digest, geometry_digest, properties_digest
+
+
+class FeatureChange(NamedTuple):
+    """A feature whose geometry or properties changed.
+
+    Attributes:
+        old: The feature in the old collection.
+        new: The feature in the new collection.
+        geometry: Whether the geometry changed.
+        properties: Whether the properties changed.
+    """
+
+    old: FeatureModel[Any, Any]
+    new: FeatureModel[Any, Any]
+    geometry: bool
+    properties: bool
+
+
+class CollectionDiff(NamedTuple):
+    """Differences between two feature collections.
+
+    Attributes:
+        added: Features only in the new collection, in its order.
+        removed: Features only in the old collection, in its order.
+        modified: Features in both collections with a different geometry or
+            different properties, in the order of the new collection.
+    """
+
+    added: list[FeatureModel[Any, Any]]
+    removed: list[FeatureModel[Any, Any]]
+    modified: list[FeatureChange]
+
+
+def _key(feature: FeatureModel[Any, Any]) -> Hashable:
+    """The id of a feature, or the digest of its content if it has none."""
+    if feature.id is not None:
+        return feature.id
+    return content_digest(feature)
+
+
+def _positions(features: Sequence[FeatureModel[Any, Any]]) -> dict[Hashable, deque[int]]:
+    """Positions of the features by key; repeated keys are matched in order."""
+    positions: dict[Hashable, deque[int]] = {}
+    for position, feature in enumerate(features):
+        key = _key(feature)
+        found = positions.get(key)
+        if found is None:
+            positions[key] = deque((position,))
+        else:
+            found.append(position)
+    return positions
+
+
+def diff_collections(
+    old: FeatureCollectionModel[Any, Any], new: FeatureCollectionModel[Any, Any]
+) -> CollectionDiff:
+    """Compare two feature collections.
+
+    Args:
+        old: The old collection.
+        new: The new collection.
+
+    Returns:
+        The added, removed and modified features.
+    """
+    positions = _positions(old.features)
+    matched = bytearray(len(old.features))
+    added = []
+    modified = []
+    for feature in new.features:
+        found = positions.get(_key(feature))
+        if not found:
+            added.append(feature)
+            continue
+        position = found.popleft()
+        matched[position] = 1
+        if feature.id is None:
+            # Matched by content.
+            continue
+        previous = old.features[position]
+        geometry = geometry_digest(previous.geometry) != geometry_digest(feature.geometry)
+        properties = properties_digest(previous.properties) != properties_digest(feature.properties)
+        if geometry or properties:
+            modified.append(FeatureChange(previous, feature, geometry, properties))
+    removed = [feature for feature, done in zip(old.features, matched) if not done]
+    return CollectionDiff(added, removed, modified)
+
+
+def apply_diff(
+    collection: FeatureCollectionModel[Any, Any], diff: CollectionDiff
+) -> FeatureCollectionModel[Any, Any]:
+    """Apply a diff to a collection in place.
+
+    Removed features are deleted and modified features replaced where they
+    are, matched by id or content like in ``diff_collections``; added
+    features are appended. The collection does not need to be the ``old``
+    collection of the diff, only to have the same features.
+
+    Args:
+        collection: The collection to update.
+        diff: The diff, e.g. from ``diff_collections``.
+
+    Returns:
+        The collection itself.
+
+    Raises:
+        ValueError: If a removed or modified feature is not in the collection;
+            the collection is then left unchanged.
+    """
+    features = collection.features
+    positions = _positions(features)
+
+    def take(feature: FeatureModel[Any, Any], action: str) -> int:
+        found = positions.get(_key(feature))
+        if not found:
+            what = f"id {feature.id!r}" if feature.id is not None else "no id"
+            raise ValueError(
+                f"Cannot apply diff: {action} feature with {what} is not in the collection"
+            )
+        return found.popleft()
+
+    removed = {take(feature, "removed") for feature in diff.removed}
+    replaced = {take(change.old, "modified"): change.new for change in diff.modified}
+    features[:] = [
+        replaced.get(position, feature)
+        for position, feature in enumerate(features)
+        if position not in removed
+    ]
+    features.extend(diff.added)
+    return collection
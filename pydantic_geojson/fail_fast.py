@@ -0,0 +1,71 @@
+"""Fail-fast validation that stops after the first errors.
+
+By default pydantic validates a whole document and reports every error. For
+a large, badly broken FeatureCollection, both the validation of the rest of
+the document and the error entries themselves are wasted work. In fail-fast
+mode features, geometries and the members of GeometryCollections are
+validated one by one and validation stops once ``max_errors`` errors have
+been found.
+
+Geometries are validated against the model matching their ``"type"`` member
+instead of every member of the geometry union, so each reported error has
+the precise location of the offending value, e.g.
+``("features", 12, "geometry", "coordinates", 0, 3, 0)``.
+
+Pass the error budget in the validation context:
+
+Example:
+    ```python
+    from pydantic_geojson import FeatureCollectionModel
+
+    collection = FeatureCollectionModel.model_validate_json(body, context={"max_errors": 1})
+    ```
+"""
+
+from typing import Any, Optional, TypeVar
+
+from pydantic import BaseModel
+
+from ._validation import BudgetExhausted, Errors, validate_model
+
+# Key of the maximum number of errors in the pydantic validation context.
+MAX_ERRORS_CONTEXT_KEY = "max_errors"
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def context_max_errors(context: Any) -> Optional[int]:
+    """Return the maximum number of errors passed in a validation context, if any."""
+    if isinstance(context, dict):
+        return context.get(MAX_ERRORS_CONTEXT_KEY)
+    return None
+
+
+def validate_fail_fast(
+    model: type[ModelT], data: Any, max_errors: int = 1, **kwargs: Any
+) -> ModelT:
+    """Validate ``data`` as ``model``, stopping once ``max_errors`` errors are found.
+
+    Args:
+        model: The model class to validate against.
+        data: The object to validate.
+        max_errors: Number of errors after which validation stops.
+        **kwargs: Passed on to pydantic's ``validate_python``, e.g. ``context``.
+
+    Returns:
+        The validated model.
+
+    Raises:
+        ValidationError: With at most ``max_errors`` errors, if ``data`` is invalid.
+        ValueError: If ``max_errors`` is less than 1.
+    """
+    if max_errors < 1:
+        raise ValueError(f"max_errors must be >= 1, got {max_errors}")
+    errors = Errors(max_errors)
+    try:
+        result = validate_model(model, data, errors, (), kwargs)
+    except BudgetExhausted:
+        result = None
+    if errors.details:
+        raise errors.validation_error(model.__name__)
+    return result  # type: ignore[no-any-return]
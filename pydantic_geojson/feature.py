@@ -1,6 +1,7 @@
-from typing import Any, Optional, Union
+from typing import Any, Generic, Optional, Union
 
 from pydantic import Field, model_validator
+from typing_extensions import TypeVar
 
 from ._base import FeatureFieldType, GeoJSONModel, validate_no_geometry_members
 from .geometry_collection import GeometryCollectionModel
@@ -11,8 +12,22 @@ from .multi_polygon import MultiPolygonModel
 from .point import PointModel
 from .polygon import PolygonModel
 
+GeometryT = TypeVar(
+    "GeometryT",
+    default=Union[
+        PointModel,
+        MultiPointModel,
+        LineStringModel,
+        MultiLineStringModel,
+        PolygonModel,
+        MultiPolygonModel,
+        GeometryCollectionModel,
+    ],
+)
+PropertiesT = TypeVar("PropertiesT", default=dict[str, Any])
 
-class FeatureModel(GeoJSONModel):
+
+class FeatureModel(GeoJSONModel, Generic[GeometryT, PropertiesT]):
     """Represents a Feature object in GeoJSON format.
 
     A Feature object represents a spatially bounded thing. According to RFC 7946
@@ -24,33 +39,32 @@ class FeatureModel(GeoJSONModel):
     A Feature object may have a member named "id". If present, the value of the
     id member is either a JSON string or number.
 
+    The model is generic over its geometry and properties types. Unparameterized
+    it accepts any geometry and a properties dictionary; parameterized, e.g.
+    ``FeatureModel[PointModel, StationProperties]``, it only accepts the given
+    geometry type and validates properties as the given model. Narrowing the
+    geometry union also makes validation faster. Parameterized classes are
+    created once and cached by pydantic.
+
     Attributes:
         type: The object type, must be "Feature".
-        properties: Optional dictionary containing feature properties. Can be
-            any JSON-serializable dictionary or None.
-        geometry: Optional geometry object. Can be any valid GeoJSON geometry
-            type (Point, MultiPoint, LineString, MultiLineString, Polygon,
-            MultiPolygon, GeometryCollection) or None.
+        properties: Optional feature properties. By default any
+            JSON-serializable dictionary, or an instance of the ``PropertiesT``
+            model; or None.
+        geometry: Optional geometry object. By default any valid GeoJSON
+            geometry type (Point, MultiPoint, LineString, MultiLineString,
+            Polygon, MultiPolygon, GeometryCollection), or a ``GeometryT``; or
+            None.
         id: Optional feature identifier. Can be a string or integer, or None.
         bbox: Optional bounding box array.
     """
 
     type: FeatureFieldType
-    properties: Optional[dict[str, Any]] = Field(
+    properties: Optional[PropertiesT] = Field(
         default=None,
         description="A JSON object or JSON null value containing feature properties.",
     )
-    geometry: Optional[
-        Union[
-            PointModel,
-            MultiPointModel,
-            LineStringModel,
-            MultiLineStringModel,
-            PolygonModel,
-            MultiPolygonModel,
-            GeometryCollectionModel,
-        ]
-    ] = Field(
+    geometry: Optional[GeometryT] = Field(
         default=None,
         description="A geometry object as defined above or a JSON null value.",
     )
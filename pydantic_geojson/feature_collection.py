@@ -1,10 +1,20 @@
-from pydantic import Field, model_validator
+from typing import Generic, Optional
 
-from ._base import FeatureCollectionFieldType, GeoJSONModel, validate_no_forbidden_members
-from .feature import FeatureModel
+from pydantic import Field, ValidationInfo, model_validator
+from typing_extensions import Self
 
+from ._base import (
+    FeatureCollectionFieldType,
+    GeoJSONModel,
+    validate_no_forbidden_members,
+)
+from .feature import FeatureModel, GeometryT, PropertiesT
+from .feature_ids import FeatureId, IndexedFeatures, check_unique_ids, context_unique_ids
+from .orientation import rewind_geometry
+from .property_index import PropertyIndex
 
-class FeatureCollectionModel(GeoJSONModel):
+
+class FeatureCollectionModel(GeoJSONModel, Generic[GeometryT, PropertiesT]):
     """Represents a FeatureCollection object in GeoJSON format.
 
     A FeatureCollection object contains a collection of Feature objects. According
@@ -12,6 +22,10 @@ class FeatureCollectionModel(GeoJSONModel):
     "features". The value of "features" is a JSON array. Each element of the array
     is a Feature object as defined above.
 
+    Like FeatureModel, the model is generic over the geometry and properties
+    types of its features: ``FeatureCollectionModel[PointModel, StationProperties]``
+    holds ``FeatureModel[PointModel, StationProperties]`` features.
+
     Attributes:
         type: The object type, must be "FeatureCollection".
         features: An array of Feature objects.
@@ -19,7 +33,7 @@ class FeatureCollectionModel(GeoJSONModel):
     """
 
     type: FeatureCollectionFieldType
-    features: list[FeatureModel] = Field(
+    features: list[FeatureModel[GeometryT, PropertiesT]] = Field(
         ...,
         description="A JSON array of Feature objects. Each element is a Feature "
         "object as defined in RFC 7946 Section 3.2.",
@@ -41,3 +55,72 @@ class FeatureCollectionModel(GeoJSONModel):
             ValueError: If forbidden members are present.
         """
         return validate_no_forbidden_members(cls, data)
+
+    @model_validator(mode="after")
+    def validate_unique_ids(self, info: ValidationInfo) -> Self:
+        """Check that no two features share an id if the context asks for it.
+
+        Args:
+            info: Validation info; the check runs with ``context={"unique_ids": True}``.
+
+        Returns:
+            The validated model.
+
+        Raises:
+            ValueError: Naming every duplicate id with the positions of its features.
+        """
+        if context_unique_ids(info.context):
+            check_unique_ids(self.features)
+        return self
+
+    def get_by_id(self, feature_id: FeatureId) -> Optional[FeatureModel[GeometryT, PropertiesT]]:
+        """Return the feature with the given id, or None.
+
+        The first lookup builds an id index and makes ``features`` an
+        ``IndexedFeatures`` list, which keeps the index up to date as features
+        are added or removed; later lookups take O(1) time. The string ``"1"``
+        and the number ``1`` are different ids.
+
+        Args:
+            feature_id: The id, a string or an integer.
+
+        Returns:
+            The first feature with the id, or None if there is none.
+        """
+        return self._indexed_features().get_by_id(feature_id)
+
+    def property_index(self, key: str) -> PropertyIndex:
+        """Return the index of property ``key`` of the features.
+
+        The index is built in one pass on first use and cached until the
+        features change, like the id index of ``get_by_id``. Its ``equals``
+        and ``between`` queries return the positions of the matching features
+        (see ``pydantic_geojson.property_index``).
+
+        Args:
+            key: The property key.
+
+        Returns:
+            The index.
+        """
+        return self._indexed_features().property_index(key)
+
+    def _indexed_features(self) -> IndexedFeatures[FeatureModel[GeometryT, PropertiesT]]:
+        features = self.features
+        if not isinstance(features, IndexedFeatures):
+            features = self.features = IndexedFeatures(features)
+        return features
+
+    def rewind(self) -> Self:
+        """Reverse, in place, the polygon rings that break the right-hand rule of RFC 7946.
+
+        Polygons and MultiPolygons, also inside GeometryCollections, end up
+        with counterclockwise exterior rings and clockwise holes. Positions are
+        reordered, not copied.
+
+        Returns:
+            The collection itself.
+        """
+        for feature in self.features:
+            rewind_geometry(feature.geometry)
+        return self
@@ -0,0 +1,228 @@
+"""Feature id lookup and uniqueness.
+
+``FeatureCollectionModel.get_by_id`` finds a feature by its ``id`` member in
+O(1) time. The id index is built on the first lookup, in one pass over the
+features, and lives in the collection's ``features`` list, which becomes an
+``IndexedFeatures`` list: appending and extending update the index, other
+changes to the list mark it for a rebuild on the next lookup, and assigning
+a new ``features`` list starts over with a new index.
+
+RFC 7946 allows ids that are JSON strings or numbers, and the string ``"1"``
+and the number ``1`` are different ids; the index keeps them apart.
+
+Uniqueness of ids is not required by RFC 7946 and is checked on demand:
+
+Example:
+    ```python
+    from pydantic_geojson import FeatureCollectionModel
+
+    collection = FeatureCollectionModel.model_validate(data, context={"unique_ids": True})
+    feature = collection.get_by_id("station-12")
+    ```
+"""
+
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any, Optional, SupportsIndex, TypeVar, Union
+
+from .property_index import PropertyIndex
+
+if TYPE_CHECKING:
+    from .feature import FeatureModel
+
+# Key of the unique ids flag in the pydantic validation context.
+UNIQUE_IDS_CONTEXT_KEY = "unique_ids"
+
+FeatureId = Union[int, str]
+FeatureT = TypeVar("FeatureT", bound="FeatureModel[Any, Any]")
+
+
+def context_unique_ids(context: Any) -> bool:
+    """Return whether a validation context asks for unique feature ids."""
+    return isinstance(context, dict) and bool(context.get(UNIQUE_IDS_CONTEXT_KEY))
+
+
+def duplicate_ids(features: Iterable["FeatureModel[Any, Any]"]) -> dict[FeatureId, list[int]]:
+    """Find the ids shared by several features, in one pass.
+
+    Features without an id are ignored.
+
+    Args:
+        features: The features.
+
+    Returns:
+        The positions of the features having each duplicate id, in order of
+        the first duplicate.
+    """
+    positions: dict[FeatureId, list[int]] = {}
+    duplicates: dict[FeatureId, list[int]] = {}
+    for position, feature in enumerate(features):
+        feature_id = feature.id
+        if feature_id is None:
+            continue
+        found = positions.setdefault(feature_id, [])
+        found.append(position)
+        if len(found) == 2:
+            duplicates[feature_id] = found
+    return duplicates
+
+
+def check_unique_ids(features: Iterable["FeatureModel[Any, Any]"]) -> None:
+    """Raise if several features share an id.
+
+    Args:
+        features: The features.
+
+    Raises:
+        ValueError: Naming every duplicate id with the positions of its features.
+    """
+    duplicates = duplicate_ids(features)
+    if duplicates:
+        listed = "; ".join(
+            f"{feature_id!r} at features {', '.join(map(str, positions))}"
+            for feature_id, positions in duplicates.items()
+        )
+        raise ValueError(f"Duplicate feature ids: {listed}")
+
+
+class IndexedFeatures(list[FeatureT]):
+    """List of features that maintains an index of their ids.
+
+    The list also caches the property indexes of its features until it
+    changes. With duplicate ids, the first feature having the id is found.
+    Changing the ``id`` or the properties of a feature in the list in place
+    is not seen by the list; call ``reindex`` afterwards.
+    """
+
+    __slots__ = ("_ids", "_stale", "_properties")
+
+    def __init__(self, features: Iterable[FeatureT] = ()) -> None:
+        """Create the list; the index is built on the first lookup.
+
+        Args:
+            features: The features.
+        """
+        super().__init__(features)
+        self._ids: dict[FeatureId, FeatureT] = {}
+        self._stale = True
+        self._properties: dict[str, PropertyIndex] = {}
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Copies and pickles hold the features only; the index is rebuilt on demand.
+        return type(self), (list(self),)
+
+    def _changed(self) -> None:
+        self._stale = True
+        self._properties.clear()
+
+    def reindex(self) -> None:
+        """Rebuild the id index and drop the property indexes."""
+        self._properties.clear()
+        ids: dict[FeatureId, FeatureT] = {}
+        for feature in self:
+            if feature.id is not None:
+                ids.setdefault(feature.id, feature)
+        self._ids = ids
+        self._stale = False
+
+    def get_by_id(self, feature_id: FeatureId) -> Optional[FeatureT]:
+        """Return the feature with the given id, or None.
+
+        Args:
+            feature_id: The id, a string or an integer.
+
+        Returns:
+            The first feature with the id, or None if there is none.
+        """
+        if self._stale:
+            self.reindex()
+        feature = self._ids.get(feature_id)
+        if feature is not None and feature.id != feature_id:
+            # The feature's id was changed in place.
+            self.reindex()
+            feature = self._ids.get(feature_id)
+        return feature
+
+    def property_index(self, key: str) -> PropertyIndex:
+        """Return the index of property ``key``, built on first use.
+
+        Args:
+            key: The property key.
+
+        Returns:
+            The index, cached until the list changes.
+        """
+        index = self._properties.get(key)
+        if index is None:
+            index = self._properties[key] = PropertyIndex.from_features(self, key)
+        return index
+
+    def _add(self, features: Iterable[FeatureT]) -> None:
+        ids = self._ids
+        for feature in features:
+            if feature.id is not None:
+                ids.setdefault(feature.id, feature)
+
+    def append(self, feature: FeatureT) -> None:
+        """Append a feature and index its id."""
+        super().append(feature)
+        self._properties.clear()
+        if not self._stale:
+            self._add((feature,))
+
+    def extend(self, features: Iterable[FeatureT]) -> None:
+        """Append features and index their ids."""
+        start = len(self)
+        super().extend(features)
+        self._properties.clear()
+        if not self._stale:
+            self._add(self[start:])
+
+    def __iadd__(self, features: Iterable[FeatureT]) -> "IndexedFeatures[FeatureT]":  # type: ignore[override, misc]
+        self.extend(features)
+        return self
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        super().__setitem__(index, value)
+        self._changed()
+
+    def __delitem__(self, index: Union[SupportsIndex, slice]) -> None:
+        super().__delitem__(index)
+        self._changed()
+
+    def __imul__(self, count: SupportsIndex) -> "IndexedFeatures[FeatureT]":
+        super().__imul__(count)
+        self._changed()
+        return self
+
+    def insert(self, index: SupportsIndex, feature: FeatureT) -> None:
+        """Insert a feature; the index is rebuilt on the next lookup."""
+        super().insert(index, feature)
+        self._changed()
+
+    def pop(self, index: SupportsIndex = -1) -> FeatureT:
+        """Remove and return a feature; the index is rebuilt on the next lookup."""
+        feature = super().pop(index)
+        self._changed()
+        return feature
+
+    def remove(self, feature: FeatureT) -> None:
+        """Remove a feature; the index is rebuilt on the next lookup."""
+        super().remove(feature)
+        self._changed()
+
+    def clear(self) -> None:
+        """Remove all features."""
+        super().clear()
+        self._ids = {}
+        self._stale = False
+        self._properties.clear()
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        """Sort the features in place; the index is rebuilt on the next lookup."""
+        super().sort(*args, **kwargs)
+        self._changed()
+
+    def reverse(self) -> None:
+        """Reverse the features in place; the index is rebuilt on the next lookup."""
+        super().reverse()
+        self._changed()
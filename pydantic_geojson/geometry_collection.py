@@ -61,9 +61,3 @@ class GeometryCollectionModel(GeoJSONModel):
             ValueError: If forbidden members are present.
         """
         return validate_no_feature_members(cls, data)
-
-
-# Required for recursive type: GeometryCollectionModel contains itself in the geometries list.
-# Using string annotation "GeometryCollectionModel" allows forward reference.
-# Pydantic needs model_rebuild() to resolve the forward reference to the class itself.
-GeometryCollectionModel.model_rebuild()
@@ -0,0 +1,448 @@
+"""GeoParquet writer and reader.
+
+Collections are written as GeoParquet 1.1 files: the columns of
+``pydantic_geojson.arrow.to_arrow`` with WKB geometries, plus a ``bbox``
+covering column holding the bounding box of each feature. Parquet keeps
+minimum and maximum statistics of the covering column per row group, so a
+reader given a query bbox skips whole row groups that lie outside it and
+only decodes and validates the matching rows of the others.
+
+Features are written one row group at a time, so a stream of features
+larger than memory can be written; likewise ``iter_geoparquet`` reads one
+row group at a time.
+
+Requires pyarrow: ``pip install 'pydantic-geojson[arrow]'``.
+
+Example:
+    ```python
+    from pydantic_geojson.geoparquet import iter_geoparquet, write_geoparquet
+
+    write_geoparquet(read_features(), "places.parquet")
+    for feature in iter_geoparquet("places.parquet", bbox=[5.9, 45.8, 10.5, 47.8]):
+        ...
+    ```
+"""
+
+import json
+import math
+import os
+from collections.abc import Iterable, Iterator, Sequence
+from itertools import islice
+from typing import Any, Optional, Union
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+except ImportError as exc:  # pragma: no cover
+    raise ImportError(
+        "pydantic_geojson.geoparquet requires pyarrow; install it with "
+        "pip install 'pydantic-geojson[arrow]'"
+    ) from exc
+
+from .arrow import (
+    _EXTENSION_METADATA,
+    _EXTENSION_NAME,
+    _GEOARROW_METADATA,
+    _JSON_EXTENSION,
+    _WKB_EXTENSION,
+    GEOMETRY_COLUMN,
+    ID_COLUMN,
+    _extension_name,
+    _features,
+    _geometry_column,
+    _is_property,
+    _storage,
+    _value_column,
+    to_arrow,
+)
+from .columnar import ColumnarFeatureCollection, box_intersects
+from .fail_fast import validate_fail_fast
+from .feature_collection import FeatureCollectionModel
+
+COVERING_COLUMN = "bbox"
+GEOPARQUET_VERSION = "1.1.0"
+
+_GEO_KEY = b"geo"
+_BOX_FIELDS = ("xmin", "ymin", "xmax", "ymax")
+_COVERING_TYPE = pa.struct([pa.field(name, pa.float64()) for name in _BOX_FIELDS])
+
+
+# ---------------------------------------------------------------------------
+# Writing
+# ---------------------------------------------------------------------------
+
+
+def _covering(columnar: ColumnarFeatureCollection) -> pa.Array:
+    """The bbox covering column; null for features without positions."""
+    bounds = columnar.bounds
+    children = [pa.array(bounds[offset::4], pa.float64()) for offset in range(4)]
+    nulls = [math.isnan(west) for west in bounds[0::4]]
+    mask = pa.array(nulls, pa.bool_()) if any(nulls) else None
+    return pa.StructArray.from_arrays(children, fields=list(_COVERING_TYPE), mask=mask)
+
+
+def _first_table(columnar: ColumnarFeatureCollection) -> pa.Table:
+    table = to_arrow(columnar, geometry_encoding="wkb")
+    if COVERING_COLUMN in table.column_names:
+        raise ValueError(
+            f"Property {COVERING_COLUMN!r} clashes with the {COVERING_COLUMN!r} covering column"
+        )
+    for index, field in enumerate(table.schema):
+        if pa.types.is_null(field.type):
+            # No value to type the column with yet: store JSON text, which fits
+            # whatever values later row groups hold.
+            metadata = {**(field.metadata or {}), _EXTENSION_NAME: _JSON_EXTENSION}
+            json_field = pa.field(field.name, pa.string(), metadata=metadata)
+            table = table.set_column(index, json_field, pa.nulls(len(table), pa.string()))
+    return table.append_column(pa.field(COVERING_COLUMN, _COVERING_TYPE), _covering(columnar))
+
+
+def _conformed_table(
+    columnar: ColumnarFeatureCollection, schema: pa.Schema, row_group: int
+) -> pa.Table:
+    """Table of a later row group, with the columns and types of the first one."""
+    has_ids = ID_COLUMN in schema.names and not _is_property(schema.field(ID_COLUMN))
+    new = [name for name in columnar.column_names if name not in schema.names]
+    if not has_ids and any(value is not None for value in columnar.ids):
+        new.append(ID_COLUMN)
+    if new:
+        raise ValueError(
+            f"Row group {row_group} has properties or ids that earlier rows lack: {new}; "
+            "the first row group fixes the columns"
+        )
+    if has_ids and ID_COLUMN in columnar.column_names:
+        raise ValueError(f"Property {ID_COLUMN!r} clashes with the {ID_COLUMN!r} column")
+    columns = []
+    for field in schema:
+        if field.name == GEOMETRY_COLUMN:
+            columns.append(_geometry_column(columnar, "wkb")[1])
+            continue
+        if field.name == COVERING_COLUMN:
+            columns.append(_covering(columnar))
+            continue
+        if field.name == ID_COLUMN and has_ids:
+            values = columnar.ids
+        elif field.name in columnar.column_names:
+            values = columnar.column(field.name)
+        else:
+            values = [None] * len(columnar)
+        if _extension_name(field) == _JSON_EXTENSION:
+            values = [None if value is None else json.dumps(value) for value in values]
+            columns.append(pa.array(values, pa.string()))
+            continue
+        columns.append(_conformed_column(field, values, row_group))
+    return pa.Table.from_arrays(columns, schema=schema)
+
+
+def _conformed_column(field: pa.Field, values: list[Any], row_group: int) -> pa.Array:
+    """Values of a later row group as an array of the column type, if they fit it exactly."""
+    new_field, column = _value_column(field.name, values)
+    as_json = _extension_name(new_field) == _JSON_EXTENSION
+    if column.type == field.type and not as_json:
+        return column
+    if pa.types.is_null(column.type):
+        return pa.nulls(len(column), field.type)
+    # Integers widen to floats; anything else, such as floats into an integer
+    # column, would lose values. The file schema cannot change once written.
+    if pa.types.is_integer(column.type) and pa.types.is_floating(field.type):
+        try:
+            return column.cast(field.type)
+        except pa.ArrowInvalid:
+            pass
+    kind = "objects or mixed types" if as_json else column.type
+    raise ValueError(
+        f"Values of {field.name!r} in row group {row_group} are {kind}, but the "
+        f"first row group fixed the column type as {field.type}"
+    )
+
+
+def _geometry_types(columnar: ColumnarFeatureCollection) -> set[str]:
+    names = set()
+    for index in range(len(columnar)):
+        name = columnar.geometry_type(index)
+        if name is None:
+            continue
+        if columnar.z is not None:
+            start, end = columnar._position_range(index)
+            if any(1 for alt in columnar.z[start:end] if alt == alt):
+                name += " Z"
+        names.add(name)
+    return names
+
+
+def _geo_metadata(geometry_types: set[str], bbox: list[float]) -> dict[str, Any]:
+    column: dict[str, Any] = {"encoding": "WKB", "geometry_types": sorted(geometry_types)}
+    if bbox[0] <= bbox[2]:
+        column["bbox"] = bbox
+    column["covering"] = {
+        COVERING_COLUMN: {name: [COVERING_COLUMN, name] for name in _BOX_FIELDS},
+    }
+    return {
+        "version": GEOPARQUET_VERSION,
+        "primary_column": GEOMETRY_COLUMN,
+        "columns": {GEOMETRY_COLUMN: column},
+    }
+
+
+def write_geoparquet(
+    features: Union[FeatureCollectionModel, Iterable[Any]],
+    where: Any,
+    *,
+    row_group_size: int = 65536,
+) -> None:
+    """Write a collection, or a stream of features, as a GeoParquet file.
+
+    Features are converted and written one row group at a time, so only
+    ``row_group_size`` features are held in memory at once besides those of
+    ``features`` itself. The first row group fixes the columns and their
+    types; later row groups must hold values of those types, except that
+    integers are stored in floating point columns. Properties that are null
+    throughout the first row group are stored as JSON text.
+
+    A path is written to a temporary file next to it, renamed when done, so
+    a failure leaves no partial file behind; other targets keep what was
+    written before the failure.
+
+    Args:
+        features: A FeatureCollectionModel, or an iterable of FeatureModel
+            instances such as a generator.
+        where: A path, a pyarrow NativeFile or a writable binary file object.
+        row_group_size: Number of features per row group. Smaller row groups
+            let bbox queries skip more data at the cost of a larger file.
+
+    Raises:
+        ValueError: If ``row_group_size`` is not positive, a property is named
+            ``geometry``, ``id`` or ``bbox``, a later row group has a property
+            (or ids) the first one lacks, or values of a type other than the
+            column type; or if a feature holds a nested GeometryCollection.
+    """
+    if row_group_size < 1:
+        raise ValueError(f"row_group_size must be positive, got {row_group_size}")
+    if isinstance(features, FeatureCollectionModel):
+        features = features.features
+    if isinstance(where, os.PathLike):
+        where = os.fspath(where)
+    if not isinstance(where, str):
+        _write_row_groups(features, where, row_group_size)
+        return
+    partial = f"{where}.{os.getpid()}.partial"
+    try:
+        _write_row_groups(features, partial, row_group_size)
+    except BaseException:
+        if os.path.exists(partial):
+            os.remove(partial)
+        raise
+    os.replace(partial, where)
+
+
+def _write_row_groups(features: Iterable[Any], where: Any, row_group_size: int) -> None:
+    iterator = iter(features)
+    geometry_types: set[str] = set()
+    bbox = [math.inf, math.inf, -math.inf, -math.inf]
+    writer = None
+    schema = None
+    try:
+        row_group = 0
+        while True:
+            batch = list(islice(iterator, row_group_size))
+            if not batch and writer is not None:
+                break
+            columnar = ColumnarFeatureCollection.from_features(batch)
+            if writer is None:
+                table = _first_table(columnar)
+                schema = table.schema
+                writer = pq.ParquetWriter(where, schema)
+            else:
+                table = _conformed_table(columnar, schema, row_group)
+            writer.write_table(table, row_group_size=row_group_size)
+            geometry_types |= _geometry_types(columnar)
+            total_bounds = columnar.total_bounds
+            if total_bounds is not None:
+                bbox[:2] = map(min, bbox[:2], total_bounds[:2])
+                bbox[2:] = map(max, bbox[2:], total_bounds[2:])
+            row_group += 1
+            if not batch:
+                break
+        writer.add_key_value_metadata(
+            {_GEO_KEY: json.dumps(_geo_metadata(geometry_types, bbox)).encode()}
+        )
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+# ---------------------------------------------------------------------------
+# Reading
+# ---------------------------------------------------------------------------
+
+
+def _geo_column(parquet_file: pq.ParquetFile) -> tuple[str, dict[str, Any]]:
+    """Name and metadata of the primary geometry column."""
+    metadata = parquet_file.metadata.metadata or {}
+    if _GEO_KEY not in metadata:
+        raise ValueError("Not a GeoParquet file: the 'geo' metadata is missing")
+    geo = json.loads(metadata[_GEO_KEY])
+    primary = geo["primary_column"]
+    return primary, geo["columns"][primary]
+
+
+def _with_extension(table: pa.Table, name: str, encoding: str) -> pa.Table:
+    """Mark the geometry column with the GeoArrow extension of its GeoParquet encoding."""
+    extension = _WKB_EXTENSION if encoding.upper() == "WKB" else f"geoarrow.{encoding.lower()}"
+    index = table.schema.get_field_index(name)
+    field = table.schema.field(index).with_metadata(
+        {_EXTENSION_NAME: extension.encode(), _EXTENSION_METADATA: _GEOARROW_METADATA}
+    )
+    return pa.Table.from_arrays(table.columns, schema=table.schema.set(index, field))
+
+
+def _row_group_bounds(
+    parquet_file: pq.ParquetFile, row_group: int, paths: dict[str, str]
+) -> Optional[list[float]]:
+    """Bounds of a row group from the covering column statistics, if all are recorded."""
+    metadata = parquet_file.metadata.row_group(row_group)
+    statistics = {}
+    for index in range(metadata.num_columns):
+        column = metadata.column(index)
+        statistics[column.path_in_schema] = column.statistics
+    bounds = []
+    for name in _BOX_FIELDS:
+        stats = statistics.get(paths[name])
+        if stats is None or not stats.has_min_max:
+            return None
+        bounds.append(stats.max if name in ("xmax", "ymax") else stats.min)
+    return bounds
+
+
+def _covering_mask(column: pa.StructArray, names: dict[str, str], bbox: Sequence[float]) -> Any:
+    """Rows whose covering bbox intersects ``bbox``, as a boolean array."""
+    west, south, east, north = bbox
+    children = column.flatten()
+    xmin, ymin, xmax, ymax = (
+        children[column.type.get_field_index(names[name])] for name in _BOX_FIELDS
+    )
+    hit_y = pc.and_(pc.less_equal(ymin, north), pc.greater_equal(ymax, south))
+    if west <= east:
+        hit_x = pc.and_(pc.less_equal(xmin, east), pc.greater_equal(xmax, west))
+    else:
+        hit_x = pc.or_(pc.greater_equal(xmax, west), pc.less_equal(xmin, east))
+    return pc.fill_null(pc.and_(hit_y, hit_x), False)
+
+
+def _geometry_bounds(geometry: Optional[dict[str, Any]]) -> list[float]:
+    """Bounds of a GeoJSON geometry object; NaN if it has no positions."""
+    xs: list[float] = []
+    ys: list[float] = []
+    stack = [] if geometry is None else [geometry]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            stack.extend(value.get("geometries", ()))
+            if "coordinates" in value:
+                stack.append(value["coordinates"])
+        elif value and not isinstance(value[0], (list, tuple)):
+            xs.append(value[0])
+            ys.append(value[1])
+        else:
+            stack.extend(value)
+    if not xs:
+        return [math.nan] * 4
+    return [min(xs), min(ys), max(xs), max(ys)]
+
+
+def _feature_batches(
+    source: Any, bbox: Optional[Sequence[float]]
+) -> Iterator[list[dict[str, Any]]]:
+    """Decoded Feature objects of each row group that may intersect ``bbox``."""
+    if isinstance(source, (str, os.PathLike)):
+        parquet_file = pq.ParquetFile(os.fspath(source), memory_map=True)
+    else:
+        parquet_file = pq.ParquetFile(source)
+    with parquet_file:
+        primary, column = _geo_column(parquet_file)
+        covering = (column.get("covering") or {}).get(COVERING_COLUMN)
+        covering_name = covering["xmin"][0] if covering else None
+        paths = {name: ".".join(covering[name]) for name in _BOX_FIELDS} if covering else {}
+        fields = {name: covering[name][1] for name in _BOX_FIELDS} if covering else {}
+        for row_group in range(parquet_file.num_row_groups):
+            if bbox is not None and covering:
+                bounds = _row_group_bounds(parquet_file, row_group, paths)
+                if bounds is not None and not box_intersects(bounds, bbox):
+                    continue
+            table = parquet_file.read_row_group(row_group)
+            if covering_name is not None:
+                if bbox is not None:
+                    mask = _covering_mask(_storage(table.column(covering_name)), fields, bbox)
+                    table = table.filter(mask)
+                table = table.drop_columns([covering_name])
+            table = _with_extension(table, primary, column.get("encoding", "WKB"))
+            features = _features(table, primary)
+            if bbox is not None and not covering:
+                features = [
+                    feature
+                    for feature in features
+                    if box_intersects(_geometry_bounds(feature["geometry"]), bbox)
+                ]
+            if features:
+                yield features
+
+
+def iter_geoparquet(
+    source: Any,
+    *,
+    bbox: Optional[Sequence[float]] = None,
+    model: type[FeatureCollectionModel] = FeatureCollectionModel,
+) -> Iterator[Any]:
+    """Read the features of a GeoParquet file, one row group at a time.
+
+    With ``bbox``, row groups whose covering statistics lie outside it are
+    skipped without reading them, and only the features whose bounding box
+    intersects it are validated and returned. Files without a bbox covering
+    column are filtered after decoding.
+
+    Args:
+        source: A path (memory-mapped), a pyarrow NativeFile or a readable
+            binary file object.
+        bbox: ``[west, south, east, north]`` to select features by; ``west >
+            east`` denotes a box crossing the antimeridian.
+        model: The collection model whose feature type is used for validation.
+
+    Yields:
+        The validated features.
+
+    Raises:
+        ValueError: If the file has no GeoParquet metadata or its geometry
+            column cannot be decoded.
+        ValidationError: If a decoded feature is invalid.
+    """
+    for features in _feature_batches(source, bbox):
+        collection = validate_fail_fast(model, {"type": "FeatureCollection", "features": features})
+        yield from collection.features
+
+
+def read_geoparquet(
+    source: Any,
+    *,
+    bbox: Optional[Sequence[float]] = None,
+    model: type[FeatureCollectionModel] = FeatureCollectionModel,
+) -> FeatureCollectionModel:
+    """Read a GeoParquet file as a collection.
+
+    Args:
+        source: A path (memory-mapped), a pyarrow NativeFile or a readable
+            binary file object.
+        bbox: ``[west, south, east, north]`` to select features by, as for
+            ``iter_geoparquet``.
+        model: The collection model to validate against.
+
+    Returns:
+        The validated collection.
+
+    Raises:
+        ValueError: If the file has no GeoParquet metadata or its geometry
+            column cannot be decoded.
+        ValidationError: If the collection is invalid.
+    """
+    features = [feature for batch in _feature_batches(source, bbox) for feature in batch]
+    return validate_fail_fast(model, {"type": "FeatureCollection", "features": features})
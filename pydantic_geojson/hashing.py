@@ -0,0 +1,275 @@
+"""Stable content hashes of geometries and features.
+
+``content_hash()`` on every model returns a digest of its content, for
+deduplication, caching and change detection:
+
+Example:
+    ```python
+    from pydantic_geojson.hashing import content_hashes
+
+    polygon.content_hash()  # 32 hex digits, cached on the geometry
+    hashes = content_hashes(collection)  # one per feature
+    ```
+
+Digests are computed over the binary values of the coordinates instead of a
+JSON rendering, so they do not depend on float formatting and are fast to
+compute. Positions are hashed ring by ring as blocks of doubles: the
+longitudes, the latitudes and, if any position has one, the altitudes, with
+NaN for missing ones. Packed and unpacked coordinates of the same geometry
+have the same digest, and ``-0.0`` is hashed as ``0.0``. The order of
+positions, rings, parts and features matters.
+
+The hash of a feature covers its geometry and its properties, as canonical
+JSON with sorted keys and whole floats written as integers, so ``1`` and
+``1.0`` hash alike, as they compare equal; the hash of a collection covers
+its features. Ids, bounding boxes and foreign members are left out, so two
+features differing only in their ids have the same hash.
+
+Geometries other than collections cache their hash. Assigning a member of
+the geometry drops the cache; after changing coordinates in place, pass
+``refresh=True``. The hashes of features, geometry collections and feature
+collections are composed from those of their parts on every call, so they
+follow assignments to their members and changes to their properties.
+
+Digests can also be computed with a relative ``tolerance``, such as ``1e-9``
+for the ``math.isclose`` default used by ``Coordinates.__eq__``: coordinate
+values are first snapped to a grid with steps of ``tolerance`` times their
+magnitude, so values within the tolerance usually, though not always, get
+the same digest. Such digests are not cached.
+"""
+
+import json
+import math
+import struct
+from array import array
+from collections.abc import Iterable
+from hashlib import blake2b
+from typing import Any, Optional
+
+from pydantic import BaseModel
+
+from ._base import CONTENT_HASH_ATTRIBUTE
+from .packed import PackedCoordinates
+
+DIGEST_SIZE = 16
+
+_COUNT = struct.Struct("<Q")
+_TYPE_CODES = {
+    "Point": b"\x01",
+    "LineString": b"\x02",
+    "Polygon": b"\x03",
+    "MultiPoint": b"\x04",
+    "MultiLineString": b"\x05",
+    "MultiPolygon": b"\x06",
+    "GeometryCollection": b"\x07",
+}
+_NULL = b"\x00"
+_FEATURE = b"F"
+_COLLECTION = b"C"
+_NO_ALTITUDES = b"\x02"
+_ALTITUDES = b"\x03"
+_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+def _snap(value: float, tolerance: float) -> float:
+    """Round the mantissa of a value to a multiple of ``tolerance``."""
+    if not value or not math.isfinite(value):
+        return value
+    mantissa, exponent = math.frexp(value)
+    return math.ldexp(round(mantissa / tolerance) * tolerance, exponent)
+
+
+def check_tolerance(tolerance: Optional[float]) -> None:
+    """Raise unless ``tolerance`` is None or a relative tolerance between 0 and 1.
+
+    Args:
+        tolerance: The tolerance.
+
+    Raises:
+        ValueError: If the tolerance is out of range.
+    """
+    if tolerance is not None and not 0 < tolerance < 1:
+        raise ValueError(f"Tolerance must be between 0 and 1, got {tolerance!r}")
+
+
+def _update_positions(digest: Any, positions: Any, tolerance: Optional[float]) -> None:
+    count = len(positions)
+    digest.update(_COUNT.pack(count))
+    if not count:
+        return
+    alts: Any
+    if isinstance(positions, PackedCoordinates):
+        values = array("d", positions.lons)
+        values.extend(array("d", positions.lats))
+        alts = positions.alts
+        if alts is not None and not any(alt == alt for alt in alts):
+            alts = None
+    else:
+        lons, lats, *rest = zip(*positions)
+        values = array("d", lons + lats)
+        alts = rest[0] if rest and rest[0].count(None) < count else None
+    if alts is not None:
+        values.extend([math.nan if alt is None else alt for alt in alts])
+    if tolerance is not None:
+        values = array("d", [_snap(value, tolerance) for value in values])
+    if 0.0 in values:
+        # Equal to 0.0, so -0.0 becomes 0.0.
+        values = array("d", [value + 0.0 for value in values])
+    digest.update(_NO_ALTITUDES if alts is None else _ALTITUDES)
+    digest.update(values)
+
+
+def _parts(geometry_type: str, coordinates: Any) -> Any:
+    """Coordinates of a geometry as a list of parts, each a list of position sequences."""
+    if geometry_type == "Point":
+        return [[[coordinates]]]
+    if geometry_type in ("LineString", "MultiPoint"):
+        return [[coordinates]]
+    if geometry_type == "Polygon":
+        return [coordinates]
+    if geometry_type == "MultiLineString":
+        return [[line] for line in coordinates]
+    return coordinates
+
+
+def update_geometry(digest: Any, geometry: Any, tolerance: Optional[float] = None) -> None:
+    """Feed a geometry model, or None, to a hash object.
+
+    Args:
+        digest: A ``hashlib`` hash object.
+        geometry: The geometry.
+        tolerance: Relative tolerance to snap coordinate values with, or None.
+    """
+    if geometry is None:
+        digest.update(_NULL)
+        return
+    geometry_type = geometry.type
+    digest.update(_TYPE_CODES[geometry_type])
+    if geometry_type == "GeometryCollection":
+        digest.update(_COUNT.pack(len(geometry.geometries)))
+        for member in geometry.geometries:
+            digest.update(content_digest(member, tolerance=tolerance))
+        return
+    parts = _parts(geometry_type, geometry.coordinates)
+    digest.update(_COUNT.pack(len(parts)))
+    for part in parts:
+        digest.update(_COUNT.pack(len(part)))
+        for ring in part:
+            _update_positions(digest, ring, tolerance)
+
+
+def _canonical(value: Any) -> Any:
+    """JSON value with whole floats as integers, so that ``1.0`` encodes as ``1``."""
+    if isinstance(value, float):
+        return int(value) if value.is_integer() else value
+    if isinstance(value, dict):
+        return {key: _canonical(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(item) for item in value]
+    return value
+
+
+def update_properties(digest: Any, properties: Any) -> None:
+    """Feed feature properties, a dictionary, a model or None, to a hash object.
+
+    Properties that compare equal, such as ``{"a": 1}`` and ``{"a": 1.0}``,
+    feed the same bytes.
+
+    Args:
+        digest: A ``hashlib`` hash object.
+        properties: The properties.
+    """
+    if isinstance(properties, BaseModel):
+        properties = properties.model_dump(mode="json")
+    digest.update(_ENCODER.encode(_canonical(properties)).encode())
+
+
+def _geometry_digest(geometry: Any, tolerance: Optional[float] = None) -> bytes:
+    digest = blake2b(digest_size=DIGEST_SIZE)
+    update_geometry(digest, geometry, tolerance)
+    return digest.digest()
+
+
+def content_digest(
+    model: BaseModel, refresh: bool = False, *, tolerance: Optional[float] = None
+) -> bytes:
+    """Return the content digest of a geometry, feature or feature collection model.
+
+    Digests of geometries other than geometry collections are cached on the
+    model, unless they are computed with a tolerance. The digests of
+    features and collections are composed from those of their members on
+    every call, so they are never stale.
+
+    Args:
+        model: The model.
+        refresh: Recompute the digests of the geometries, instead of using
+            cached ones.
+        tolerance: Relative tolerance to snap coordinate values with, or
+            None for exact values.
+
+    Returns:
+        The digest, ``DIGEST_SIZE`` bytes.
+    """
+    snapped = tolerance is not None
+    cached = None if refresh or snapped else model.__dict__.get(CONTENT_HASH_ATTRIBUTE)
+    if cached is not None:
+        return cached  # type: ignore[no-any-return]
+    model_type = model.type  # type: ignore[attr-defined]
+    # Containers are not cached: their members may change without them seeing it.
+    if model_type == "FeatureCollection":
+        digest = blake2b(_COLLECTION, digest_size=DIGEST_SIZE)
+        for feature in model.features:  # type: ignore[attr-defined]
+            digest.update(content_digest(feature, refresh, tolerance=tolerance))
+        return digest.digest()
+    if model_type == "Feature":
+        geometry = model.geometry  # type: ignore[attr-defined]
+        digest = blake2b(_FEATURE, digest_size=DIGEST_SIZE)
+        if geometry is None:
+            digest.update(_NULL)
+        else:
+            digest.update(content_digest(geometry, refresh, tolerance=tolerance))
+        update_properties(digest, model.properties)  # type: ignore[attr-defined]
+        return digest.digest()
+    if model_type == "GeometryCollection":
+        members = model.geometries  # type: ignore[attr-defined]
+        digest = blake2b(_TYPE_CODES[model_type], digest_size=DIGEST_SIZE)
+        digest.update(_COUNT.pack(len(members)))
+        for member in members:
+            digest.update(content_digest(member, refresh, tolerance=tolerance))
+        return digest.digest()
+    value = _geometry_digest(model, tolerance)
+    if not snapped:
+        model.__dict__[CONTENT_HASH_ATTRIBUTE] = value
+    return value
+
+
+def content_hashes(models: Iterable[BaseModel]) -> list[str]:
+    """Return the content hashes of many models at once.
+
+    Args:
+        models: Geometry or feature models, or a feature collection for the
+            hashes of its features.
+
+    Returns:
+        One hash of 32 hex digits per model, in order.
+    """
+    if isinstance(models, BaseModel):
+        models = models.features
+    return [content_digest(model).hex() for model in models]
+
+
+def geometry_digest(geometry: Any, tolerance: Optional[float] = None) -> bytes:
+    """Return the content digest of a geometry model, or of None."""
+    if geometry is None:
+        return _NULL_DIGEST
+    return content_digest(geometry, tolerance=tolerance)
+
+
+def properties_digest(properties: Any) -> bytes:
+    """Return the digest of feature properties."""
+    digest = blake2b(digest_size=DIGEST_SIZE)
+    update_properties(digest, properties)
+    return digest.digest()
+
+
+_NULL_DIGEST = _geometry_digest(None)
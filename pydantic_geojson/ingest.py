@@ -0,0 +1,160 @@
+"""Bulk ingest that keeps the valid features of a collection.
+
+``FeatureCollectionModel`` validation is all or nothing: one broken feature
+rejects the whole collection. ``ingest`` validates each feature on its own
+and returns a collection of the valid ones together with a compact report of
+the rejected ones. Valid features are validated once and then placed in the
+collection as model instances, which pydantic does not validate again.
+
+Example:
+    ```python
+    from pydantic_geojson.ingest import ingest_json
+
+    result = ingest_json(body)
+    save(result.collection)
+    for error in result.errors:
+        print(error.feature_index, error.loc, error.msg)
+    ```
+"""
+
+from collections.abc import Iterable, Sequence
+from typing import Any, NamedTuple, Union
+
+from pydantic_core import from_json
+
+from ._validation import BudgetExhausted, Errors, split_field, validate_item
+from .feature_collection import FeatureCollectionModel
+
+
+class FeatureError(NamedTuple):
+    """One validation error of a rejected feature.
+
+    Attributes:
+        feature_index: Position of the feature in the input.
+        loc: Location of the error within the feature.
+        msg: Human readable error message.
+        type: Pydantic error type, e.g. ``"less_than_equal"``.
+    """
+
+    feature_index: int
+    loc: tuple[Union[str, int], ...]
+    msg: str
+    type: str
+
+
+class IngestResult(NamedTuple):
+    """Outcome of a bulk ingest.
+
+    Attributes:
+        collection: Collection holding the valid features, in input order.
+        errors: Errors of the rejected features, in input order.
+    """
+
+    collection: FeatureCollectionModel
+    errors: list[FeatureError]
+
+    @property
+    def rejected(self) -> list[int]:
+        """Indices of the rejected features, in input order."""
+        return list(dict.fromkeys(error.feature_index for error in self.errors))
+
+
+def ingest(
+    data: Union[dict[str, Any], Iterable[Any]],
+    *,
+    model: type[FeatureCollectionModel] = FeatureCollectionModel,
+    max_errors_per_feature: int = 1,
+    **kwargs: Any,
+) -> IngestResult:
+    """Validate the features of a collection one by one, keeping the valid ones.
+
+    Args:
+        data: A FeatureCollection object, whose ``features`` may be any
+            sequence, or an iterable of Feature objects (e.g. a generator
+            reading them one at a time).
+        model: The collection model, FeatureCollectionModel or a subclass; its
+            ``features`` item type is used to validate each feature.
+        max_errors_per_feature: Number of errors reported per rejected feature.
+        **kwargs: Passed on to pydantic's ``validate_python``, e.g. ``context``.
+
+    Returns:
+        The collection of valid features and the errors of the rejected ones.
+
+    Raises:
+        ValidationError: If the collection itself (without its features) is invalid.
+        ValueError: If ``max_errors_per_feature`` is less than 1, if ``model``
+            has no ``features`` list of feature models, or if ``features`` is
+            not a sequence.
+    """
+    if max_errors_per_feature < 1:
+        raise ValueError(f"max_errors_per_feature must be >= 1, got {max_errors_per_feature}")
+    split = split_field(model, "features")
+    if split is None:
+        raise ValueError(f"{model.__name__} has no features field holding feature models")
+    _, dispatch, annotation = split
+
+    if isinstance(data, dict):
+        envelope = {key: value for key, value in data.items() if key != "features"}
+        features = data.get("features")
+        if not isinstance(features, Sequence) or isinstance(features, (str, bytes, bytearray)):
+            # Let the collection model report the missing or malformed member.
+            model.__pydantic_validator__.validate_python(data, **kwargs)
+            raise ValueError(
+                f"features must be a sequence of Feature objects, got {type(features).__name__}"
+            )
+    else:
+        envelope = {"type": "FeatureCollection"}
+        features = data
+
+    valid = []
+    errors: list[FeatureError] = []
+    for index, feature in enumerate(features):
+        feature_errors = Errors(max_errors_per_feature)
+        result = None
+        try:
+            result = validate_item(annotation, dispatch, feature, feature_errors, (), kwargs)
+        except BudgetExhausted:
+            pass
+        if feature_errors.details:
+            errors.extend(
+                FeatureError(index, error["loc"], error["msg"], error["type"])
+                for error in feature_errors.details
+            )
+        else:
+            valid.append(result)
+
+    collection = model.__pydantic_validator__.validate_python(
+        {**envelope, "features": valid}, **kwargs
+    )
+    return IngestResult(collection, errors)
+
+
+def ingest_json(
+    json_data: Union[str, bytes, bytearray],
+    *,
+    model: type[FeatureCollectionModel] = FeatureCollectionModel,
+    max_errors_per_feature: int = 1,
+    **kwargs: Any,
+) -> IngestResult:
+    """Parse a FeatureCollection document and ingest it with ``ingest``.
+
+    Args:
+        json_data: The JSON document.
+        model: The collection model.
+        max_errors_per_feature: Number of errors reported per rejected feature.
+        **kwargs: Passed on to pydantic's ``validate_python``, e.g. ``context``.
+
+    Returns:
+        The collection of valid features and the errors of the rejected ones.
+
+    Raises:
+        ValidationError: If the document is not valid JSON or the collection
+            itself is invalid.
+        ValueError: If ``max_errors_per_feature`` is less than 1.
+    """
+    try:
+        data = from_json(json_data)
+    except ValueError:
+        model.model_validate_json(json_data)  # reports the JSON error
+        raise
+    return ingest(data, model=model, max_errors_per_feature=max_errors_per_feature, **kwargs)
@@ -0,0 +1,270 @@
+"""Resource budgets for validating untrusted GeoJSON.
+
+Nothing in GeoJSON bounds the size of a document: GeometryCollections nest
+arbitrarily deep and collections can hold any number of features and
+positions. ``ValidationLimits`` sets budgets for these, and the checks here
+reject a document as soon as one is exceeded, so an oversized input costs
+time proportional to the limit rather than to the input.
+
+Pass the limits in the validation context. With ``model_validate_json`` the
+raw document is checked before it is parsed:
+
+Example:
+    ```python
+    from pydantic_geojson import FeatureCollectionModel
+    from pydantic_geojson.limits import ValidationLimits
+
+    limits = ValidationLimits(max_depth=16, max_positions=1_000_000, max_features=10_000)
+    collection = FeatureCollectionModel.model_validate_json(body, context={"limits": limits})
+    ```
+"""
+
+import re
+from typing import Any, NamedTuple, Optional, Union
+
+from pydantic_core import PydanticCustomError
+
+# Key of the ValidationLimits in the pydantic validation context.
+LIMITS_CONTEXT_KEY = "limits"
+
+
+class ValidationLimits(NamedTuple):
+    """Budgets enforced while validating a GeoJSON document. None means unlimited.
+
+    Attributes:
+        max_depth: Maximum nesting depth of JSON arrays and objects, e.g. 8 for
+            a FeatureCollection of MultiPolygons.
+        max_positions: Maximum total number of positions in all geometries.
+        max_features: Maximum total number of features.
+        max_properties_size: Maximum size of a single feature's ``properties``
+            object, in bytes of compact JSON: whitespace between tokens is not
+            counted, so a document passes or fails whatever its formatting.
+            Approximate for Python input, where escapes are not counted.
+    """
+
+    max_depth: Optional[int] = None
+    max_positions: Optional[int] = None
+    max_features: Optional[int] = None
+    max_properties_size: Optional[int] = None
+
+
+def _exceeded(name: str, limit: int) -> PydanticCustomError:
+    return PydanticCustomError(
+        "validation_limit",
+        "Validation limit exceeded: {name} > {limit}",
+        {"name": name, "limit": limit},
+    )
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _scalar_size(value: Any) -> int:
+    if isinstance(value, str):
+        return len(value.encode()) + 2
+    if value is None or value is True:
+        return 4
+    if value is False:
+        return 5
+    return len(repr(value))
+
+
+def _check_properties(
+    properties: Any, depth: int, max_depth: Optional[int], max_size: Optional[int]
+) -> None:
+    """Check the nesting depth and approximate compact JSON size of ``properties``."""
+    size = 0
+    stack: list[tuple[Any, int]] = [(properties, depth)]
+    while stack:
+        node, depth = stack.pop()
+        if isinstance(node, dict):
+            size += 1 + len(node) * 2 if node else 2  # braces, colons and commas
+            for key, value in node.items():
+                size += _scalar_size(str(key))
+                stack.append((value, depth + 1))
+        elif isinstance(node, (list, tuple)):
+            size += 1 + len(node) if node else 2  # brackets and commas
+            stack.extend((item, depth + 1) for item in node)
+        else:
+            size += _scalar_size(node)
+            continue
+        if max_depth is not None and depth > max_depth:
+            raise _exceeded("max_depth", max_depth)
+        if max_size is not None and size > max_size:
+            raise _exceeded("max_properties_size", max_size)
+    if max_size is not None and size > max_size:
+        raise _exceeded("max_properties_size", max_size)
+
+
+def check_limits(data: Any, limits: ValidationLimits) -> None:
+    """Check decoded GeoJSON (dicts and lists) against the limits.
+
+    The walk stops at the first exceeded limit, so its cost is bounded by the
+    limits rather than by the size of ``data``.
+
+    Args:
+        data: The decoded document.
+        limits: The budgets to enforce.
+
+    Raises:
+        PydanticCustomError: A ValueError of type ``validation_limit``, if a
+            limit is exceeded.
+    """
+    max_depth, max_positions, max_features, max_properties_size = limits
+    positions = 0
+    features = 0
+    # (node, nesting depth of node)
+    stack: list[tuple[Any, int]] = [(data, 1)]
+    while stack:
+        node, depth = stack.pop()
+        if isinstance(node, dict):
+            if max_depth is not None and depth > max_depth:
+                raise _exceeded("max_depth", max_depth)
+            for key, value in node.items():
+                if key == "properties":
+                    if value is None:
+                        continue
+                    if max_depth is not None or max_properties_size is not None:
+                        _check_properties(value, depth + 1, max_depth, max_properties_size)
+                    continue
+                if key == "bbox":
+                    continue
+                if key == "features" and isinstance(value, list):
+                    features += len(value)
+                    if max_features is not None and features > max_features:
+                        raise _exceeded("max_features", max_features)
+                if isinstance(value, (dict, list)):
+                    stack.append((value, depth + 1))
+        elif isinstance(node, list):
+            if max_depth is not None and depth > max_depth:
+                raise _exceeded("max_depth", max_depth)
+            if node and _is_number(node[0]):
+                positions += 1
+                if max_positions is not None and positions > max_positions:
+                    raise _exceeded("max_positions", max_positions)
+                continue
+            for item in node:
+                if isinstance(item, (dict, list)):
+                    stack.append((item, depth + 1))
+
+
+_STRING = rb'"[^"\\]*(?:\\.[^"\\]*)*"'
+_NUMBERS = rb'\[\s*[-0-9][^\[\]{}"]*\]'
+# Each match skips scalars and uninteresting strings, then captures one token:
+# a "features", "properties" or "bbox" key whose value is an array or object;
+# up to 1024 consecutive numeric arrays (positions or a bbox), possibly with
+# the bracket opening their array; or a bracket. Runs of positions are capped
+# so that the scan can stop soon after max_positions. The lookahead and
+# backreference make the scalar skip atomic, so failing matches cannot
+# backtrack exponentially.
+_JSON_TOKEN = re.compile(
+    rb"(?:(?=(?P<scalars>[^\"\[\]{}]+))(?P=scalars)"
+    rb'|(?!"(?:features|properties|bbox)"\s*:\s*[\[{])' + _STRING + rb")*"
+    rb'(?:"(?P<key>features|properties|bbox)"\s*:\s*(?=[\[{])'
+    rb"|(?P<open>\[\s*(?=\[))?(?P<numbers>" + _NUMBERS + rb"(?:\s*,\s*" + _NUMBERS + rb"){0,1023})"
+    rb"|(?P<bracket>[\[\]{}]))"
+)
+_STRINGS = re.compile(_STRING)
+_KEY = _JSON_TOKEN.groupindex["key"]
+_BRACKET = _JSON_TOKEN.groupindex["bracket"]
+
+
+def _blank_bytes(data: Union[bytes, bytearray], start: int, end: int) -> int:
+    """Count the whitespace bytes between the tokens of ``data[start:end]``.
+
+    The slice must not start or end inside a string.
+    """
+    tokens = _STRINGS.sub(b"", data[start:end])
+    return sum(tokens.count(blank) for blank in (b" ", b"\t", b"\n", b"\r"))
+
+
+def check_json_limits(data: Union[str, bytes, bytearray], limits: ValidationLimits) -> None:
+    """Check a GeoJSON document against the limits before it is parsed.
+
+    The document is scanned without being decoded and the scan stops at the
+    first exceeded limit. Malformed JSON is not reported here: the scan stops
+    where it becomes malformed and the rest is left to the parser.
+
+    Args:
+        data: The JSON document.
+        limits: The budgets to enforce.
+
+    Raises:
+        PydanticCustomError: A ValueError of type ``validation_limit``, if a
+            limit is exceeded.
+    """
+    if isinstance(data, str):
+        data = data.encode()
+    unlimited = len(data) + 1  # no document can exceed this
+    max_depth, max_positions, max_features, max_properties_size = (
+        unlimited if limit is None else limit for limit in limits
+    )
+    positions = 0
+    features = 0
+    # One frame per open container: the interesting key it is the value of, if any.
+    frames: list[Optional[bytes]] = []
+    key: Optional[bytes] = None
+    # Offset of the open "properties" object (or past the end) and its depth.
+    properties_start = unlimited
+    properties_depth = -1
+    # Whitespace in the open "properties" object, counted up to properties_scanned.
+    properties_blank = 0
+    properties_scanned = 0
+    match_at = _JSON_TOKEN.match
+    pos = 0
+    while True:
+        match = match_at(data, pos)
+        if match is None:
+            break  # end of document, or malformed JSON
+        pos = match.end()
+        if pos - properties_start - properties_blank > max_properties_size:
+            # Only count whitespace once the raw size is over the limit; each
+            # byte is counted at most once.
+            properties_blank += _blank_bytes(data, properties_scanned, pos)
+            properties_scanned = pos
+            if pos - properties_start - properties_blank > max_properties_size:
+                raise _exceeded("max_properties_size", max_properties_size)
+        kind = match.lastindex
+        if kind == _BRACKET:
+            bracket = data[pos - 1]
+            if bracket == 0x5D or bracket == 0x7D:  # ] or }
+                if len(frames) == properties_depth:
+                    properties_start = unlimited
+                    properties_depth = -1
+                if frames:
+                    frames.pop()
+                continue
+            if bracket == 0x7B and frames and frames[-1] == b"features":
+                if properties_start == unlimited:
+                    features += 1
+                    if features > max_features:
+                        raise _exceeded("max_features", max_features)
+            frames.append(key)
+            if len(frames) > max_depth:
+                raise _exceeded("max_depth", max_depth)
+            if key == b"properties" and properties_start == unlimited:
+                properties_start = pos - 1
+                properties_depth = len(frames)
+                properties_blank = 0
+                properties_scanned = properties_start
+        elif kind == _KEY:
+            key = match.group("key")
+            continue
+        else:  # numeric arrays: positions and bboxes
+            if match.group("open"):
+                frames.append(key)
+            if len(frames) >= max_depth:
+                raise _exceeded("max_depth", max_depth)
+            if key != b"bbox" and properties_start == unlimited:
+                positions += match.group("numbers").count(b"[")
+                if positions > max_positions:
+                    raise _exceeded("max_positions", max_positions)
+        key = None
+
+
+def context_limits(context: Any) -> Optional[ValidationLimits]:
+    """Return the ValidationLimits passed in a validation context, if any."""
+    if isinstance(context, dict):
+        return context.get(LIMITS_CONTEXT_KEY)
+    return None
@@ -1,6 +1,13 @@
-from pydantic import Field, model_validator
+from typing import TYPE_CHECKING, Union
+
+from pydantic import Field, ValidationInfo, model_validator
+from typing_extensions import Self
 
 from ._base import Coordinates, GeoJSONModel, LineStringFieldType, validate_no_feature_members
+from .antimeridian import check_antimeridian, context_antimeridian_cut
+
+if TYPE_CHECKING:
+    from .multi_line_string import MultiLineStringModel
 
 
 class LineStringModel(GeoJSONModel):
@@ -40,3 +47,45 @@ class LineStringModel(GeoJSONModel):
             ValueError: If forbidden members are present.
         """
         return validate_no_feature_members(cls, data)
+
+    @model_validator(mode="after")
+    def validate_antimeridian(self, info: ValidationInfo) -> Self:
+        """Reject uncut antimeridian crossings if the context asks for it.
+
+        Args:
+            info: Validation info; the check runs with
+                ``context={"antimeridian_cut": True}``.
+
+        Returns:
+            The validated model.
+
+        Raises:
+            ValueError: If an edge crosses the antimeridian.
+        """
+        if context_antimeridian_cut(info.context):
+            check_antimeridian([self.coordinates], "LineString")
+        return self
+
+    def cut_antimeridian(self) -> Union["LineStringModel", "MultiLineStringModel"]:
+        """Cut the line into parts on either side of the antimeridian.
+
+        Returns:
+            A MultiLineStringModel if the line crosses the antimeridian,
+            otherwise the line itself.
+        """
+        from .antimeridian import cut_antimeridian
+
+        return cut_antimeridian(self)  # type: ignore[no-any-return]
+
+    def length(self, *, spherical: bool = False) -> float:
+        """Compute the geodesic length of the line.
+
+        Args:
+            spherical: Use a sphere instead of the WGS 84 ellipsoid.
+
+        Returns:
+            The length in metres.
+        """
+        from .measure import lengths
+
+        return lengths([self], spherical=spherical)[0]
@@ -0,0 +1,172 @@
+"""Merge and concatenation of feature collections without validation.
+
+Building a collection from the features of others, as in
+``FeatureCollectionModel(type="FeatureCollection", features=a.features + b.features)``,
+validates every feature again. ``concat`` and ``merge`` reuse the validated
+feature models instead: the new collection holds the same feature objects,
+so combining collections of millions of features only copies references.
+
+Example:
+    ```python
+    from pydantic_geojson.merge import concat, merge
+
+    everything = concat(north, south)  # all features, in order
+    latest = merge(yesterday, today, on_conflict="last")  # one feature per id
+    ```
+
+The result has the type of the collections if they all have the same type,
+such as ``FeatureCollectionModel[PointModel, Place]``; otherwise it is a
+plain ``FeatureCollectionModel``, which holds features of any type.
+
+The ``bbox`` of the result is combined from the ``bbox`` members of the
+collections, without visiting the features. It is None unless every
+collection with features has one. Boxes crossing the antimeridian are
+combined into the smallest box around all of them, which may cross it too.
+"""
+
+import math
+from collections.abc import Sequence
+from typing import Any, Literal, Optional
+
+from .feature import FeatureModel
+from .feature_collection import FeatureCollectionModel
+from .feature_ids import FeatureId, check_unique_ids
+
+IdConflict = Literal["error", "first", "last"]
+
+Collection = FeatureCollectionModel[Any, Any]
+
+
+def _longitude_union(intervals: list[tuple[float, float]]) -> tuple[float, float]:
+    """Smallest longitude interval around the given ones, some crossing the antimeridian."""
+    arcs = sorted((west, west + (east - west) % 360) for west, east in intervals)
+    merged = [list(arcs[0])]
+    for start, end in arcs[1:]:
+        if start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    # The last arc may reach around past the start of the first ones.
+    reach = merged[-1][1] - 360
+    gap, west, east = -math.inf, -180.0, 180.0
+    for (_, end), (start, _) in zip(merged, [*merged[1:], [merged[0][0] + 360, 0]]):
+        end = max(end, reach)
+        if start - end > gap:
+            gap, west, east = start - end, start, end
+    if gap <= 0:
+        return -180.0, 180.0
+    if west >= 180:
+        west -= 360
+    if east > 180:
+        east -= 360
+    return west, east
+
+
+def combine_bboxes(bboxes: Sequence[Optional[Sequence[float]]]) -> Optional[list[float]]:
+    """Return the bounding box around several bounding boxes.
+
+    Args:
+        bboxes: Bounding boxes of 4 or 6 values, as in the ``bbox`` member.
+
+    Returns:
+        The combined box, with altitudes only if all boxes have them, or
+        None if there are no boxes or one of them is None.
+    """
+    if not bboxes or any(bbox is None for bbox in bboxes):
+        return None
+    boxes: list[Sequence[float]] = bboxes  # type: ignore[assignment]
+    dims = 3 if all(len(bbox) == 6 for bbox in boxes) else 2
+    wests = [bbox[0] for bbox in boxes]
+    easts = [bbox[len(bbox) // 2] for bbox in boxes]
+    south = min(bbox[1] for bbox in boxes)
+    north = max(bbox[len(bbox) // 2 + 1] for bbox in boxes)
+    if all(west <= east for west, east in zip(wests, easts)):
+        west, east = min(wests), max(easts)
+    else:
+        west, east = _longitude_union(list(zip(wests, easts)))
+    if dims == 2:
+        return [west, south, east, north]
+    depth = min(bbox[2] for bbox in boxes)
+    height = max(bbox[5] for bbox in boxes)
+    return [west, south, depth, east, north, height]
+
+
+def _collection(
+    collections: Sequence[Collection], features: list[FeatureModel[Any, Any]]
+) -> Collection:
+    if not collections:
+        raise ValueError("At least one feature collection is needed")
+    bbox = combine_bboxes(
+        [collection.bbox for collection in collections if collection.features or collection.bbox]
+    )
+    # Features are not validated again, so only a type that all the
+    # collections share is known to fit them.
+    model = type(collections[0])
+    if any(type(collection) is not model for collection in collections):
+        model = FeatureCollectionModel
+    return model.model_construct(type="FeatureCollection", features=features, bbox=bbox)
+
+
+def concat(*collections: Collection) -> Collection:
+    """Concatenate feature collections without validating their features again.
+
+    Args:
+        *collections: The collections; the result has their type if they
+            share it, otherwise it is a FeatureCollectionModel.
+
+    Returns:
+        A collection of all the features, in order; the features are the
+        same objects as in the collections. Foreign members are dropped.
+
+    Raises:
+        ValueError: If no collection is given.
+    """
+    features: list[FeatureModel[Any, Any]] = []
+    for collection in collections:
+        features.extend(collection.features)
+    return _collection(collections, features)
+
+
+def merge(*collections: Collection, on_conflict: IdConflict = "error") -> Collection:
+    """Merge feature collections, keeping one feature per id.
+
+    Like ``concat``, without validating the features again, but features
+    sharing an id, in different collections or in the same one, are
+    resolved by ``on_conflict``. Features without an id are all kept.
+
+    Args:
+        *collections: The collections; the result has their type if they
+            share it, otherwise it is a FeatureCollectionModel.
+        on_conflict: ``"error"`` to raise on a shared id, ``"first"`` to keep
+            the first feature with the id, or ``"last"`` to keep the last
+            one, at the position of the first.
+
+    Returns:
+        The merged collection. Its ``bbox`` covers all the collections, also
+        the features that were left out.
+
+    Raises:
+        ValueError: If no collection is given, if ``on_conflict`` is invalid,
+            or, with ``"error"``, naming every shared id with the positions of
+            its features in the concatenated collections.
+    """
+    if on_conflict not in ("error", "first", "last"):
+        raise ValueError(f"on_conflict must be 'error', 'first' or 'last', not {on_conflict!r}")
+    if on_conflict == "error":
+        merged = concat(*collections)
+        check_unique_ids(merged.features)
+        return merged
+    features: list[FeatureModel[Any, Any]] = []
+    positions: dict[FeatureId, int] = {}
+    for collection in collections:
+        for feature in collection.features:
+            feature_id = feature.id
+            if feature_id is None:
+                features.append(feature)
+                continue
+            position = positions.setdefault(feature_id, len(features))
+            if position == len(features):
+                features.append(feature)
+            elif on_conflict == "last":
+                features[position] = feature
+    return _collection(collections, features)
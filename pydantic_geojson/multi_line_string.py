@@ -1,8 +1,10 @@
 from typing import Annotated
 
-from pydantic import AfterValidator, Field, model_validator
+from pydantic import AfterValidator, Field, ValidationInfo, model_validator
+from typing_extensions import Self
 
 from ._base import Coordinates, GeoJSONModel, MultiLineStringFieldType, validate_no_feature_members
+from .antimeridian import check_antimeridian, context_antimeridian_cut
 
 
 def validate_linestring_coordinates(coords: list[Coordinates]) -> list[Coordinates]:
@@ -70,3 +72,45 @@ class MultiLineStringModel(GeoJSONModel):
             ValueError: If forbidden members are present.
         """
         return validate_no_feature_members(cls, data)
+
+    @model_validator(mode="after")
+    def validate_antimeridian(self, info: ValidationInfo) -> Self:
+        """Reject uncut antimeridian crossings if the context asks for it.
+
+        Args:
+            info: Validation info; the check runs with
+                ``context={"antimeridian_cut": True}``.
+
+        Returns:
+            The validated model.
+
+        Raises:
+            ValueError: If an edge crosses the antimeridian.
+        """
+        if context_antimeridian_cut(info.context):
+            check_antimeridian(self.coordinates, "Line {} of MultiLineString")
+        return self
+
+    def cut_antimeridian(self) -> "MultiLineStringModel":
+        """Cut the lines into parts on either side of the antimeridian.
+
+        Returns:
+            A new MultiLineStringModel if a line crosses the antimeridian,
+            otherwise the model itself.
+        """
+        from .antimeridian import cut_antimeridian
+
+        return cut_antimeridian(self)  # type: ignore[no-any-return]
+
+    def length(self, *, spherical: bool = False) -> float:
+        """Compute the geodesic length of the lines.
+
+        Args:
+            spherical: Use a sphere instead of the WGS 84 ellipsoid.
+
+        Returns:
+            The length in metres.
+        """
+        from .measure import lengths
+
+        return lengths([self], spherical=spherical)[0]
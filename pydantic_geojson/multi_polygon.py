@@ -1,8 +1,12 @@
 from typing import Annotated
 
-from pydantic import AfterValidator, Field, model_validator
+from pydantic import AfterValidator, Field, ValidationInfo, model_validator
+from typing_extensions import Self
 
 from ._base import GeoJSONModel, LinearRing, MultiPolygonFieldType, validate_no_feature_members
+from .antimeridian import check_antimeridian, context_antimeridian_cut
+from .orientation import check_polygon_orientation, context_right_hand_rule, rewind_geometry
+from .validity import check_multipolygon_validity, context_strict_validity
 
 
 def validate_polygon_rings(rings: list[LinearRing]) -> list[LinearRing]:
@@ -71,3 +75,112 @@ class MultiPolygonModel(GeoJSONModel):
             ValueError: If forbidden members are present.
         """
         return validate_no_feature_members(cls, data)
+
+    @model_validator(mode="after")
+    def validate_orientation(self, info: ValidationInfo) -> Self:
+        """Check the right-hand rule if the context asks for it.
+
+        Args:
+            info: Validation info; the check runs with
+                ``context={"right_hand_rule": True}``.
+
+        Returns:
+            The validated model.
+
+        Raises:
+            ValueError: If an exterior ring is clockwise or a hole counterclockwise.
+        """
+        if context_right_hand_rule(info.context):
+            for index, polygon in enumerate(self.coordinates):
+                check_polygon_orientation(polygon, f"polygon {index}")
+        return self
+
+    @model_validator(mode="after")
+    def validate_antimeridian(self, info: ValidationInfo) -> Self:
+        """Reject uncut antimeridian crossings if the context asks for it.
+
+        Args:
+            info: Validation info; the check runs with
+                ``context={"antimeridian_cut": True}``.
+
+        Returns:
+            The validated model.
+
+        Raises:
+            ValueError: If an edge of a ring crosses the antimeridian.
+        """
+        if context_antimeridian_cut(info.context):
+            for index, polygon in enumerate(self.coordinates):
+                check_antimeridian(polygon, f"Ring {{}} of polygon {index}")
+        return self
+
+    @model_validator(mode="after")
+    def validate_strict_validity(self, info: ValidationInfo) -> Self:
+        """Check that the polygons are valid as geometries if the context asks for it.
+
+        Args:
+            info: Validation info; the check runs with
+                ``context={"strict_validity": True}``.
+
+        Returns:
+            The validated model.
+
+        Raises:
+            ValueError: If a ring self-intersects, rings of a polygon cross, a
+                hole lies outside its exterior ring, or polygons overlap.
+        """
+        if context_strict_validity(info.context):
+            check_multipolygon_validity(self.coordinates)
+        return self
+
+    def cut_antimeridian(self) -> "MultiPolygonModel":
+        """Cut the polygons into polygons on either side of the antimeridian.
+
+        Returns:
+            A new MultiPolygonModel if a polygon crosses the antimeridian,
+            otherwise the model itself.
+
+        Raises:
+            ValueError: If a ring winds around the earth more than once.
+        """
+        from .antimeridian import cut_antimeridian
+
+        return cut_antimeridian(self)  # type: ignore[no-any-return]
+
+    def rewind(self) -> Self:
+        """Reverse, in place, the rings that break the right-hand rule of RFC 7946.
+
+        Afterwards exterior rings are counterclockwise and holes are clockwise.
+        Positions are reordered, not copied.
+
+        Returns:
+            The multipolygon itself.
+        """
+        rewind_geometry(self)
+        return self
+
+    def area(self, *, spherical: bool = False) -> float:
+        """Compute the geodesic area of the polygons, holes excluded.
+
+        Args:
+            spherical: Use a sphere instead of the WGS 84 ellipsoid.
+
+        Returns:
+            The area in square metres.
+        """
+        from .measure import areas
+
+        return areas([self], spherical=spherical)[0]
+
+    def perimeter(self, *, spherical: bool = False) -> float:
+        """Compute the geodesic length of all rings of the polygons, holes included.
+
+        Args:
+            spherical: Use a sphere instead of the WGS 84 ellipsoid.
+
+        Returns:
+            The perimeter in metres.
+        """
+        from .measure import perimeters
+
+        return perimeters([self], spherical=spherical)[0]
@@ -0,0 +1,129 @@
+"""Ring orientation (winding order) checks and rewinding.
+
+RFC 7946 Section 3.1.6 asks for polygon rings to follow the right-hand rule:
+exterior rings counterclockwise, holes clockwise. Parsers should not reject
+polygons with other winding orders, so validation ignores orientation unless
+asked to check it:
+
+Example:
+    ```python
+    from pydantic_geojson import FeatureCollectionModel
+
+    collection = FeatureCollectionModel.model_validate(data, context={"right_hand_rule": True})
+    ```
+
+``rewind()`` on polygons, multipolygons and feature collections fixes the
+winding order in place instead. Orientation is the sign of the ring's area in
+the longitude/latitude plane, computed with the shoelace formula over the
+longitude and latitude sequences; reversing a ring reverses its list (or its
+packed buffer) without creating new positions.
+"""
+
+from collections.abc import Sequence
+from operator import itemgetter, mul
+from typing import Any
+
+from ._base import CONTENT_HASH_ATTRIBUTE
+from .packed import PackedCoordinates
+
+# Key of the orientation check flag in the pydantic validation context.
+RIGHT_HAND_RULE_CONTEXT_KEY = "right_hand_rule"
+
+_lon = itemgetter(0)
+_lat = itemgetter(1)
+
+
+def context_right_hand_rule(context: Any) -> bool:
+    """Return whether a validation context asks for the orientation check."""
+    return isinstance(context, dict) and bool(context.get(RIGHT_HAND_RULE_CONTEXT_KEY))
+
+
+def signed_area(ring: Sequence[Any]) -> float:
+    """Signed area of a closed ring in the longitude/latitude plane, in square degrees.
+
+    Args:
+        ring: The positions of the ring, first and last equal.
+
+    Returns:
+        A positive area for counterclockwise rings, negative for clockwise
+        rings and zero for degenerate ones.
+    """
+    if isinstance(ring, PackedCoordinates):
+        lons: Sequence[float] = ring.lons
+        lats: Sequence[float] = ring.lats
+    else:
+        lons = list(map(_lon, ring))
+        lats = list(map(_lat, ring))
+    # Shoelace formula, with longitudes relative to the first position to keep
+    # the products small and precise.
+    origin = lons[0] if len(lons) else 0.0
+    xs = [lon - origin for lon in lons]
+    twice_area: float = sum(map(mul, xs, lats[1:])) - sum(map(mul, xs[1:], lats))
+    return twice_area / 2
+
+
+def check_polygon_orientation(rings: Sequence[Sequence[Any]], where: str = "Polygon") -> None:
+    """Check that polygon rings follow the right-hand rule of RFC 7946.
+
+    Args:
+        rings: The exterior ring followed by the holes.
+        where: Description of the polygon for the error message.
+
+    Raises:
+        ValueError: If the exterior ring is clockwise or a hole counterclockwise.
+    """
+    for index, ring in enumerate(rings):
+        area = signed_area(ring)
+        if index == 0 and area < 0:
+            raise ValueError(
+                f"The exterior ring of {where} is clockwise; RFC 7946 Section 3.1.6 requires "
+                "counterclockwise exterior rings. Use rewind() to fix the winding order."
+            )
+        if index > 0 and area > 0:
+            raise ValueError(
+                f"Hole {index} of {where} is counterclockwise; RFC 7946 Section 3.1.6 requires "
+                "clockwise holes. Use rewind() to fix the winding order."
+            )
+
+
+def rewind_polygon(rings: Sequence[Any]) -> int:
+    """Reverse, in place, the rings of a polygon that break the right-hand rule.
+
+    Args:
+        rings: The exterior ring followed by the holes, as lists or
+            ``PackedCoordinates``.
+
+    Returns:
+        The number of rings reversed.
+    """
+    reversed_count = 0
+    for index, ring in enumerate(rings):
+        area = signed_area(ring)
+        if (area < 0) if index == 0 else (area > 0):
+            ring.reverse()
+            reversed_count += 1
+    return reversed_count
+
+
+def rewind_geometry(geometry: Any) -> int:
+    """Rewind the polygons of a geometry model in place; other geometries are left alone.
+
+    Args:
+        geometry: A geometry model, or None.
+
+    Returns:
+        The number of rings reversed.
+    """
+    geometry_type = getattr(geometry, "type", None)
+    if geometry_type == "Polygon":
+        reversed_rings = rewind_polygon(geometry.coordinates)
+    elif geometry_type == "MultiPolygon":
+        reversed_rings = sum(rewind_polygon(polygon) for polygon in geometry.coordinates)
+    elif geometry_type == "GeometryCollection":
+        reversed_rings = sum(rewind_geometry(member) for member in geometry.geometries)
+    else:
+        return 0
+    if reversed_rings:
+        # The order of positions changed, and with it the content hash.
+        geometry.__dict__.pop(CONTENT_HASH_ATTRIBUTE, None)
+    return reversed_rings
@@ -0,0 +1,227 @@
+"""Compact, array-backed storage for coordinate sequences.
+
+A ``list[Coordinates]`` costs a list slot, a tuple and up to three boxed
+numbers per vertex, over 100 bytes for a 2D position. ``PackedCoordinates``
+stores the same positions in one flat ``array("d")`` (16 bytes per 2D vertex,
+24 bytes per 3D vertex) while still behaving as a sequence of ``Coordinates``
+with the usual ``lon``/``lat``/``alt`` attributes and tolerant equality.
+
+The saving is in the memory a model holds on to, not in validation: input is
+validated as ``list[Coordinates]`` and packed afterwards, so the peak memory
+while validating is higher than for the plain list.
+
+It can be used as a field type in place of ``list[Coordinates]``:
+
+Example:
+    ```python
+    from pydantic import Field
+
+    from pydantic_geojson import LineStringModel
+    from pydantic_geojson.packed import PackedCoordinates
+
+
+    class CompactLineStringModel(LineStringModel):
+        coordinates: PackedCoordinates = Field(..., min_length=2)
+    ```
+"""
+
+import math
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Annotated, Any, Union, overload
+
+from pydantic import AfterValidator, GetCoreSchemaHandler
+from pydantic_core import core_schema
+
+from ._base import Coordinates, check_linear_ring
+
+
+class PackedCoordinates(Sequence[Coordinates]):
+    """A sequence of positions stored in a single flat ``array("d")``.
+
+    Positions are stored interleaved: ``[lon, lat, lon, lat, ...]`` when
+    ``dims`` is 2 and ``[lon, lat, alt, ...]`` when ``dims`` is 3. In a 3D
+    sequence, positions without an altitude are stored with a NaN altitude and
+    read back with ``alt=None``.
+
+    Items are materialized as ``Coordinates`` on access, so indexing and
+    iteration keep the ``lon``/``lat``/``alt`` attribute API. Equality is
+    tolerant in the same way as ``Coordinates.__eq__``.
+
+    Args:
+        data: Flat array of doubles holding the interleaved positions.
+        dims: Number of values per position, 2 or 3.
+
+    Raises:
+        ValueError: If ``dims`` is not 2 or 3 or does not divide ``len(data)``.
+    """
+
+    __slots__ = ("_data", "_dims")
+
+    def __init__(self, data: array, dims: int = 2) -> None:
+        if dims not in (2, 3):
+            raise ValueError(f"Packed coordinates must have 2 or 3 dimensions, not {dims}")
+        if len(data) % dims:
+            raise ValueError(
+                f"Packed coordinate buffer length {len(data)} is not a multiple of {dims}"
+            )
+        self._data = data
+        self._dims = dims
+
+    @classmethod
+    def from_positions(cls, positions: Iterable[Sequence[Any]]) -> "PackedCoordinates":
+        """Pack positions such as ``Coordinates`` or ``[lon, lat(, alt)]`` lists.
+
+        The result is 3D if any position has an altitude, 2D otherwise.
+
+        Args:
+            positions: Iterable of positions.
+
+        Returns:
+            The packed coordinates.
+        """
+        positions = positions if isinstance(positions, Sequence) else list(positions)
+        dims = 2
+        for position in positions:
+            if len(position) > 2 and position[2] is not None:
+                dims = 3
+                break
+        data = array("d")
+        if dims == 2:
+            for position in positions:
+                data.append(position[0])
+                data.append(position[1])
+        else:
+            for position in positions:
+                alt = position[2] if len(position) > 2 else None
+                data.append(position[0])
+                data.append(position[1])
+                data.append(math.nan if alt is None else alt)
+        return cls(data, dims)
+
+    @property
+    def dims(self) -> int:
+        """Number of values stored per position (2 or 3)."""
+        return self._dims
+
+    @property
+    def data(self) -> array:
+        """The underlying flat buffer, shared (not copied)."""
+        return self._data
+
+    @property
+    def lons(self) -> memoryview:
+        """Strided, zero-copy view of the longitudes."""
+        return memoryview(self._data)[0 :: self._dims]
+
+    @property
+    def lats(self) -> memoryview:
+        """Strided, zero-copy view of the latitudes."""
+        return memoryview(self._data)[1 :: self._dims]
+
+    @property
+    def alts(self) -> Union[memoryview, None]:
+        """Strided, zero-copy view of the altitudes, or None for 2D sequences."""
+        if self._dims == 2:
+            return None
+        return memoryview(self._data)[2 :: self._dims]
+
+    def __len__(self) -> int:
+        return len(self._data) // self._dims
+
+    def _at(self, offset: int) -> Coordinates:
+        data = self._data
+        if self._dims == 2:
+            return Coordinates(data[offset], data[offset + 1])
+        alt = data[offset + 2]
+        return Coordinates(data[offset], data[offset + 1], None if alt != alt else alt)
+
+    @overload
+    def __getitem__(self, index: int) -> Coordinates: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "PackedCoordinates": ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Coordinates, "PackedCoordinates"]:
+        dims = self._dims
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step == 1:
+                return PackedCoordinates(self._data[start * dims : stop * dims], dims)
+            data = array("d")
+            for i in range(start, stop, step):
+                data.extend(self._data[i * dims : i * dims + dims])
+            return PackedCoordinates(data, dims)
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("PackedCoordinates index out of range")
+        return self._at(index * dims)
+
+    def __iter__(self) -> Iterator[Coordinates]:
+        for offset in range(0, len(self._data), self._dims):
+            yield self._at(offset)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare position by position with the tolerance of ``Coordinates.__eq__``."""
+        if isinstance(other, PackedCoordinates):
+            if self._dims == other._dims and self._data == other._data:
+                return True
+        elif not isinstance(other, Sequence) or isinstance(other, (str, bytes)):
+            return NotImplemented
+        if len(self) != len(other):
+            return False
+        for mine, theirs in zip(self, other):
+            if not isinstance(theirs, Coordinates):
+                theirs = Coordinates(*theirs)
+            if not mine == theirs:  # Coordinates only overrides __eq__
+                return False
+        return True
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def reverse(self) -> None:
+        """Reverse the order of the positions in place, without materializing them."""
+        data = self._data
+        data.reverse()
+        # Reversing the flat buffer also reversed the values inside each position.
+        last = self._dims - 1
+        data[0 :: self._dims], data[last :: self._dims] = (
+            data[last :: self._dims],
+            data[0 :: self._dims],
+        )
+
+    def to_list(self) -> list[list[float]]:
+        """Return the positions as GeoJSON ``[lon, lat]`` / ``[lon, lat, alt]`` lists."""
+        return [[c.lon, c.lat] if c.alt is None else [c.lon, c.lat, c.alt] for c in self]
+
+    def __repr__(self) -> str:
+        return f"PackedCoordinates({self.to_list()!r})"
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source_type: Any, handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        """Validate like ``list[Coordinates]``, then pack; serialize as position lists.
+
+        The full ``list[Coordinates]`` is built before packing and released
+        right after, so validation does not lower the peak memory use; only
+        the validated model is compact.
+        """
+
+        def validate(value: Any, validate_positions: Any) -> "PackedCoordinates":
+            if isinstance(value, cls):
+                return value
+            return cls.from_positions(validate_positions(value))
+
+        return core_schema.no_info_wrap_validator_function(
+            validate,
+            handler.generate_schema(list[Coordinates]),
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                lambda value: value.to_list()
+            ),
+        )
+
+
+PackedLinearRing = Annotated[PackedCoordinates, AfterValidator(check_linear_ring)]
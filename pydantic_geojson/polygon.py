@@ -1,6 +1,15 @@
-from pydantic import Field, model_validator
+from typing import TYPE_CHECKING, Union
+
+from pydantic import Field, ValidationInfo, model_validator
+from typing_extensions import Self
 
 from ._base import GeoJSONModel, LinearRing, PolygonFieldType, validate_no_feature_members
+from .antimeridian import check_antimeridian, context_antimeridian_cut
+from .orientation import check_polygon_orientation, context_right_hand_rule, rewind_geometry
+from .validity import check_polygon_validity, context_strict_validity
+
+if TYPE_CHECKING:
+    from .multi_polygon import MultiPolygonModel
 
 
 class PolygonModel(GeoJSONModel):
@@ -44,3 +53,113 @@ class PolygonModel(GeoJSONModel):
             ValueError: If forbidden members are present.
         """
         return validate_no_feature_members(cls, data)
+
+    @model_validator(mode="after")
+    def validate_orientation(self, info: ValidationInfo) -> Self:
+        """Check the right-hand rule if the context asks for it.
+
+        Args:
+            info: Validation info; the check runs with
+                ``context={"right_hand_rule": True}``.
+
+        Returns:
+            The validated model.
+
+        Raises:
+            ValueError: If the exterior ring is clockwise or a hole counterclockwise.
+        """
+        if context_right_hand_rule(info.context):
+            check_polygon_orientation(self.coordinates)
+        return self
+
+    @model_validator(mode="after")
+    def validate_antimeridian(self, info: ValidationInfo) -> Self:
+        """Reject uncut antimeridian crossings if the context asks for it.
+
+        Args:
+            info: Validation info; the check runs with
+                ``context={"antimeridian_cut": True}``.
+
+        Returns:
+            The validated model.
+
+        Raises:
+            ValueError: If an edge of a ring crosses the antimeridian.
+        """
+        if context_antimeridian_cut(info.context):
+            check_antimeridian(self.coordinates, "Ring {} of Polygon")
+        return self
+
+    @model_validator(mode="after")
+    def validate_strict_validity(self, info: ValidationInfo) -> Self:
+        """Check that the polygon is valid as a geometry if the context asks for it.
+
+        Args:
+            info: Validation info; the check runs with
+                ``context={"strict_validity": True}``.
+
+        Returns:
+            The validated model.
+
+        Raises:
+            ValueError: If a ring self-intersects, rings cross or a hole lies
+                outside the exterior ring.
+        """
+        if context_strict_validity(info.context):
+            check_polygon_validity(self.coordinates)
+        return self
+
+    def cut_antimeridian(self) -> Union["PolygonModel", "MultiPolygonModel"]:
+        """Cut the polygon into polygons on either side of the antimeridian.
+
+        Holes that do not cross the antimeridian go to the part containing
+        them. A ring encircling a pole is closed along that pole.
+
+        Returns:
+            A MultiPolygonModel if the polygon crosses the antimeridian,
+            otherwise the polygon itself.
+
+        Raises:
+            ValueError: If a ring winds around the earth more than once.
+        """
+        from .antimeridian import cut_antimeridian
+
+        return cut_antimeridian(self)  # type: ignore[no-any-return]
+
+    def rewind(self) -> Self:
+        """Reverse, in place, the rings that break the right-hand rule of RFC 7946.
+
+        Afterwards the exterior ring is counterclockwise and the holes are
+        clockwise. Positions are reordered, not copied.
+
+        Returns:
+            The polygon itself.
+        """
+        rewind_geometry(self)
+        return self
+
+    def area(self, *, spherical: bool = False) -> float:
+        """Compute the geodesic area of the polygon, holes excluded.
+
+        Args:
+            spherical: Use a sphere instead of the WGS 84 ellipsoid.
+
+        Returns:
+            The area in square metres.
+        """
+        from .measure import areas
+
+        return areas([self], spherical=spherical)[0]
+
+    def perimeter(self, *, spherical: bool = False) -> float:
+        """Compute the geodesic length of all rings of the polygon, holes included.
+
+        Args:
+            spherical: Use a sphere instead of the WGS 84 ellipsoid.
+
+        Returns:
+            The perimeter in metres.
+        """
+        from .measure import perimeters
+
+        return perimeters([self], spherical=spherical)[0]
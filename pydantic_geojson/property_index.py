@@ -0,0 +1,238 @@
+"""Property indexes for filtering large collections.
+
+Filtering a collection by a property normally visits the properties of every
+feature. A ``PropertyIndex`` over one property key is built once, in one pass,
+and then answers equality and range queries in time proportional to the
+number of matching features.
+
+The index is dictionary-encoded: every distinct value is stored once, in
+``values``, and each feature only holds the small integer code of its value.
+Distinct values are numbered in sorted order (numbers, then strings, then
+other values), and the positions of the features are stored grouped by code.
+The features having one value, or a range of values, are then one contiguous
+slice of a single array, returned as a view without copying:
+
+Example:
+    ```python
+    from pydantic_geojson.property_index import select
+
+    status = collection.property_index("status")
+    population = collection.property_index("population")
+
+    active = status.equals("active")  # positions of the matching features
+    big = population.between(1_000_000, None)
+    positions = select(active, big, mask=columns.intersects([5.9, 45.8, 10.5, 47.8]))
+    subset = columns.take(positions)
+    ```
+
+``FeatureCollectionModel.property_index`` caches the index of each key until
+the features change. Indexes over a ``ColumnarFeatureCollection`` are built
+from its columns: ``PropertyIndex(columns.column("status"))``.
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Sequence
+from typing import Any, Optional
+
+from pydantic import BaseModel
+
+# Sort groups of distinct values.
+_NUMBER, _STRING, _OTHER = range(3)
+
+
+def _key(value: Any) -> Any:
+    # True == 1 in Python, but not in JSON.
+    return (value,) if isinstance(value, bool) else value
+
+
+def _group(value: Any) -> int:
+    if isinstance(value, (int, float)) and not isinstance(value, bool) and value == value:
+        return _NUMBER
+    if isinstance(value, str):
+        return _STRING
+    return _OTHER
+
+
+def _sort_key(value: Any) -> tuple[str, str]:
+    # Values that are neither numbers nor strings, such as None and booleans.
+    return type(value).__name__, repr(value)
+
+
+def feature_property(feature: BaseModel, key: str) -> Any:
+    """Return the value of property ``key`` of a feature, or None if it has none.
+
+    Args:
+        feature: A feature whose properties are a dictionary, a model or None.
+        key: The property key.
+
+    Returns:
+        The value, or None if the feature has no such property.
+    """
+    properties = getattr(feature, "properties", None)
+    if isinstance(properties, dict):
+        return properties.get(key)
+    return getattr(properties, key, None)
+
+
+class PropertyIndex:
+    """Dictionary-encoded hash and sorted index of one property.
+
+    Attributes:
+        values: The distinct values, in sorted order; the code of a value is
+            its position in this list.
+        codes: The code of the value of each feature, or -1 for values that
+            cannot be indexed (lists and objects).
+    """
+
+    __slots__ = ("values", "codes", "_codes_by_value", "_starts", "_positions", "_groups")
+
+    def __init__(self, values: Iterable[Any]) -> None:
+        """Build the index.
+
+        Args:
+            values: The value of the property for each feature, in feature
+                order; None for features without it.
+        """
+        codes_by_value: dict[Any, int] = {}
+        distinct: list[Any] = []
+        codes = array("i")
+        for value in values:
+            try:
+                code = codes_by_value.setdefault(_key(value), len(distinct))
+            except TypeError:
+                code = -1
+            else:
+                if code == len(distinct):
+                    distinct.append(value)
+            codes.append(code)
+
+        # Renumber the distinct values in sorted order, numbers first, then strings.
+        grouped: tuple[list[int], ...] = ([], [], [])
+        for code, value in enumerate(distinct):
+            grouped[_group(value)].append(code)
+        grouped[_NUMBER].sort(key=distinct.__getitem__)
+        grouped[_STRING].sort(key=distinct.__getitem__)
+        grouped[_OTHER].sort(key=lambda code: _sort_key(distinct[code]))
+        order = [*grouped[_NUMBER], *grouped[_STRING], *grouped[_OTHER]]
+        # The last entry maps the code -1 of values that cannot be indexed to itself.
+        renumbered = array("i", [-1]) * (len(order) + 1)
+        for new, old in enumerate(order):
+            renumbered[old] = new
+        self.values = [distinct[old] for old in order]
+        self.codes = array("i", map(renumbered.__getitem__, codes))
+        self._codes_by_value = {key: renumbered[code] for key, code in codes_by_value.items()}
+
+        # Feature positions sorted by code; features of one code are a contiguous run.
+        positions = array("q", sorted(range(len(codes)), key=self.codes.__getitem__))
+        sorted_codes = [self.codes[position] for position in positions]
+        self._starts = array(
+            "q", [bisect_left(sorted_codes, code) for code in range(len(order) + 1)]
+        )
+        self._positions = positions
+
+        # First code and sorted values of the numbers and of the strings.
+        numbers = len(grouped[_NUMBER])
+        strings = len(grouped[_STRING])
+        self._groups = {
+            _NUMBER: (0, self.values[:numbers]),
+            _STRING: (numbers, self.values[numbers : numbers + strings]),
+        }
+
+    @classmethod
+    def from_features(cls, features: Iterable[BaseModel], key: str) -> "PropertyIndex":
+        """Build the index of property ``key`` of some features.
+
+        Args:
+            features: The features.
+            key: The property key.
+
+        Returns:
+            The index.
+        """
+        return cls(feature_property(feature, key) for feature in features)
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __repr__(self) -> str:
+        return f"PropertyIndex({len(self)} features, {len(self.values)} distinct values)"
+
+    def _view(self, start_code: int, end_code: int) -> memoryview:
+        start = self._starts[start_code]
+        end = self._starts[end_code]
+        return memoryview(self._positions)[start:end].toreadonly()
+
+    def equals(self, value: Any) -> memoryview:
+        """Return the positions of the features whose value equals ``value``.
+
+        Args:
+            value: The value; None finds the features without the property.
+
+        Returns:
+            A read-only view of the positions, in ascending order.
+        """
+        try:
+            code = self._codes_by_value.get(_key(value))
+        except TypeError:
+            code = None
+        if code is None:
+            return self._view(0, 0)
+        return self._view(code, code + 1)
+
+    def between(self, low: Any = None, high: Any = None) -> memoryview:
+        """Return the positions of the features whose value lies in ``[low, high]``.
+
+        Numbers and strings are ordered separately: a range of numbers never
+        matches a string, and the other way around.
+
+        Args:
+            low: Smallest value, or None for no lower bound.
+            high: Largest value, or None for no upper bound.
+
+        Returns:
+            A read-only view of the positions, ordered by value and then in
+            ascending order.
+
+        Raises:
+            ValueError: If neither bound is given, or the bounds are not both
+                numbers or both strings.
+        """
+        bounds = [bound for bound in (low, high) if bound is not None]
+        groups = {_group(bound) for bound in bounds}
+        if not bounds or len(groups) > 1 or _OTHER in groups:
+            raise ValueError(
+                f"Range bounds must be numbers or strings, of the same kind; got {low!r}, {high!r}"
+            )
+        first, values = self._groups[groups.pop()]
+        start = 0 if low is None else bisect_left(values, low)
+        end = len(values) if high is None else bisect_right(values, high)
+        return self._view(first + start, first + max(start, end))
+
+
+def select(*positions: Sequence[int], mask: Optional[Sequence[bool]] = None) -> list[int]:
+    """Combine query results and a mask, such as a spatial filter.
+
+    Args:
+        *positions: Results of index queries; a position is kept only if it is
+            in all of them.
+        mask: Optional flag per feature, e.g. from
+            ``ColumnarFeatureCollection.intersects``; a position is kept only
+            if its flag is true.
+
+    Returns:
+        The kept positions, in ascending order, for use with
+        ``ColumnarFeatureCollection.take``.
+
+    Raises:
+        ValueError: If no positions are given.
+    """
+    if not positions:
+        raise ValueError("select() needs at least one sequence of positions")
+    smallest, *others = sorted(positions, key=len)
+    kept: Iterable[int] = smallest
+    for other in others:
+        kept = set(kept).intersection(other)
+    if mask is not None:
+        kept = [position for position in kept if mask[position]]
+    return sorted(kept)
@@ -0,0 +1,229 @@
+"""Precomputed JSON Schemas for the GeoJSON models.
+
+Generating ``model_json_schema()`` builds the core schema of every model and
+walks it again for each schema mode, which adds up when a service embeds the
+models in several apps or workers. This module ships the schemas of every
+public model, for both the ``validation`` and ``serialization`` modes, in a
+single JSON file with ``$defs`` shared across models.
+
+The shipped file is stamped with the versions of pydantic-geojson and pydantic
+it was generated with. If either differs from the running versions, the
+schemas are regenerated once per process instead of being read from the file.
+
+``model_json_schema()`` of the public model classes is served from these
+schemas when called with default options (``mode`` aside). FastAPI does not
+call it: it generates the OpenAPI schema of all route models in one pass of
+pydantic's ``GenerateJsonSchema``, so it gets no speedup from this module
+unless the app's ``openapi()`` is overridden to use ``schema_definitions``.
+
+Example:
+    ```python
+    from pydantic_geojson import FeatureCollectionModel
+    from pydantic_geojson.schema import model_json_schema, schema_definitions
+
+    schema = model_json_schema(FeatureCollectionModel)  # == FeatureCollectionModel.model_json_schema()
+    components = schema_definitions(ref_template="#/components/schemas/{model}")
+    ```
+
+Regenerate the shipped file after changing a model with
+``python -m pydantic_geojson.schema``.
+"""
+
+import copy
+import json
+from functools import cache
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from pydantic import BaseModel
+from pydantic.json_schema import DEFAULT_REF_TEMPLATE, JsonSchemaMode, models_json_schema
+from pydantic.version import VERSION as PYDANTIC_VERSION
+
+from . import __version__
+
+MODEL_NAMES = (
+    "PointModel",
+    "MultiPointModel",
+    "LineStringModel",
+    "MultiLineStringModel",
+    "PolygonModel",
+    "MultiPolygonModel",
+    "GeometryCollectionModel",
+    "FeatureModel",
+    "FeatureCollectionModel",
+)
+
+SCHEMA_MODES: tuple[JsonSchemaMode, ...] = ("validation", "serialization")
+
+SCHEMA_FILE = Path(__file__).with_name("schemas.json")
+
+_DEFS_PREFIX = "#/$defs/"
+
+
+def build_schema_bundle() -> dict[str, Any]:
+    """Generate the JSON Schemas of every public model, in every schema mode.
+
+    Returns:
+        A dict holding the generating versions and, per mode, the ``$defs``
+        shared by all models.
+    """
+    import pydantic_geojson
+
+    models = [getattr(pydantic_geojson, name) for name in MODEL_NAMES]
+    schemas = {}
+    for mode in SCHEMA_MODES:
+        _, definitions = models_json_schema([(model, mode) for model in models])
+        schemas[mode] = definitions["$defs"]
+    return {"version": __version__, "pydantic_version": PYDANTIC_VERSION, "schemas": schemas}
+
+
+def _is_current(bundle: dict[str, Any]) -> bool:
+    return (
+        bundle.get("version") == __version__ and bundle.get("pydantic_version") == PYDANTIC_VERSION
+    )
+
+
+@cache
+def _load_bundle() -> dict[str, Any]:
+    """Read the shipped bundle, regenerating it if it is missing or stale."""
+    try:
+        bundle = json.loads(SCHEMA_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return build_schema_bundle()
+    return bundle if _is_current(bundle) else build_schema_bundle()
+
+
+def _check_mode(mode: str) -> None:
+    if mode not in SCHEMA_MODES:
+        raise ValueError(f"Schema mode must be one of {SCHEMA_MODES}, got {mode!r}")
+
+
+def _reachable(definitions: dict[str, Any], name: str) -> set[str]:
+    """Names of the definitions referenced, directly or not, by ``definitions[name]``."""
+    seen: set[str] = set()
+    stack: list[Any] = [definitions[name]]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            ref = node.get("$ref")
+            if isinstance(ref, str) and ref.startswith(_DEFS_PREFIX):
+                target = ref[len(_DEFS_PREFIX) :]
+                if target not in seen:
+                    seen.add(target)
+                    stack.append(definitions[target])
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
+    return seen
+
+
+def _with_ref_template(node: Any, ref_template: str) -> Any:
+    if isinstance(node, dict):
+        result = {key: _with_ref_template(value, ref_template) for key, value in node.items()}
+        ref = node.get("$ref")
+        if isinstance(ref, str) and ref.startswith(_DEFS_PREFIX):
+            result["$ref"] = ref_template.format(model=ref[len(_DEFS_PREFIX) :])
+        return result
+    if isinstance(node, list):
+        return [_with_ref_template(item, ref_template) for item in node]
+    return node
+
+
+@cache
+def _model_schema(name: str, mode: JsonSchemaMode) -> dict[str, Any]:
+    definitions = _load_bundle()["schemas"][mode]
+    used = _reachable(definitions, name)
+    if name in used:
+        # Recursive models are referenced from the top level, as pydantic does.
+        schema: dict[str, Any] = {"$ref": _DEFS_PREFIX + name}
+    else:
+        schema = copy.deepcopy(definitions[name])
+    if used:
+        schema["$defs"] = {key: definitions[key] for key in sorted(used)}
+    return schema
+
+
+def model_json_schema(
+    model: Union[type[BaseModel], str], mode: JsonSchemaMode = "validation"
+) -> dict[str, Any]:
+    """Return the precomputed JSON Schema of a public model.
+
+    The result is equal to ``model.model_json_schema(mode=mode)`` and is a
+    fresh copy that the caller may modify.
+
+    Args:
+        model: One of the public model classes, or its name.
+        mode: The schema mode, ``"validation"`` or ``"serialization"``.
+
+    Returns:
+        The JSON Schema of the model.
+
+    Raises:
+        ValueError: If the model is not a public pydantic-geojson model or the
+            mode is unknown.
+    """
+    name = _public_name(model)
+    if name is None:
+        raise ValueError(f"No precomputed schema for {getattr(model, '__name__', model)!r}")
+    _check_mode(mode)
+    return copy.deepcopy(_model_schema(name, mode))
+
+
+def _public_name(model: Union[type[BaseModel], str]) -> Optional[str]:
+    """The name of a public model class or model name, or None for any other model."""
+    import pydantic_geojson
+
+    name = model if isinstance(model, str) else model.__name__
+    if name not in MODEL_NAMES or (
+        not isinstance(model, str) and getattr(pydantic_geojson, name) is not model
+    ):
+        return None
+    return name
+
+
+@cache
+def _schema_definitions(mode: JsonSchemaMode, ref_template: str) -> dict[str, Any]:
+    definitions: dict[str, Any] = _load_bundle()["schemas"][mode]
+    if ref_template == DEFAULT_REF_TEMPLATE:
+        return definitions
+    return {
+        name: _with_ref_template(definition, ref_template)
+        for name, definition in definitions.items()
+    }
+
+
+def schema_definitions(
+    mode: JsonSchemaMode = "validation", ref_template: str = DEFAULT_REF_TEMPLATE
+) -> dict[str, Any]:
+    """Return the shared definitions of every public model, keyed by name.
+
+    This is what OpenAPI ``components/schemas`` needs: pass
+    ``ref_template="#/components/schemas/{model}"`` to point references there.
+
+    Args:
+        mode: The schema mode, ``"validation"`` or ``"serialization"``.
+        ref_template: Format string for ``$ref`` values, with a ``{model}`` field.
+
+    Returns:
+        A fresh copy of the definitions that the caller may modify.
+
+    Raises:
+        ValueError: If the mode is unknown.
+    """
+    _check_mode(mode)
+    return copy.deepcopy(_schema_definitions(mode, ref_template))
+
+
+def write_schema_file(path: Path = SCHEMA_FILE) -> None:
+    """Regenerate the schemas and write them to ``path``.
+
+    Args:
+        path: Destination file, the shipped schema file by default.
+    """
+    bundle = build_schema_bundle()
+    path.write_text(json.dumps(bundle, indent=2) + "\n", encoding="utf-8")
+
+
+if __name__ == "__main__":
+    write_schema_file()
+    print(f"Wrote {SCHEMA_FILE}")
@@ -0,0 +1,253 @@
+"""In-memory vector tile pyramid for serving tiles straight from a feature collection.
+
+``TileIndex`` preprocesses a collection once, in the spirit of geojson-vt:
+features are projected to Web Mercator, Douglas-Peucker importance is computed
+for every vertex (so simplification for any zoom level is a threshold filter)
+and world-space bounding boxes are bucketed into a grid. Tiles are then sliced
+lazily on request and kept in an LRU cache bounded by tile count and bytes.
+
+Example:
+    ```python
+    from pydantic_geojson.tile_index import TileIndex
+
+    index = TileIndex(feature_collection, max_zoom=14)
+    tile_bytes = index.get_tile(10, 215, 389)
+    print(index.stats.hit_rate)
+    ```
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from typing import NamedTuple, Optional, Union
+
+from ._tiling import ProjectedFeature, project_features
+from .feature import FeatureModel
+from .feature_collection import FeatureCollectionModel
+from .mvt import DEFAULT_BUFFER, DEFAULT_EXTENT, DEFAULT_TOLERANCE, check_tile_address, encode_layer
+
+# Features whose bounding box touches more grid cells than this are not bucketed.
+_MAX_GRID_CELLS = 256
+
+
+class TileIndexStats(NamedTuple):
+    """Cache and slicing metrics of a TileIndex.
+
+    Attributes:
+        hits: Number of tile requests served from the cache.
+        misses: Number of tile requests that required slicing.
+        evictions: Number of tiles evicted from the cache.
+        cached_tiles: Number of tiles currently cached.
+        cached_bytes: Total size of the cached tiles in bytes.
+        slice_count: Number of tiles sliced so far.
+        slice_time: Total time spent slicing tiles, in seconds.
+        max_slice_time: Slowest single tile slice, in seconds.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    cached_tiles: int
+    cached_bytes: int
+    slice_count: int
+    slice_time: float
+    max_slice_time: float
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of tile requests served from the cache (0.0 when nothing was requested)."""
+        requests = self.hits + self.misses
+        return self.hits / requests if requests else 0.0
+
+    @property
+    def mean_slice_time(self) -> float:
+        """Average time spent slicing one tile, in seconds."""
+        return self.slice_time / self.slice_count if self.slice_count else 0.0
+
+
+class TileIndex:
+    """Lazily sliced, LRU-cached vector tile pyramid over a feature collection.
+
+    The collection is projected and simplified once at construction time; the
+    index does not observe later changes to the collection.
+
+    Args:
+        features: A FeatureCollectionModel or an iterable of FeatureModel.
+        layer_name: Name of the MVT layer holding the features.
+        max_zoom: Deepest zoom level served by the index.
+        extent: Tile extent in integer tile units.
+        buffer: Clip buffer around each tile, in tile units.
+        tolerance: Douglas-Peucker tolerance, in tile units.
+        max_tiles: Maximum number of tiles kept in the cache.
+        max_bytes: Maximum total size of the cached tiles, in bytes.
+        grid_zoom: Zoom level of the grid used to look up candidate features;
+            defaults to ``min(max_zoom, 8)``.
+
+    Raises:
+        ValueError: If any of the options is out of range.
+    """
+
+    def __init__(
+        self,
+        features: Union[FeatureCollectionModel, Iterable[FeatureModel]],
+        *,
+        layer_name: str = "features",
+        max_zoom: int = 14,
+        extent: int = DEFAULT_EXTENT,
+        buffer: int = DEFAULT_BUFFER,
+        tolerance: float = DEFAULT_TOLERANCE,
+        max_tiles: int = 1024,
+        max_bytes: int = 64 * 1024 * 1024,
+        grid_zoom: Optional[int] = None,
+    ) -> None:
+        if not 0 <= max_zoom <= 24:
+            raise ValueError(f"max_zoom must be in [0, 24], got {max_zoom}")
+        if extent <= 0:
+            raise ValueError(f"Tile extent must be > 0, got {extent}")
+        if buffer < 0:
+            raise ValueError(f"Tile buffer must be >= 0, got {buffer}")
+        if max_tiles < 0 or max_bytes < 0:
+            raise ValueError("Tile cache bounds must be >= 0")
+        if grid_zoom is None:
+            grid_zoom = min(max_zoom, 8)
+        if not 0 <= grid_zoom <= max_zoom:
+            raise ValueError(f"grid_zoom must be in [0, max_zoom], got {grid_zoom}")
+
+        self.layer_name = layer_name
+        self.max_zoom = max_zoom
+        self.extent = extent
+        self.buffer = buffer
+        self.tolerance = tolerance
+        self.max_tiles = max_tiles
+        self.max_bytes = max_bytes
+        self.grid_zoom = grid_zoom
+
+        if isinstance(features, FeatureCollectionModel):
+            features = features.features
+        self._features = project_features(features)
+        self._large: list[ProjectedFeature] = []
+        self._grid = self._build_grid()
+
+        self._lock = threading.Lock()
+        self._cache: OrderedDict[tuple[int, int, int], bytes] = OrderedDict()
+        self._cached_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._slice_count = 0
+        self._slice_time = 0.0
+        self._max_slice_time = 0.0
+
+    def _build_grid(self) -> dict[tuple[int, int], list[ProjectedFeature]]:
+        """Bucket features by the grid cells their buffered bounding boxes touch."""
+        size = 1 << self.grid_zoom
+        # A cell's buffer at grid_zoom covers the (smaller) buffer of every deeper tile.
+        pad = self.buffer / self.extent
+        grid: dict[tuple[int, int], list[ProjectedFeature]] = {}
+        for feature in self._features:
+            min_x, min_y, max_x, max_y = feature.bbox
+            x0 = max(int(min_x * size - pad), 0)
+            y0 = max(int(min_y * size - pad), 0)
+            x1 = min(int(max_x * size + pad), size - 1)
+            y1 = min(int(max_y * size + pad), size - 1)
+            if (x1 - x0 + 1) * (y1 - y0 + 1) > _MAX_GRID_CELLS:
+                # Huge features would flood the grid; they are candidates for every tile.
+                self._large.append(feature)
+                continue
+            for cx in range(x0, x1 + 1):
+                for cy in range(y0, y1 + 1):
+                    grid.setdefault((cx, cy), []).append(feature)
+        return grid
+
+    def _candidates(self, z: int, x: int, y: int) -> list[ProjectedFeature]:
+        if z < self.grid_zoom:
+            return self._features
+        shift = z - self.grid_zoom
+        cell = self._grid.get((x >> shift, y >> shift), [])
+        return cell + self._large if self._large else cell
+
+    def _slice(self, z: int, x: int, y: int) -> bytes:
+        return encode_layer(
+            self._candidates(z, x, y),
+            z,
+            x,
+            y,
+            layer_name=self.layer_name,
+            extent=self.extent,
+            buffer=self.buffer,
+            tolerance=self.tolerance,
+        )
+
+    def get_tile(self, z: int, x: int, y: int) -> bytes:
+        """Return the MVT bytes of a tile, slicing it on first request.
+
+        Args:
+            z: Tile zoom level, at most ``max_zoom``.
+            x: Tile column.
+            y: Tile row.
+
+        Returns:
+            The encoded tile, or empty bytes if no feature intersects it.
+
+        Raises:
+            ValueError: If the tile address is invalid or deeper than ``max_zoom``.
+        """
+        check_tile_address(z, x, y)
+        if z > self.max_zoom:
+            raise ValueError(f"Tile zoom {z} is deeper than the index max_zoom {self.max_zoom}")
+        key = (z, x, y)
+        with self._lock:
+            tile = self._cache.get(key)
+            if tile is not None:
+                self._cache.move_to_end(key)
+                self._hits += 1
+                return tile
+            self._misses += 1
+
+        start = time.perf_counter()
+        tile = self._slice(z, x, y)
+        elapsed = time.perf_counter() - start
+
+        with self._lock:
+            self._slice_count += 1
+            self._slice_time += elapsed
+            self._max_slice_time = max(self._max_slice_time, elapsed)
+            self._store(key, tile)
+        return tile
+
+    def _store(self, key: tuple[int, int, int], tile: bytes) -> None:
+        size = len(tile)
+        if key in self._cache or self.max_tiles == 0 or size > self.max_bytes:
+            return
+        self._cache[key] = tile
+        self._cached_bytes += size
+        while len(self._cache) > self.max_tiles or self._cached_bytes > self.max_bytes:
+            _, evicted = self._cache.popitem(last=False)
+            self._cached_bytes -= len(evicted)
+            self._evictions += 1
+
+    def clear_cache(self) -> None:
+        """Drop every cached tile; metrics are kept."""
+        with self._lock:
+            self._cache.clear()
+            self._cached_bytes = 0
+
+    @property
+    def stats(self) -> TileIndexStats:
+        """A snapshot of the cache and slicing metrics."""
+        with self._lock:
+            return TileIndexStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                cached_tiles=len(self._cache),
+                cached_bytes=self._cached_bytes,
+                slice_count=self._slice_count,
+                slice_time=self._slice_time,
+                max_slice_time=self._max_slice_time,
+            )
+
+    def __len__(self) -> int:
+        """Number of indexed (projected) features."""
+        return len(self._features)
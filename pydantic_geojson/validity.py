@@ -0,0 +1,426 @@
+"""Strict polygon validity checks.
+
+A Polygon that parses may still be invalid as a geometry: bow-tie rings,
+rings crossing each other and holes outside the exterior ring are accepted
+by the models but rejected by spatial databases. The strict check finds
+them, and is opt-in:
+
+Example:
+    ```python
+    from pydantic_geojson import FeatureCollectionModel
+
+    collection = FeatureCollectionModel.model_validate(data, context={"strict_validity": True})
+    ```
+
+Intersections are found with the Shamos-Hoey sweep line, in O(n log n) time
+for n edges: edges enter and leave an ordered status structure as a vertical
+line sweeps across them, and only edges that become neighbours in it are
+tested against each other. The sweep stops at the first invalid
+intersection, whose location is reported. Rings may touch each other at
+single points, as in the OGC Simple Features model; a ring may not touch
+itself. Coordinates are treated as planar longitude/latitude.
+
+The polygons of a MultiPolygon must not overlap nor share edges either. An
+R-tree over their bounding boxes yields the candidate pairs, and only those
+are swept together, so MultiPolygons with many parts are checked in near
+linear time.
+"""
+
+import math
+from collections.abc import Iterator, Sequence
+from typing import Any, NamedTuple, Optional
+
+from ._index import STRTree
+from .packed import PackedCoordinates
+
+# Key of the strict validity flag in the pydantic validation context.
+STRICT_VALIDITY_CONTEXT_KEY = "strict_validity"
+
+_Point = tuple[float, float]
+
+
+class PolygonError(NamedTuple):
+    """The first problem found in a polygon.
+
+    Attributes:
+        reason: Description of the problem, naming the rings involved.
+        location: Longitude and latitude of the problem.
+    """
+
+    reason: str
+    location: _Point
+
+
+def context_strict_validity(context: Any) -> bool:
+    """Return whether a validation context asks for the strict validity check."""
+    return isinstance(context, dict) and bool(context.get(STRICT_VALIDITY_CONTEXT_KEY))
+
+
+def _vertices(ring: Sequence[Any]) -> tuple[list[float], list[float]]:
+    """Longitudes and latitudes of a ring, without repeated positions and closing position."""
+    if isinstance(ring, PackedCoordinates):
+        lons, lats = list(ring.lons), list(ring.lats)
+    else:
+        lons = [position[0] for position in ring]
+        lats = [position[1] for position in ring]
+    xs: list[float] = []
+    ys: list[float] = []
+    for x, y in zip(lons, lats):
+        if not xs or x != xs[-1] or y != ys[-1]:
+            xs.append(x)
+            ys.append(y)
+    while len(xs) > 1 and xs[-1] == xs[0] and ys[-1] == ys[0]:
+        xs.pop()
+        ys.pop()
+    return xs, ys
+
+
+def _orientation(ax: float, ay: float, bx: float, by: float, cx: float, cy: float) -> int:
+    cross = (bx - ax) * (cy - ay) - (by - ay) * (cx - ax)
+    return (cross > 0) - (cross < 0)
+
+
+class _Sweep:
+    """Edges of a polygon and the tests between them."""
+
+    def __init__(self, rings: list[tuple[list[float], list[float]]]) -> None:
+        self.rings = rings
+        self.ring: list[int] = []
+        self.index: list[int] = []
+        # Endpoints in sweep order: (x1, y1) before (x2, y2) lexicographically.
+        self.x1: list[float] = []
+        self.y1: list[float] = []
+        self.x2: list[float] = []
+        self.y2: list[float] = []
+        self.slope: list[float] = []
+        for ring, (xs, ys) in enumerate(rings):
+            count = len(xs)
+            for index in range(count):
+                ax, ay = xs[index], ys[index]
+                bx, by = xs[(index + 1) % count], ys[(index + 1) % count]
+                if (bx, by) < (ax, ay):
+                    ax, ay, bx, by = bx, by, ax, ay
+                self.ring.append(ring)
+                self.index.append(index)
+                self.x1.append(ax)
+                self.y1.append(ay)
+                self.x2.append(bx)
+                self.y2.append(by)
+                self.slope.append((by - ay) / (bx - ax) if bx != ax else math.inf)
+
+    def _start(self, edge: int) -> _Point:
+        xs, ys = self.rings[self.ring[edge]]
+        index = self.index[edge]
+        return xs[index], ys[index]
+
+    def _end(self, edge: int) -> _Point:
+        xs, ys = self.rings[self.ring[edge]]
+        index = (self.index[edge] + 1) % len(xs)
+        return xs[index], ys[index]
+
+    def _search(self, status: list[int], x: float, y: float, slope: float) -> int:
+        """Position in the status, ordered bottom to top along the sweep line at ``x``,
+        of a point ``(x, y)`` followed by an edge with the given slope."""
+        x1, y1, y2, slopes = self.x1, self.y1, self.y2, self.slope
+        inf = math.inf
+        low, high = 0, len(status)
+        while low < high:
+            middle = (low + high) // 2
+            other = status[middle]
+            other_slope = slopes[other]
+            if other_slope == inf:
+                other_y = min(max(y, y1[other]), y2[other])
+            else:
+                other_y = y1[other] + other_slope * (x - x1[other])
+            if other_y < y or (other_y == y and other_slope < slope):
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def run(self) -> Optional[PolygonError]:
+        events = sorted(
+            [(self.x1[edge], self.y1[edge], 0, edge) for edge in range(len(self.x1))]
+            + [(self.x2[edge], self.y2[edge], 1, edge) for edge in range(len(self.x1))]
+        )
+        status: list[int] = []
+        for x, y, kind, edge in events:
+            if kind == 0:
+                position = self._search(status, x, y, self.slope[edge])
+                status.insert(position, edge)
+                if position:
+                    error = self.test(edge, status[position - 1])
+                    if error is not None:
+                        return error
+                if position + 1 < len(status):
+                    error = self.test(edge, status[position + 1])
+                    if error is not None:
+                        return error
+            else:
+                # Edges ending at the same point compare equal: scan past them.
+                position = self._search(status, x, y, -math.inf)
+                while position < len(status) and status[position] != edge:
+                    position += 1
+                if position == len(status):
+                    position = status.index(edge)
+                del status[position]
+                if 0 < position < len(status):
+                    error = self.test(status[position - 1], status[position])
+                    if error is not None:
+                        return error
+        return None
+
+    def _describe(self, a: int, b: int) -> str:
+        ring_a, ring_b = sorted((self.ring[a], self.ring[b]))
+        if ring_a == ring_b:
+            return f"Ring {ring_a} self-intersects"
+        return f"Rings {ring_a} and {ring_b} cross"
+
+    def test(self, a: int, b: int) -> Optional[PolygonError]:
+        """Return an error if two edges intersect in a way a valid polygon does not allow."""
+        if self.ring[a] == self.ring[b]:
+            count = len(self.rings[self.ring[a]][0])
+            step = (self.index[b] - self.index[a]) % count
+            if step in (1, count - 1):
+                # Consecutive edges meet at their shared vertex, and overlap
+                # only if the ring folds back on itself there.
+                first, second = (a, b) if step == 1 else (b, a)
+                vx, vy = self._end(first)
+                px, py = self._start(first)
+                qx, qy = self._end(second)
+                if (px - vx) * (qy - vy) == (py - vy) * (qx - vx) and (px - vx) * (qx - vx) + (
+                    py - vy
+                ) * (qy - vy) > 0:
+                    return PolygonError(f"Ring {self.ring[a]} folds back on itself", (vx, vy))
+                return None
+        a1 = (self.x1[a], self.y1[a])
+        a2 = (self.x2[a], self.y2[a])
+        b1 = (self.x1[b], self.y1[b])
+        b2 = (self.x2[b], self.y2[b])
+        o1 = _orientation(*a1, *a2, *b1)
+        o2 = _orientation(*a1, *a2, *b2)
+        o3 = _orientation(*b1, *b2, *a1)
+        o4 = _orientation(*b1, *b2, *a2)
+        if o1 == o2 == 0:
+            # Collinear: the edges share a stretch, a point or nothing.
+            start, end = max(a1, b1), min(a2, b2)
+            if start > end:
+                return None
+            if start < end:
+                return PolygonError(f"{self._describe(a, b)} along an edge", start)
+            point = start
+        elif o1 * o2 > 0 or o3 * o4 > 0:
+            return None
+        elif o1 and o2 and o3 and o4:
+            ax, ay = a1
+            dx, dy = a2[0] - ax, a2[1] - ay
+            ex, ey = b2[0] - b1[0], b2[1] - b1[1]
+            t = ((b1[0] - ax) * ey - (b1[1] - ay) * ex) / (dx * ey - dy * ex)
+            return PolygonError(self._describe(a, b), (ax + t * dx, ay + t * dy))
+        else:
+            point = b1 if o1 == 0 else b2 if o2 == 0 else a1 if o3 == 0 else a2
+        return self._touch(a, b, point)
+
+    def _incident(self, edge: int, point: _Point) -> Optional[tuple[_Point, _Point]]:
+        """Neighbouring vertices of ``point`` on the ring of ``edge``, if it is a vertex."""
+        xs, ys = self.rings[self.ring[edge]]
+        count = len(xs)
+        index = self.index[edge]
+        if self._end(edge) == point:
+            index = (index + 1) % count
+        elif self._start(edge) != point:
+            return None
+        previous, following = (index - 1) % count, (index + 1) % count
+        return (xs[previous], ys[previous]), (xs[following], ys[following])
+
+    def _touch(self, a: int, b: int, point: _Point) -> Optional[PolygonError]:
+        """Check edges meeting at a single point."""
+        if self.ring[a] == self.ring[b]:
+            return PolygonError(self._describe(a, b), point)
+        around_a = self._incident(a, point)
+        around_b = self._incident(b, point)
+        if around_a is not None and around_b is not None:
+            # Both rings pass through the vertex: they cross if the edges of
+            # one lie on both sides of the wedge formed by the other.
+            origin = math.atan2(around_a[0][1] - point[1], around_a[0][0] - point[0])
+
+            def angle(vertex: _Point) -> float:
+                turn = math.atan2(vertex[1] - point[1], vertex[0] - point[0]) - origin
+                return turn % (2 * math.pi)
+
+            wedge = angle(around_a[1])
+            sides = [angle(vertex) for vertex in around_b]
+            if all(0 < side != wedge for side in sides) and (sides[0] < wedge) != (
+                sides[1] < wedge
+            ):
+                return PolygonError(self._describe(a, b), point)
+            return None
+        # A vertex of one ring on an edge of the other: the ring crosses the
+        # edge if its neighbouring vertices are on opposite sides of it.
+        vertex_edge, line_edge = (a, b) if around_a is not None else (b, a)
+        around = around_a if around_a is not None else around_b
+        if around is None:
+            return None
+        line = (self.x1[line_edge], self.y1[line_edge], self.x2[line_edge], self.y2[line_edge])
+        sides = [_orientation(*line, *vertex) for vertex in around]
+        if sides[0] * sides[1] < 0:
+            return PolygonError(self._describe(vertex_edge, line_edge), point)
+        return None
+
+
+def _locate(xs: list[float], ys: list[float], x: float, y: float) -> int:
+    """Return 1 if a point is inside a ring, -1 if outside and 0 if on its boundary."""
+    inside = False
+    count = len(xs)
+    for index in range(count):
+        ax, ay = xs[index - 1], ys[index - 1]
+        bx, by = xs[index], ys[index]
+        if (
+            _orientation(ax, ay, bx, by, x, y) == 0
+            and min(ax, bx) <= x <= max(ax, bx)
+            and min(ay, by) <= y <= max(ay, by)
+        ):
+            return 0
+        if (ay > y) != (by > y) and x < ax + (y - ay) * (bx - ax) / (by - ay):
+            inside = not inside
+    return 1 if inside else -1
+
+
+def polygon_error(rings: Sequence[Sequence[Any]]) -> Optional[PolygonError]:
+    """Find the first strict validity problem of a polygon.
+
+    Args:
+        rings: The exterior ring followed by the holes.
+
+    Returns:
+        The problem, or None if the polygon is valid: its rings have at
+        least three distinct positions, do not intersect themselves or cross
+        each other, and its holes lie inside the exterior ring.
+    """
+    return _polygon_error([_vertices(ring) for ring in rings])
+
+
+def _polygon_error(vertices: list[tuple[list[float], list[float]]]) -> Optional[PolygonError]:
+    for index, (xs, ys) in enumerate(vertices):
+        if len(xs) < 3:
+            location = (xs[0], ys[0]) if xs else (math.nan, math.nan)
+            return PolygonError(f"Ring {index} has fewer than 3 distinct positions", location)
+    error = _Sweep(vertices).run()
+    if error is not None:
+        return error
+    shell_xs, shell_ys = vertices[0]
+    for index, (xs, ys) in enumerate(vertices[1:], start=1):
+        # Rings do not cross, so any vertex off the exterior ring tells on
+        # which side the hole lies.
+        for x, y in _probes(xs, ys):
+            side = _locate(shell_xs, shell_ys, x, y)
+            if side < 0:
+                return PolygonError(f"Hole {index} lies outside the exterior ring", (x, y))
+            if side > 0:
+                break
+    return None
+
+
+def _probes(xs: list[float], ys: list[float]) -> Iterator[_Point]:
+    """Points on a ring: its vertices, then the midpoints of its edges.
+
+    When the boundaries of two rings do not cross, the first probe off the
+    other ring's boundary tells on which side of it the ring lies; the
+    midpoints decide when every vertex lies on that boundary.
+    """
+    yield from zip(xs, ys)
+    count = len(xs)
+    for index in range(count):
+        following = (index + 1) % count
+        yield (xs[index] + xs[following]) / 2, (ys[index] + ys[following]) / 2
+
+
+def _inside(vertices: list[tuple[list[float], list[float]]], x: float, y: float) -> int:
+    """Return 1 if a point is in a polygon's interior, -1 if outside and 0 if on its boundary."""
+    side = _locate(*vertices[0], x, y)
+    for xs, ys in vertices[1:] if side > 0 else ():
+        hole_side = _locate(xs, ys, x, y)
+        if hole_side >= 0:
+            return -hole_side
+    return side
+
+
+def _overlap(
+    first: list[tuple[list[float], list[float]]], second: list[tuple[list[float], list[float]]]
+) -> Optional[tuple[str, _Point]]:
+    """Return how two valid polygons overlap, as a reason suffix and a location, or None."""
+    error = _Sweep(first + second).run()
+    if error is not None:
+        shared_edge = error.reason.endswith("along an edge")
+        return ("share an edge" if shared_edge else "overlap"), error.location
+    # The boundaries do not cross, so a polygon is inside the other if any of
+    # its points off the other's boundary is.
+    for inner, outer in ((second, first), (first, second)):
+        xs, ys = inner[0]
+        for x, y in _probes(xs, ys):
+            side = _inside(outer, x, y)
+            if side > 0:
+                return "overlap", (x, y)
+            if side < 0:
+                break
+    return None
+
+
+def multipolygon_error(polygons: Sequence[Sequence[Sequence[Any]]]) -> Optional[PolygonError]:
+    """Find the first strict validity problem of a MultiPolygon.
+
+    Each polygon is checked as by ``polygon_error``; then polygons whose
+    bounding boxes intersect, as found with an R-tree, are checked for
+    overlapping interiors or shared edges. Polygons may touch at points.
+
+    Args:
+        polygons: The polygons, each a list of rings.
+
+    Returns:
+        The problem, or None if the MultiPolygon is valid. Reasons name the
+        polygons involved.
+    """
+    vertices = [[_vertices(ring) for ring in rings] for rings in polygons]
+    for index, polygon in enumerate(vertices):
+        error = _polygon_error(polygon)
+        if error is not None:
+            return PolygonError(f"Polygon {index}: {error.reason}", error.location)
+    boxes = [(min(xs), min(ys), max(xs), max(ys)) for (xs, ys), *_ in vertices]
+    for first, second in sorted(STRTree(boxes).pairs()):
+        overlap = _overlap(vertices[first], vertices[second])
+        if overlap is not None:
+            return PolygonError(f"Polygons {first} and {second} {overlap[0]}", overlap[1])
+    return None
+
+
+def check_multipolygon_validity(polygons: Sequence[Sequence[Sequence[Any]]]) -> None:
+    """Check that a MultiPolygon passes the strict validity check.
+
+    Args:
+        polygons: The polygons, each a list of rings.
+
+    Raises:
+        ValueError: If a polygon is invalid, or two polygons overlap or share
+            an edge.
+    """
+    error = multipolygon_error(polygons)
+    if error is not None:
+        lon, lat = error.location
+        raise ValueError(f"Invalid MultiPolygon: {error.reason} at ({lon}, {lat})")
+
+
+def check_polygon_validity(rings: Sequence[Sequence[Any]], where: str = "Polygon") -> None:
+    """Check that a polygon passes the strict validity check.
+
+    Args:
+        rings: The exterior ring followed by the holes.
+        where: Description of the polygon for the error message.
+
+    Raises:
+        ValueError: If a ring is degenerate or self-intersects, rings cross,
+            or a hole lies outside the exterior ring.
+    """
+    error = polygon_error(rings)
+    if error is not None:
+        lon, lat = error.location
+        raise ValueError(f"Invalid {where}: {error.reason} at ({lon}, {lat})")
@@ -4,6 +4,8 @@ import copy
 
 import pytest
 
+from pydantic_geojson import FeatureCollectionModel, FeatureModel
+
 # ============================================================================
 # Coordinate fixtures
 # ============================================================================
@@ -591,3 +593,50 @@ def feature_with_nested_geometry_collection(nested_geometry_collection_data):
         "geometry": nested_geometry_collection_data,
         "properties": {"name": "Test Nested GeometryCollection"},
     }
+
+
+# ============================================================================
+# Feature and FeatureCollection builders
+# ============================================================================
+
+
+class GeoJSONBuilder:
+    """Builds Feature and FeatureCollection test data."""
+
+    @staticmethod
+    def point(lon=0, lat=0):
+        """Point GeoJSON data."""
+        return {"type": "Point", "coordinates": [lon, lat]}
+
+    @staticmethod
+    def feature(geometry, properties=None, **members):
+        """Feature GeoJSON data; ``members`` adds an ``id``, a ``bbox`` or foreign members."""
+        return {"type": "Feature", "geometry": geometry, "properties": properties, **members}
+
+    def point_feature(self, lon=0, lat=0, properties=None, **members):
+        """Feature GeoJSON data with a Point geometry."""
+        return self.feature(self.point(lon, lat), properties, **members)
+
+    def place(self, name, lon, lat=0, **members):
+        """Feature GeoJSON data with a ``name`` property, and no geometry if ``lon`` is None."""
+        geometry = None if lon is None else self.point(lon, lat)
+        return self.feature(geometry, {"name": name}, **members)
+
+    def feature_model(self, geometry, properties=None, **members):
+        """A validated FeatureModel."""
+        return FeatureModel.model_validate(self.feature(geometry, properties, **members))
+
+    @staticmethod
+    def collection_data(features, **members):
+        """FeatureCollection GeoJSON data of Feature data or models."""
+        return {"type": "FeatureCollection", "features": list(features), **members}
+
+    def collection(self, features, cls=FeatureCollectionModel, **members):
+        """A validated FeatureCollection model of Feature data or models."""
+        return cls.model_validate(self.collection_data(features, **members))
+
+
+@pytest.fixture
+def geojson():
+    """Builder of Feature and FeatureCollection test data."""
+    return GeoJSONBuilder()
@@ -0,0 +1,200 @@
+"""Tests for cutting geometries at the antimeridian."""
+
+from typing import Union
+
+import pytest
+from pydantic import ValidationError
+
+from pydantic_geojson import (
+    FeatureCollectionModel,
+    FeatureModel,
+    LineStringModel,
+    MultiLineStringModel,
+    MultiPolygonModel,
+    PointModel,
+    PolygonModel,
+)
+from pydantic_geojson.antimeridian import crosses_antimeridian, cut_antimeridian
+from pydantic_geojson.packed import PackedLinearRing
+
+CUT = {"antimeridian_cut": True}
+# A 20 by 10 degree box centred on the antimeridian, counterclockwise.
+BOX = [[170, 0], [-170, 0], [-170, 10], [170, 10], [170, 0]]
+EAST_BOX = [[[180, 10], [170, 10], [170, 0], [180, 0], [180, 10]]]
+WEST_BOX = [[[-180, 0], [-170, 0], [-170, 10], [-180, 10], [-180, 0]]]
+
+
+def coordinates(value):
+    if isinstance(value[0], (int, float)):
+        return [float(number) for number in value[:2]]
+    return [coordinates(item) for item in value]
+
+
+class CompactPolygonModel(PolygonModel):
+    coordinates: list[PackedLinearRing]
+
+
+class TestAntimeridian:
+    """Test suite for antimeridian cutting and checks."""
+
+    def test_crosses_antimeridian(self):
+        """Test crossing detection on longitude jumps above 180 degrees."""
+        assert crosses_antimeridian(BOX)
+        assert crosses_antimeridian([[179, 0], [-179, 0]])
+        assert not crosses_antimeridian([[180, 0], [170, 0]])
+        assert not crosses_antimeridian([[-90, 0], [90, 0]])
+
+    def test_cut_line_string(self):
+        """Test cutting a line that crosses twice, interpolating the crossings."""
+        line = LineStringModel(
+            type="LineString", coordinates=[[170, 0], [-170, 10, 100], [-160, 10], [160, 20]]
+        )
+        cut = line.cut_antimeridian()
+
+        assert isinstance(cut, MultiLineStringModel)
+        assert coordinates(cut.coordinates) == [
+            [[170, 0], [180, 5]],
+            [[-180, 5], [-170, 10], [-160, 10], [-180, 15]],
+            [[180, 15], [160, 20]],
+        ]
+
+    def test_uncut_geometries_are_returned(self):
+        """Test that geometries which do not cross are returned as they are."""
+        line = LineStringModel(type="LineString", coordinates=[[170, 0], [180, 0], [175, 5]])
+        point = PointModel(type="Point", coordinates=[180, 0])
+
+        assert line.cut_antimeridian() is line
+        assert cut_antimeridian(point) is point
+        assert cut_antimeridian(None) is None
+
+    def test_cut_polygon(self):
+        """Test cutting a box into two boxes, keeping the bbox member."""
+        polygon = PolygonModel(type="Polygon", coordinates=[BOX], bbox=[170, 0, -170, 10])
+        cut = polygon.cut_antimeridian()
+
+        assert isinstance(cut, MultiPolygonModel)
+        assert coordinates(cut.coordinates) == [EAST_BOX, WEST_BOX]
+        assert cut.bbox == [170, 0, -170, 10]
+
+    def test_cut_polygon_with_hole_and_clockwise_ring(self):
+        """Test that cut rings follow the right-hand rule and holes go to their part."""
+        hole = [[-178, 2], [-176, 2], [-176, 4], [-178, 4], [-178, 2]]
+        cut = CompactPolygonModel(type="Polygon", coordinates=[BOX[::-1], hole]).cut_antimeridian()
+
+        assert coordinates(cut.coordinates) == [EAST_BOX, WEST_BOX + [hole]]
+
+    def test_cut_concave_polygon(self):
+        """Test a polygon crossing the antimeridian four times."""
+        ring = [[170, 0], [-170, 0], [-170, 3], [175, 3], [175, 6], [-170, 6], [-170, 9]]
+        ring += [[170, 9], [170, 0]]
+        cut = PolygonModel(type="Polygon", coordinates=[ring]).cut_antimeridian()
+
+        assert coordinates(cut.coordinates) == [
+            [
+                [[180, 9], [170, 9], [170, 0], [180, 0], [180, 3], [175, 3], [175, 6], [180, 6]]
+                + [[180, 9]]
+            ],
+            [[[-180, 0], [-170, 0], [-170, 3], [-180, 3], [-180, 0]]],
+            [[[-180, 6], [-170, 6], [-170, 9], [-180, 9], [-180, 6]]],
+        ]
+
+    def test_cut_polar_polygon(self):
+        """Test that a ring around the north pole is closed along the pole."""
+        ring = [[170, 80], [-150, 80], [-90, 80], [0, 80], [90, 80], [170, 80]]
+        cut = PolygonModel(type="Polygon", coordinates=[ring]).cut_antimeridian()
+
+        assert coordinates(cut.coordinates) == [
+            [[[180, 90], [170, 90], [170, 80], [180, 80], [180, 90]]],
+            [
+                [[-180, 80], [-150, 80], [-90, 80], [0, 80], [90, 80], [170, 80], [170, 90]]
+                + [[80, 90], [-10, 90], [-100, 90], [-180, 90], [-180, 80]]
+            ],
+        ]
+        MultiPolygonModel.model_validate(cut.model_dump(), context=CUT)
+
+    def test_cut_feature_collection(self):
+        """Test cutting the geometries of a FeatureCollection into a copy."""
+        collection = FeatureCollectionModel.model_validate(
+            {
+                "type": "FeatureCollection",
+                "features": [
+                    {
+                        "type": "Feature",
+                        "properties": {"name": "route"},
+                        "geometry": {
+                            "type": "GeometryCollection",
+                            "geometries": [
+                                {"type": "MultiLineString", "coordinates": [[[170, 0], [-170, 0]]]},
+                                {"type": "MultiPolygon", "coordinates": [[BOX]]},
+                            ],
+                        },
+                    },
+                    {"type": "Feature", "properties": None, "geometry": None},
+                ],
+            }
+        )
+        cut = cut_antimeridian(collection)
+        members = cut.features[0].geometry.geometries
+
+        assert coordinates(members[0].coordinates) == [[[170, 0], [180, 0]], [[-180, 0], [-170, 0]]]
+        assert coordinates(members[1].coordinates) == [EAST_BOX, WEST_BOX]
+        assert cut.features[0].properties == {"name": "route"}
+        assert collection.features[0].geometry.geometries[0].coordinates[0][1].lon == -170
+
+    def test_cut_keeps_foreign_members(self):
+        """Test that foreign members of a cut geometry are carried over to its parts."""
+        line = LineStringModel.model_validate(
+            {"type": "LineString", "coordinates": [[170, 0], [-170, 0]], "name": "route"}
+        )
+        polygon = PolygonModel.model_validate({"type": "Polygon", "coordinates": [BOX], "z": 1})
+
+        assert cut_antimeridian(line).model_extra == {"name": "route"}
+        assert cut_antimeridian(polygon).model_extra == {"z": 1}
+
+    def test_cut_parameterized_feature(self):
+        """Test that a typed Feature keeps its type, or is refused a geometry it cannot hold."""
+        data = {
+            "type": "Feature",
+            "properties": {"name": "route"},
+            "geometry": {"type": "LineString", "coordinates": [[170, 0], [-170, 0]]},
+        }
+        lines = FeatureModel[Union[LineStringModel, MultiLineStringModel], dict]
+        cut = cut_antimeridian(lines.model_validate(data))
+
+        assert type(cut) is lines
+        assert cut.geometry.type == "MultiLineString"
+        assert lines.model_validate(cut.model_dump()) == cut
+        with pytest.raises(ValueError, match="LineString of a .* into a MultiLineString"):
+            cut_antimeridian(FeatureModel[LineStringModel, dict].model_validate(data))
+        with pytest.raises(ValueError, match="does not accept"):
+            cut_antimeridian(
+                FeatureCollectionModel[LineStringModel, dict].model_validate(
+                    {"type": "FeatureCollection", "features": [data]}
+                )
+            )
+        data["geometry"]["coordinates"] = [[160, 0], [170, 0]]
+        uncut = FeatureModel[LineStringModel, dict].model_validate(data)
+        assert cut_antimeridian(uncut) == uncut
+
+    @pytest.mark.parametrize(
+        "geometry, message",
+        [
+            ({"type": "LineString", "coordinates": [[170, 0], [-170, 0]]}, "LineString crosses"),
+            ({"type": "Polygon", "coordinates": [BOX]}, "Ring 0 of Polygon crosses"),
+            ({"type": "MultiPolygon", "coordinates": [[EAST_BOX[0]], [BOX]]}, "of polygon 1"),
+        ],
+    )
+    def test_check(self, geometry, message):
+        """Test that uncut crossings fail only when the check is requested."""
+        data = {
+            "type": "FeatureCollection",
+            "features": [{"type": "Feature", "properties": None, "geometry": geometry}],
+        }
+
+        FeatureCollectionModel.model_validate(data)
+        for context in (CUT, {**CUT, "max_errors": 1}):
+            with pytest.raises(ValidationError, match=message):
+                FeatureCollectionModel.model_validate(data, context=context)
+
+        cut = cut_antimeridian(FeatureCollectionModel.model_validate(data))
+        FeatureCollectionModel.model_validate(cut.model_dump(), context=CUT)
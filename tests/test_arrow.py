@@ -0,0 +1,165 @@
+"""Tests for Arrow and GeoArrow export and import."""
+
+import io
+
+import pytest
+
+from pydantic_geojson import PointModel, PolygonModel
+from pydantic_geojson.columnar import ColumnarFeatureCollection
+from tests.test_utils import SAMPLE_GEOMETRIES as GEOMETRIES
+
+pa = pytest.importorskip("pyarrow")
+
+from pydantic_geojson.arrow import (  # noqa: E402
+    from_arrow,
+    geometries_from_arrow,
+    geometries_to_arrow,
+    read_ipc,
+    to_arrow,
+    write_ipc,
+)
+
+
+def geometries_of(features):
+    return [f.geometry for f in features]
+
+
+class TestArrow:
+    """Test suite for Arrow export and import."""
+
+    @pytest.mark.parametrize("geometry_type", list(GEOMETRIES))
+    def test_native_round_trip(self, geojson, geometry_type):
+        """Test the GeoArrow native encoding of each geometry type, with null geometries."""
+        geometry = GEOMETRIES[geometry_type]
+        original = geojson.collection(
+            [geojson.feature(geometry), geojson.feature(None), geojson.feature(geometry)]
+        )
+        table = to_arrow(original)
+        field = table.schema.field("geometry")
+
+        assert field.metadata[b"ARROW:extension:name"] == (
+            f"geoarrow.{geometry_type.lower()}".encode()
+        )
+        assert geometries_of(from_arrow(table).features) == geometries_of(original.features)
+        assert geometries_of(from_arrow(table.slice(1)).features) == geometries_of(
+            original.features[1:]
+        )
+
+    def test_wkb_for_mixed_types(self, geojson):
+        """Test that mixed geometry types and GeometryCollections use WKB."""
+        original = geojson.collection(
+            [
+                geojson.feature(GEOMETRIES["Point"]),
+                geojson.feature(
+                    {"type": "GeometryCollection", "geometries": [GEOMETRIES["LineString"]]},
+                ),
+                geojson.feature(GEOMETRIES["MultiPolygon"]),
+            ]
+        )
+        table = to_arrow(original)
+
+        assert table.schema.field("geometry").metadata[b"ARROW:extension:name"] == b"geoarrow.wkb"
+        assert geometries_of(from_arrow(table).features) == geometries_of(original.features)
+        with pytest.raises(ValueError, match="native"):
+            to_arrow(original, geometry_encoding="native")
+
+    def test_properties_and_ids(self, geojson):
+        """Test property columns, JSON columns and the id column."""
+        original = geojson.collection(
+            [
+                geojson.feature(GEOMETRIES["Point"], {"name": "a", "tags": {"k": 1}, "n": 1}, id=1),
+                geojson.feature(GEOMETRIES["Point"], {"name": "b", "tags": "x"}, id=2),
+            ]
+        )
+        table = to_arrow(original)
+
+        assert table.column_names == ["id", "name", "tags", "n", "geometry"]
+        assert table.schema.field("n").type == pa.int64()
+        assert table.schema.field("tags").metadata[b"ARROW:extension:name"] == b"arrow.json"
+        assert from_arrow(table) == original
+
+    def test_null_values_are_omitted(self, geojson):
+        """Test that null property values are left out on import."""
+        table = to_arrow(
+            geojson.collection(
+                [geojson.feature(None, {"a": None, "b": 1}), geojson.feature(None, None)]
+            )
+        )
+
+        assert [f.properties for f in from_arrow(table).features] == [{"b": 1}, {}]
+
+    def test_zero_copy_from_columnar(self, geojson):
+        """Test that the native encoding shares the coordinate buffers of a columnar collection."""
+        columnar = ColumnarFeatureCollection.from_model(
+            geojson.collection(
+                [
+                    geojson.feature(GEOMETRIES["LineString"]),
+                    geojson.feature(GEOMETRIES["LineString"]),
+                ]
+            )
+        )
+        geometry = to_arrow(columnar).column("geometry").chunk(0)
+        x, _, _ = geometry.values.flatten()
+
+        assert x.buffers()[1].address == columnar.x.buffer_info()[0]
+        assert geometry.offsets.buffers()[1].address == columnar.ring_offsets.buffer_info()[0]
+
+    def test_geometries(self):
+        """Test export and import of geometry models."""
+        geometries = [
+            PolygonModel.model_validate(GEOMETRIES["Polygon"]),
+            None,
+            PolygonModel.model_validate(GEOMETRIES["Polygon"]),
+        ]
+        table = geometries_to_arrow(geometries)
+
+        assert table.column_names == ["geometry"]
+        assert geometries_from_arrow(table) == geometries
+
+    def test_interleaved_coordinates(self):
+        """Test import of the interleaved GeoArrow coordinate encoding."""
+        coordinates = pa.FixedSizeListArray.from_arrays(pa.array([1.0, 2.0, 3.0, 4.0]), 2)
+        metadata = {b"ARROW:extension:name": b"geoarrow.point"}
+        table = pa.table(
+            [coordinates], schema=pa.schema([pa.field("geom", coordinates.type, metadata=metadata)])
+        )
+
+        assert geometries_from_arrow(table) == [
+            PointModel(type="Point", coordinates=[1, 2]),
+            PointModel(type="Point", coordinates=[3, 4]),
+        ]
+
+    def test_ipc(self, geojson, tmp_path):
+        """Test writing and reading Arrow IPC files."""
+        original = geojson.collection(
+            [geojson.feature(GEOMETRIES["Polygon"], {"name": "a"}, id="x")]
+        )
+        path = tmp_path / "collection.arrow"
+        write_ipc(original, path)
+        sink = io.BytesIO()
+        write_ipc(original, sink, geometry_encoding="wkb")
+
+        assert read_ipc(path) == original
+        assert read_ipc(pa.BufferReader(sink.getvalue())) == original
+
+    def test_property_name_clash(self, geojson):
+        """Test that properties named like the geometry or id column are rejected."""
+        with pytest.raises(ValueError, match="geometry"):
+            to_arrow(geojson.collection([geojson.feature(None, {"geometry": 1})]))
+        with pytest.raises(ValueError, match="'id' clashes"):
+            to_arrow(
+                geojson.collection(
+                    [geojson.feature(None, {"id": "a"}), geojson.feature(None, None, id=1)]
+                )
+            )
+
+    def test_property_named_id_without_ids(self, geojson):
+        """Test that an id property is exported when no feature has an id, and stays a property."""
+        original = geojson.collection(
+            [geojson.feature(GEOMETRIES["Point"], {"id": "a"}), geojson.feature(None, {"n": 1})]
+        )
+        table = to_arrow(original)
+
+        assert table.column_names == ["id", "n", "geometry"]
+        assert from_arrow(table) == original
+        assert [f.id for f in from_arrow(table).features] == [None, None]
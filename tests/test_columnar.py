@@ -0,0 +1,181 @@
+"""Tests for the columnar FeatureCollection representation."""
+
+import math
+
+import pytest
+from pydantic import BaseModel
+
+from pydantic_geojson import FeatureCollectionModel, PointModel, PolygonModel
+from pydantic_geojson.columnar import ColumnarFeatureCollection
+
+
+@pytest.fixture
+def collection(geojson, valid_polygon_with_holes, valid_multi_polygon):
+    """A collection with every geometry type, null members and foreign members."""
+    return geojson.collection(
+        [
+            geojson.point_feature(1, 2, {"a": 1, "b": "x"}, id=7),
+            geojson.feature(valid_polygon_with_holes, None, bbox=[0, 0, 1, 1], source="survey"),
+            geojson.feature(valid_multi_polygon, {"c": [1, 2]}),
+            geojson.feature(None, {}),
+            geojson.feature(
+                {
+                    "type": "GeometryCollection",
+                    "geometries": [
+                        {"type": "Point", "coordinates": [3, 3], "bbox": [3, 3, 3, 3]},
+                        {"type": "MultiLineString", "coordinates": [[[0, 0], [1, 1]]]},
+                        {"type": "MultiPoint", "coordinates": []},
+                    ],
+                },
+                {"a": 2},
+            ),
+            geojson.feature({"type": "LineString", "coordinates": [[9, 9, 5], [10, 10]]}, {"a": 3}),
+        ],
+        bbox=[-180, -90, 180, 90],
+        name="places",
+    )
+
+
+class TestColumnarFeatureCollection:
+    """Test suite for ColumnarFeatureCollection."""
+
+    def test_round_trip(self, collection):
+        """Test that converting back gives an equal collection."""
+        columnar = ColumnarFeatureCollection.from_model(collection)
+
+        assert len(columnar) == 6
+        assert columnar.to_model() == collection
+
+    def test_layout(self, geojson):
+        """Test the offset and type arrays of a small collection."""
+        columnar = ColumnarFeatureCollection.from_model(
+            geojson.collection(
+                [
+                    geojson.point_feature(1, 2),
+                    geojson.feature(
+                        {
+                            "type": "MultiLineString",
+                            "coordinates": [[[0, 0], [1, 1]], [[2, 2], [3, 3], [4, 4]]],
+                        }
+                    ),
+                    geojson.feature(None),
+                ]
+            )
+        )
+
+        assert list(columnar.x) == [1, 0, 1, 2, 3, 4]
+        assert list(columnar.y) == [2, 0, 1, 2, 3, 4]
+        assert columnar.z is None
+        assert list(columnar.geometry_types) == [1, 5, 0]
+        assert list(columnar.member_offsets) == [0, 1, 2, 2]
+        assert list(columnar.geometry_offsets) == [0, 1, 3]
+        assert list(columnar.part_offsets) == [0, 1, 2, 3]
+        assert list(columnar.ring_offsets) == [0, 1, 3, 6]
+        assert [columnar.geometry_type(i) for i in range(3)] == ["Point", "MultiLineString", None]
+
+    def test_altitudes(self, collection):
+        """Test that missing altitudes are NaN in a 3D collection."""
+        columnar = ColumnarFeatureCollection.from_model(collection)
+
+        assert columnar.z is not None
+        assert columnar.z[-2] == 5
+        assert math.isnan(columnar.z[-1])
+
+    def test_columns(self, collection):
+        """Test property columns, with None for missing properties."""
+        columnar = ColumnarFeatureCollection.from_model(collection)
+
+        assert columnar.column_names == ["a", "b", "c"]
+        assert columnar.column("a") == [1, None, None, None, 2, 3]
+        assert columnar.column("b") == ["x", None, None, None, None, None]
+        assert columnar.ids == [7, None, None, None, None, None]
+        with pytest.raises(KeyError):
+            columnar.column("d")
+
+    def test_typed_properties(self, geojson):
+        """Test that typed properties models are stored as columns."""
+
+        class Properties(BaseModel):
+            name: str
+
+        model = FeatureCollectionModel[PointModel, Properties]
+        collection = geojson.collection([geojson.point_feature(0, 0, {"name": "a"})], cls=model)
+        columnar = ColumnarFeatureCollection.from_model(collection)
+
+        assert columnar.column("name") == ["a"]
+        assert columnar.to_model(model) == collection
+
+    def test_bounds(self, collection):
+        """Test per-feature and total bounds."""
+        columnar = ColumnarFeatureCollection.from_model(collection)
+        bounds = columnar.bounds
+
+        assert list(bounds[0:4]) == [1, 2, 1, 2]
+        assert all(math.isnan(value) for value in bounds[12:16])
+        assert list(bounds[16:20]) == [0, 0, 3, 3]
+        assert columnar.total_bounds == (
+            min(columnar.x),
+            min(columnar.y),
+            max(columnar.x),
+            max(columnar.y),
+        )
+        assert ColumnarFeatureCollection().total_bounds is None
+
+    def test_filter(self, collection):
+        """Test filtering by a property column and by bbox."""
+        columnar = ColumnarFeatureCollection.from_model(collection)
+        with_a = columnar.filter([value is not None for value in columnar.column("a")])
+        near_origin = columnar.filter(columnar.intersects([-1, -1, 0.5, 0.5]))
+        near_equator = columnar.filter(columnar.intersects([99, -1, 100.5, 0.5]))
+
+        assert with_a.to_model().features == [collection.features[i] for i in (0, 4, 5)]
+        assert [f.geometry.type for f in near_origin.to_model().features] == ["GeometryCollection"]
+        assert [f.geometry.type for f in near_equator.to_model().features] == [
+            "Polygon",
+            "MultiPolygon",
+        ]
+        with pytest.raises(ValueError, match="Mask"):
+            columnar.filter([True])
+
+    def test_intersects_across_antimeridian(self, geojson):
+        """Test a query bbox that crosses the antimeridian."""
+        columnar = ColumnarFeatureCollection.from_model(
+            geojson.collection(
+                [
+                    geojson.point_feature(179, 0),
+                    geojson.point_feature(0, 0),
+                    geojson.point_feature(-179, 0),
+                ]
+            )
+        )
+
+        assert columnar.intersects([170, -10, -170, 10]) == [True, False, True]
+
+    def test_take(self, collection):
+        """Test selecting features in any order, with repeats."""
+        columnar = ColumnarFeatureCollection.from_model(collection)
+
+        for indices in ([5, 4, 3, 2, 1, 0], [4, 4], []):
+            taken = columnar.take(indices).to_model()
+            assert taken.features == [collection.features[i] for i in indices]
+            assert taken.bbox == collection.bbox
+
+    def test_nested_geometry_collection(self, geojson):
+        """Test that nested GeometryCollections are rejected."""
+        nested = {"type": "GeometryCollection", "geometries": []}
+        collection = geojson.collection(
+            [geojson.feature({"type": "GeometryCollection", "geometries": [nested]})]
+        )
+
+        with pytest.raises(ValueError, match="nested GeometryCollection"):
+            ColumnarFeatureCollection.from_model(collection)
+
+    def test_from_geometries(self, valid_polygon_data):
+        """Test building a collection from geometry models."""
+        polygon = PolygonModel.model_validate(valid_polygon_data)
+        columnar = ColumnarFeatureCollection.from_geometries([polygon, None])
+
+        assert len(columnar) == 2
+        assert columnar.column_names == []
+        assert PolygonModel.model_validate(columnar.geometry(0)) == polygon
+        assert columnar.geometry(1) is None
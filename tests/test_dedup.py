@@ -0,0 +1,96 @@
+"""Tests for deduplication."""
+
+import pytest
+
+from pydantic_geojson import PointModel
+from pydantic_geojson.dedup import deduplicate, unique_features, unique_geometries
+from pydantic_geojson.hashing import content_hashes
+
+
+@pytest.fixture
+def repeated(geojson):
+    """Features repeating ids, geometries and content."""
+    return geojson.collection(
+        [
+            geojson.place("A", 1, id="a"),
+            geojson.place("A", 1, id="b"),
+            geojson.place("B", 2, id="a"),
+            geojson.place("C", 1),
+            geojson.place("A", 1),
+            geojson.place("D", None, id=1),
+            geojson.place("D", None, id="1"),
+            geojson.place("A", 1.0, id=1),
+        ]
+    )
+
+
+def names(features):
+    return [(item.id, item.properties["name"]) for item in features]
+
+
+class TestDedup:
+    """Test suite for deduplication."""
+
+    def test_modes(self, repeated):
+        """Test deduplication by id, by geometry and by content."""
+        features = repeated.features
+
+        assert names(unique_features(features, "id")) == [
+            ("a", "A"), ("b", "A"), (None, "C"), (None, "A"), (1, "D"), ("1", "D")
+        ]  # fmt: skip
+        assert names(unique_features(features, "geometry")) == [
+            ("a", "A"), ("a", "B"), (1, "D"), ("1", "D")
+        ]  # fmt: skip
+        assert names(unique_features(features)) == [
+            ("a", "A"), ("a", "B"), (None, "C"), (1, "D")
+        ]  # fmt: skip
+
+    def test_collection(self, repeated):
+        """Test that the deduplicated collection shares the features of the original."""
+        deduplicated = deduplicate(repeated, "geometry")
+
+        assert type(deduplicated) is type(repeated)
+        assert len(repeated.features) == 8
+        assert [id(item) for item in deduplicated.features] == [
+            id(repeated.features[position]) for position in (0, 2, 5, 6)
+        ]
+        assert len(set(content_hashes(deduplicate(repeated, "geometry")))) == 3
+
+    def test_tolerance(self, geojson):
+        """Test that snapping treats nearby values as repeats."""
+        nearby = geojson.collection(
+            [
+                geojson.place("A", 8.5, id=1),
+                geojson.place("A", 8.5 + 1e-13, id=2),
+                geojson.place("A", 8.5 + 1e-6, id=3),
+                geojson.place("A", -0.0, id=4),
+                geojson.place("A", 0.0, id=5),
+            ]
+        )
+
+        assert [item.id for item in unique_features(nearby.features)] == [1, 2, 3, 4]
+        assert [item.id for item in unique_features(nearby.features, tolerance=1e-9)] == [1, 3, 4]
+        assert [
+            item.id for item in unique_features(nearby.features, "geometry", tolerance=1e-5)
+        ] == [1, 4]
+        # Snapped digests do not replace the cached exact ones.
+        assert nearby.features[1].content_hash() == nearby.features[1].content_hash(refresh=True)
+
+    def test_stream(self, geojson):
+        """Test streaming from a generator, with a window of recent keys."""
+        points = (PointModel(type="Point", coordinates=[x % 3, 0]) for x in (0, 1, 0, 2, 0, 1, 0))
+        kept = unique_geometries(points, window=2)
+
+        assert [point.coordinates.lon for point in kept] == [0, 1, 2, 1]
+        features = geojson.collection([geojson.place("A", x) for x in (1, 2, 3, 1)]).features
+        assert len(list(unique_features(iter(features), window=2))) == 4
+        assert len(list(unique_features(iter(features), window=3))) == 3
+
+    def test_errors(self):
+        """Test that invalid arguments raise on the call, before iterating."""
+        with pytest.raises(ValueError, match="Deduplicate by"):
+            unique_features([], "name")
+        with pytest.raises(ValueError, match="Tolerance"):
+            unique_features([], tolerance=0)
+        with pytest.raises(ValueError, match="Window"):
+            unique_geometries([], window=0)
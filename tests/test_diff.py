@@ -0,0 +1,96 @@
+"""Tests for collection diff and patch."""
+
+import pytest
+
+from pydantic_geojson.diff import FeatureChange, apply_diff, diff_collections
+
+
+@pytest.fixture
+def old_features(geojson):
+    """Features of the old collection."""
+    return [
+        geojson.place("A", 1, id="a"),
+        geojson.place("B", 2, id="b"),
+        geojson.place("C", 3, id=1),
+        geojson.place("D", 4, id="d"),
+        geojson.place("E", 5),
+        geojson.place("F", 6),
+    ]
+
+
+@pytest.fixture
+def new_features(geojson):
+    """Features of the new collection."""
+    return [
+        geojson.place("B2", 2, id="b"),
+        geojson.place("C", 3, id="1"),
+        geojson.place("C", 3.5, id=1),
+        geojson.place("A", 1, id="a", bbox=[1, 0, 1, 0]),
+        geojson.place("F", 6),
+        geojson.place("E2", 5),
+        geojson.place("G", 7, id="g"),
+    ]
+
+
+class TestDiff:
+    """Test suite for diff and patch."""
+
+    def test_diff(self, geojson, old_features, new_features):
+        """Test matching by id and by content, and the kind of each modification."""
+        old = geojson.collection(old_features)
+        new = geojson.collection(new_features)
+        diff = diff_collections(old, new)
+
+        assert diff.added == [new.features[1], new.features[5], new.features[6]]
+        assert diff.removed == [old.features[3], old.features[4]]
+        assert diff.modified == [
+            FeatureChange(old.features[1], new.features[0], geometry=False, properties=True),
+            FeatureChange(old.features[2], new.features[2], geometry=True, properties=False),
+        ]
+        assert diff_collections(old, geojson.collection(old_features)) == ([], [], [])
+
+    def test_numeric_properties(self, geojson):
+        """Test that properties are compared as their content hashes compare them."""
+        old = geojson.collection([geojson.place(1, 1, id="a"), geojson.place(2, 2)])
+        new = geojson.collection([geojson.place(1.0, 1, id="a"), geojson.place(2.0, 2)])
+
+        assert diff_collections(old, new) == ([], [], [])
+        changed = geojson.collection([geojson.place(True, 1, id="a"), geojson.place(2.0, 2)])
+        assert diff_collections(old, changed).modified == [
+            FeatureChange(old.features[0], changed.features[0], geometry=False, properties=True)
+        ]
+
+    def test_apply(self, geojson, old_features, new_features):
+        """Test that applying a diff to a copy of the old collection gives the new features."""
+        diff = diff_collections(geojson.collection(old_features), geojson.collection(new_features))
+        replica = geojson.collection(old_features)
+        features = replica.features
+
+        assert apply_diff(replica, diff) is replica
+        assert replica.features is features
+        assert diff_collections(replica, geojson.collection(new_features)) == ([], [], [])
+        assert [f.properties["name"] for f in replica.features] == [
+            "A", "B2", "C", "F", "C", "E2", "G"
+        ]  # fmt: skip
+
+    def test_duplicates_and_conflicts(self, geojson, old_features):
+        """Test that repeated features are matched one to one, and missing ones are reported."""
+        old = geojson.collection([geojson.place("X", 1), geojson.place("X", 1)])
+        new = geojson.collection([geojson.place("X", 1)])
+        diff = diff_collections(old, new)
+
+        assert diff == ([], [old.features[1]], [])
+        apply_diff(old, diff)
+        assert len(old.features) == 1
+        with pytest.raises(ValueError, match="removed feature with id 'a' is not in"):
+            apply_diff(new, diff_collections(geojson.collection(old_features), new))
+        unchanged = geojson.collection([geojson.place("Z", 1, id="z")])
+        with pytest.raises(ValueError, match="modified feature with id 'a'"):
+            apply_diff(
+                unchanged,
+                diff_collections(
+                    geojson.collection([old_features[0]]),
+                    geojson.collection([geojson.place("A", 9, id="a"), old_features[5]]),
+                ),
+            )
+        assert len(unchanged.features) == 1
@@ -0,0 +1,169 @@
+"""Tests for fail-fast validation."""
+
+import json
+from typing import Union
+
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from pydantic_geojson import FeatureCollectionModel, FeatureModel, PointModel, PolygonModel
+from pydantic_geojson.fail_fast import validate_fail_fast
+from pydantic_geojson.limits import ValidationLimits
+
+
+class CityProperties(BaseModel):
+    name: str
+
+
+class CityFeature(FeatureModel):
+    properties: CityProperties
+    geometry: Union[PointModel, PolygonModel]
+
+
+class CityCollection(FeatureCollectionModel):
+    features: list[CityFeature]
+
+
+def errors_of(model, data, max_errors, json_input=False):
+    context = {"max_errors": max_errors}
+    with pytest.raises(ValidationError) as exc_info:
+        if json_input:
+            model.model_validate_json(json.dumps(data), context=context)
+        else:
+            model.model_validate(data, context=context)
+    return exc_info.value.errors(include_url=False)
+
+
+class TestFailFast:
+    """Test suite for validation that stops after the first errors."""
+
+    @pytest.mark.parametrize("json_input", [False, True])
+    def test_stops_at_first_error(self, geojson, json_input):
+        """Test that only the first error is reported, with its precise location."""
+        data = geojson.collection_data(
+            [
+                geojson.point_feature(),
+                geojson.point_feature(lat=100),
+                geojson.point_feature(lon=200),
+            ]
+        )
+        errors = errors_of(FeatureCollectionModel, data, 1, json_input)
+
+        assert [error["loc"] for error in errors] == [("features", 1, "geometry", "coordinates", 1)]
+        assert errors[0]["type"] == "less_than_equal"
+
+    def test_stops_after_n_errors(self, geojson):
+        """Test that validation stops once max_errors errors are found."""
+        data = geojson.collection_data([geojson.point_feature(lon=200) for _ in range(10)])
+
+        assert len(errors_of(FeatureCollectionModel, data, 3)) == 3
+        assert len(errors_of(FeatureCollectionModel, data, 100)) == 10
+
+    def test_geometry_errors_are_not_repeated_per_union_member(self, invalid_polygon_data_no_loop):
+        """Test that a geometry is only validated against the model of its type."""
+        feature = {"type": "Feature", "geometry": invalid_polygon_data_no_loop, "properties": None}
+        errors = errors_of(FeatureModel, feature, 100)
+        with pytest.raises(ValidationError) as exc_info:
+            FeatureModel.model_validate(feature)
+
+        assert [error["loc"] for error in errors] == [("geometry", "coordinates", 0)]
+        assert exc_info.value.error_count() > 1
+
+    def test_nested_geometry_collections(self):
+        """Test locations inside nested GeometryCollections."""
+        geometry = {
+            "type": "GeometryCollection",
+            "geometries": [
+                {"type": "Point", "coordinates": [0, 0]},
+                {
+                    "type": "GeometryCollection",
+                    "geometries": [{"type": "Point", "coordinates": [0, -91]}],
+                },
+            ],
+        }
+        errors = errors_of(FeatureModel, {"type": "Feature", "geometry": geometry}, 5)
+
+        assert [error["loc"] for error in errors] == [
+            ("geometry", "geometries", 1, "geometries", 0, "coordinates", 1)
+        ]
+
+    def test_collection_and_member_errors(self, geojson):
+        """Test that errors of the collection itself are reported alongside member errors."""
+        data = geojson.collection_data([geojson.point_feature(lon=200)], bbox=[0, 0, 0])
+        errors = errors_of(FeatureCollectionModel, data, 5)
+
+        assert [error["loc"] for error in errors] == [
+            ("features", 0, "geometry", "coordinates", 0),
+            ("bbox",),
+        ]
+
+    def test_unknown_geometry_type(self):
+        """Test that a geometry of unknown type is one error, as with a discriminated union."""
+        feature = {"type": "Feature", "geometry": {"type": "Circle", "coordinates": [0, 0]}}
+        errors = errors_of(FeatureModel, feature, 10)
+
+        assert [(error["type"], error["loc"]) for error in errors] == [
+            ("union_tag_invalid", ("geometry",))
+        ]
+
+    def test_geometry_not_an_object(self):
+        """Test that non-object geometries are reported against the whole union."""
+        errors = errors_of(FeatureModel, {"type": "Feature", "geometry": "POINT (0 0)"}, 1)
+
+        assert errors[0]["loc"][0] == "geometry"
+
+    def test_valid_input_matches_normal_validation(self, geojson):
+        """Test that valid documents validate to the same models."""
+        data = geojson.collection_data(
+            [
+                geojson.point_feature(1, 2, {"a": 1}),
+                {"type": "Feature", "geometry": None, "properties": None, "id": "x"},
+            ]
+        )
+        fail_fast = FeatureCollectionModel.model_validate(data, context={"max_errors": 1})
+
+        assert fail_fast == FeatureCollectionModel.model_validate(data)
+        assert isinstance(fail_fast.features[0].geometry, PointModel)
+
+    def test_custom_models(self, geojson):
+        """Test fail-fast validation of user subclasses with typed properties."""
+        data = geojson.collection_data(
+            [
+                geojson.point_feature(properties={"name": "Minsk"}),
+                geojson.point_feature(properties={}),
+                {"type": "Feature", "geometry": {"type": "LineString", "coordinates": []}},
+            ]
+        )
+        errors = errors_of(CityCollection, data, 10)
+
+        assert [error["loc"] for error in errors] == [
+            ("features", 1, "properties", "name"),
+            ("features", 2, "geometry"),
+            ("features", 2, "properties"),
+        ]
+        valid = CityCollection.model_validate(
+            geojson.collection_data([geojson.point_feature(properties={"name": "Minsk"})]),
+            context={"max_errors": 1},
+        )
+        assert isinstance(valid.features[0], CityFeature)
+        assert valid.features[0].properties.name == "Minsk"
+
+    def test_combined_with_limits(self, geojson):
+        """Test that limits are still checked before fail-fast validation."""
+        context = {"max_errors": 1, "limits": ValidationLimits(max_features=1)}
+
+        with pytest.raises(ValidationError, match="max_features"):
+            FeatureCollectionModel.model_validate(
+                geojson.collection_data([geojson.point_feature(), geojson.point_feature()]),
+                context=context,
+            )
+
+    def test_invalid_json(self):
+        """Test that malformed JSON is reported as usual."""
+        with pytest.raises(ValidationError, match="json_invalid"):
+            FeatureCollectionModel.model_validate_json("{", context={"max_errors": 1})
+
+    def test_max_errors_must_be_positive(self, geojson):
+        """Test that a budget below one error is rejected."""
+        with pytest.raises(ValueError, match="max_errors"):
+            validate_fail_fast(FeatureModel, geojson.point_feature(), max_errors=0)
@@ -0,0 +1,92 @@
+"""Tests for feature id lookup and uniqueness."""
+
+import copy
+import pickle
+
+import pytest
+from pydantic import ValidationError
+
+from pydantic_geojson import FeatureCollectionModel
+from pydantic_geojson.feature_ids import IndexedFeatures, duplicate_ids
+
+
+@pytest.fixture
+def collection(geojson):
+    """Build a collection of features without geometry, one per id."""
+    return lambda ids: geojson.collection(
+        geojson.feature(None, id=feature_id) for feature_id in ids
+    )
+
+
+class TestFeatureIds:
+    """Test suite for feature ids."""
+
+    def test_get_by_id(self, collection):
+        """Test lookups, with string and number ids kept apart."""
+        features = collection([1, "1", "a", None, "a"])
+
+        assert features.get_by_id(1) is features.features[0]
+        assert features.get_by_id("1") is features.features[1]
+        assert features.get_by_id("a") is features.features[2]
+        assert features.get_by_id(2) is None
+        assert isinstance(features.features, IndexedFeatures)
+        assert features.model_dump() == collection([1, "1", "a", None, "a"]).model_dump()
+
+    def test_index_follows_changes(self, geojson, collection):
+        """Test that the index sees additions, removals, reordering and replacement."""
+        features = collection(["a", "b"])
+        assert features.get_by_id("a") is not None
+
+        features.features.append(geojson.feature_model(None, id="c"))
+        features.features += [geojson.feature_model(None, id="d")]
+        assert features.get_by_id("c") is features.features[2]
+        assert features.get_by_id("d") is features.features[3]
+
+        del features.features[0]
+        assert features.get_by_id("a") is None
+        features.features[0] = geojson.feature_model(None, id="e")
+        assert features.get_by_id("b") is None
+        assert features.get_by_id("e") is features.features[0]
+
+        features.features.insert(0, geojson.feature_model(None, id="d"))
+        assert features.get_by_id("d") is features.features[0]
+        features.features.reverse()
+        assert features.get_by_id("d") is features.features[0]
+
+        features.features[1].id = "renamed"
+        assert features.get_by_id("c") is None
+        features.features.reindex()
+        assert features.get_by_id("renamed") is features.features[1]
+
+        features.features = [geojson.feature_model(None, id="f")]
+        assert features.get_by_id("f") is features.features[0]
+        assert features.get_by_id("e") is None
+        features.features.clear()
+        assert features.get_by_id("f") is None
+
+    def test_copies(self, collection):
+        """Test that copies and pickles keep the features and index them again."""
+        features = collection(["a", "b"])
+        features.get_by_id("a")
+
+        for other in (copy.deepcopy(features), pickle.loads(pickle.dumps(features))):
+            assert other == features
+            assert other.get_by_id("b") == features.features[1]
+            assert other.get_by_id("b") is not features.features[1]
+
+    def test_unique_ids(self, collection):
+        """Test that duplicates are reported in one error only when the context asks for it."""
+        ids = ["a", 1, "1", None, None, 1, "a", 1]
+        data = collection(ids).model_dump()
+
+        assert duplicate_ids(collection(ids).features) == {1: [1, 5, 7], "a": [0, 6]}
+        FeatureCollectionModel.model_validate(data)
+        FeatureCollectionModel.model_validate(
+            collection(["a", "1", 1]).model_dump(), context={"unique_ids": True}
+        )
+        for context in ({"unique_ids": True}, {"unique_ids": True, "max_errors": 1}):
+            with pytest.raises(
+                ValidationError,
+                match=r"Duplicate feature ids: 1 at features 1, 5, 7; 'a' at features 0, 6",
+            ):
+                FeatureCollectionModel.model_validate(data, context=context)
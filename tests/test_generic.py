@@ -0,0 +1,120 @@
+"""Tests for Feature and FeatureCollection models parameterized by geometry and properties."""
+
+import json
+from typing import Union
+
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from pydantic_geojson import (
+    FeatureCollectionModel,
+    FeatureModel,
+    LineStringModel,
+    PointModel,
+    PolygonModel,
+)
+from pydantic_geojson.ingest import ingest
+
+
+class StationProperties(BaseModel):
+    name: str
+    elevation: float
+
+
+StationFeature = FeatureModel[PointModel, StationProperties]
+StationCollection = FeatureCollectionModel[PointModel, StationProperties]
+
+
+def station(lon=0, lat=0, name="Minsk", elevation=220.0):
+    return {
+        "type": "Feature",
+        "geometry": {"type": "Point", "coordinates": [lon, lat]},
+        "properties": {"name": name, "elevation": elevation},
+    }
+
+
+class TestGenericModels:
+    """Test suite for generic FeatureModel and FeatureCollectionModel."""
+
+    def test_typed_properties(self):
+        """Test that properties are validated as the properties model."""
+        feature = StationFeature.model_validate(station(27.56, 53.9))
+
+        assert isinstance(feature, FeatureModel)
+        assert isinstance(feature.geometry, PointModel)
+        assert feature.properties == StationProperties(name="Minsk", elevation=220.0)
+
+    def test_narrowed_geometry(self, valid_polygon_data):
+        """Test that other geometry types are rejected."""
+        data = {"type": "Feature", "geometry": valid_polygon_data, "properties": None}
+
+        with pytest.raises(ValidationError, match="geometry"):
+            StationFeature.model_validate(data)
+
+    def test_invalid_properties(self):
+        """Test that properties not matching the properties model are rejected."""
+        with pytest.raises(ValidationError) as exc_info:
+            StationFeature.model_validate(station(elevation="high"))
+
+        assert exc_info.value.errors()[0]["loc"] == ("properties", "elevation")
+
+    def test_null_members_are_allowed(self):
+        """Test that geometry and properties may still be JSON null."""
+        feature = StationFeature.model_validate({"type": "Feature", "geometry": None})
+
+        assert feature.geometry is None
+        assert feature.properties is None
+
+    def test_geometry_union(self, valid_polygon_data):
+        """Test parameterizing by a union of geometry types."""
+        model = FeatureModel[Union[PointModel, PolygonModel], dict]
+        feature = model.model_validate({"type": "Feature", "geometry": valid_polygon_data})
+
+        assert isinstance(feature.geometry, PolygonModel)
+        with pytest.raises(ValidationError):
+            model.model_validate(
+                {"type": "Feature", "geometry": {"type": "LineString", "coordinates": [[0, 0]] * 2}}
+            )
+
+    def test_collection(self):
+        """Test that collection features are of the parameterized feature class."""
+        collection = StationCollection.model_validate_json(
+            json.dumps({"type": "FeatureCollection", "features": [station(), station(1, 1)]})
+        )
+
+        assert type(collection.features[0]) is StationFeature
+        assert collection.features[1].properties.elevation == 220.0
+
+    def test_defaults_are_unchanged(self, valid_linestring_data):
+        """Test that unparameterized models accept any geometry and properties object."""
+        feature = FeatureModel.model_validate(
+            {"type": "Feature", "geometry": valid_linestring_data, "properties": {"a": [1]}}
+        )
+        collection = FeatureCollectionModel.model_validate(
+            {"type": "FeatureCollection", "features": [station()]}
+        )
+
+        assert isinstance(feature.geometry, LineStringModel)
+        assert feature.properties == {"a": [1]}
+        assert type(collection.features[0]) is FeatureModel
+        assert "FeatureModel" in FeatureCollectionModel.model_json_schema()["$defs"]
+
+    def test_parameterized_classes_are_cached(self):
+        """Test that parameterizing twice returns the same class."""
+        assert FeatureModel[PointModel, StationProperties] is StationFeature
+        assert FeatureCollectionModel[PointModel, StationProperties] is StationCollection
+
+    def test_fail_fast_and_ingest(self):
+        """Test that fail-fast validation and ingest use the narrowed types."""
+        data = {
+            "type": "FeatureCollection",
+            "features": [station(), station(lat=100), {**station(), "properties": {}}],
+        }
+        with pytest.raises(ValidationError) as exc_info:
+            StationCollection.model_validate(data, context={"max_errors": 1})
+        result = ingest(data, model=StationCollection)
+
+        assert exc_info.value.errors()[0]["loc"] == ("features", 1, "geometry", "coordinates", 1)
+        assert isinstance(result.collection, StationCollection)
+        assert result.collection.features[0].properties.name == "Minsk"
+        assert result.rejected == [1, 2]
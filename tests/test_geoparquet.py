@@ -0,0 +1,219 @@
+"""Tests for GeoParquet writing and reading."""
+
+import json
+
+import pytest
+
+from tests.test_utils import SAMPLE_GEOMETRIES as GEOMETRIES
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+from pydantic_geojson.geoparquet import (  # noqa: E402
+    iter_geoparquet,
+    read_geoparquet,
+    write_geoparquet,
+)
+
+
+@pytest.fixture
+def point_feature(geojson):
+    """Build a Point feature model with the given properties."""
+    return lambda x, y, **properties: geojson.feature_model(geojson.point(x, y), properties)
+
+
+@pytest.fixture
+def read_row_groups(monkeypatch):
+    """Record the row groups read from Parquet files."""
+    read = []
+    original = pq.ParquetFile.read_row_group
+
+    def read_row_group(self, index, *args, **kwargs):
+        read.append(index)
+        return original(self, index, *args, **kwargs)
+
+    monkeypatch.setattr(pq.ParquetFile, "read_row_group", read_row_group)
+    return read
+
+
+class TestGeoParquet:
+    """Test suite for GeoParquet writing and reading."""
+
+    def test_round_trip(self, geojson, tmp_path):
+        """Test writing and reading all geometry types, properties and ids."""
+        original = geojson.collection(
+            [
+                geojson.feature(None, {"tags": {"a": 1}}),
+                *(
+                    geojson.feature(geometry, {"name": name}, id=i)
+                    for i, (name, geometry) in enumerate(GEOMETRIES.items())
+                ),
+            ]
+        )
+        path = tmp_path / "layer.parquet"
+        write_geoparquet(original, path, row_group_size=2)
+
+        assert read_geoparquet(path) == original
+        assert list(iter_geoparquet(path)) == original.features
+
+    def test_geo_metadata(self, geojson, point_feature, tmp_path):
+        """Test the GeoParquet file metadata."""
+        path = tmp_path / "layer.parquet"
+        write_geoparquet(
+            geojson.collection([point_feature(1, 2), point_feature(3, 4)]), path, row_group_size=1
+        )
+        geo = json.loads(pq.ParquetFile(path).metadata.metadata[b"geo"])
+
+        assert geo["version"] == "1.1.0"
+        assert geo["primary_column"] == "geometry"
+        column = geo["columns"]["geometry"]
+        assert column["encoding"] == "WKB"
+        assert column["geometry_types"] == ["Point"]
+        assert column["bbox"] == [1, 2, 3, 4]
+        assert column["covering"]["bbox"]["xmin"] == ["bbox", "xmin"]
+
+    def test_bbox_skips_row_groups(self, geojson, point_feature, tmp_path, read_row_groups):
+        """Test that a bbox query reads only the row groups it intersects."""
+        path = tmp_path / "layer.parquet"
+        write_geoparquet(
+            geojson.collection(point_feature(x, 0, n=x) for x in range(100)),
+            path,
+            row_group_size=10,
+        )
+        features = read_geoparquet(path, bbox=[25, -1, 34.5, 1]).features
+
+        assert [f.properties["n"] for f in features] == list(range(25, 35))
+        assert read_row_groups == [2, 3]
+
+    def test_bbox_across_antimeridian(self, geojson, point_feature, tmp_path, read_row_groups):
+        """Test a query box crossing the antimeridian."""
+        path = tmp_path / "layer.parquet"
+        write_geoparquet(
+            geojson.collection(point_feature(x, 0) for x in (-179, -100, 0, 100, 179)),
+            path,
+            row_group_size=1,
+        )
+        features = list(iter_geoparquet(path, bbox=[170, -10, -170, 10]))
+
+        assert [f.geometry.coordinates.lon for f in features] == [-179, 179]
+        assert read_row_groups == [0, 4]
+
+    def test_streaming_write(self, point_feature, tmp_path):
+        """Test writing a generator of features with properties varying between row groups."""
+        path = tmp_path / "layer.parquet"
+
+        def features():
+            for x in range(25):
+                yield point_feature(x, 0, n=x, **({"note": "even"} if x % 2 == 0 else {}))
+
+        write_geoparquet(features(), path, row_group_size=4)
+        parquet_file = pq.ParquetFile(path)
+        read = read_geoparquet(path).features
+
+        assert parquet_file.num_row_groups == 7
+        assert [f.properties for f in read[:2]] == [{"n": 0, "note": "even"}, {"n": 1}]
+        assert len(read) == 25
+
+    def test_streaming_write_null_first_row_group(self, point_feature, tmp_path):
+        """Test that a property null throughout the first row group takes later values."""
+        path = tmp_path / "layer.parquet"
+        notes = [None, None, "late", 3, {"k": [1]}]
+        write_geoparquet(
+            [point_feature(x, 0, note=note) for x, note in enumerate(notes)],
+            path,
+            row_group_size=2,
+        )
+
+        assert [f.properties.get("note") for f in read_geoparquet(path).features] == notes
+
+    def test_streaming_write_rejects_new_properties(self, point_feature, tmp_path):
+        """Test that a property first seen after the first row group is rejected."""
+        with pytest.raises(ValueError, match="first row group"):
+            write_geoparquet(
+                [point_feature(0, 0), point_feature(1, 1, name="late")],
+                tmp_path / "layer.parquet",
+                row_group_size=1,
+            )
+
+    def test_streaming_write_property_named_id(self, geojson, point_feature, tmp_path):
+        """Test that an id property column is not confused with feature ids in later row groups."""
+        path = tmp_path / "layer.parquet"
+        features = [point_feature(0, 0, id="a"), point_feature(1, 1, id="b")]
+        write_geoparquet(features, path, row_group_size=1)
+
+        assert read_geoparquet(path).features == features
+        with pytest.raises(ValueError, match="earlier rows lack"):
+            write_geoparquet(
+                [point_feature(0, 0, id="a"), geojson.feature_model(geojson.point(1, 1), id=2)],
+                path,
+                row_group_size=1,
+            )
+        with pytest.raises(ValueError, match="'id' clashes"):
+            write_geoparquet(
+                [geojson.feature_model(geojson.point(0, 0), id=1), point_feature(1, 1, id="b")],
+                path,
+                row_group_size=1,
+            )
+
+    def test_streaming_write_column_types(self, point_feature, tmp_path):
+        """Test that later values are widened to float or rejected, never truncated."""
+        path = tmp_path / "layer.parquet"
+        write_geoparquet(
+            [point_feature(x, 0, a=x + 0.5) for x in range(5)]
+            + [point_feature(x, 0, a=x) for x in range(5, 10)],
+            path,
+            row_group_size=5,
+        )
+        assert [f.properties["a"] for f in read_geoparquet(path).features] == [
+            0.5, 1.5, 2.5, 3.5, 4.5, 5, 6, 7, 8, 9
+        ]  # fmt: skip
+
+        for late in (5.5, "5", {"k": 5}):
+            with pytest.raises(ValueError, match="'a' in row group 1 are .* fixed the column"):
+                write_geoparquet(
+                    [point_feature(x, 0, a=x) for x in range(5)] + [point_feature(5, 0, a=late)],
+                    path,
+                    row_group_size=5,
+                )
+
+    def test_failed_write_leaves_no_file(self, point_feature, tmp_path):
+        """Test that a write failing mid-stream removes its partial file."""
+        path = tmp_path / "layer.parquet"
+        features = [point_feature(0, 0), point_feature(1, 1, name="late")]
+        with pytest.raises(ValueError, match="first row group"):
+            write_geoparquet(features, path, row_group_size=1)
+
+        assert list(tmp_path.iterdir()) == []
+        write_geoparquet(features[:1], path)
+        with pytest.raises(ValueError, match="first row group"):
+            write_geoparquet(features, path, row_group_size=1)
+        assert list(tmp_path.iterdir()) == [path]
+        assert len(read_geoparquet(path).features) == 1
+
+    def test_without_covering(self, geojson, point_feature, tmp_path):
+        """Test reading a file without a bbox covering column."""
+        path = tmp_path / "layer.parquet"
+        write_geoparquet(geojson.collection(point_feature(x, x) for x in range(5)), path)
+        table = pq.read_table(path).drop_columns(["bbox"])
+        geo = json.loads(pq.ParquetFile(path).metadata.metadata[b"geo"])
+        del geo["columns"]["geometry"]["covering"]
+        pq.write_table(table.replace_schema_metadata({b"geo": json.dumps(geo).encode()}), path)
+
+        features = read_geoparquet(path, bbox=[0.5, 0.5, 2.5, 2.5]).features
+
+        assert [f.geometry.coordinates.lon for f in features] == [1, 2]
+
+    def test_empty(self, tmp_path):
+        """Test writing and reading an empty stream."""
+        path = tmp_path / "layer.parquet"
+        write_geoparquet(iter(()), path)
+
+        assert read_geoparquet(path).features == []
+
+    def test_not_geoparquet(self, tmp_path):
+        """Test that Parquet files without GeoParquet metadata are rejected."""
+        path = tmp_path / "plain.parquet"
+        pq.write_table(pa.table({"a": [1]}), path)
+
+        with pytest.raises(ValueError, match="GeoParquet"):
+            read_geoparquet(path)
@@ -0,0 +1,174 @@
+"""Tests for content hashes."""
+
+import copy
+import pickle
+
+import pytest
+from pydantic import BaseModel
+
+from pydantic_geojson import (
+    FeatureCollectionModel,
+    FeatureModel,
+    GeometryCollectionModel,
+    LineStringModel,
+    MultiPolygonModel,
+    PointModel,
+    PolygonModel,
+)
+from pydantic_geojson._base import Coordinates
+from pydantic_geojson.hashing import content_hashes
+from pydantic_geojson.orientation import rewind_geometry
+from pydantic_geojson.packed import PackedLinearRing
+
+# Clockwise exterior ring, so rewinding reverses it.
+RING = [[0, 0], [0, 1], [1, 1], [1, 0], [0, 0]]
+
+
+class CompactPolygonModel(PolygonModel):
+    coordinates: list[PackedLinearRing]
+
+
+class Properties(BaseModel):
+    name: str
+    height: float
+
+
+def polygon(ring=RING):
+    return PolygonModel.model_validate({"type": "Polygon", "coordinates": [ring]})
+
+
+@pytest.fixture
+def feature(geojson):
+    """Build a feature model, with a Point at ``(1, 2)`` unless a geometry is given."""
+    return lambda properties, geometry=None, **members: geojson.feature_model(
+        geometry or geojson.point(1, 2), properties, **members
+    )
+
+
+class TestContentHash:
+    """Test suite for content hashes."""
+
+    def test_geometry(self):
+        """Test that hashes depend on the coordinate values and their order only."""
+        digest = polygon().content_hash()
+
+        assert len(digest) == 32
+        assert polygon([[float(x), float(y)] for x, y in RING]).content_hash() == digest
+        assert polygon([[x, -0.0 if y == 0 else y] for x, y in RING]).content_hash() == digest
+        assert CompactPolygonModel.model_validate(polygon().model_dump()).content_hash() == digest
+        assert polygon([[x, y, None] for x, y in RING]).content_hash() == digest
+        assert polygon(RING[::-1]).content_hash() != digest
+        assert polygon([[x, y, 0] for x, y in RING]).content_hash() != digest
+        assert MultiPolygonModel(type="MultiPolygon", coordinates=[[RING]]).content_hash() != digest
+        assert (
+            LineStringModel(type="LineString", coordinates=[[0, 1], [2, 3]]).content_hash()
+            != LineStringModel(type="LineString", coordinates=[[2, 3], [0, 1]]).content_hash()
+        )
+        bounded = PolygonModel(type="Polygon", coordinates=[RING], bbox=[0, 0, 1, 1])
+        assert bounded.content_hash() == digest
+
+    def test_feature(self, feature):
+        """Test that feature hashes cover geometry and properties, not ids or key order."""
+        digest = feature({"a": 1, "b": [1, 2]}).content_hash()
+
+        assert feature({"b": [1, 2], "a": 1}, id=7, bbox=[1, 2, 1, 2]).content_hash() == digest
+        assert feature({"a": 1, "b": [2, 1]}).content_hash() != digest
+        moved = feature({"a": 1, "b": [1, 2]}, {"type": "Point", "coordinates": [1, 3]})
+        assert moved.content_hash() != digest
+        assert feature(None).content_hash() != feature({}).content_hash()
+        typed = FeatureModel[PointModel, Properties].model_validate(
+            {
+                "type": "Feature",
+                "geometry": None,
+                "properties": {"name": "a", "height": 2.5},
+            }
+        )
+        untyped = FeatureModel.model_validate(typed.model_dump())
+        assert typed.content_hash() == untyped.content_hash()
+
+    def test_caching(self):
+        """Test that hashes are cached until a member is assigned or rings are rewound."""
+        model = polygon()
+        digest = model.content_hash()
+        model.coordinates[0][1] = Coordinates(0, 2)
+
+        assert model.content_hash() == digest
+        assert model.content_hash(refresh=True) != digest
+        changed = model.content_hash()
+        assert model.model_copy().content_hash() == changed
+        original = polygon().coordinates
+        assert model.model_copy(update={"coordinates": original}).content_hash() == digest
+        model.coordinates = original
+        assert model.content_hash() == digest
+
+        assert model == polygon()
+        assert "_content_hash" not in model.model_dump()
+        assert copy.deepcopy(model).content_hash() == digest
+        assert pickle.loads(pickle.dumps(model)).content_hash() == digest
+
+        model.rewind()
+        assert model.content_hash() == polygon(RING[::-1]).content_hash()
+
+    def test_feature_follows_geometry(self, feature):
+        """Test that feature and collection hashes see assignments to their geometries."""
+        model = feature({"a": 1})
+        digest = model.content_hash()
+        model.geometry.coordinates = Coordinates(5, 5)
+
+        assert model.content_hash() != digest
+        assert (
+            model.content_hash()
+            == feature({"a": 1}, {"type": "Point", "coordinates": [5, 5]}).content_hash()
+        )
+        model.properties["a"] = 2
+        assert (
+            model.content_hash()
+            == feature({"a": 2}, {"type": "Point", "coordinates": [5, 5]}).content_hash()
+        )
+
+        nested = GeometryCollectionModel(type="GeometryCollection", geometries=[polygon()])
+        digest = nested.content_hash()
+        nested.geometries[0].coordinates = polygon(RING[::-1]).coordinates
+        assert nested.content_hash() != digest
+        assert nested.content_hash() == nested.content_hash(refresh=True)
+
+    def test_numeric_properties(self, feature):
+        """Test that properties hash alike exactly when they compare equal."""
+        digest = feature({"a": 1, "b": [2, {"c": -0.0}]}).content_hash()
+
+        assert feature({"a": 1.0, "b": [2.0, {"c": 0}]}).content_hash() == digest
+        assert feature({"a": 1.5, "b": [2, {"c": 0}]}).content_hash() != digest
+        assert feature({"a": True}).content_hash() != feature({"a": 1}).content_hash()
+        assert feature({"a": "1"}).content_hash() != feature({"a": 1}).content_hash()
+
+    def test_rewind_collection(self, geojson, feature):
+        """Test that rewinding a collection changes the hashes of the changed features only."""
+        collection = geojson.collection(
+            [geojson.feature(polygon().model_dump(), {}), geojson.point_feature(1, 2, {})]
+        )
+        before = content_hashes(collection)
+        collection.rewind()
+        after = content_hashes(collection)
+
+        assert after[0] != before[0]
+        assert after[1] == before[1]
+        assert after[0] == feature({}, polygon(RING[::-1]).model_dump()).content_hash()
+
+        nested = GeometryCollectionModel(type="GeometryCollection", geometries=[polygon()])
+        digest = nested.content_hash()
+        assert rewind_geometry(nested) == 1
+        assert nested.content_hash() != digest
+        assert nested.content_hash() == nested.content_hash(refresh=True)
+
+    def test_collection(self, feature):
+        """Test collection hashes and batch hashing."""
+        features = [feature({"n": n}, {"type": "Point", "coordinates": [n, 0]}) for n in range(3)]
+        collection = FeatureCollectionModel(type="FeatureCollection", features=features)
+
+        assert content_hashes(collection) == [item.content_hash() for item in features]
+        assert content_hashes(features[:2]) == content_hashes(collection)[:2]
+        digest = collection.content_hash()
+        collection.features.reverse()
+        assert collection.content_hash() != digest
+        collection.features.reverse()
+        assert collection.content_hash() == digest
@@ -0,0 +1,119 @@
+"""Tests for lazy package loading and the import-time budget."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+import pydantic_geojson
+
+# Budgets for cold imports, in seconds. See benchmarks/import_time.py for reporting.
+PACKAGE_IMPORT_BUDGET = 0.05
+MODEL_IMPORT_BUDGET = 0.15  # on top of ``import pydantic``
+
+# Wall-clock timings depend on the machine, so by default the budgets are checked
+# with this much slack, which still catches loading a heavy dependency eagerly.
+# Setting this variable checks the exact budgets.
+IMPORT_BUDGET_ENV = "PYDANTIC_GEOJSON_IMPORT_BUDGET"
+BUDGET_SLACK = 1 if os.environ.get(IMPORT_BUDGET_ENV) else 3
+
+# Optional dependencies and modules of optional features, which models must not load.
+HEAVY_MODULES = (
+    "numpy",
+    "pyarrow",
+    "shapely",
+    "pyproj",
+    "fastapi",
+    "pydantic_geojson.columnar",
+    "pydantic_geojson.hashing",
+    "pydantic_geojson.mvt",
+    "pydantic_geojson.shapely",
+)
+
+TIMER = "import time; _t = time.perf_counter(); {statement}; print(time.perf_counter() - _t)"
+
+
+def _run(code: str) -> str:
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return result.stdout.strip()
+
+
+def _cold_import_seconds(statement: str, runs: int = 5) -> float:
+    # The best run is the least disturbed by other load on the machine.
+    return min(float(_run(TIMER.format(statement=statement))) for _ in range(runs))
+
+
+class TestLazyImport:
+    """Test that the package defers loading models and building schemas."""
+
+    def test_import_does_not_load_models(self):
+        """Test that importing the package imports neither models nor pydantic."""
+        output = _run(
+            "import sys, pydantic_geojson; "
+            "print(sorted(m for m in sys.modules "
+            "if m.split('.')[0] == 'pydantic' or m.startswith('pydantic_geojson.')))"
+        )
+
+        assert output == "[]"
+
+    def test_attribute_access_loads_model(self):
+        """Test that public models resolve on first access and are cached."""
+        model = pydantic_geojson.PointModel
+
+        assert model.__module__ == "pydantic_geojson.point"
+        assert vars(pydantic_geojson)["PointModel"] is model
+        assert "FeatureCollectionModel" in dir(pydantic_geojson)
+
+    def test_star_import(self):
+        """Test that ``from pydantic_geojson import *`` exposes every public name."""
+        namespace: dict = {}
+        exec("from pydantic_geojson import *", namespace)
+
+        assert all(name in namespace for name in pydantic_geojson.__all__)
+
+    def test_unknown_attribute(self):
+        """Test that unknown attributes still raise AttributeError."""
+        with pytest.raises(AttributeError, match="NotAModel"):
+            pydantic_geojson.NotAModel  # noqa: B018
+
+    def test_schema_build_is_deferred(self):
+        """Test that schemas are built on first use, not at import time."""
+        output = _run(
+            "from pydantic_geojson import FeatureCollectionModel as F; "
+            "print(F.__pydantic_complete__); "
+            "F.model_validate({'type': 'FeatureCollection', 'features': []}); "
+            "print(F.__pydantic_complete__)"
+        )
+
+        assert output.split() == ["False", "True"]
+
+    def test_models_do_not_load_heavy_modules(self):
+        """Test that validating a model loads no optional dependency or feature module."""
+        output = _run(
+            "import sys; "
+            "from pydantic_geojson import FeatureCollectionModel as F; "
+            "F.model_validate({'type': 'FeatureCollection', 'features': []}); "
+            f"print(sorted(set({HEAVY_MODULES!r}).intersection(sys.modules)))"
+        )
+
+        assert output == "[]"
+
+
+class TestImportTimeBudget:
+    """Test that cold imports stay within budget."""
+
+    def test_package_import_budget(self):
+        """Test the cost of ``import pydantic_geojson``."""
+        seconds = _cold_import_seconds("import pydantic_geojson")
+
+        assert seconds < PACKAGE_IMPORT_BUDGET * BUDGET_SLACK
+
+    def test_model_import_budget(self):
+        """Test the cost of importing a model on top of pydantic itself."""
+        baseline = _cold_import_seconds("import pydantic")
+        model = _cold_import_seconds("from pydantic_geojson import FeatureCollectionModel")
+
+        assert model - baseline < MODEL_IMPORT_BUDGET * BUDGET_SLACK
@@ -0,0 +1,127 @@
+"""Tests for partial-acceptance bulk ingest."""
+
+import json
+
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from pydantic_geojson import FeatureCollectionModel, FeatureModel, PointModel
+from pydantic_geojson.ingest import FeatureError, ingest, ingest_json
+
+
+class CityProperties(BaseModel):
+    name: str
+
+
+class CityFeature(FeatureModel):
+    properties: CityProperties
+
+
+class CityCollection(FeatureCollectionModel):
+    features: list[CityFeature]
+
+
+@pytest.fixture
+def mixed_collection(geojson):
+    """A collection whose features 1 and 3 are invalid."""
+    return {
+        "type": "FeatureCollection",
+        "bbox": [-10, -10, 10, 10],
+        "features": [
+            geojson.point_feature(1, 1, {"name": "a"}),
+            geojson.point_feature(200, 1, {"name": "b"}),
+            geojson.point_feature(2, 2, {"name": "c"}),
+            {"type": "Feature", "geometry": {"type": "Polygon", "coordinates": [[[0, 0]]]}},
+        ],
+    }
+
+
+class TestIngest:
+    """Test suite for keeping valid features and reporting invalid ones."""
+
+    def test_keeps_valid_features(self, mixed_collection):
+        """Test that valid features are kept in order and invalid ones are reported."""
+        result = ingest(mixed_collection)
+
+        assert isinstance(result.collection, FeatureCollectionModel)
+        assert result.collection.bbox == [-10, -10, 10, 10]
+        assert [f.properties["name"] for f in result.collection.features] == ["a", "c"]
+        assert result.rejected == [1, 3]
+        assert result.errors[0] == FeatureError(
+            1,
+            ("geometry", "coordinates", 0),
+            "Input should be less than or equal to 180",
+            "less_than_equal",
+        )
+
+    def test_valid_features_are_not_revalidated(self, mixed_collection):
+        """Test that kept features are the instances validated per feature."""
+        result = ingest(mixed_collection)
+        feature = result.collection.features[0]
+
+        assert isinstance(feature.geometry, PointModel)
+        assert feature == FeatureModel.model_validate(mixed_collection["features"][0])
+
+    def test_json_input(self, mixed_collection):
+        """Test that JSON documents give the same result as Python input."""
+        assert ingest_json(json.dumps(mixed_collection)) == ingest(mixed_collection)
+
+    def test_iterable_of_features(self, mixed_collection):
+        """Test that features can be streamed from an iterable."""
+        result = ingest(iter(mixed_collection["features"]))
+
+        assert len(result.collection.features) == 2
+        assert result.collection.bbox is None
+        assert result.rejected == [1, 3]
+
+    def test_errors_per_feature(self, mixed_collection):
+        """Test that more than one error per feature can be reported."""
+        mixed_collection["features"][1]["geometry"]["coordinates"] = [200, 100]
+
+        assert len(ingest(mixed_collection).errors) == 2
+        assert len(ingest(mixed_collection, max_errors_per_feature=5).errors) == 3
+
+    def test_custom_collection_model(self, mixed_collection):
+        """Test ingest with a subclass that types its feature properties."""
+        mixed_collection["features"][2]["properties"] = {}
+        result = ingest(mixed_collection, model=CityCollection)
+
+        assert isinstance(result.collection, CityCollection)
+        assert [f.properties.name for f in result.collection.features] == ["a"]
+        assert result.rejected == [1, 2, 3]
+
+    def test_invalid_collection(self, mixed_collection):
+        """Test that errors of the collection itself are still raised."""
+        mixed_collection["bbox"] = [0, 0, 0]
+
+        with pytest.raises(ValidationError, match="bbox"):
+            ingest(mixed_collection)
+        with pytest.raises(ValidationError, match="features"):
+            ingest({"type": "FeatureCollection", "features": None})
+        with pytest.raises(ValidationError, match="json_invalid"):
+            ingest_json("{")
+
+    def test_max_errors_per_feature_must_be_positive(self):
+        """Test that a budget below one error is rejected."""
+        with pytest.raises(ValueError, match="max_errors_per_feature"):
+            ingest([], max_errors_per_feature=0)
+
+    def test_features_sequence(self, mixed_collection):
+        """Test that features given as a tuple are ingested, and a generator is rejected."""
+        mixed_collection["features"] = tuple(mixed_collection["features"])
+        result = ingest(mixed_collection)
+
+        assert len(result.collection.features) == 2
+        assert result.rejected == [1, 3]
+        mixed_collection["features"] = (feature for feature in result.collection.features)
+        with pytest.raises(ValueError, match="features must be a sequence"):
+            ingest(mixed_collection)
+
+    def test_model_without_features(self):
+        """Test that a model whose features are not feature models is rejected."""
+
+        class Untyped(FeatureCollectionModel):
+            features: list[dict]
+
+        with pytest.raises(ValueError, match="Untyped has no features field"):
+            ingest([], model=Untyped)
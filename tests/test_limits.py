@@ -0,0 +1,175 @@
+"""Tests for validation resource budgets."""
+
+import json
+import time
+
+import pytest
+from pydantic import ValidationError
+
+from pydantic_geojson import FeatureCollectionModel, FeatureModel, GeometryCollectionModel
+from pydantic_geojson.limits import ValidationLimits, check_json_limits, check_limits
+
+
+def nested_geometry_collection(depth):
+    """A GeometryCollection nested ``depth`` times around a Point."""
+    geometry = {"type": "Point", "coordinates": [0, 0]}
+    for _ in range(depth):
+        geometry = {"type": "GeometryCollection", "geometries": [geometry]}
+    return geometry
+
+
+def collection(n_features, n_positions=2, properties=None):
+    """A FeatureCollection of ``n_features`` LineStrings with ``n_positions`` positions each."""
+    line = {"type": "LineString", "coordinates": [[i % 90, 0] for i in range(n_positions)]}
+    feature = {"type": "Feature", "geometry": line, "properties": properties or {}}
+    return {"type": "FeatureCollection", "bbox": [0, 0, 89, 0], "features": [feature] * n_features}
+
+
+def check_both(data, limits, indent=None):
+    """Run the Python and JSON checks and return their outcomes (None or error message)."""
+    outcomes = []
+    encoded = json.dumps(data, indent=indent)
+    for check, document in ((check_limits, data), (check_json_limits, encoded)):
+        try:
+            check(document, limits)
+        except ValueError as exc:
+            outcomes.append(str(exc))
+        else:
+            outcomes.append(None)
+    return outcomes
+
+
+class TestLimitChecks:
+    """Test that the Python and raw JSON checks agree on every limit."""
+
+    @pytest.mark.parametrize(
+        "limits,expected",
+        [
+            (ValidationLimits(), None),
+            (ValidationLimits(max_depth=6), None),
+            (ValidationLimits(max_depth=5), "max_depth > 5"),
+            (ValidationLimits(max_positions=30), None),
+            (ValidationLimits(max_positions=29), "max_positions > 29"),
+            (ValidationLimits(max_features=10), None),
+            (ValidationLimits(max_features=9), "max_features > 9"),
+            (ValidationLimits(max_properties_size=100), None),
+            (ValidationLimits(max_properties_size=10), "max_properties_size > 10"),
+        ],
+    )
+    def test_collection_limits(self, limits, expected):
+        """Test each limit on a collection of 10 features with 3 positions each.
+
+        Positions and the innermost properties list are both at depth 6.
+        """
+        data = collection(10, n_positions=3, properties={"name": "x", "tags": [["a"]]})
+        outcomes = check_both(data, limits)
+
+        if expected is None:
+            assert outcomes == [None, None]
+        else:
+            assert all(expected in outcome for outcome in outcomes)
+
+    def test_bbox_is_not_a_position(self):
+        """Test that bounding boxes do not count towards max_positions."""
+        outcomes = check_both(collection(1, n_positions=2), ValidationLimits(max_positions=2))
+
+        assert outcomes == [None, None]
+
+    @pytest.mark.parametrize("indent", [None, 2, "\t"])
+    def test_properties_size_ignores_formatting(self, indent):
+        """Test that max_properties_size counts compact JSON, however the document is formatted."""
+        properties = {"name": "a b", "tags": [["a"], {"k": 1.5}]}
+        data = collection(2, properties=properties)
+        size = len(json.dumps(properties, separators=(",", ":")))
+
+        assert check_both(data, ValidationLimits(max_properties_size=size), indent) == [None, None]
+        outcomes = check_both(data, ValidationLimits(max_properties_size=size - 1), indent)
+        assert all("max_properties_size" in outcome for outcome in outcomes)
+
+    @pytest.mark.parametrize(
+        "properties",
+        [{}, {"a": {}}, {"a": []}, {"a": [[], {}], "b": [{"c": []}]}, {"a": [1, []]}],
+    )
+    def test_properties_size_of_empty_containers(self, properties):
+        """Test that empty objects and arrays count their two bytes of compact JSON."""
+        data = collection(1, properties=properties)
+        size = len(json.dumps(properties, separators=(",", ":")))
+
+        assert check_both(data, ValidationLimits(max_properties_size=size)) == [None, None]
+        outcomes = check_both(data, ValidationLimits(max_properties_size=size - 1))
+        assert all("max_properties_size" in outcome for outcome in outcomes)
+
+    def test_null_properties_have_no_size(self):
+        """Test that ``"properties": null`` does not count towards max_properties_size."""
+        data = collection(1)
+        data["features"][0] = {**data["features"][0], "properties": None}
+
+        assert check_both(data, ValidationLimits(max_properties_size=0)) == [None, None]
+
+    def test_nested_geometry_collection_depth(self):
+        """Test that deeply nested GeometryCollections are rejected by depth."""
+        data = nested_geometry_collection(50)
+
+        assert all("max_depth" in outcome for outcome in check_both(data, ValidationLimits(32)))
+
+    def test_strings_do_not_confuse_json_scan(self):
+        """Test that brackets and keys inside strings are not counted."""
+        properties = {"text": 'features: [{[1, 2]}] "quoted" \\ ', "features": "no"}
+        data = collection(1, properties=properties)
+
+        assert check_both(data, ValidationLimits(max_depth=6, max_positions=2)) == [None, None]
+
+    def test_rejection_time_is_bounded_by_limit(self):
+        """Test that an oversized document is rejected without scanning all of it."""
+        document = json.dumps(collection(1, n_positions=1_000_000)).encode()
+        start = time.perf_counter()
+        with pytest.raises(ValueError, match="max_positions"):
+            check_json_limits(document, ValidationLimits(max_positions=100))
+        elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        check_json_limits(document, ValidationLimits())
+        full_scan = time.perf_counter() - start
+
+        assert elapsed * 100 < full_scan
+
+
+class TestModelLimits:
+    """Test limits passed to model validation through the context."""
+
+    def test_model_validate(self):
+        """Test that an exceeded limit is reported as a ValidationError."""
+        limits = ValidationLimits(max_features=2)
+
+        with pytest.raises(ValidationError) as exc_info:
+            FeatureCollectionModel.model_validate(collection(3), context={"limits": limits})
+
+        (error,) = exc_info.value.errors()
+        assert error["type"] == "validation_limit"
+        assert error["loc"] == ()
+        assert error["ctx"] == {"name": "max_features", "limit": 2}
+
+    def test_model_validate_json(self):
+        """Test that JSON documents are checked before parsing."""
+        limits = ValidationLimits(max_depth=10)
+        document = json.dumps(nested_geometry_collection(20))
+
+        with pytest.raises(ValidationError, match="max_depth > 10"):
+            GeometryCollectionModel.model_validate_json(document, context={"limits": limits})
+
+    def test_within_limits(self):
+        """Test that documents within the limits validate as usual."""
+        limits = ValidationLimits(max_depth=8, max_positions=4, max_features=2)
+        data = collection(2)
+        context = {"limits": limits}
+
+        assert len(FeatureCollectionModel.model_validate(data, context=context).features) == 2
+        model = FeatureCollectionModel.model_validate_json(json.dumps(data), context=context)
+        assert len(model.features) == 2
+
+    def test_no_limits_without_context(self):
+        """Test that nothing is enforced without limits in the context."""
+        data = collection(1)["features"][0]
+
+        assert FeatureModel.model_validate(data, context={"other": 1}).geometry is not None
+        assert FeatureModel.model_validate(data).geometry is not None
@@ -0,0 +1,132 @@
+"""Tests for geodesic area, length and perimeter."""
+
+import math
+
+import pytest
+
+from pydantic_geojson import (
+    FeatureCollectionModel,
+    LineStringModel,
+    MultiLineStringModel,
+    MultiPolygonModel,
+    PolygonModel,
+)
+from pydantic_geojson.columnar import ColumnarFeatureCollection
+from pydantic_geojson.measure import MEAN_EARTH_RADIUS, areas, lengths, perimeters
+
+# Reference values from GeographicLib (WGS 84).
+SQUARE = [[0, 0], [1, 0], [1, 1], [0, 1], [0, 0]]
+SQUARE_AREA = 12308778361.469452
+SQUARE_PERIMETER = 443770.917248
+HOLE = [[0.2, 0.2], [0.2, 0.4], [0.4, 0.4], [0.4, 0.2], [0.2, 0.2]]
+HOLE_AREA = 492356574.692912
+HOLE_PERIMETER = 88756.845618
+EQUATOR_DEGREE = 111319.490793
+MERIDIAN_DEGREE = 110574.388558
+
+
+def polygon(*rings):
+    return PolygonModel(type="Polygon", coordinates=list(rings))
+
+
+class TestMeasure:
+    """Test suite for geodesic measures."""
+
+    def test_polygon_area(self):
+        """Test the ellipsoidal area of a polygon, with and without a hole."""
+        assert polygon(SQUARE).area() == pytest.approx(SQUARE_AREA, rel=1e-6)
+        assert polygon(SQUARE, HOLE).area() == pytest.approx(SQUARE_AREA - HOLE_AREA, rel=1e-6)
+
+    def test_winding_order(self):
+        """Test that rings give the same area in either winding order."""
+        assert polygon(SQUARE[::-1]).area() == pytest.approx(polygon(SQUARE).area())
+
+    def test_spherical_area(self):
+        """Test the spherical area of an octant of the sphere."""
+        octant = [[0, 0], [90, 0], [0, 90], [0, 0]]
+        expected = 4 * math.pi * MEAN_EARTH_RADIUS**2 / 8
+
+        assert polygon(octant).area(spherical=True) == pytest.approx(expected, rel=1e-12)
+
+    def test_antimeridian(self):
+        """Test a polygon crossing the antimeridian."""
+        ring = [[179.5, 0], [-179.5, 0], [-179.5, 1], [179.5, 1], [179.5, 0]]
+
+        assert polygon(ring).area() == pytest.approx(SQUARE_AREA, rel=1e-6)
+
+    def test_perimeter(self):
+        """Test that the perimeter includes the holes."""
+        assert polygon(SQUARE, HOLE).perimeter() == pytest.approx(
+            SQUARE_PERIMETER + HOLE_PERIMETER, rel=1e-9
+        )
+
+    def test_line_length(self):
+        """Test ellipsoidal and spherical line lengths."""
+        line = LineStringModel(type="LineString", coordinates=[[0, 0], [1, 0], [1, 1]])
+        spherical = 2 * MEAN_EARTH_RADIUS * math.radians(1)
+
+        assert line.length() == pytest.approx(EQUATOR_DEGREE + MERIDIAN_DEGREE, rel=1e-9)
+        assert line.length(spherical=True) == pytest.approx(spherical, rel=1e-9)
+
+    def test_multi_geometries(self):
+        """Test MultiPolygon and MultiLineString measures."""
+        multi_polygon = MultiPolygonModel(
+            type="MultiPolygon", coordinates=[[SQUARE], [[[x + 10, y] for x, y in SQUARE]]]
+        )
+        multi_line = MultiLineStringModel(
+            type="MultiLineString", coordinates=[[[0, 0], [1, 0]], [[0, 0], [0, 1]]]
+        )
+
+        assert multi_polygon.area() == pytest.approx(2 * SQUARE_AREA, rel=1e-6)
+        assert multi_polygon.perimeter() == pytest.approx(2 * SQUARE_PERIMETER, rel=1e-9)
+        assert multi_line.length() == pytest.approx(EQUATOR_DEGREE + MERIDIAN_DEGREE, rel=1e-9)
+
+    def test_batched(self):
+        """Test measures over a collection of mixed geometries."""
+        collection = FeatureCollectionModel.model_validate(
+            {
+                "type": "FeatureCollection",
+                "features": [
+                    {"type": "Feature", "properties": None, "geometry": geometry}
+                    for geometry in [
+                        {"type": "Polygon", "coordinates": [SQUARE, HOLE]},
+                        {"type": "LineString", "coordinates": [[0, 0], [1, 0]]},
+                        None,
+                        {"type": "Point", "coordinates": [0, 0]},
+                        {
+                            "type": "GeometryCollection",
+                            "geometries": [
+                                {"type": "Polygon", "coordinates": [SQUARE]},
+                                {"type": "LineString", "coordinates": [[0, 0], [0, 1]]},
+                            ],
+                        },
+                    ]
+                ],
+            }
+        )
+        expected_areas = [SQUARE_AREA - HOLE_AREA, 0, 0, 0, SQUARE_AREA]
+
+        assert areas(collection) == pytest.approx(expected_areas, rel=1e-6)
+        assert areas(ColumnarFeatureCollection.from_model(collection)) == areas(collection)
+        assert lengths(collection) == pytest.approx(
+            [0, EQUATOR_DEGREE, 0, 0, MERIDIAN_DEGREE], rel=1e-9
+        )
+        assert perimeters(collection) == pytest.approx(
+            [SQUARE_PERIMETER + HOLE_PERIMETER, 0, 0, 0, SQUARE_PERIMETER], rel=1e-9
+        )
+
+    def test_no_matching_geometries(self):
+        """Test collections without polygons or lines."""
+        points = [None, {"type": "Point", "coordinates": [1, 2]}]
+        collection = FeatureCollectionModel.model_validate(
+            {
+                "type": "FeatureCollection",
+                "features": [
+                    {"type": "Feature", "properties": None, "geometry": geometry}
+                    for geometry in points
+                ],
+            }
+        )
+
+        assert areas(collection) == [0.0, 0.0]
+        assert lengths(collection) == [0.0, 0.0]
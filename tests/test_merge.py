@@ -0,0 +1,90 @@
+"""Tests for merge and concatenation of feature collections."""
+
+import pytest
+from pydantic import ValidationError
+
+from pydantic_geojson import FeatureCollectionModel, PointModel, PolygonModel
+from pydantic_geojson.merge import combine_bboxes, concat, merge
+
+
+def names(merged):
+    return [item.properties["name"] for item in merged.features]
+
+
+class TestMerge:
+    """Test suite for merge and concat."""
+
+    def test_concat(self, geojson):
+        """Test that concatenation reuses the features and combines the bboxes."""
+        typed = FeatureCollectionModel[PointModel, dict]
+        first = geojson.collection(
+            [geojson.place("A", 1, id="a"), geojson.place("B", 2)], cls=typed, bbox=[1, 1, 2, 1]
+        )
+        second = geojson.collection([geojson.place("C", 3, id="a")], bbox=[3, 1, 3, 1])
+        joined = concat(first, second, geojson.collection([]))
+
+        assert type(joined) is FeatureCollectionModel
+        assert type(concat(first, first)) is typed
+        assert names(joined) == ["A", "B", "C"]
+        assert all(
+            joined.features[position] is item
+            for position, item in enumerate([*first.features, *second.features])
+        )
+        assert joined.bbox == [1, 1, 3, 1]
+        assert concat(first, geojson.collection([geojson.place("D", 4)])).bbox is None
+        assert joined.model_dump()["features"] == [
+            *first.model_dump()["features"],
+            *second.model_dump()["features"],
+        ]
+        with pytest.raises(ValueError, match="At least one"):
+            concat()
+
+    def test_merge(self, geojson):
+        """Test the id conflict policies."""
+        first = geojson.collection(
+            [geojson.place("A", 1, id="a"), geojson.place("B", 2, id=1), geojson.place("C", 3)]
+        )
+        second = geojson.collection(
+            [geojson.place("D", 4, id="1"), geojson.place("E", 5, id="a"), geojson.place("C", 3)]
+        )
+
+        assert names(merge(first, second, on_conflict="first")) == ["A", "B", "C", "D", "C"]
+        assert names(merge(first, second, on_conflict="last")) == ["E", "B", "C", "D", "C"]
+        assert names(merge(first, geojson.collection([geojson.place("F", 6, id="b")]))) == [
+            "A", "B", "C", "F"
+        ]  # fmt: skip
+        with pytest.raises(ValueError, match="Duplicate feature ids: 'a' at features 0, 4"):
+            merge(first, second)
+        with pytest.raises(ValueError, match="on_conflict"):
+            merge(first, on_conflict="replace")
+
+    def test_mixed_types(self, geojson):
+        """Test that collections of different types give a plain, valid collection."""
+        points = geojson.collection(
+            [geojson.place("A", 1)], cls=FeatureCollectionModel[PointModel, dict]
+        )
+        square = [[0, 0], [1, 0], [1, 1], [0, 1], [0, 0]]
+        polygons = geojson.collection(
+            [geojson.feature({"type": "Polygon", "coordinates": [square]}, {"name": "B"})],
+            cls=FeatureCollectionModel[PolygonModel, dict],
+        )
+
+        for combined in (concat(points, polygons), merge(polygons, points)):
+            assert type(combined) is FeatureCollectionModel
+            assert FeatureCollectionModel.model_validate(combined.model_dump()) == combined
+        with pytest.raises(ValidationError):
+            FeatureCollectionModel[PointModel, dict].model_validate(
+                concat(points, polygons).model_dump()
+            )
+
+    def test_combine_bboxes(self):
+        """Test combining 2D, 3D and antimeridian-crossing bboxes."""
+        assert combine_bboxes([[0, 0, 1, 1], [-5, 2, -4, 3]]) == [-5, 0, 1, 3]
+        assert combine_bboxes([[0, 0, -10, 1, 1, 5], [2, 2, 0, 3, 3, 9]]) == [0, 0, -10, 3, 3, 9]
+        assert combine_bboxes([[0, 0, -10, 1, 1, 5], [2, 2, 3, 3]]) == [0, 0, 3, 3]
+        assert combine_bboxes([[170, 0, -170, 1], [160, 0, 165, 1]]) == [160, 0, -170, 1]
+        assert combine_bboxes([[170, 0, -170, 1], [-175, -1, -160, 0]]) == [170, -1, -160, 1]
+        assert combine_bboxes([[170, 0, -170, 1], [-100, 0, 100, 1]]) == [170, 0, 100, 1]
+        assert combine_bboxes([[10, 0, 5, 1], [4, 0, 11, 1]]) == [-180, 0, 180, 1]
+        assert combine_bboxes([[0, 0, 1, 1], None]) is None
+        assert combine_bboxes([]) is None
@@ -0,0 +1,252 @@
+"""Tests for Mapbox Vector Tile encoding."""
+
+import math
+from array import array
+from typing import Optional
+
+import pytest
+from pydantic import BaseModel
+
+from pydantic_geojson import FeatureCollectionModel, PointModel, _tiling, mvt
+from pydantic_geojson._tiling import clip_line, clip_ring, compute_importance, project_features
+from pydantic_geojson.mvt import encode_layer, encode_tile
+from tests.test_utils import decode_mvt
+
+
+class StationProperties(BaseModel):
+    name: str
+    capacity: Optional[int] = None
+
+
+def _circle(lon, lat, radius, vertices):
+    ring = [
+        [
+            lon + radius * math.cos(2 * math.pi * i / vertices),
+            lat + radius * math.sin(2 * math.pi * i / vertices),
+        ]
+        for i in range(vertices)
+    ]
+    return ring + ring[:1]
+
+
+@pytest.fixture
+def dense_collection(geojson):
+    """Lines, polygons and points with enough vertices to take the vectorized paths."""
+    wave = [[-20 + i * 0.04, 10 * math.sin(i / 25)] for i in range(1000)]
+    polygon = {
+        "type": "Polygon",
+        "coordinates": [_circle(0, 0, 15, 400), _circle(0, 0, 5, 100)[::-1]],
+    }
+    points = {
+        "type": "MultiPoint",
+        "coordinates": [[i * 0.5 - 25, i * 0.3 - 15] for i in range(100)],
+    }
+    return geojson.collection(
+        [
+            geojson.feature({"type": "LineString", "coordinates": wave}, id=0),
+            geojson.feature(polygon, id=1),
+            geojson.feature(points, id=2),
+        ]
+    )
+
+
+def _signed_area(path):
+    return sum(x1 * y2 - x2 * y1 for (x1, y1), (x2, y2) in zip(path, path[1:]))
+
+
+class TestEncodeTile:
+    """Test suite for encode_tile."""
+
+    def test_point_layer_structure(self, geojson):
+        """Test that a point at the origin lands in the middle of the root tile."""
+        fc = geojson.collection([geojson.point_feature(0, 0, id=7)])
+        layer = decode_mvt(encode_tile(fc, 0, 0, 0, layer_name="points"))["points"]
+
+        assert layer["version"] == 2
+        assert layer["extent"] == 4096
+        (feature,) = layer["features"]
+        assert feature["id"] == 7
+        assert feature["type"] == 1
+        assert feature["geometry"] == [[(2048, 2048)]]
+
+    def test_multi_point_uses_single_move_to(self, geojson):
+        """Test that MultiPoint positions are encoded as one MoveTo with several points."""
+        fc = geojson.collection(
+            [geojson.feature({"type": "MultiPoint", "coordinates": [[-90, 0], [90, 0]]})]
+        )
+        (feature,) = decode_mvt(encode_tile(fc, 0, 0, 0))["features"]["features"]
+
+        assert feature["geometry"] == [[(1024, 2048)], [(3072, 2048)]]
+
+    def test_polygon_winding_follows_mvt_spec(self, geojson, valid_polygon_with_holes):
+        """Test that exterior rings are clockwise and holes counter-clockwise in tile space."""
+        fc = geojson.collection([geojson.feature(valid_polygon_with_holes)])
+        (feature,) = decode_mvt(encode_tile(fc, 7, 99, 63, tolerance=0))["features"]["features"]
+
+        exterior, hole = feature["geometry"]
+        assert feature["type"] == 3
+        assert exterior[0] == exterior[-1]
+        assert _signed_area(exterior) > 0
+        assert _signed_area(hole) < 0
+
+    def test_line_is_clipped_to_tile_buffer(self, geojson):
+        """Test that a world-spanning line is clipped to the tile plus buffer."""
+        fc = geojson.collection(
+            [geojson.feature({"type": "LineString", "coordinates": [[-170, 10], [170, 10]]})]
+        )
+        (feature,) = decode_mvt(encode_tile(fc, 1, 0, 0, buffer=64))["features"]["features"]
+
+        (path,) = feature["geometry"]
+        xs = [x for x, _ in path]
+        assert min(xs) >= -64
+        assert max(xs) == 4096 + 64
+
+    def test_simplification_drops_vertices(self, geojson):
+        """Test that dense lines are simplified at low zoom and kept with tolerance 0."""
+        coordinates = [[i / 10000, (i % 2) * 1e-3] for i in range(1000)]
+        fc = geojson.collection(
+            [geojson.feature({"type": "LineString", "coordinates": coordinates})]
+        )
+
+        simplified = decode_mvt(encode_tile(fc, 0, 0, 0))["features"]["features"][0]
+        exact = decode_mvt(encode_tile(fc, 10, 512, 511, tolerance=0))["features"]["features"][0]
+
+        assert len(simplified["geometry"][0]) == 2
+        assert len(exact["geometry"][0]) > 100
+
+    def test_properties_encoding(self, geojson):
+        """Test property values of each supported type and shared key/value tables."""
+        properties = {
+            "name": "a",
+            "count": 3,
+            "delta": -4,
+            "ratio": 0.5,
+            "flag": True,
+            "meta": {"k": [1, 2]},
+            "missing": None,
+        }
+        fc = geojson.collection(
+            [
+                geojson.point_feature(1, 1, properties, id="string-id"),
+                geojson.point_feature(2, 2, {"name": "a"}),
+            ]
+        )
+        layer = decode_mvt(encode_tile(fc, 0, 0, 0))["features"]
+        first, second = layer["features"]
+
+        assert "id" not in first
+        assert first["properties"] == {
+            "name": "a",
+            "count": 3,
+            "delta": -4,
+            "ratio": 0.5,
+            "flag": True,
+            "meta": '{"k":[1,2]}',
+        }
+        assert second["properties"] == {"name": "a"}
+        assert layer["values"].count("a") == 1
+
+    def test_typed_properties(self, geojson):
+        """Test that properties models are encoded like dictionaries."""
+        fc = geojson.collection(
+            [
+                geojson.point_feature(1, 1, {"name": "a", "capacity": 3}),
+                geojson.point_feature(2, 2, {"name": "b"}),
+            ],
+            cls=FeatureCollectionModel[PointModel, StationProperties],
+        )
+        layer = decode_mvt(encode_tile(fc, 0, 0, 0))["features"]
+
+        assert [feature["properties"] for feature in layer["features"]] == [
+            {"name": "a", "capacity": 3},
+            {"name": "b"},
+        ]
+
+    def test_geometry_collection_is_flattened(self, geojson, valid_geometry_collection_data):
+        """Test that each member of a GeometryCollection becomes its own MVT feature."""
+        fc = geojson.collection([geojson.feature(valid_geometry_collection_data, {"kind": "gc"})])
+        features = decode_mvt(encode_tile(fc, 12, 1130, 1621))["features"]["features"]
+
+        assert len(features) == len(valid_geometry_collection_data["geometries"])
+        assert [f["type"] for f in features] == [1, 3, 2]
+        assert all(f["properties"] == {"kind": "gc"} for f in features)
+
+    def test_empty_tile(self, geojson, valid_point_data):
+        """Test that a tile without features encodes to empty bytes."""
+        fc = geojson.collection([geojson.feature(valid_point_data), geojson.feature(None)])
+
+        assert encode_tile(fc, 5, 0, 0) == b""
+
+    def test_accepts_feature_iterable(self, geojson, valid_point_data):
+        """Test that an iterable of features is accepted as well as a collection."""
+        fc = geojson.collection([geojson.feature(valid_point_data)])
+
+        assert encode_tile(iter(fc.features), 0, 0, 0) == encode_tile(fc, 0, 0, 0)
+
+    @pytest.mark.parametrize("z,x,y", [(-1, 0, 0), (0, 1, 0), (2, 0, 4), (3, -1, 0)])
+    def test_invalid_tile_address(self, geojson, z, x, y):
+        """Test that addresses outside the tile pyramid are rejected."""
+        with pytest.raises(ValueError, match="Tile"):
+            encode_tile(geojson.collection([]), z, x, y)
+
+
+class TestVectorizedEncoding:
+    """Test that the numpy paths produce the same tiles as the pure Python fallback."""
+
+    def test_projection_matches_fallback(self, dense_collection, monkeypatch):
+        """Test that vectorized projection agrees with the scalar formulas."""
+        vectorized = project_features(dense_collection.features)
+        monkeypatch.setattr(_tiling, "np", None)
+        fallback = project_features(dense_collection.features)
+
+        for ours, theirs in zip(vectorized, fallback):
+            assert ours.bbox == pytest.approx(theirs.bbox, abs=1e-15)
+            assert list(ours.geometry[0][0::3]) == pytest.approx(list(theirs.geometry[0][0::3]))
+
+    def test_importance_matches_fallback(self, monkeypatch):
+        """Test that vectorized Douglas-Peucker ranks every vertex like the loop."""
+        part = array("d")
+        for i in range(500):
+            part.extend((i / 500, 0.5 + 0.1 * math.sin(i / 7) * math.cos(i / 31), 0.0))
+        vectorized = array("d", part)
+        compute_importance(vectorized)
+        monkeypatch.setattr(_tiling, "np", None)
+        compute_importance(part)
+
+        assert vectorized == part
+
+    @pytest.mark.parametrize("axis", [0, 1])
+    @pytest.mark.parametrize("k1,k2", [(0.25, 0.75), (0.5, 0.5), (0.1, 0.3), (-1.0, 0.5)])
+    def test_clipping_matches_fallback(self, monkeypatch, axis, k1, k2):
+        """Test clipping of lines and rings that cross, touch and run along the bounds."""
+        zigzag = array("d")
+        for i in range(200):
+            # Every fourth vertex lies exactly on a grid line that the bounds reuse.
+            value = round(i % 8 / 8, 3) if i % 4 else 0.25 * (i % 3)
+            zigzag.extend((value, i / 200, 0.0) if axis == 0 else (i / 200, value, 0.0))
+        ring = array("d")
+        for i in range(100):
+            angle = 2 * math.pi * i / 100
+            ring.extend((0.5 + 0.4 * math.cos(angle), 0.5 + 0.3 * math.sin(3 * angle), 0.0))
+        ring.extend(ring[:3])
+
+        vectorized = (clip_line(zigzag, k1, k2, axis), clip_ring(ring, k1, k2, axis))
+        monkeypatch.setattr(_tiling, "np", None)
+
+        assert vectorized == (clip_line(zigzag, k1, k2, axis), clip_ring(ring, k1, k2, axis))
+        assert vectorized[0]
+
+    @pytest.mark.parametrize(
+        "z,x,y,tolerance",
+        [(0, 0, 0, 3.0), (3, 3, 3, 3.0), (4, 7, 7, 0), (5, 15, 16, 1.0), (6, 31, 30, 0)],
+    )
+    def test_tiles_match_fallback(self, dense_collection, monkeypatch, z, x, y, tolerance):
+        """Test that simplification, clipping, snapping and zigzag encoding agree byte for byte."""
+        projected = project_features(dense_collection.features)
+        vectorized = encode_layer(projected, z, x, y, layer_name="dense", tolerance=tolerance)
+        monkeypatch.setattr(_tiling, "np", None)
+        monkeypatch.setattr(mvt, "np", None)
+        fallback = encode_layer(projected, z, x, y, layer_name="dense", tolerance=tolerance)
+
+        assert vectorized
+        assert vectorized == fallback
@@ -0,0 +1,114 @@
+"""Tests for ring orientation checks and rewinding."""
+
+import pytest
+from pydantic import ValidationError
+
+from pydantic_geojson import FeatureCollectionModel, MultiPolygonModel, PolygonModel
+from pydantic_geojson.orientation import signed_area
+from pydantic_geojson.packed import PackedCoordinates, PackedLinearRing
+
+CCW = [[0, 0], [4, 0], [4, 4], [0, 4], [0, 0]]
+CW_HOLE = [[1, 1], [1, 2], [2, 2], [2, 1], [1, 1]]
+RIGHT_HAND = {"right_hand_rule": True}
+
+
+def coordinates(model):
+    return [[list(position[:2]) for position in ring] for ring in model.coordinates]
+
+
+class CompactPolygonModel(PolygonModel):
+    coordinates: list[PackedLinearRing]
+
+
+class TestOrientation:
+    """Test suite for the right-hand rule."""
+
+    def test_signed_area(self):
+        """Test the sign and size of ring areas."""
+        assert signed_area(PolygonModel(type="Polygon", coordinates=[CCW]).coordinates[0]) == 16
+        assert signed_area(CW_HOLE) == -1
+        assert signed_area(PackedCoordinates.from_positions(CCW[::-1])) == -16
+
+    def test_valid_orientation(self):
+        """Test that rings following the right-hand rule pass the check."""
+        data = {"type": "Polygon", "coordinates": [CCW, CW_HOLE]}
+
+        assert coordinates(PolygonModel.model_validate(data, context=RIGHT_HAND)) == [CCW, CW_HOLE]
+
+    @pytest.mark.parametrize(
+        "rings, message",
+        [([CCW[::-1]], "exterior ring"), ([CCW, CW_HOLE[::-1]], "Hole 1")],
+    )
+    def test_invalid_orientation(self, rings, message):
+        """Test that wrongly wound rings fail only when the check is requested."""
+        data = {"type": "Polygon", "coordinates": rings}
+
+        PolygonModel.model_validate(data)
+        with pytest.raises(ValidationError, match=message):
+            PolygonModel.model_validate(data, context=RIGHT_HAND)
+
+    def test_nested_check(self):
+        """Test the check inside a FeatureCollection, also in fail-fast mode."""
+        data = {
+            "type": "FeatureCollection",
+            "features": [
+                {
+                    "type": "Feature",
+                    "properties": None,
+                    "geometry": {"type": "MultiPolygon", "coordinates": [[CCW], [CCW[::-1]]]},
+                }
+            ],
+        }
+
+        for context in (RIGHT_HAND, {**RIGHT_HAND, "max_errors": 1}):
+            with pytest.raises(ValidationError, match="exterior ring of polygon 1"):
+                FeatureCollectionModel.model_validate(data, context=context)
+
+    def test_rewind_polygon(self):
+        """Test that rewind reverses only the wrongly wound rings, in place."""
+        polygon = PolygonModel(type="Polygon", coordinates=[CCW[::-1], CW_HOLE[::-1]])
+        exterior = polygon.coordinates[0]
+        first = exterior[0]
+
+        assert polygon.rewind() is polygon
+        assert coordinates(polygon) == [CCW, CW_HOLE]
+        assert polygon.coordinates[0] is exterior
+        assert polygon.coordinates[0][-1] is first
+
+    def test_rewind_packed(self):
+        """Test rewinding packed rings."""
+        polygon = CompactPolygonModel.model_validate(
+            {"type": "Polygon", "coordinates": [CCW[::-1]]}
+        )
+
+        assert coordinates(polygon.rewind()) == [CCW]
+
+    def test_rewind_multipolygon_and_collection(self):
+        """Test rewinding MultiPolygons and the polygons of a FeatureCollection."""
+        multi = MultiPolygonModel(type="MultiPolygon", coordinates=[[CCW[::-1]], [CCW]])
+        multi.rewind()
+
+        assert [signed_area(polygon[0]) for polygon in multi.coordinates] == [16, 16]
+
+        collection = FeatureCollectionModel.model_validate(
+            {
+                "type": "FeatureCollection",
+                "features": [
+                    {
+                        "type": "Feature",
+                        "properties": None,
+                        "geometry": {
+                            "type": "GeometryCollection",
+                            "geometries": [
+                                {"type": "Polygon", "coordinates": [CCW[::-1], CW_HOLE[::-1]]},
+                                {"type": "Point", "coordinates": [0, 0]},
+                            ],
+                        },
+                    },
+                    {"type": "Feature", "properties": None, "geometry": None},
+                ],
+            }
+        )
+        collection.rewind()
+
+        assert coordinates(collection.features[0].geometry.geometries[0]) == [CCW, CW_HOLE]
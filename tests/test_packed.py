@@ -0,0 +1,170 @@
+"""Tests for PackedCoordinates."""
+
+import gc
+import json
+import tracemalloc
+from array import array
+
+import pytest
+from pydantic import Field, TypeAdapter, ValidationError
+
+from pydantic_geojson import LineStringModel, PolygonModel
+from pydantic_geojson._base import Coordinates
+from pydantic_geojson.packed import PackedCoordinates, PackedLinearRing
+from tests.test_utils import assert_coordinates_equal
+
+
+class CompactLineStringModel(LineStringModel):
+    coordinates: PackedCoordinates = Field(..., min_length=2)
+
+
+class CompactPolygonModel(PolygonModel):
+    coordinates: list[PackedLinearRing]
+
+
+class TestPackedCoordinates:
+    """Test suite for the array-backed coordinate sequence."""
+
+    def test_2d_positions(self):
+        """Test that 2D positions keep the lon/lat/alt attribute API."""
+        packed = PackedCoordinates.from_positions([[1, 2], [3.5, -4.5]])
+
+        assert packed.dims == 2
+        assert len(packed) == 2
+        assert_coordinates_equal(packed[0], [1, 2])
+        assert_coordinates_equal(packed[-1], [3.5, -4.5])
+        assert isinstance(packed[1], Coordinates)
+        assert list(packed.lons) == [1, 3.5]
+        assert list(packed.lats) == [2, -4.5]
+        assert packed.alts is None
+
+    def test_mixed_dimensions_pack_as_3d(self):
+        """Test that a missing altitude in a 3D sequence reads back as None."""
+        packed = PackedCoordinates.from_positions([[1, 2, 10], [3, 4]])
+
+        assert packed.dims == 3
+        assert_coordinates_equal(packed[0], [1, 2, 10])
+        assert_coordinates_equal(packed[1], [3, 4])
+        assert packed.to_list() == [[1, 2, 10], [3, 4]]
+
+    def test_tolerant_equality(self):
+        """Test equality with packed and plain sequences, within float tolerance."""
+        packed = PackedCoordinates.from_positions([[0.1, 0.1], [1, 1]])
+
+        assert packed == PackedCoordinates.from_positions([[0.1 + 1e-10, 0.1], [1, 1]])
+        assert packed == [Coordinates(0.1, 0.1), Coordinates(1, 1)]
+        assert packed == [[0.1, 0.1], [1, 1]]
+        assert packed != [[0.1, 0.1], [1, 1, 0]]
+        assert packed != [[0.1, 0.1]]
+        assert packed != "not positions"
+
+    def test_slicing_and_index_errors(self):
+        """Test slices return packed sequences and bad indices raise IndexError."""
+        packed = PackedCoordinates.from_positions([[0, 0], [1, 1], [2, 2], [3, 3]])
+
+        assert packed[1:3] == [[1, 1], [2, 2]]
+        assert packed[::2] == [[0, 0], [2, 2]]
+        assert isinstance(packed[1:], PackedCoordinates)
+        with pytest.raises(IndexError):
+            packed[4]
+
+    @pytest.mark.parametrize(
+        "positions",
+        [[[1, 2], [3, 4], [5, 6]], [[1, 2, 7], [3, 4], [5, 6, 8], [9, 10, 11]]],
+    )
+    def test_reverse_in_place(self, positions):
+        """Test that reversing keeps every position intact."""
+        packed = PackedCoordinates.from_positions(positions)
+        buffer = packed.data
+        packed.reverse()
+
+        assert packed.data is buffer
+        assert packed == list(reversed(positions))
+
+    def test_invalid_buffer(self):
+        """Test that inconsistent buffers are rejected."""
+        with pytest.raises(ValueError, match="dimensions"):
+            PackedCoordinates(array("d", [1, 2]), 4)
+        with pytest.raises(ValueError, match="multiple"):
+            PackedCoordinates(array("d", [1, 2, 3]), 2)
+
+    def test_unhashable(self):
+        """Test that the mutable packed sequence is not hashable."""
+        with pytest.raises(TypeError):
+            hash(PackedCoordinates.from_positions([[0, 0]]))
+
+
+class TestPackedModels:
+    """Test packed coordinates used as model field types."""
+
+    def test_line_string_validation_and_serialization(self, valid_linestring_data):
+        """Test that a packed LineString validates, serializes and compares like the original."""
+        compact = CompactLineStringModel(**valid_linestring_data)
+        plain = LineStringModel(**valid_linestring_data)
+
+        assert isinstance(compact.coordinates, PackedCoordinates)
+        assert compact.coordinates == plain.coordinates
+        assert compact.model_dump()["coordinates"] == valid_linestring_data["coordinates"]
+        assert (
+            json.loads(compact.model_dump_json())["coordinates"]
+            == (valid_linestring_data["coordinates"])
+        )
+
+    def test_packed_instance_is_reused(self, valid_linestring_data):
+        """Test that passing a PackedCoordinates does not copy it."""
+        packed = PackedCoordinates.from_positions(valid_linestring_data["coordinates"])
+        compact = CompactLineStringModel(type="LineString", coordinates=packed)
+
+        assert compact.coordinates is packed
+
+    def test_coordinate_ranges_are_validated(self):
+        """Test that packed fields keep the coordinate range errors and locations."""
+        with pytest.raises(ValidationError) as exc_info:
+            CompactLineStringModel(type="LineString", coordinates=[[0, 0], [181, 0]])
+
+        (error,) = exc_info.value.errors()
+        assert error["loc"] == ("coordinates", 1, 0)
+
+    def test_min_length_applies(self, invalid_linestring_one_coordinate):
+        """Test that Field constraints apply to packed sequences."""
+        with pytest.raises(ValidationError, match="at least 2 items"):
+            CompactLineStringModel(**invalid_linestring_one_coordinate)
+
+    def test_packed_linear_ring(self, valid_polygon_with_holes, invalid_polygon_data_no_loop):
+        """Test that packed linear rings keep the closed ring validation."""
+        polygon = CompactPolygonModel.model_validate_json(json.dumps(valid_polygon_with_holes))
+
+        assert len(polygon.coordinates) == 2
+        assert all(isinstance(ring, PackedCoordinates) for ring in polygon.coordinates)
+        with pytest.raises(ValidationError, match="start and end"):
+            CompactPolygonModel(**invalid_polygon_data_no_loop)
+
+    def test_json_schema_matches_plain_list(self):
+        """Test that the JSON schema is the same as for list[Coordinates]."""
+        assert (
+            TypeAdapter(PackedCoordinates).json_schema()
+            == TypeAdapter(list[Coordinates]).json_schema()
+        )
+
+    def test_uses_less_memory_per_vertex(self):
+        """Test that packed positions retain far fewer bytes per vertex."""
+        n = 20_000
+        document = json.dumps([[i * 1e-3, i * 1e-3 / 2] for i in range(n)]).encode()
+
+        def retained(adapter):
+            gc.collect()
+            tracemalloc.start()
+            try:
+                before = tracemalloc.take_snapshot()
+                result = adapter.validate_json(document)
+                after = tracemalloc.take_snapshot()
+            finally:
+                tracemalloc.stop()
+            del result
+            return sum(stat.size_diff for stat in after.compare_to(before, "filename")) / n
+
+        plain = retained(TypeAdapter(list[Coordinates]))
+        packed = retained(TypeAdapter(PackedCoordinates))
+
+        assert packed < 20
+        assert packed * 4 < plain
@@ -0,0 +1,98 @@
+"""Tests for batch reprojection."""
+
+import pytest
+
+from pydantic_geojson import PointModel
+from pydantic_geojson.columnar import ColumnarFeatureCollection
+from tests.test_utils import SAMPLE_GEOMETRIES as GEOMETRIES
+
+np = pytest.importorskip("numpy")
+
+from pydantic_geojson.projection import (  # noqa: E402
+    WEB_MERCATOR,
+    project,
+    project_arrays,
+    utm,
+    utm_zone,
+)
+
+# Reference values computed with PROJ.
+REFERENCE = [
+    (WEB_MERCATOR, (-105.01621, 39.57422), (-11690351.022239484, 4804260.634299833)),
+    (utm(33), (13.4, 52.5), (391390.73133995204, 5817855.24081733)),
+    (utm(18, south=True), (-74.0, -40.0), (585360.4618427712, 5571763.935366911)),
+]
+
+
+@pytest.fixture
+def collection(geojson):
+    """A collection of the sample geometries, with their positions as properties."""
+    return geojson.collection(
+        geojson.feature(geometry, {"index": index})
+        for index, geometry in enumerate(GEOMETRIES.values())
+    )
+
+
+class TestProjection:
+    """Test suite for reprojection."""
+
+    @pytest.mark.parametrize("projection, position, expected", REFERENCE)
+    def test_reference_values(self, projection, position, expected):
+        """Test the built-in projections against PROJ, and their inverses."""
+        x, y = project_arrays(PointModel(type="Point", coordinates=list(position)), projection)
+
+        assert x[0] == pytest.approx(expected[0], abs=1e-6)
+        assert y[0] == pytest.approx(expected[1], abs=1e-6)
+        lon, lat = projection.inverse(x, y)
+        assert (lon[0], lat[0]) == pytest.approx(position, abs=1e-9)
+
+    def test_web_mercator_bounds(self):
+        """Test that Web Mercator maps the world to a square and clamps the poles."""
+        x, y = WEB_MERCATOR.forward(np.array([180.0, -180.0]), np.array([90.0, -85.0511287798066]))
+
+        assert list(x) == pytest.approx([20037508.342789244, -20037508.342789244])
+        assert list(y) == pytest.approx([20037508.342789244, -20037508.342789244])
+
+    def test_project_collection(self, collection):
+        """Test that projection keeps structure and properties and only replaces x and y."""
+        columns = ColumnarFeatureCollection.from_model(collection)
+        projected = project(columns, WEB_MERCATOR)
+
+        assert projected.ring_offsets is columns.ring_offsets
+        assert projected.z is columns.z
+        assert projected.column("index") == columns.column("index")
+        assert projected.geometry(1)["coordinates"][1] == pytest.approx(
+            [333958.4723798207, 445640.1096560497, 5]
+        )
+        assert projected.bounds[:4] == pytest.approx([111319.49079327357, 222684.20850554318] * 2)
+        back = project(projected, WEB_MERCATOR, inverse=True).to_model()
+        assert back.features[2].geometry.coordinates[0][1].lon == pytest.approx(4)
+        assert columns.bounds[:4].tolist() == [1, 2, 1, 2]
+
+    def test_custom_transformer(self, collection):
+        """Test that a transformer function is called once with all positions."""
+        calls = []
+
+        def shift(x, y):
+            calls.append(len(x))
+            return x + 1, y - 1
+
+        projected = project(collection, shift)
+
+        assert calls == [len(projected.x)]
+        assert projected.geometry(0) == {"type": "Point", "coordinates": [2.0, 1.0]}
+        with pytest.raises(ValueError, match="no inverse"):
+            project(projected, shift, inverse=True)
+        with pytest.raises(ValueError, match="returned"):
+            project(projected, lambda x, y: (x[:1], y))
+
+    def test_utm_zone(self):
+        """Test zone lookup, including the Norway and Svalbard exceptions."""
+        assert utm_zone(13.4, 52.5) == (33, False)
+        assert utm_zone(-74, -40) == (18, True)
+        assert utm_zone(180, 0) == (1, False)
+        assert utm_zone(5, 60) == (32, False)
+        assert utm_zone(20, 78) == (33, False)
+        assert utm(*utm_zone(-74, -40)).name == "EPSG:32718"
+        with pytest.raises(ValueError, match="between 1 and 60"):
+            utm(61)
@@ -0,0 +1,99 @@
+"""Tests for property indexes."""
+
+import pytest
+from pydantic import BaseModel
+
+from pydantic_geojson import FeatureCollectionModel, FeatureModel, PointModel
+from pydantic_geojson.columnar import ColumnarFeatureCollection
+from pydantic_geojson.property_index import PropertyIndex, select
+
+VALUES = ["b", 3, None, "a", 1.5, True, 1, [1], "b", 3, False, "1", 10]
+
+
+class Properties(BaseModel):
+    status: str
+
+
+@pytest.fixture
+def collection(geojson):
+    """A collection with one Point feature per value of VALUES."""
+    return geojson.collection(
+        geojson.point_feature(position, 0, {"value": value, "position": position})
+        for position, value in enumerate(VALUES)
+    )
+
+
+class TestPropertyIndex:
+    """Test suite for property indexes."""
+
+    def test_equals(self):
+        """Test equality queries; booleans, numbers and strings are kept apart."""
+        index = PropertyIndex(VALUES)
+
+        assert index.values == [1, 1.5, 3, 10, "1", "a", "b", None, False, True]
+        assert list(index.equals("b")) == [0, 8]
+        assert list(index.equals(3)) == [1, 9]
+        assert list(index.equals(1)) == [6]
+        assert list(index.equals(True)) == [5]
+        assert list(index.equals(None)) == [2]
+        assert list(index.equals("1")) == [11]
+        assert list(index.equals("missing")) == []
+        assert list(index.equals([1])) == []
+        assert index.codes[7] == -1
+        assert len(index) == len(VALUES)
+        with pytest.raises(TypeError):
+            index.equals("b")[0] = 1
+
+    def test_between(self):
+        """Test range queries over numbers and over strings."""
+        index = PropertyIndex(VALUES)
+
+        assert list(index.between(1.5, 3)) == [4, 1, 9]
+        assert list(index.between(2, None)) == [1, 9, 12]
+        assert list(index.between(None, 1.5)) == [6, 4]
+        assert list(index.between("a", "b")) == [3, 0, 8]
+        assert list(index.between("c", None)) == []
+        assert list(index.between(5, 4)) == []
+        for low, high in ((None, None), (1, "b"), (True, None)):
+            with pytest.raises(ValueError, match="Range bounds"):
+                index.between(low, high)
+
+    def test_collection(self, collection):
+        """Test indexes of a collection, cached until the features change."""
+        features = collection
+        index = features.property_index("value")
+
+        assert features.property_index("value") is index
+        assert list(index.equals("b")) == [0, 8]
+        assert list(features.property_index("missing").equals(None)) == list(range(len(VALUES)))
+
+        features.features.append(FeatureModel(type="Feature", geometry=None, properties=None))
+        assert features.property_index("value") is not index
+        assert list(features.property_index("value").equals(None)) == [2, 13]
+
+        typed = FeatureCollectionModel[PointModel, Properties].model_validate(
+            {
+                "type": "FeatureCollection",
+                "features": [
+                    {"type": "Feature", "geometry": None, "properties": {"status": status}}
+                    for status in ("active", "closed", "active")
+                ],
+            }
+        )
+        assert list(typed.property_index("status").equals("active")) == [0, 2]
+
+    def test_select(self, collection):
+        """Test combining queries with each other and with a spatial filter."""
+        features = collection
+        columns = ColumnarFeatureCollection.from_model(features)
+        index = PropertyIndex(columns.column("value"))
+        positions = PropertyIndex(columns.column("position"))
+
+        numbers = index.between(None, 100)
+        assert select(numbers) == [1, 4, 6, 9, 12]
+        assert select(numbers, positions.between(5, None)) == [6, 9, 12]
+        mask = columns.intersects([0, -1, 8.5, 1])
+        assert select(numbers, mask=mask) == [1, 4, 6]
+        assert columns.take(select(numbers, mask=mask)).column("value") == [3, 1.5, 1]
+        with pytest.raises(ValueError, match="at least one"):
+            select()
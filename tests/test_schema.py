@@ -0,0 +1,151 @@
+"""Tests for the precomputed JSON Schemas."""
+
+import json
+import re
+from pathlib import Path
+
+import pytest
+from pydantic import json_schema
+from pydantic.version import VERSION as PYDANTIC_VERSION
+
+import pydantic_geojson
+from pydantic_geojson import schema
+from pydantic_geojson.schema import (
+    MODEL_NAMES,
+    SCHEMA_MODES,
+    build_schema_bundle,
+    model_json_schema,
+    schema_definitions,
+)
+
+
+@pytest.fixture
+def fresh_cache():
+    """Clear the in-process schema caches before and after the test."""
+
+    def clear():
+        schema._load_bundle.cache_clear()
+        schema._model_schema.cache_clear()
+        schema._schema_definitions.cache_clear()
+
+    clear()
+    yield
+    clear()
+
+
+class TestPrecomputedSchemas:
+    """Test suite for the shipped and cached model schemas."""
+
+    @pytest.mark.parametrize("mode", SCHEMA_MODES)
+    @pytest.mark.parametrize("name", MODEL_NAMES)
+    def test_matches_model_json_schema(self, name, mode):
+        """Test that every precomputed schema equals the live pydantic output."""
+        model = getattr(pydantic_geojson, name)
+        live = json_schema.model_json_schema(model, mode=mode)
+
+        assert model_json_schema(model, mode) == live
+        assert model_json_schema(name, mode) == live
+        assert model.model_json_schema(mode=mode) == live
+
+    def test_shipped_file_is_up_to_date(self):
+        """Test that the shipped file matches a fresh build for the versions it is stamped with."""
+        shipped = json.loads(schema.SCHEMA_FILE.read_text(encoding="utf-8"))
+        if shipped["pydantic_version"] != PYDANTIC_VERSION:
+            pytest.skip(f"schemas.json was generated with pydantic {shipped['pydantic_version']}")
+
+        assert shipped == build_schema_bundle(), "run `python -m pydantic_geojson.schema`"
+
+    def test_definitions_are_shared(self):
+        """Test that models share one set of definitions per mode."""
+        definitions = schema_definitions()
+
+        assert set(MODEL_NAMES) < set(definitions)
+        assert "Coordinates" in definitions
+
+    def test_openapi_ref_template(self):
+        """Test that references can be pointed at OpenAPI components."""
+        definitions = schema_definitions(ref_template="#/components/schemas/{model}")
+        serialized = json.dumps(definitions)
+
+        assert "#/$defs/" not in serialized
+        assert '"#/components/schemas/FeatureModel"' in serialized
+
+    def test_results_are_copies(self):
+        """Test that modifying a returned schema does not affect later calls."""
+        first = model_json_schema("PointModel")
+        first["title"] = "Changed"
+        schema_definitions()["PointModel"]["title"] = "Changed"
+
+        assert model_json_schema("PointModel")["title"] == "PointModel"
+        assert schema_definitions()["PointModel"]["title"] == "PointModel"
+
+    def test_stale_file_is_regenerated(self, fresh_cache, monkeypatch, tmp_path):
+        """Test that a file stamped with another version is ignored."""
+        stale = tmp_path / "schemas.json"
+        bundle = build_schema_bundle()
+        bundle["version"] = "0.0.0"
+        bundle["schemas"]["validation"]["PointModel"]["title"] = "Stale"
+        stale.write_text(json.dumps(bundle), encoding="utf-8")
+        monkeypatch.setattr(schema, "SCHEMA_FILE", stale)
+
+        assert model_json_schema("PointModel")["title"] == "PointModel"
+
+    def test_missing_file_is_regenerated(self, fresh_cache, monkeypatch, tmp_path):
+        """Test that schemas are still available without the shipped file."""
+        monkeypatch.setattr(schema, "SCHEMA_FILE", tmp_path / "missing.json")
+
+        assert model_json_schema("FeatureModel") == json_schema.model_json_schema(
+            pydantic_geojson.FeatureModel
+        )
+
+    def test_write_schema_file(self, tmp_path):
+        """Test that the regeneration entry point writes a loadable bundle."""
+        path = tmp_path / "schemas.json"
+        schema.write_schema_file(path)
+
+        assert json.loads(path.read_text(encoding="utf-8")) == build_schema_bundle()
+
+    def test_model_method_uses_precomputed_schemas(self, monkeypatch):
+        """Test that Model.model_json_schema() of public models skips schema generation."""
+        model_json_schema("PointModel", "serialization")
+
+        class Generated(Exception):
+            pass
+
+        def generate(self, *args, **kwargs):
+            raise Generated
+
+        monkeypatch.setattr(json_schema.GenerateJsonSchema, "generate", generate)
+
+        class PointModel(pydantic_geojson.PointModel):
+            pass
+
+        point_schema = pydantic_geojson.PointModel.model_json_schema(mode="serialization")
+        assert point_schema == model_json_schema("PointModel", "serialization")
+        with pytest.raises(Generated):
+            pydantic_geojson.PointModel.model_json_schema(ref_template="#/components/{model}")
+        with pytest.raises(Generated):
+            PointModel.model_json_schema()
+        with pytest.raises(Generated):
+            pydantic_geojson.FeatureModel[pydantic_geojson.PointModel, dict].model_json_schema()
+
+    def test_version_matches_pyproject(self):
+        """Test that the version stamped on the schemas is the released package version."""
+        pyproject = Path(__file__).parents[1] / "pyproject.toml"
+        version = re.search(r'^version = "(.+)"', pyproject.read_text(), re.MULTILINE)
+
+        assert version is not None
+        assert pydantic_geojson.__version__ == version.group(1)
+
+    def test_unknown_model_or_mode(self):
+        """Test that user models and unknown modes are rejected."""
+
+        class PointModel(pydantic_geojson.PointModel):
+            pass
+
+        with pytest.raises(ValueError, match="No precomputed schema"):
+            model_json_schema(PointModel)
+        with pytest.raises(ValueError, match="No precomputed schema"):
+            model_json_schema("Coordinates")
+        with pytest.raises(ValueError, match="mode"):
+            model_json_schema("PointModel", "input")  # type: ignore[arg-type]
@@ -0,0 +1,147 @@
+"""Tests for bulk conversion to and from Shapely."""
+
+import pytest
+
+from pydantic_geojson import PointModel, PolygonModel
+from pydantic_geojson.columnar import ColumnarFeatureCollection
+from tests.test_utils import SAMPLE_GEOMETRIES as GEOMETRIES
+
+shapely = pytest.importorskip("shapely")
+np = pytest.importorskip("numpy")
+
+from pydantic_geojson.shapely import (  # noqa: E402
+    collection_from_shapely,
+    from_shapely,
+    to_shapely,
+)
+
+
+@pytest.fixture
+def collection(geojson):
+    """Build a collection with one feature per geometry, all with the same properties."""
+    return lambda geometries, properties=None: geojson.collection(
+        geojson.feature(geometry, properties) for geometry in geometries
+    )
+
+
+EMPTY = [
+    {"type": "MultiPoint", "coordinates": []},
+    {"type": "MultiLineString", "coordinates": []},
+    {"type": "Polygon", "coordinates": []},
+    {"type": "MultiPolygon", "coordinates": []},
+    {"type": "GeometryCollection", "geometries": []},
+]
+
+MIXED = [
+    *GEOMETRIES.values(),
+    None,
+    {"type": "GeometryCollection", "geometries": [GEOMETRIES["Point"], GEOMETRIES["Polygon"]]},
+    {"type": "Point", "coordinates": [1, 2, 3]},
+]
+
+
+class TestShapely:
+    """Test suite for Shapely interop."""
+
+    def test_to_shapely(self, collection):
+        """Test that each geometry converts to the equal Shapely geometry."""
+        geometries = to_shapely(collection(MIXED))
+
+        assert geometries.dtype == object
+        assert shapely.equals(geometries[0], shapely.Point(1, 2))
+        assert shapely.equals(
+            geometries[2],
+            shapely.Polygon([(0, 0), (4, 0), (4, 4), (0, 0)], [[(1, 1), (2, 1), (2, 2), (1, 1)]]),
+        )
+        assert geometries[6] is None
+        assert [geometry.geom_type for geometry in geometries[7].geoms] == ["Point", "Polygon"]
+        assert shapely.has_z(geometries[8])
+        assert not shapely.has_z(geometries[0])
+
+    @pytest.mark.parametrize("geometry", MIXED, ids=lambda g: g and g["type"])
+    def test_round_trip(self, collection, geometry):
+        """Test converting geometry models to Shapely and back."""
+        original = collection([geometry, geometry]).features[0].geometry
+        models = from_shapely(to_shapely([original, None, original]))
+
+        assert models == [original, None, original]
+
+    def test_single_geometry(self):
+        """Test the conversion of a single geometry."""
+        point = PointModel(type="Point", coordinates=[3, 4])
+
+        assert shapely.equals(to_shapely(point), shapely.Point(3, 4))
+        assert from_shapely(shapely.box(0, 0, 1, 1)) == PolygonModel.model_validate(
+            {"type": "Polygon", "coordinates": [[[1, 0], [1, 1], [0, 1], [0, 0], [1, 0]]]}
+        )
+
+    def test_columnar_input(self, collection):
+        """Test that a columnar collection converts like the collection model."""
+        original = collection(MIXED)
+
+        assert list(to_shapely(ColumnarFeatureCollection.from_model(original))) == list(
+            to_shapely(original)
+        )
+
+    def test_collection_from_shapely(self, collection):
+        """Test building a collection with properties and ids."""
+        original = collection(MIXED, {"name": "x"})
+        rebuilt = collection_from_shapely(
+            to_shapely(original), [{"name": "x"}] * len(MIXED), ids=list(range(len(MIXED)))
+        )
+
+        assert [feature.geometry for feature in rebuilt.features] == [
+            feature.geometry for feature in original.features
+        ]
+        assert rebuilt.features[3].properties == {"name": "x"}
+        assert rebuilt.features[3].id == 3
+        with pytest.raises(ValueError, match="properties"):
+            collection_from_shapely(to_shapely(original), [])
+
+    def test_empty_geometries_to_shapely(self, collection):
+        """Test that empty geometries become empty Shapely geometries, also among others."""
+        mixed = [
+            *EMPTY,
+            {"type": "MultiPoint", "coordinates": [[1, 2]]},
+            {
+                "type": "GeometryCollection",
+                "geometries": [GEOMETRIES["Point"], {"type": "MultiPoint", "coordinates": []}],
+            },
+        ]
+        converted = to_shapely(collection(mixed))
+
+        assert [geometry.wkt for geometry in converted[:5]] == [
+            "MULTIPOINT EMPTY",
+            "MULTILINESTRING EMPTY",
+            "POLYGON EMPTY",
+            "MULTIPOLYGON EMPTY",
+            "GEOMETRYCOLLECTION EMPTY",
+        ]
+        assert converted[5].equals(shapely.MultiPoint([(1, 2)]))
+        assert [member.is_empty for member in converted[6].geoms] == [False, True]
+        assert to_shapely(collection(EMPTY[:1])).tolist() == [shapely.MultiPoint()]
+
+    @pytest.mark.parametrize("geometry", EMPTY, ids=lambda g: g["type"])
+    def test_empty_round_trip(self, collection, geometry):
+        """Test that empty geometries come back from Shapely as empty models."""
+        point = GEOMETRIES["Point"]
+        member = {"type": "GeometryCollection", "geometries": [point, geometry]}
+        if geometry["type"] == "GeometryCollection":
+            member = geometry  # GeometryCollections cannot nest
+        originals = [f.geometry for f in collection([geometry, point, member]).features]
+        models = from_shapely(to_shapely(originals))
+
+        assert models == originals
+        assert collection_from_shapely(to_shapely(originals)) == collection(originals)
+
+    def test_empty_and_unsupported(self):
+        """Test empty geometries, LinearRings and nested GeometryCollections."""
+        ring = shapely.LinearRing([(0, 0), (1, 0), (1, 1)])
+
+        assert from_shapely([shapely.Point(), None, shapely.LineString()]) == [None, None, None]
+        with pytest.raises(ValueError, match="empty Point or LineString members"):
+            from_shapely(shapely.GeometryCollection([shapely.Point(1, 1), shapely.Point()]))
+        assert from_shapely(ring).type == "LineString"
+        nested = shapely.GeometryCollection([shapely.GeometryCollection([shapely.Point(1, 1)])])
+        with pytest.raises(ValueError, match="Nested"):
+            from_shapely([nested])
@@ -0,0 +1,135 @@
+"""Tests for the in-memory vector tile index."""
+
+import pytest
+
+from pydantic_geojson import FeatureCollectionModel
+from pydantic_geojson.mvt import encode_tile
+from pydantic_geojson.tile_index import TileIndex
+from tests.test_utils import decode_mvt
+
+
+@pytest.fixture
+def grid_collection(geojson):
+    """A collection with one small square polygon per degree cell around the origin."""
+    features = []
+    for i in range(-10, 10):
+        for j in range(-10, 10):
+            ring = [[i, j], [i + 0.5, j], [i + 0.5, j + 0.5], [i, j + 0.5], [i, j]]
+            polygon = {"type": "Polygon", "coordinates": [ring]}
+            features.append(geojson.feature(polygon, {"i": i, "j": j}, id=len(features)))
+    return geojson.collection(features)
+
+
+class TestTileIndex:
+    """Test suite for TileIndex slicing and caching."""
+
+    @pytest.mark.parametrize("z,x,y", [(0, 0, 0), (3, 4, 3), (6, 32, 31), (9, 256, 255)])
+    def test_tiles_match_direct_encoding(self, grid_collection, z, x, y):
+        """Test that sliced tiles are identical to encoding the collection directly."""
+        index = TileIndex(grid_collection, max_zoom=10, grid_zoom=5)
+
+        assert index.get_tile(z, x, y) == encode_tile(grid_collection, z, x, y)
+
+    def test_cache_hits_and_metrics(self, grid_collection):
+        """Test that repeated requests are served from the cache and counted."""
+        index = TileIndex(grid_collection)
+        first = index.get_tile(4, 8, 7)
+        second = index.get_tile(4, 8, 7)
+        stats = index.stats
+
+        assert first is second
+        assert stats.hits == 1
+        assert stats.misses == 1
+        assert stats.hit_rate == 0.5
+        assert stats.slice_count == 1
+        assert stats.slice_time >= stats.max_slice_time > 0
+        assert stats.cached_tiles == 1
+        assert stats.cached_bytes == len(first)
+
+    def test_cache_bounded_by_count(self, grid_collection):
+        """Test that the least recently used tile is evicted when the count bound is hit."""
+        index = TileIndex(grid_collection, max_tiles=2)
+        index.get_tile(1, 0, 0)
+        index.get_tile(1, 1, 0)
+        index.get_tile(1, 0, 0)  # refresh 1/0/0
+        index.get_tile(1, 1, 1)  # evicts 1/1/0
+
+        assert index.stats.evictions == 1
+        assert index.stats.cached_tiles == 2
+        index.get_tile(1, 0, 0)
+        assert index.stats.hits == 2
+
+    def test_cache_bounded_by_bytes(self, grid_collection):
+        """Test that the cache never holds more bytes than allowed."""
+        tiles = [(2, 2, 1), (2, 1, 1), (2, 1, 2)]
+        max_bytes = max(len(encode_tile(grid_collection, *tile)) for tile in tiles)
+        index = TileIndex(grid_collection, max_bytes=max_bytes)
+        for tile in tiles:
+            index.get_tile(*tile)
+
+        assert index.stats.cached_bytes <= max_bytes
+        assert index.stats.cached_tiles == 1
+        assert index.stats.evictions == 2
+
+    def test_empty_tiles_are_cached(self, grid_collection):
+        """Test that tiles without features are cached as empty bytes."""
+        index = TileIndex(grid_collection)
+
+        assert index.get_tile(5, 0, 0) == b""
+        assert index.get_tile(5, 0, 0) == b""
+        assert index.stats.hits == 1
+
+    def test_large_features_reach_every_tile(self):
+        """Test that features spanning many grid cells are still found at high zoom."""
+        fc = FeatureCollectionModel(
+            type="FeatureCollection",
+            features=[
+                {
+                    "type": "Feature",
+                    "geometry": {
+                        "type": "LineString",
+                        "coordinates": [[-170, 0.001], [170, 0.001]],
+                    },
+                }
+            ],
+        )
+        index = TileIndex(fc, max_zoom=12)
+        layers = decode_mvt(index.get_tile(12, 2048, 2047))
+
+        assert len(layers["features"]["features"]) == 1
+
+    def test_clear_cache(self, grid_collection):
+        """Test that clearing the cache forces slicing again."""
+        index = TileIndex(grid_collection)
+        index.get_tile(0, 0, 0)
+        index.clear_cache()
+        index.get_tile(0, 0, 0)
+
+        assert index.stats.misses == 2
+        assert index.stats.cached_tiles == 1
+
+    def test_len_counts_indexed_features(self, grid_collection):
+        """Test that the index reports the number of projected features."""
+        assert len(TileIndex(grid_collection)) == len(grid_collection.features)
+
+    def test_zoom_deeper_than_max_zoom(self, grid_collection):
+        """Test that tiles below max_zoom are rejected."""
+        index = TileIndex(grid_collection, max_zoom=4)
+
+        with pytest.raises(ValueError, match="max_zoom"):
+            index.get_tile(5, 0, 0)
+
+    @pytest.mark.parametrize(
+        "options",
+        [
+            {"max_zoom": 25},
+            {"extent": 0},
+            {"buffer": -1},
+            {"max_tiles": -1},
+            {"max_zoom": 4, "grid_zoom": 5},
+        ],
+    )
+    def test_invalid_options(self, grid_collection, options):
+        """Test that invalid index options are rejected."""
+        with pytest.raises(ValueError):
+            TileIndex(grid_collection, **options)
@@ -2,6 +2,31 @@
 
 from pydantic_geojson._base import Coordinates
 
+# One GeoJSON object of each geometry type other than GeometryCollection.
+SAMPLE_GEOMETRIES = {
+    "Point": {"type": "Point", "coordinates": [1, 2]},
+    "LineString": {"type": "LineString", "coordinates": [[1, 2], [3, 4, 5]]},
+    "Polygon": {
+        "type": "Polygon",
+        "coordinates": [
+            [[0, 0], [4, 0], [4, 4], [0, 0]],
+            [[1, 1], [2, 1], [2, 2], [1, 1]],
+        ],
+    },
+    "MultiPoint": {"type": "MultiPoint", "coordinates": [[1, 2], [3, 4]]},
+    "MultiLineString": {
+        "type": "MultiLineString",
+        "coordinates": [[[1, 2], [3, 4]], [[5, 6], [7, 8], [9, 9]]],
+    },
+    "MultiPolygon": {
+        "type": "MultiPolygon",
+        "coordinates": [
+            [[[0, 0], [1, 0], [1, 1], [0, 0]]],
+            [[[5, 5], [6, 5], [6, 6], [5, 5]], [[5.1, 5.1], [5.2, 5.1], [5.2, 5.2], [5.1, 5.1]]],
+        ],
+    },
+}
+
 
 def assert_coordinates_equal(coord: Coordinates, expected: list[float]) -> None:
     """Assert that a Coordinates object matches expected [lon, lat] or [lon, lat, alt]."""
@@ -11,3 +36,120 @@ def assert_coordinates_equal(coord: Coordinates, expected: list[float]) -> None:
         assert coord.alt == expected[2]
     else:
         assert coord.alt is None
+
+
+def _read_varint(data: bytes, pos: int) -> tuple[int, int]:
+    result = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        shift += 7
+        if not byte & 0x80:
+            return result, pos
+
+
+def _read_fields(data: bytes) -> list[tuple[int, object]]:
+    """Split a protobuf message into (field number, value) pairs."""
+    import struct
+
+    fields: list[tuple[int, object]] = []
+    pos = 0
+    while pos < len(data):
+        key, pos = _read_varint(data, pos)
+        field, wire_type = key >> 3, key & 0x7
+        value: object
+        if wire_type == 0:
+            value, pos = _read_varint(data, pos)
+        elif wire_type == 1:
+            value = struct.unpack("<d", data[pos : pos + 8])[0]
+            pos += 8
+        elif wire_type == 2:
+            length, pos = _read_varint(data, pos)
+            value = data[pos : pos + length]
+            pos += length
+        else:
+            raise AssertionError(f"Unexpected wire type {wire_type}")
+        fields.append((field, value))
+    return fields
+
+
+def _read_packed(data: bytes) -> list[int]:
+    values = []
+    pos = 0
+    while pos < len(data):
+        value, pos = _read_varint(data, pos)
+        values.append(value)
+    return values
+
+
+def _unzigzag(value: int) -> int:
+    return (value >> 1) ^ -(value & 1)
+
+
+def decode_mvt_geometry(commands: list[int]) -> list[list[tuple[int, int]]]:
+    """Decode MVT geometry commands into paths of absolute tile coordinates."""
+    paths: list[list[tuple[int, int]]] = []
+    x = y = 0
+    i = 0
+    while i < len(commands):
+        command_id, count = commands[i] & 0x7, commands[i] >> 3
+        i += 1
+        if command_id == 7:
+            paths[-1].append(paths[-1][0])
+            continue
+        for _ in range(count):
+            x += _unzigzag(commands[i])
+            y += _unzigzag(commands[i + 1])
+            i += 2
+            if command_id == 1:
+                paths.append([(x, y)])
+            else:
+                paths[-1].append((x, y))
+    return paths
+
+
+def decode_mvt(data: bytes) -> dict[str, dict]:
+    """Decode an MVT tile into ``{layer name: layer}`` with decoded features."""
+    layers = {}
+    for field, raw_layer in _read_fields(data):
+        assert field == 3
+        layer: dict = {"features": [], "keys": [], "values": []}
+        for layer_field, value in _read_fields(raw_layer):  # type: ignore[arg-type]
+            if layer_field == 1:
+                layer["name"] = value.decode()  # type: ignore[union-attr]
+            elif layer_field == 2:
+                layer["features"].append(value)
+            elif layer_field == 3:
+                layer["keys"].append(value.decode())  # type: ignore[union-attr]
+            elif layer_field == 4:
+                ((value_field, raw_value),) = _read_fields(value)  # type: ignore[arg-type]
+                if value_field == 1:
+                    raw_value = raw_value.decode()  # type: ignore[union-attr]
+                elif value_field == 6:
+                    raw_value = _unzigzag(raw_value)  # type: ignore[arg-type]
+                elif value_field == 7:
+                    raw_value = bool(raw_value)
+                layer["values"].append(raw_value)
+            elif layer_field == 5:
+                layer["extent"] = value
+            elif layer_field == 15:
+                layer["version"] = value
+        features = []
+        for raw_feature in layer["features"]:
+            feature: dict = {"properties": {}}
+            for feature_field, value in _read_fields(raw_feature):
+                if feature_field == 1:
+                    feature["id"] = value
+                elif feature_field == 2:
+                    tags = _read_packed(value)  # type: ignore[arg-type]
+                    for k, v in zip(tags[::2], tags[1::2]):
+                        feature["properties"][layer["keys"][k]] = layer["values"][v]
+                elif feature_field == 3:
+                    feature["type"] = value
+                elif feature_field == 4:
+                    feature["geometry"] = decode_mvt_geometry(_read_packed(value))  # type: ignore[arg-type]
+            features.append(feature)
+        layer["features"] = features
+        layers[layer["name"]] = layer
+    return layers
@@ -0,0 +1,204 @@
+"""Tests for the strict polygon validity check."""
+
+import math
+
+import pytest
+from pydantic import ValidationError
+
+from pydantic_geojson import FeatureCollectionModel, MultiPolygonModel, PolygonModel
+from pydantic_geojson._index import STRTree
+from pydantic_geojson.packed import PackedLinearRing
+from pydantic_geojson.validity import PolygonError, multipolygon_error, polygon_error
+
+STRICT = {"strict_validity": True}
+SQUARE = [[0, 0], [4, 0], [4, 4], [0, 4], [0, 0]]
+HOLE = [[1, 1], [1, 2], [2, 2], [2, 1], [1, 1]]
+
+
+class CompactPolygonModel(PolygonModel):
+    coordinates: list[PackedLinearRing]
+
+
+class TestValidity:
+    """Test suite for polygon validity."""
+
+    @pytest.mark.parametrize(
+        "rings",
+        [
+            [SQUARE],
+            [SQUARE, HOLE],
+            # Repeated and collinear positions.
+            [[[0, 0], [2, 0], [2, 0], [4, 0], [4, 4], [0, 4], [0, 0]]],
+            # Holes touching the exterior ring at a vertex and on an edge.
+            [SQUARE, [[0, 0], [1, 2], [2, 1], [0, 0]], [[2, 4], [3, 3], [1, 3], [2, 4]]],
+            # Holes touching each other at a vertex.
+            [SQUARE, [[1, 1], [2, 2], [3, 1], [1, 1]], [[2, 2], [1, 3], [3, 3], [2, 2]]],
+        ],
+    )
+    def test_valid(self, rings):
+        """Test polygons that pass the check."""
+        assert polygon_error(rings) is None
+
+    @pytest.mark.parametrize(
+        "rings, error",
+        [
+            (
+                [[[0, 0], [4, 4], [4, 0], [0, 4], [0, 0]]],
+                PolygonError("Ring 0 self-intersects", (2.0, 2.0)),
+            ),
+            (
+                [[[0, 0], [4, 0], [2, 2], [4, 4], [0, 4], [2, 2], [0, 0]]],
+                PolygonError("Ring 0 self-intersects", (2, 2)),
+            ),
+            (
+                [[[0, 0], [4, 0], [4, 6], [4, 4], [0, 4], [0, 0]]],
+                PolygonError("Ring 0 self-intersects", (4, 4)),
+            ),
+            (
+                [SQUARE, [[3, 1], [3, 2], [5, 2], [5, 1], [3, 1]]],
+                PolygonError("Rings 0 and 1 cross", (4.0, 1.0)),
+            ),
+            (
+                [SQUARE, [[1, 1], [2, 2], [3, 1], [1, 1]], [[2, 2], [1, 0.5], [3, 3], [2, 2]]],
+                PolygonError("Rings 1 and 2 cross", (2, 2)),
+            ),
+            (
+                [SQUARE, HOLE, [[5, 5], [5, 6], [6, 6], [6, 5], [5, 5]]],
+                PolygonError("Hole 2 lies outside the exterior ring", (5, 5)),
+            ),
+            (
+                [[[0, 0], [1, 1], [0, 0], [0, 0]]],
+                PolygonError("Ring 0 has fewer than 3 distinct positions", (0, 0)),
+            ),
+        ],
+    )
+    def test_invalid(self, rings, error):
+        """Test that the first problem is reported with its location."""
+        assert polygon_error(rings) == error
+
+    def test_opt_in(self):
+        """Test that the models check validity only when asked to."""
+        bow_tie = [[0, 0], [4, 4], [4, 0], [0, 4], [0, 0]]
+        data = {"type": "Polygon", "coordinates": [bow_tie]}
+
+        PolygonModel.model_validate(data)
+        with pytest.raises(ValidationError, match=r"Invalid Polygon: Ring 0 .* at \(2.0, 2.0\)"):
+            PolygonModel.model_validate(data, context=STRICT)
+        with pytest.raises(ValidationError, match="self-intersects"):
+            CompactPolygonModel.model_validate(data, context=STRICT)
+
+    def test_nested(self):
+        """Test the check on MultiPolygons inside a FeatureCollection, also in fail-fast mode."""
+        data = {
+            "type": "FeatureCollection",
+            "features": [
+                {
+                    "type": "Feature",
+                    "properties": None,
+                    "geometry": {
+                        "type": "MultiPolygon",
+                        "coordinates": [[SQUARE], [SQUARE, [[5, 5], [5, 6], [6, 6], [5, 5]]]],
+                    },
+                }
+            ],
+        }
+
+        FeatureCollectionModel.model_validate(data)
+        for context in (STRICT, {**STRICT, "max_errors": 1}):
+            with pytest.raises(
+                ValidationError, match="Invalid MultiPolygon: Polygon 1: Hole 1 lies outside"
+            ):
+                FeatureCollectionModel.model_validate(data, context=context)
+
+    def test_large_polygon(self):
+        """Test a polygon with many vertices and a crossing introduced late in the ring."""
+        count = 20_000
+        ring = [
+            [math.cos(2 * math.pi * i / count) * 10, math.sin(2 * math.pi * i / count) * 10]
+            for i in range(count)
+        ]
+        ring.append(ring[0])
+
+        assert MultiPolygonModel.model_validate(
+            {"type": "MultiPolygon", "coordinates": [[ring]]}, context=STRICT
+        )
+        ring[count // 2] = [20, 0]
+        error = polygon_error([ring])
+        assert error is not None and error.reason == "Ring 0 self-intersects"
+
+    @pytest.mark.parametrize(
+        "polygons, error",
+        [
+            (
+                [[SQUARE], [[[4, 0], [8, 0], [8, 4], [4, 0]]], [[[8, 4], [9, 9], [8, 9], [8, 4]]]],
+                None,
+            ),
+            (
+                [[SQUARE, HOLE], [HOLE[::-1]]],
+                PolygonError("Polygons 0 and 1 share an edge", (1, 1)),
+            ),
+            (
+                [[[[5, 5], [6, 5], [6, 6], [5, 5]]], [SQUARE], [[[3, 3], [5, 3], [5, 5], [3, 3]]]],
+                PolygonError("Polygons 1 and 2 overlap", (4, 4)),
+            ),
+            (
+                [[SQUARE, HOLE], [[[2.5, 2.5], [3, 2.5], [3, 3], [2.5, 2.5]]]],
+                PolygonError("Polygons 0 and 1 overlap", (2.5, 2.5)),
+            ),
+            ([[SQUARE, HOLE], [[[1.2, 1.2], [1.8, 1.2], [1.8, 1.8], [1.2, 1.2]]]], None),
+            (
+                [[[[1, 1], [5, 5], [1, 5], [1, 1]]], [[[3, 5], [2, 2], [1, 3], [3, 5]]]],
+                PolygonError("Polygons 0 and 1 overlap", (2.5, 3.5)),
+            ),
+            (
+                [
+                    [SQUARE, [[1, 1], [1, 3], [3, 3], [3, 1], [1, 1]]],
+                    [[[2, 1], [3, 2], [2, 3], [1, 2], [2, 1]]],
+                ],
+                None,
+            ),
+        ],
+    )
+    def test_multipolygon_overlaps(self, polygons, error):
+        """Test that overlapping polygons and shared edges are reported; islands in holes are not."""
+        assert multipolygon_error(polygons) == error
+
+    def test_many_parts(self):
+        """Test a MultiPolygon with many parts, checked through the bounding box index."""
+        parts = [
+            [[[x, y], [x + 1, y], [x + 1, y + 1], [x, y + 1], [x, y]]]
+            for x in (column * 1.5 for column in range(100))
+            for y in (row * 1.5 for row in range(50))
+        ]
+        data = {"type": "MultiPolygon", "coordinates": parts}
+
+        assert MultiPolygonModel.model_validate(data, context=STRICT)
+        parts.append([[[10.75, 10.75], [11.25, 10.75], [11.25, 11.25], [10.75, 10.75]]])
+        with pytest.raises(ValidationError, match="Polygons 357 and 5000 overlap"):
+            MultiPolygonModel.model_validate(data, context=STRICT)
+
+
+class TestSTRTree:
+    """Test suite for the bounding box index."""
+
+    def test_query_and_pairs(self):
+        """Test queries and intersecting pairs against a brute-force search."""
+        boxes = [(x % 37, x % 23, x % 37 + 2, x % 23 + 3) for x in range(500)]
+        boxes.append((math.nan,) * 4)
+        tree = STRTree(boxes, node_capacity=4)
+
+        def intersects(a, b):
+            return a[0] <= b[2] and a[2] >= b[0] and a[1] <= b[3] and a[3] >= b[1]
+
+        query = (5, 5, 10, 7)
+        assert sorted(tree.query(query)) == [
+            index for index, box in enumerate(boxes) if intersects(box, query)
+        ]
+        assert sorted(tree.pairs()) == [
+            (i, j)
+            for i in range(len(boxes))
+            for j in range(i + 1, len(boxes))
+            if intersects(boxes[i], boxes[j])
+        ]
+        assert len(tree) == 500
+        assert STRTree([]).query(query) == []
@@ -0,0 +1,50 @@
+"""Tests for the WKB encoding of geometry objects."""
+
+import struct
+
+import pytest
+
+from pydantic_geojson._wkb import dumps, loads
+from tests.test_utils import SAMPLE_GEOMETRIES as GEOMETRIES
+
+
+class TestWKB:
+    """Test suite for the WKB encoding."""
+
+    @pytest.mark.parametrize("geometry_type", list(GEOMETRIES))
+    def test_round_trip(self, geometry_type):
+        """Test that each geometry type decodes to what was encoded."""
+        geometry = GEOMETRIES[geometry_type]
+
+        assert loads(dumps(geometry)) == geometry
+        assert dumps(loads(dumps(geometry))) == dumps(geometry)
+
+    def test_point_encoding(self):
+        """Test the byte layout of a 2D and a 3D point."""
+        assert dumps({"type": "Point", "coordinates": [1, 2]}) == struct.pack("<BIdd", 1, 1, 1, 2)
+        assert dumps({"type": "Point", "coordinates": [1, 2, 3]}) == struct.pack(
+            "<BIddd", 1, 1001, 1, 2, 3
+        )
+
+    def test_read_big_endian_ewkb(self):
+        """Test reading big-endian EWKB with a Z flag."""
+        data = struct.pack(">BIddd", 0, 0x80000001, 1, 2, 3)
+
+        assert loads(data) == {"type": "Point", "coordinates": [1, 2, 3]}
+
+    def test_geometry_collection(self):
+        """Test GeometryCollections, with altitudes in one member only."""
+        geometry = {
+            "type": "GeometryCollection",
+            "geometries": [
+                {"type": "Point", "coordinates": [1, 2, 3]},
+                {"type": "LineString", "coordinates": [[0, 0], [1, 1]]},
+            ],
+        }
+
+        assert loads(dumps(geometry)) == geometry
+
+    def test_unsupported(self):
+        """Test that M geometries are rejected."""
+        with pytest.raises(ValueError, match="M values"):
+            loads(struct.pack("<BIddd", 1, 2001, 1, 2, 3))